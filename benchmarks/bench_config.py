@@ -0,0 +1,37 @@
+# benchmarks/bench_config.py
+"""C() lookups: compiled bound view vs walking an explicit config dict, and bind cost."""
+from __future__ import annotations
+
+from common import project_config
+
+from dq_engine.utils.config import C, bind_config
+
+KEYS = [
+    "KEYS.PRIMARY_KEYS",
+    "LOGIC_RULES.RATIO_CHECKS",
+    "CATEGORICAL.VALID_DOMAINS",
+    "QUALITY_BANDS",
+    "SAMPLING.ENABLED",
+    "MISSING.KEY",
+]
+
+
+class ConfigLookup:
+    params = ([10_000],)
+    param_names = ["n_calls"]
+
+    def setup(self, n_calls):
+        self.cfg = project_config()
+        bind_config(self.cfg, validate=False)
+
+    def time_bound_view(self, n_calls):
+        for i in range(n_calls):
+            C(KEYS[i % len(KEYS)], None)
+
+    def time_dict_walk(self, n_calls):
+        cfg = self.cfg
+        for i in range(n_calls):
+            C(KEYS[i % len(KEYS)], None, config=cfg)
+
+    def time_bind(self, n_calls):
+        bind_config(self.cfg)
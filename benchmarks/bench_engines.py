@@ -0,0 +1,334 @@
+# benchmarks/bench_engines.py
+"""Section engines on synthetic Telco frames (2.3/2.4 profiling, 2.5 keys + consistency + violation network, 2.7 tests, 2.9 scoring, 2.11 correlation)."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from common import cols, project_config, rows, telco_frame
+
+from dq_engine.engines.consistency import ConsistencyCfg, ConsistencyEngine
+from dq_engine.engines.correlation import CorrelationEngine, numeric_feature_cols, pearson_from_chunks
+from dq_engine.engines.hypothesis import HypothesisEngine
+from dq_engine.engines.keys import clear_ref_index_cache, fk_membership, key_uniqueness
+from dq_engine.engines.model_checks import fold_assignment, fold_correlations
+from dq_engine.engines.profiling import ProfilingCfg, profile_frame, profile_table
+from dq_engine.engines.scoring import ScoringCfg, score_frame
+from dq_engine.engines.temporal import TemporalCfg, TemporalProfiler, validate_intervals
+from dq_engine.engines.type_inference import TypeInferenceCfg, infer_types
+from dq_engine.engines.violations import ViolationMatrix
+from dq_engine.memory import MemoryOptCfg, optimize_frame
+from dq_engine.out_of_core import SpillStore, iter_chunks
+from dq_engine.partitioned import PartitionCfg, logic_rule_defs, run_partitioned
+from dq_engine.sampling import stratified_sample
+
+
+class Correlation:
+    params = (rows(), cols())
+    param_names = ["n_rows", "n_cols"]
+
+    def setup(self, n_rows, n_cols):
+        df = telco_frame(n_rows, n_cols)
+        self.df = df
+        self.cols = numeric_feature_cols(df)[:64]
+
+    def time_pair_table(self, n_rows, n_cols):
+        CorrelationEngine(self.df, self.cols).pair_table(["pearson", "spearman"], threshold=0.85)
+
+    def time_vif(self, n_rows, n_cols):
+        CorrelationEngine(self.df, self.cols).vif()
+
+
+class Hypothesis:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.df = telco_frame(n_rows)
+        cfg = project_config()
+        self.group_by = (cfg.get("CAT_NUM_RELATIONSHIPS") or {}).get("GROUP_BY") or ["Contract"]
+        self.pairs = (cfg.get("CAT_CAT_RELATIONSHIPS") or {}).get("PAIRS") or [["Contract", "Churn"]]
+
+    def time_anova_kruskal(self, n_rows):
+        HypothesisEngine(self.df).anova_kruskal(self.group_by)
+
+    def time_chi_square(self, n_rows):
+        HypothesisEngine(self.df).chi_square(self.pairs)
+
+
+class Keys:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.df = telco_frame(n_rows)
+        ids = self.df["customerID"]
+        self.ref = ids.iloc[: int(len(ids) * 0.99)].reset_index(drop=True)
+
+    def time_key_uniqueness(self, n_rows):
+        key_uniqueness(self.df, ["customerID"])
+
+    def time_fk_membership_cold(self, n_rows):
+        clear_ref_index_cache()
+        fk_membership(self.df["customerID"], self.ref, "CUSTOMER_DIM", "customerID")
+
+
+class Scoring:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        rng = np.random.default_rng(0)
+        self.frame = pd.DataFrame({
+            "numeric_score": rng.uniform(50, 100, n_rows),
+            "categorical_score": rng.uniform(50, 100, n_rows),
+            "logic_score": rng.uniform(50, 100, n_rows),
+            "contract_status": rng.choice(["PASS", "WARN", "FAIL"], n_rows),
+            "missingness_score": rng.uniform(50, 100, n_rows),
+            "outlier_score": rng.uniform(50, 100, n_rows),
+        })
+        self.cfg = ScoringCfg.from_config(project_config())
+
+    def time_score_frame(self, n_rows):
+        score_frame(self.frame, cfg=self.cfg)
+
+
+class Sampling:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.df = telco_frame(n_rows)
+
+    def time_stratified_sample(self, n_rows):
+        stratified_sample(self.df, ["Contract", "Churn"], max(1_000, n_rows // 10))
+
+
+class Memory:
+    params = (rows(), cols())
+    param_names = ["n_rows", "n_cols"]
+
+    def setup(self, n_rows, n_cols):
+        self.df = telco_frame(n_rows, n_cols)
+        self.cfg = MemoryOptCfg.from_config(project_config())
+
+    def time_optimize_frame(self, n_rows, n_cols):
+        optimize_frame(self.df, self.cfg)
+
+
+class OutOfCore:
+    params = (rows(), cols())
+    param_names = ["n_rows", "n_cols"]
+
+    def setup(self, n_rows, n_cols):
+        import tempfile
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.df = telco_frame(n_rows, n_cols)
+        self.num = numeric_feature_cols(self.df)
+        self.chunk_rows = max(1_000, n_rows // 8)
+        self.store = SpillStore(self._tmp.name)
+        self.spilled = self.store.write("bench", iter_chunks(self.df, self.chunk_rows))
+
+    def teardown(self, n_rows, n_cols):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def time_spill_write(self, n_rows, n_cols):
+        self.store.write("bench_w", iter_chunks(self.df, self.chunk_rows))
+
+    def time_pearson_from_spill(self, n_rows, n_cols):
+        pearson_from_chunks(self.spilled.iter_chunks(self.chunk_rows, self.num), self.num)
+
+
+class Profiling:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        import duckdb
+
+        self.df = telco_frame(n_rows)
+        self.cfg = ProfilingCfg.from_config(project_config())
+        self.con = duckdb.connect()
+        self.con.register("_src", self.df)
+        self.con.execute("create table t as select * from _src")
+
+    def teardown(self, n_rows):
+        self.con.close()
+
+    def time_profile_frame(self, n_rows):
+        profile_frame(self.df, self.cfg)
+
+    def time_profile_table_duckdb(self, n_rows):
+        profile_table(_Reader(self.con), "t", self.cfg)
+
+
+class Partitioned:
+    params = (rows(), [1, 2, 4])
+    param_names = ["n_rows", "n_jobs"]
+
+    def setup(self, n_rows, n_jobs):
+        import tempfile
+
+        self._tmp = tempfile.TemporaryDirectory()
+        cfg = project_config()
+        self.df = telco_frame(n_rows)
+        self.path = f"{self._tmp.name}/telco.parquet"
+        self.df.to_parquet(self.path, row_group_size=max(1_000, n_rows // 16))
+        self.pcfg = ProfilingCfg.from_config(cfg)
+        self.rules = logic_rule_defs(cfg.get("LOGIC_RULES"))
+        self.cfg = {by: PartitionCfg(n_jobs=n_jobs, n_partitions=max(4, n_jobs), by=by, spill_dir=self._tmp.name)
+                    for by in ("key", "rows")}
+
+    def teardown(self, n_rows, n_jobs):
+        self._tmp.cleanup()
+
+    def _run(self, source, by):
+        run_partitioned(source, cfg=self.cfg[by], profiling_cfg=self.pcfg, rules=self.rules,
+                        key_defs=[("telco_customer", ["customerID"])])
+
+    def time_frame_by_key(self, n_rows, n_jobs):
+        self._run(self.df, "key")
+
+    def time_parquet_by_rows(self, n_rows, n_jobs):
+        self._run(self.path, "rows")
+
+    def time_parquet_by_key(self, n_rows, n_jobs):
+        self._run(self.path, "key")
+
+
+class TypeInference:
+    params = (rows(), cols())
+    param_names = ["n_rows", "n_cols"]
+
+    def setup(self, n_rows, n_cols):
+        # raw CSV shape: every column arrives as text (2.2.1 input)
+        self.df = telco_frame(n_rows, n_cols).astype("string")
+        self.cfg = TypeInferenceCfg.from_config(project_config())
+
+    def time_infer_types(self, n_rows, n_cols):
+        infer_types(self.df, self.cfg)
+
+
+class Temporal:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        import dataclasses
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory()
+        base = TemporalCfg.from_config(project_config())
+        self.cfg = dataclasses.replace(base, state_path=f"{self.tmp.name}/state.parquet")
+        self.df = telco_frame(n_rows)
+        warm = TemporalProfiler.for_frame(self.df, self.cfg)
+        warm.update(self.df)
+        warm.save()
+        start = pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(n_rows) % 900, unit="D")
+        self.iv = pd.DataFrame({
+            "pseudo_start": start, "pseudo_end": start + pd.to_timedelta(self.df["tenure"] * 30, unit="D"),
+            "call_start_ts": start, "call_end_ts": start + pd.to_timedelta(np.arange(n_rows) % 400, unit="min"),
+            "contract_start_date": start, "contract_end_date": start + pd.Timedelta(days=365),
+        })
+
+    def teardown(self, n_rows):
+        self.tmp.cleanup()
+
+    def time_full_rebuild(self, n_rows):
+        prof = TemporalProfiler.for_frame(self.df, self.cfg, load=False)
+        prof.update(self.df)
+        prof.ts_outliers()
+        prof.corr_deltas()
+
+    def time_incremental_refresh(self, n_rows):
+        prof = TemporalProfiler.for_frame(self.df, self.cfg)
+        prof.update(self.df)
+        prof.ts_outliers()
+        prof.corr_deltas()
+
+    def time_validate_intervals(self, n_rows):
+        validate_intervals(self.iv, self.cfg.intervals)
+
+
+class Consistency:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.cfg = ConsistencyCfg.from_config(project_config())
+        df = telco_frame(n_rows).copy()
+        df["tenure_bucket"] = pd.cut(df["tenure"], [-1, 12, 24, 48, 72], labels=["0-12", "13-24", "25-48", "49-72"])
+        expected = df["tenure"] * df["MonthlyCharges"]
+        for helper in ("expected_total_from_tenure_monthly", "expected_total_senior",
+                       "expected_total_from_payment_profile", "expected_min_total_from_contract"):
+            df[helper] = expected
+        df["expected_total_for_zero_tenure"] = np.where(df["tenure"] == 0, 0.0, np.nan)
+        dummies = pd.get_dummies(df[["InternetService", "PaymentMethod"]], dtype="int8")
+        contract = pd.get_dummies(df["Contract"], prefix="ContractType", dtype="int8")
+        self.df = pd.concat([df, dummies, contract], axis=1)
+
+    def time_catnum_alignment(self, n_rows):
+        ConsistencyEngine(self.df).catnum_alignment(self.cfg.catnum_rules)
+
+    def time_onehot_integrity(self, n_rows):
+        ConsistencyEngine(self.df).onehot_integrity(self.cfg.onehot_groups)
+
+    def time_totals_reconciliation(self, n_rows):
+        ConsistencyEngine(self.df).totals_reconciliation(self.cfg.totals_rules)
+
+
+class ViolationNetwork:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        rng = np.random.default_rng(0)
+        n_rules, n_viol = 500, n_rows * 3
+        rule = rng.zipf(1.3, n_viol) % n_rules
+        left, right = rng.integers(0, 60, n_rules), rng.integers(0, 60, n_rules)
+        self.records = pd.DataFrame({
+            "row_key": rng.integers(0, n_rows, n_viol),
+            "rule_id": pd.Series(rule).map("rule_{}".format),
+            "left_col": pd.Series(left[rule]).map("col_{}".format),
+            "right_col": pd.Series(right[rule]).map("col_{}".format),
+            "severity": np.where(rule % 3 == 0, "fail", "warn"),
+        })
+        self.n_rows = n_rows
+        self.matrix = self._build()
+
+    def _build(self):
+        return ViolationMatrix.from_records(self.records, feature_cols=("left_col", "right_col"), n_total=self.n_rows)
+
+    def time_build_matrix(self, n_rows):
+        self._build()
+
+    def time_rule_edges(self, n_rows):
+        self.matrix.rule_edges()
+
+    def time_column_edges(self, n_rows):
+        self.matrix.column_edges()
+
+
+class PredictiveConsistency:
+    params = (rows(),)
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(n_rows, 30))
+        self.X[rng.random(self.X.shape) < 0.02] = np.nan
+        self.y = (self.X[:, 0] + rng.normal(size=n_rows) > 0).astype("float64")
+        self.folds = fold_assignment(n_rows, 5, 42)
+
+    def time_fold_correlations(self, n_rows):
+        fold_correlations(self.X, self.y, self.folds)
+
+
+class _Reader:
+    def __init__(self, con):
+        self.con = con
+
+    def read_df(self, sql):
+        return self.con.execute(sql).df()
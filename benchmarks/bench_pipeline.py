@@ -0,0 +1,58 @@
+# benchmarks/bench_pipeline.py
+"""End-to-end pipeline.run (dbt skipped) against a temporary DuckDB warehouse."""
+from __future__ import annotations
+
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+import duckdb
+import yaml
+
+from common import rows, spec
+from synth import load_duckdb
+
+from dq_engine import pipeline
+
+DATABASE = "DQ_ENGINE"                    # DuckDB catalog name == file stem
+TABLE = f"{DATABASE}.ANALYTICS.MRT_TELCO_CHURN"
+
+
+class PipelineRun:
+    params = (rows(),)
+    param_names = ["n_rows"]
+    timeout = 600
+
+    def setup(self, n_rows):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        db = root / f"{DATABASE}.duckdb"
+        con = duckdb.connect(str(db))
+        con.execute("create schema if not exists ANALYTICS")
+        load_duckdb(spec(n_rows), con, "ANALYTICS.MRT_TELCO_CHURN")
+        con.execute("alter table ANALYTICS.MRT_TELCO_CHURN rename column Churn_flag to CHURN_FLAG")
+        con.close()
+
+        checks = [{"id": "rowcount_mart", "type": "row_count", "table": TABLE, "severity": "fail",
+                   "params": {"min_rows": 1}}]
+        for col, values in [("CHURN_FLAG", [0, 1]), ("Contract", spec(1).levels["Contract"]),
+                            ("PaymentMethod", spec(1).levels["PaymentMethod"])]:
+            checks.append({"id": f"accepted_{col.lower()}", "type": "accepted_values", "table": TABLE,
+                           "column": col, "severity": "warn", "params": {"values": values}})
+        cfg = {
+            "project": {"dataset_id": "telco_churn_bench"},
+            "warehouse": {"target": "duckdb", "database": DATABASE, "raw_schema": "RAW",
+                          "analytics_schema": "ANALYTICS", "dq_schema": "DQ", "duckdb_path": str(db)},
+            "dbt": {"project_dir": str(root), "profiles_dir": str(root)},
+            "checks": checks,
+        }
+        self.config_path = root / "pipeline.yaml"
+        self.config_path.write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+
+    def teardown(self, n_rows):
+        self._tmp.cleanup()
+
+    def time_run(self, n_rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline.run(str(self.config_path), skip_dbt=True)
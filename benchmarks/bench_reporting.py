@@ -0,0 +1,111 @@
+# benchmarks/bench_reporting.py
+"""append_sec2 into a growing unified Section 2 report; streamed dashboard writes; Parquet artifacts vs CSV."""
+from __future__ import annotations
+
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.artifacts import ArtifactCfg, artifact_manifest, clear_artifact_cache, read_artifact, write_artifact
+from dq_engine.report_writer import ReportWriterCfg, Section, write_report
+from dq_engine.utils.reporting import append_sec2
+
+
+def _chunk(n: int, section: str) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "section": section,
+        "section_name": f"check {section}",
+        "check": [f"check_{i}" for i in range(n)],
+        "status": rng.choice(["OK", "WARN", "FAIL"], n),
+        "level": "info",
+        "metric_value": rng.random(n),
+    })
+
+
+class AppendSec2:
+    params = ([100, 10_000], [10, 100])
+    param_names = ["report_rows", "chunk_rows"]
+
+    def setup(self, report_rows, chunk_rows):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "section2_report.csv"
+        with contextlib.redirect_stdout(io.StringIO()):
+            append_sec2(_chunk(report_rows, "2.0.0"), self.path)
+        self.chunk = _chunk(chunk_rows, "2.9.9")
+
+    def teardown(self, report_rows, chunk_rows):
+        self._tmp.cleanup()
+
+    def time_append(self, report_rows, chunk_rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            append_sec2(self.chunk, self.path)
+
+
+class StreamedReport:
+    params = ([1_000, 100_000],)
+    param_names = ["table_rows"]
+
+    def setup(self, table_rows):
+        self._tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.table = pd.DataFrame({"feature": [f"f{i}" for i in range(table_rows)],
+                                   "p_value": rng.random(table_rows), "effect": rng.normal(size=table_rows)})
+        self.cfg = ReportWriterCfg(n_jobs=1)
+
+    def teardown(self, table_rows):
+        self._tmp.cleanup()
+
+    def _sections(self):
+        return [Section(f"s{i}", f"Section {i}").metrics({"n": i}).table(self.table, table_id=f"t{i}") for i in range(10)]
+
+    def time_html(self, table_rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_report(Path(self._tmp.name) / "dash.html", self._sections(), title="bench", cfg=self.cfg)
+
+    def time_markdown(self, table_rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_report(Path(self._tmp.name) / "findings.md", self._sections(), title="bench", cfg=self.cfg)
+
+
+class Artifacts:
+    params = ([10_000, 1_000_000],)
+    param_names = ["report_rows"]
+
+    def setup(self, report_rows):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "outlier_report_iqr_z.csv"
+        self.table = _chunk(report_rows, "2.3.3")
+        self.cfg = ArtifactCfg(csv_mirror=False)
+        self.csv = Path(self._tmp.name) / "legacy.csv"
+        self.table.to_csv(self.csv, index=False)
+        write_artifact(self.table, self.path, cfg=self.cfg)
+        self.specs = [("outlier_report_iqr_z.csv", self.path, "2.3.3", "core_numeric")]
+
+    def teardown(self, report_rows):
+        self._tmp.cleanup()
+        clear_artifact_cache()
+
+    def time_write_csv(self, report_rows):
+        self.table.to_csv(self.csv, index=False)
+
+    def time_write_artifact(self, report_rows):
+        write_artifact(self.table, self.path, cfg=self.cfg)
+
+    def time_read_csv(self, report_rows):
+        pd.read_csv(self.csv)
+
+    def time_read_artifact_cold(self, report_rows):
+        clear_artifact_cache()
+        read_artifact(self.path, cfg=self.cfg)
+
+    def time_read_artifact_cached(self, report_rows):
+        read_artifact(self.path, cfg=self.cfg)
+
+    def time_manifest(self, report_rows):
+        with contextlib.redirect_stdout(io.StringIO()):
+            artifact_manifest(self.specs)
@@ -0,0 +1,21 @@
+# benchmarks/bench_stats.py
+"""Multiple-testing corrections (helpers/stats_corrections.adjust_pvalues)."""
+from __future__ import annotations
+
+import numpy as np
+
+from dq_engine.helpers.stats_corrections import adjust_pvalues
+
+
+class AdjustPvalues:
+    params = ([1_000, 100_000], ["fdr_bh", "holm", "bonferroni"])
+    param_names = ["n_tests", "method"]
+
+    def setup(self, n_tests, method):
+        rng = np.random.default_rng(0)
+        p = rng.uniform(size=n_tests)
+        p[rng.random(n_tests) < 0.01] = np.nan
+        self.p = p
+
+    def time_adjust(self, n_tests, method):
+        adjust_pvalues(self.p, method)
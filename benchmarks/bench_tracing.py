@@ -0,0 +1,33 @@
+# benchmarks/bench_tracing.py
+"""Instrumentation overhead: @traced / span() with tracing off and on."""
+from __future__ import annotations
+
+from dq_engine.utils.tracing import disable_tracing, enable_tracing, span, traced
+
+
+@traced("bench.noop")
+def _noop() -> None:
+    return None
+
+
+class TracingOverhead:
+    params = ([False, True],)
+    param_names = ["enabled"]
+
+    def setup(self, enabled):
+        if enabled:
+            enable_tracing()
+        else:
+            disable_tracing()
+
+    def teardown(self, enabled):
+        disable_tracing()
+
+    def time_traced_10k(self, enabled):
+        for _ in range(10_000):
+            _noop()
+
+    def time_span_10k(self, enabled):
+        for _ in range(10_000):
+            with span("bench.block", rows_in=1):
+                pass
@@ -0,0 +1,67 @@
+# benchmarks/common.py
+"""
+Shared helpers for the benchmark suites.
+
+- `DQ_BENCH_SCALE` (small | medium | large) picks the row/column grid; CI runs
+  `small`, release checks run `medium`/`large`.
+- Frames are generated once per (rows, cols, seed) and memoised so several
+  suites time the same input without paying generation twice.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+SRC_DIR = REPO_ROOT / "src"
+CONFIG_PATH = REPO_ROOT / "config" / "project_config.yaml"
+
+for _p in (str(SRC_DIR), str(BENCH_DIR)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from synth import SynthSpec, generate  # noqa: E402
+
+SCALES: Dict[str, Dict[str, List[int]]] = {
+    "small": {"rows": [10_000, 100_000], "cols": [21, 200]},
+    "medium": {"rows": [100_000, 1_000_000], "cols": [21, 500]},
+    "large": {"rows": [1_000_000, 10_000_000], "cols": [21, 2_000]},
+}
+SEED = 42
+
+
+def scale() -> str:
+    s = os.environ.get("DQ_BENCH_SCALE", "small").lower()
+    if s not in SCALES:
+        raise ValueError(f"Unknown DQ_BENCH_SCALE {s!r}; expected one of {sorted(SCALES)}")
+    return s
+
+
+def rows() -> List[int]:
+    return list(SCALES[scale()]["rows"])
+
+
+def cols() -> List[int]:
+    return list(SCALES[scale()]["cols"])
+
+
+@lru_cache(maxsize=1)
+def project_config() -> Dict[str, Any]:
+    with CONFIG_PATH.open("r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def spec(n_rows: int, n_cols: int = 21, **overrides: Any) -> SynthSpec:
+    return SynthSpec.from_config(project_config(), n_rows=int(n_rows), n_cols=int(n_cols), seed=SEED, **overrides)
+
+
+@lru_cache(maxsize=4)
+def telco_frame(n_rows: int, n_cols: int = 21):
+    """Synthetic Telco frame (memoised; callers must not mutate it)."""
+    return generate(spec(n_rows, n_cols))
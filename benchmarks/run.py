@@ -0,0 +1,222 @@
+# benchmarks/run.py
+"""
+Minimal asv-style runner for benchmarks/bench_*.py.
+
+- A suite is a class with `params` / `param_names`, optional `setup` /
+  `teardown`, and `time_*` methods (the asv layout, so the same files run under
+  `asv` when it is installed).
+- Each case is timed `--repeat` times after one warm-up call; the minimum is
+  recorded.
+- Results go to benchmarks/results/<scale>-<timestamp>.json and are compared to
+  benchmarks/baselines/<scale>.json. Absolute timings depend on the host, so
+  every run also times a fixed calibration workload (numpy sort, pandas
+  groupby, a pure-Python loop). The baseline stores its own, and baseline
+  times are scaled by current / baseline calibration before comparing
+  (`--no-calibrate` compares raw times, e.g. against a baseline recorded
+  on the same machine).
+- A case regresses when it is slower than scaled baseline * threshold AND by
+  more than the absolute floor (so sub-millisecond jitter never fails CI).
+  A suite may set `regression_threshold` to override.
+- Exit code 1 on any regression; `--save-baseline` rewrites the baseline.
+
+    python benchmarks/run.py                       # DQ_BENCH_SCALE=small
+    python benchmarks/run.py --scale medium --filter Keys
+    python benchmarks/run.py --save-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_DIR = BENCH_DIR / "baselines"
+
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_FLOOR_S = 0.005
+
+
+def _cases(filter_: str | None) -> Iterator[Tuple[str, type, str]]:
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        mod = importlib.import_module(path.stem)
+        for cls_name, cls in sorted(vars(mod).items()):
+            if not isinstance(cls, type) or cls.__module__ != mod.__name__:
+                continue
+            for meth in sorted(m for m in vars(cls) if m.startswith("time_")):
+                name = f"{path.stem}.{cls_name}.{meth}"
+                if filter_ and filter_ not in name:
+                    continue
+                yield name, cls, meth
+
+
+def _param_grid(cls: type) -> List[Tuple[Any, ...]]:
+    params = getattr(cls, "params", None)
+    if not params:
+        return [()]
+    if not isinstance(params, tuple):
+        params = (params,)
+    return list(itertools.product(*params))
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Best-of-`repeat` time of a fixed CPU / memory workload, the host-speed yardstick."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    x = rng.random(1_000_000)
+    df = pd.DataFrame({"k": rng.integers(0, 1_000, 200_000), "v": rng.random(200_000)})
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        np.sort(x)
+        df.groupby("k")["v"].agg(["mean", "std"])
+        sum(i * i for i in range(200_000))
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _case_key(name: str, args: Tuple[Any, ...], cls: type) -> str:
+    if not args:
+        return name
+    names = getattr(cls, "param_names", None) or [f"p{i}" for i in range(len(args))]
+    return f"{name}[{','.join(f'{k}={v}' for k, v in zip(names, args, strict=True))}]"
+
+
+def time_case(cls: type, meth: str, args: Tuple[Any, ...], repeat: int) -> float:
+    obj = cls()
+    if hasattr(obj, "setup"):
+        obj.setup(*args)
+    try:
+        fn = getattr(obj, meth)
+        fn(*args)                                       # warm-up
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(*args)
+            best = min(best, time.perf_counter() - t0)
+        return best
+    finally:
+        if hasattr(obj, "teardown"):
+            obj.teardown(*args)
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    thresholds: Dict[str, float],
+    floor_s: float = DEFAULT_FLOOR_S,
+    speed: float = 1.0,
+) -> List[Dict[str, Any]]:
+    """`speed` = current / baseline calibration time; baseline times are scaled by it."""
+    rows = []
+    for key, t in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        base *= speed
+        thr = thresholds.get(key, DEFAULT_THRESHOLD)
+        ratio = t / base if base > 0 else float("inf")
+        rows.append({
+            "case": key,
+            "baseline_s": base,
+            "current_s": t,
+            "ratio": ratio,
+            "regressed": ratio > thr and (t - base) > floor_s,
+        })
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Run dq-engine benchmarks")
+    ap.add_argument("--scale", choices=["small", "medium", "large"], default=None)
+    ap.add_argument("--filter", default=None, help="substring of <module>.<Suite>.<time_method>")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--floor", type=float, default=DEFAULT_FLOOR_S, help="absolute regression floor (s)")
+    ap.add_argument(
+        "--no-calibrate", action="store_true", help="compare raw times (same-machine baseline)"
+    )
+    args = ap.parse_args(argv)
+
+    if args.scale:
+        os.environ["DQ_BENCH_SCALE"] = args.scale
+    if str(BENCH_DIR) not in sys.path:
+        sys.path.insert(0, str(BENCH_DIR))
+    import common
+
+    scale = common.scale()
+    calibration = calibrate()
+    print(f"📏 Calibration workload: {calibration * 1e3:.2f} ms")
+    results: Dict[str, float] = {}
+    thresholds: Dict[str, float] = {}
+    for name, cls, meth in _cases(args.filter):
+        for combo in _param_grid(cls):
+            key = _case_key(name, combo, cls)
+            t = time_case(cls, meth, combo, args.repeat)
+            results[key] = t
+            thresholds[key] = float(getattr(cls, "regression_threshold", DEFAULT_THRESHOLD))
+            print(f"⏱️ {key:<90} {t * 1e3:10.2f} ms")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    payload = {
+        "scale": scale,
+        "timestamp": stamp,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration_s": calibration,
+        "results": results,
+    }
+    out = RESULTS_DIR / f"{scale}-{stamp}.json"
+    out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"💾 Results → {out}")
+
+    baseline_path = BASELINE_DIR / f"{scale}.json"
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        merged = {}
+        if baseline_path.exists():
+            old = json.loads(baseline_path.read_text(encoding="utf-8"))
+            old_cal = old.get("calibration_s")
+            # cases not re-run here are rescaled so the file stays on one host's clock
+            k = calibration / old_cal if old_cal else 1.0
+            merged = {case: t * k for case, t in old.get("results", {}).items()}
+        merged.update(results)
+        payload["results"] = dict(sorted(merged.items()))
+        baseline_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"📌 Baseline saved → {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"ℹ️ No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    base_payload = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline = base_payload.get("results", {})
+    base_cal = base_payload.get("calibration_s")
+    speed = calibration / base_cal if base_cal and not args.no_calibrate else 1.0
+    if speed != 1.0:
+        print(f"📏 Calibration is {speed:.2f}× the baseline host's; baseline times scaled")
+    cmp_rows = compare(results, baseline, thresholds, args.floor, speed)
+    regressed = [r for r in cmp_rows if r["regressed"]]
+    for r in regressed:
+        print(f"❌ {r['case']}: {r['baseline_s'] * 1e3:.2f} ms → {r['current_s'] * 1e3:.2f} ms ({r['ratio']:.2f}×)")
+    if regressed:
+        print(f"❌ {len(regressed)} regression(s) vs {baseline_path.name}")
+        return 1
+    print(f"✅ No regressions vs {baseline_path.name} ({len(cmp_rows)} cases compared)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
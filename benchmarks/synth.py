@@ -0,0 +1,348 @@
+# benchmarks/synth.py
+"""
+Seeded synthetic Telco generator for benchmarks.
+
+- Reproduces the 21-column IBM Telco schema (levels from EXPECTED_LEVELS) and
+  builds rows that satisfy every LOGIC_RULES entry by construction
+  (phone -> MultipleLines, internet -> add-ons, tenure/contract/charges).
+- Violations are then injected per rule at a tunable rate. The injector reads
+  each rule's expression (violation_expr, or if/then for DEPENDENCIES) and
+  assigns values that make it fire, so new rules in the config are picked up
+  without code changes. `rule_violation_rates` re-evaluates the same
+  expressions to report the realised rates.
+- Scale: `iter_chunks` streams any number of rows (1e4 -> 1e8) in fixed-size,
+  independently seeded chunks; `n_cols` pads with numeric / categorical noise
+  features up to 2,000 columns.
+"""
+from __future__ import annotations
+
+import ast
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+TELCO_LEVELS: Dict[str, List[str]] = {
+    "gender": ["Female", "Male"],
+    "Partner": ["Yes", "No"],
+    "Dependents": ["Yes", "No"],
+    "PhoneService": ["Yes", "No"],
+    "MultipleLines": ["Yes", "No", "No phone service"],
+    "InternetService": ["DSL", "Fiber optic", "No"],
+    "OnlineSecurity": ["Yes", "No", "No internet service"],
+    "OnlineBackup": ["Yes", "No", "No internet service"],
+    "DeviceProtection": ["Yes", "No", "No internet service"],
+    "TechSupport": ["Yes", "No", "No internet service"],
+    "StreamingTV": ["Yes", "No", "No internet service"],
+    "StreamingMovies": ["Yes", "No", "No internet service"],
+    "Contract": ["Month-to-month", "One year", "Two year"],
+    "PaperlessBilling": ["Yes", "No"],
+    "PaymentMethod": ["Electronic check", "Mailed check", "Bank transfer (automatic)", "Credit card (automatic)"],
+    "Churn": ["Yes", "No"],
+}
+TELCO_COLUMNS = [
+    "customerID", "gender", "SeniorCitizen", "Partner", "Dependents", "tenure",
+    "PhoneService", "MultipleLines", "InternetService", "OnlineSecurity", "OnlineBackup",
+    "DeviceProtection", "TechSupport", "StreamingTV", "StreamingMovies", "Contract",
+    "PaperlessBilling", "PaymentMethod", "MonthlyCharges", "TotalCharges", "Churn",
+]
+ADDONS = ["OnlineSecurity", "OnlineBackup", "DeviceProtection", "TechSupport", "StreamingTV", "StreamingMovies"]
+
+
+@dataclass
+class SynthSpec:
+    n_rows: int = 7_043
+    n_cols: int = 21                         # >= 21; extra columns are noise features
+    seed: int = 42
+    violation_rate: float = 0.01             # default per-rule injection rate
+    rule_rates: Dict[str, float] = field(default_factory=dict)
+    null_rate: float = 0.0                   # nulls sprinkled over non-key columns
+    dup_key_rate: float = 0.0                # rows whose customerID repeats an earlier one
+    ratio_violation_rate: float = 0.01       # RATIO_CHECKS breaches
+    levels: Mapping[str, List[str]] = field(default_factory=lambda: dict(TELCO_LEVELS))
+    logic_rules: Mapping[str, Any] = field(default_factory=dict)
+    ratio_checks: Mapping[str, Any] = field(default_factory=dict)
+    target_column: str = "Churn_flag"
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], **overrides: Any) -> "SynthSpec":
+        levels = dict(TELCO_LEVELS)
+        for k, v in (config.get("EXPECTED_LEVELS") or {}).items():
+            if k in levels and isinstance(v, (list, tuple)):
+                levels[k] = [str(x) for x in v]
+        rules = dict(config.get("LOGIC_RULES") or {})
+        spec = cls(
+            levels=levels,
+            logic_rules={g: dict(rules.get(g) or {}) for g in ("MUTUAL_EXCLUSION", "DEPENDENCIES")},
+            ratio_checks=dict(rules.get("RATIO_CHECKS") or {}),
+            target_column=str((config.get("TARGET") or {}).get("COLUMN", "Churn_flag")),
+        )
+        for k, v in overrides.items():
+            setattr(spec, k, v)
+        return spec
+
+
+def chunk_seed(seed: int, chunk_index: int) -> int:
+    h = hashlib.sha256(f"{seed}:{chunk_index}".encode()).digest()
+    return int.from_bytes(h[:8], "little") & 0x7FFF_FFFF_FFFF_FFFF
+
+
+# ---------------------------------------------------------------------------
+# Clean base rows
+# ---------------------------------------------------------------------------
+def _base(n: int, start: int, rng: np.random.Generator, spec: SynthSpec) -> pd.DataFrame:
+    lv = spec.levels
+    pick = lambda col, p=None: rng.choice(np.array(lv[col], dtype=object), n, p=p)  # noqa: E731
+
+    contract = pick("Contract", [0.55, 0.21, 0.24])
+    m2m = contract == "Month-to-month"
+    tenure = np.where(m2m, rng.integers(0, 73, n), rng.integers(1, 73, n))
+
+    phone = pick("PhoneService", [0.9, 0.1])
+    multi = np.where(phone == "Yes", rng.choice(["Yes", "No"], n), "No phone service").astype(object)
+
+    internet = pick("InternetService", [0.34, 0.44, 0.22])
+    no_net = internet == "No"
+    addons = {a: np.where(no_net, "No internet service", rng.choice(["Yes", "No"], n)).astype(object) for a in ADDONS}
+
+    monthly = np.where(
+        no_net, rng.uniform(18.25, 26.0, n),
+        np.where(internet == "Fiber optic", rng.uniform(68.0, 118.75, n), rng.uniform(23.0, 90.0, n)),
+    ).round(2)
+    total = (monthly * tenure * rng.uniform(0.97, 1.03, n)).round(2)
+    total = np.where(tenure == 0, np.nan, total)
+
+    logit = -1.0 + 1.2 * m2m - 0.04 * tenure + 0.6 * (internet == "Fiber optic")
+    churn = np.where(rng.random(n) < 1 / (1 + np.exp(-logit)), "Yes", "No").astype(object)
+
+    df = pd.DataFrame({
+        "customerID": [f"{i:07d}-SYNTH" for i in range(start, start + n)],
+        "gender": pick("gender"),
+        "SeniorCitizen": (rng.random(n) < 0.16).astype("int64"),
+        "Partner": pick("Partner"),
+        "Dependents": pick("Dependents", [0.3, 0.7]),
+        "tenure": tenure.astype("int64"),
+        "PhoneService": phone,
+        "MultipleLines": multi,
+        "InternetService": internet,
+        **addons,
+        "Contract": contract,
+        "PaperlessBilling": pick("PaperlessBilling", [0.59, 0.41]),
+        "PaymentMethod": pick("PaymentMethod"),
+        "MonthlyCharges": monthly,
+        "TotalCharges": total,
+        "Churn": churn,
+    })
+    return df[TELCO_COLUMNS]
+
+
+def _pad_columns(df: pd.DataFrame, n_cols: int, rng: np.random.Generator) -> pd.DataFrame:
+    extra = n_cols - df.shape[1]
+    if extra <= 0:
+        return df
+    n = len(df)
+    n_cat = extra // 5
+    n_num = extra - n_cat
+    cols: Dict[str, Any] = {}
+    if n_num:
+        X = rng.standard_normal((n, n_num), dtype=np.float32)
+        cols.update({f"num_{j:04d}": X[:, j] for j in range(n_num)})
+    for j in range(n_cat):
+        k = int(rng.integers(2, 12))
+        codes = rng.integers(0, k, n)
+        cols[f"cat_{j:04d}"] = pd.Categorical.from_codes(codes, [f"L{i}" for i in range(k)])
+    return pd.concat([df, pd.DataFrame(cols, index=df.index)], axis=1)
+
+
+# ---------------------------------------------------------------------------
+# Rule-driven violation injection
+# ---------------------------------------------------------------------------
+def _const(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        return -node.operand.value
+    raise ValueError("not a constant")
+
+
+def _other_level(spec: SynthSpec, col: str, not_value: Any) -> Any:
+    for v in spec.levels.get(col, []):
+        if v != not_value:
+            return v
+    return f"__not_{not_value}__"
+
+
+def _satisfy(node: ast.AST, want: bool, spec: SynthSpec, out: Dict[str, Any]) -> None:
+    """Collect column assignments that make `node` evaluate to `want`."""
+    if isinstance(node, ast.Expression):
+        return _satisfy(node.body, want, spec, out)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _satisfy(node.operand, not want, spec, out)
+    if isinstance(node, ast.BoolOp):
+        conj = isinstance(node.op, ast.And)
+        if conj == want:                 # and->True / or->False: every term
+            for v in node.values:
+                _satisfy(v, want, spec, out)
+        else:                            # and->False / or->True: one term is enough
+            _satisfy(node.values[0], want, spec, out)
+        return
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
+        col, meth = node.func.value.id, node.func.attr
+        is_null_true = (meth in ("isna", "isnull")) == want
+        out[col] = np.nan if is_null_true else out.get(col, 1)
+        return
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.left, ast.Name):
+        col, op, c = node.left.id, node.ops[0], _const(node.comparators[0])
+        eq = isinstance(op, ast.Eq) == want if isinstance(op, (ast.Eq, ast.NotEq)) else None
+        if eq is not None:
+            out[col] = c if eq else _other_level(spec, col, c)
+            return
+        gt = isinstance(op, (ast.Gt, ast.GtE))
+        strict = isinstance(op, (ast.Gt, ast.Lt))
+        if want:
+            out[col] = c + 1 if gt else c - 1
+        else:
+            out[col] = (c if strict else c - 1) if gt else (c if strict else c + 1)
+        return
+    raise ValueError(f"unsupported rule expression: {ast.unparse(node)}")
+
+
+def _eval(node: ast.AST, df: pd.DataFrame) -> pd.Series:
+    """Evaluate a rule expression over `df` (same subset of syntax as `_satisfy`)."""
+    if isinstance(node, ast.Expression):
+        return _eval(node.body, df)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ~_eval(node.operand, df)
+    if isinstance(node, ast.BoolOp):
+        parts = [_eval(v, df) for v in node.values]
+        out = parts[0]
+        for p in parts[1:]:
+            out = (out & p) if isinstance(node.op, ast.And) else (out | p)
+        return out
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        s = df[node.func.value.id]
+        return s.isna() if node.func.attr in ("isna", "isnull") else s.notna()
+    if isinstance(node, ast.Compare):
+        s, c = df[node.left.id], _const(node.comparators[0])
+        op = node.ops[0]
+        return {
+            ast.Eq: lambda: s == c, ast.NotEq: lambda: s != c, ast.Gt: lambda: s > c,
+            ast.GtE: lambda: s >= c, ast.Lt: lambda: s < c, ast.LtE: lambda: s <= c,
+        }[type(op)]().fillna(False).astype(bool)
+    raise ValueError(f"unsupported rule expression: {ast.unparse(node)}")
+
+
+def _rule_trees(spec: SynthSpec) -> Dict[str, ast.AST]:
+    """{rule name -> AST of its violation condition}."""
+    out: Dict[str, ast.AST] = {}
+    for name, r in (spec.logic_rules.get("MUTUAL_EXCLUSION") or {}).items():
+        if r.get("violation_expr"):
+            out[name] = ast.parse(" ".join(str(r["violation_expr"]).split()), mode="eval")
+    for name, r in (spec.logic_rules.get("DEPENDENCIES") or {}).items():
+        if r.get("if") and r.get("then"):
+            out[name] = ast.parse(f"({r['if']}) and not ({r['then']})", mode="eval")
+    return out
+
+
+def inject_violations(df: pd.DataFrame, spec: SynthSpec, rng: np.random.Generator) -> pd.DataFrame:
+    n = len(df)
+    for name, tree in _rule_trees(spec).items():
+        rate = float(spec.rule_rates.get(name, spec.violation_rate))
+        k = int(rng.binomial(n, rate)) if rate > 0 else 0
+        if not k:
+            continue
+        assign: Dict[str, Any] = {}
+        try:
+            _satisfy(tree, True, spec, assign)
+        except ValueError:
+            continue
+        rows = rng.choice(n, k, replace=False)
+        for col, val in assign.items():
+            if col in df.columns:
+                if isinstance(val, float) and np.isnan(val) and df[col].dtype.kind in "iu":
+                    df[col] = df[col].astype("float64")
+                df.iloc[rows, df.columns.get_loc(col)] = val
+    for r in spec.ratio_checks.values():
+        lhs = r.get("lhs")
+        if lhs not in df.columns or spec.ratio_violation_rate <= 0:
+            continue
+        k = int(rng.binomial(n, spec.ratio_violation_rate))
+        rows = rng.choice(n, k, replace=False)
+        factor = 1.0 + 3.0 * float(r.get("max_rel_error", 0.2))
+        j = df.columns.get_loc(lhs)
+        df.iloc[rows, j] = (df.iloc[rows, j].to_numpy(dtype="float64") * factor + float(r.get("max_abs_error", 0))).round(2)
+    return df
+
+
+def rule_violation_rates(df: pd.DataFrame, spec: SynthSpec) -> pd.Series:
+    """Realised violation rate per rule (evaluated with the same expressions)."""
+    return pd.Series({name: float(_eval(t, df).mean()) for name, t in _rule_trees(spec).items()}, name="violation_rate")
+
+
+# ---------------------------------------------------------------------------
+# Public entry points
+# ---------------------------------------------------------------------------
+def generate_chunk(spec: SynthSpec, start: int, n: int, chunk_index: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(chunk_seed(spec.seed, chunk_index))
+    df = _base(n, start, rng, spec)
+    df = inject_violations(df, spec, rng)
+    if spec.dup_key_rate > 0 and n > 1:
+        k = int(rng.binomial(n, spec.dup_key_rate))
+        dst = rng.choice(np.arange(1, n), min(k, n - 1), replace=False)
+        df.iloc[dst, 0] = df["customerID"].to_numpy()[rng.integers(0, dst)]
+    if spec.null_rate > 0:
+        for c in df.columns[1:]:
+            mask = rng.random(n) < spec.null_rate
+            if mask.any():
+                if df[c].dtype.kind in "iu":
+                    df[c] = df[c].astype("Int64")
+                df.loc[mask, c] = None
+    df[spec.target_column] = (df["Churn"] == "Yes").astype("int64")
+    return _pad_columns(df, spec.n_cols + 1, rng)      # +1: target flag is not a schema column
+
+
+def iter_chunks(spec: SynthSpec, chunk_rows: int = 1_000_000) -> Iterator[pd.DataFrame]:
+    """Deterministic stream of frames totalling spec.n_rows rows."""
+    for i, start in enumerate(range(0, spec.n_rows, chunk_rows)):
+        yield generate_chunk(spec, start, min(chunk_rows, spec.n_rows - start), i)
+
+
+def generate(spec: SynthSpec, chunk_rows: int = 1_000_000) -> pd.DataFrame:
+    return pd.concat(list(iter_chunks(spec, chunk_rows)), ignore_index=True)
+
+
+def write_parquet(spec: SynthSpec, path: str | Path, chunk_rows: int = 1_000_000) -> Path:
+    """Stream to one Parquet file (one row group per chunk)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = None
+    try:
+        for chunk in iter_chunks(spec, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def load_duckdb(spec: SynthSpec, con: Any, table: str, chunk_rows: int = 1_000_000) -> int:
+    """Create or replace `table` in a DuckDB connection, chunk by chunk."""
+    n = 0
+    for i, chunk in enumerate(iter_chunks(spec, chunk_rows)):
+        con.register("_synth_chunk", chunk)
+        if i == 0:
+            con.execute(f"create or replace table {table} as select * from _synth_chunk")
+        else:
+            con.execute(f"insert into {table} select * from _synth_chunk")
+        con.unregister("_synth_chunk")
+        n += len(chunk)
+    return n
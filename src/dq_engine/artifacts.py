@@ -0,0 +1,473 @@
+# src/dq_engine/artifacts.py
+"""
+Artifact layer: section reports written once as zstd Parquet, described by a
+manifest at write time, read back from an in-process Arrow cache.
+
+- `write_artifact(df, ".../outlier_report_iqr_z.csv")` writes
+  `outlier_report_iqr_z.parquet` (ARTIFACT_STORE.FORMAT) and, with
+  CSV_MIRROR, the CSV next to it for humans / spreadsheets. Callers keep
+  their existing `.csv` names; the Parquet file is the source of truth.
+- The Parquet bytes are hashed (sha256) while still in memory, and the size,
+  row / column counts, Arrow schema and hash go into the directory's
+  `.artifact_manifest.json` together with the file's (size, mtime_ns).
+- Reads (`read_artifact` / `read_artifact_table`) resolve `x.csv` to
+  `x.parquet` via the manifest. If the file's stat still matches, the
+  recorded hash is trusted (no re-hash) and used as the cache key. Repeated
+  reads of an unchanged artifact, in any section, then return the same
+  memory-mapped Arrow table; `read_artifact` only pays `to_pandas`.
+  Artifacts without a manifest entry (legacy CSVs, files written by
+  other tools) fall back to `pd.read_csv`.
+- `artifact_manifest(specs)` builds the 2.3.19 / 2.4.15 manifest rows from
+  the recorded entries. It re-hashes only files with no entry or whose stat
+  changed (JSON sidecars, files edited by hand), and records those hashes
+  for the next run.
+- Manifest updates are lock-protected within a process and written
+  atomically. If another process overwrites a concurrent entry, that entry
+  is simply re-hashed on its next read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from dq_engine.out_of_core import parse_bytes
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+MANIFEST_NAME = ".artifact_manifest.json"
+ARTIFACT_MANIFEST_COLUMNS = [
+    "artifact_name",
+    "section",
+    "stage",
+    "path",
+    "format",  # parquet | csv | json | ...
+    "exists",
+    "size_bytes",
+    "n_rows",  # tables written through write_artifact; NaN otherwise
+    "n_cols",
+    "sha256",
+    "last_modified",
+    "csv_mirror",
+]
+
+_lock = threading.RLock()
+# dir → (manifest mtime_ns, entries)
+_manifests: dict[Path, tuple[int, dict[str, dict[str, Any]]]] = {}
+
+
+@dataclass(frozen=True)
+class ArtifactCfg:
+    format: str = "parquet"  # parquet | csv (csv = legacy behaviour, no Parquet file)
+    csv_mirror: bool = True
+    compression: str = "zstd"
+    compression_level: int | None = 3
+    cache_bytes: int = 512 << 20
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> ArtifactCfg:
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        fmt = str(get("ARTIFACT_STORE.FORMAT", "parquet")).lower()
+        if fmt not in ("parquet", "csv"):
+            raise ValueError(f"ARTIFACT_STORE.FORMAT must be parquet or csv, got {fmt!r}")
+        level = get("ARTIFACT_STORE.COMPRESSION_LEVEL", 3)
+        return cls(
+            format=fmt,
+            csv_mirror=bool(get("ARTIFACT_STORE.CSV_MIRROR", True)),
+            compression=str(get("ARTIFACT_STORE.COMPRESSION", "zstd")),
+            compression_level=int(level) if level is not None else None,
+            cache_bytes=parse_bytes(get("ARTIFACT_STORE.CACHE_BYTES", "512MB")) or 0,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+def _now() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def load_manifest(directory: str | Path) -> dict[str, dict[str, Any]]:
+    """{file name: entry} for `directory`; parsed once per manifest version."""
+    directory = Path(directory)
+    p = directory / MANIFEST_NAME
+    key = _stat_key(p)
+    with _lock:
+        hit = _manifests.get(directory)
+        if key is None:
+            return {}
+        if hit is not None and hit[0] == key[1]:
+            return hit[1]
+        try:
+            entries = json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        _manifests[directory] = (key[1], entries)
+        return entries
+
+
+def _record(directory: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Merge `entries` into the on-disk manifest (re-read first, atomic replace)."""
+    with _lock:
+        man = dict(load_manifest(directory))
+        man.update(entries)
+        p = directory / MANIFEST_NAME
+        tmp = p.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(dict(sorted(man.items())), indent=1, default=str), encoding="utf-8"
+        )
+        os.replace(tmp, p)
+        _manifests[directory] = (p.stat().st_mtime_ns, man)
+
+
+def file_sha256(path: str | Path, chunk_bytes: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_bytes), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _fresh(path: Path, entry: dict[str, Any] | None) -> bool:
+    key = _stat_key(path)
+    return (
+        bool(entry)
+        and key is not None
+        and [entry.get("size_bytes"), entry.get("mtime_ns")] == list(key)
+    )
+
+
+def file_entry(path: str | Path) -> dict[str, Any] | None:
+    """Manifest entry for any file; hashes it only when there is no entry or its stat changed."""
+    path = Path(path)
+    man = load_manifest(path.parent)
+    entry = man.get(path.name)
+    if _fresh(path, entry):
+        return entry
+    key = _stat_key(path)
+    if key is None:
+        return None
+    with span("artifacts.rehash", path=path.name, bytes_read=key[0]):
+        entry = {
+            "file": path.name,
+            "format": path.suffix.lstrip(".").lower(),
+            "size_bytes": key[0],
+            "mtime_ns": key[1],
+            "sha256": file_sha256(path),
+            "csv": (entry or {}).get("csv"),
+        }
+    if entry["format"] == "parquet":
+        import pyarrow.parquet as pq
+
+        md = pq.read_metadata(path)
+        entry.update(
+            n_rows=md.num_rows,
+            n_cols=md.num_columns,
+            schema=[[f.name, str(f.type)] for f in md.schema.to_arrow_schema()],
+        )
+    _record(path.parent, {path.name: entry})
+    return entry
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+class _ArrowCache:
+    """LRU of Arrow tables keyed by content hash, bounded by ARTIFACT_STORE.CACHE_BYTES."""
+
+    def __init__(self) -> None:
+        self._tables: OrderedDict[str, Any] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str) -> Any:
+        with _lock:
+            t = self._tables.get(digest)
+            if t is None:
+                self.misses += 1
+                return None
+            self._tables.move_to_end(digest)
+            self.hits += 1
+            return t
+
+    def put(self, digest: str, table: Any, limit: int) -> None:
+        nbytes = int(table.nbytes)
+        if nbytes > limit:
+            return
+        with _lock:
+            if digest in self._tables:
+                return
+            self._tables[digest] = table
+            self._bytes += nbytes
+            while self._bytes > limit and self._tables:
+                _, old = self._tables.popitem(last=False)
+                self._bytes -= int(old.nbytes)
+
+    def clear(self) -> None:
+        with _lock:
+            self._tables.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+
+_cache = _ArrowCache()
+
+
+def clear_artifact_cache() -> None:
+    _cache.clear()
+
+
+def artifact_cache_stats() -> dict[str, int]:
+    return {
+        "tables": len(_cache._tables),
+        "bytes": _cache._bytes,
+        "hits": _cache.hits,
+        "misses": _cache.misses,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Write
+# ---------------------------------------------------------------------------
+def _arrow_cell(x: Any) -> Any:
+    if x is None or isinstance(x, str) or (isinstance(x, float) and x != x):
+        return x
+    return json.dumps(x, default=str) if isinstance(x, (list, dict)) else str(x)
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Mixed object columns → JSON / str cells (same rule as append_sec2's `detail` column)."""
+    out = df.copy()
+    for c in out.select_dtypes(include="object").columns:
+        out[c] = out[c].map(_arrow_cell)
+    return out
+
+
+def _to_arrow(df: pd.DataFrame) -> Any:
+    import pyarrow as pa
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+
+
+def _write_bytes(path: Path, payload: Any) -> None:
+    tmp = path.with_suffix(f".tmp{path.suffix}")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_suffix(".tmp.csv")
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def primary_path(path: str | Path, cfg: ArtifactCfg | None = None) -> Path:
+    """`x.csv` / `x` → the file write_artifact writes (`x.parquet` unless FORMAT=csv)."""
+    path = Path(path)
+    cfg = cfg or ArtifactCfg.from_config()
+    return path.with_suffix(".csv" if cfg.format == "csv" else ".parquet")
+
+
+@traced("artifacts.write_artifact")
+def write_artifact(
+    df: pd.DataFrame,
+    path: str | Path,
+    *,
+    cfg: ArtifactCfg | None = None,
+    csv_mirror: bool | None = None,
+) -> dict[str, Any]:
+    """
+    Atomically write `df` as the artifact for `path` and record its manifest entry.
+
+    Returns the entry: {file, format, size_bytes, mtime_ns, n_rows, n_cols, schema, sha256,
+    csv, written_utc}.
+    """
+    cfg = cfg or ArtifactCfg.from_config()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mirror = cfg.csv_mirror if csv_mirror is None else csv_mirror
+
+    if cfg.format == "csv":
+        target = path.with_suffix(".csv")
+        _write_csv(df, target)
+        stale = path.with_suffix(".parquet")
+        if stale.name in load_manifest(path.parent):
+            stale.unlink(missing_ok=True)  # reads would otherwise prefer it
+        entry = file_entry(target)
+        return {**entry, "n_rows": len(df), "n_cols": df.shape[1]} if entry else {}
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    target = path.with_suffix(".parquet")
+    with span("artifacts.write_parquet", path=target.name, rows_in=len(df)) as sp:
+        table = _to_arrow(df)
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            table, sink, compression=cfg.compression, compression_level=cfg.compression_level
+        )
+        buf = sink.getvalue()
+        digest = hashlib.sha256(memoryview(buf)).hexdigest()
+        _write_bytes(target, memoryview(buf))
+        size, mtime_ns = _stat_key(target)
+        sp.set(bytes_written=size)
+    csv_name = None
+    if mirror:
+        csv_path = path.with_suffix(".csv")
+        with span("artifacts.write_csv", path=csv_path.name, rows_in=len(df)):
+            _write_csv(df, csv_path)
+        csv_name = csv_path.name
+    entry = {
+        "file": target.name,
+        "format": "parquet",
+        "size_bytes": size,
+        "mtime_ns": mtime_ns,
+        "n_rows": table.num_rows,
+        "n_cols": table.num_columns,
+        "schema": [[f.name, str(f.type)] for f in table.schema],
+        "sha256": digest,
+        "csv": csv_name,
+        "written_utc": _now(),
+    }
+    _record(target.parent, {target.name: entry})
+    _cache.put(digest, table, cfg.cache_bytes)  # write-through: the next section's read is a hit
+    return entry
+
+
+# ---------------------------------------------------------------------------
+# Read
+# ---------------------------------------------------------------------------
+def resolve_artifact(path: str | Path) -> Path | None:
+    """The file a read of `path` uses: its Parquet artifact when present, else `path` itself."""
+    path = Path(path)
+    pq_path = path.with_suffix(".parquet")
+    if pq_path.exists():
+        return pq_path
+    return path if path.exists() else None
+
+
+def artifact_exists(path: str | Path) -> bool:
+    return resolve_artifact(path) is not None
+
+
+@traced("artifacts.read_artifact_table")
+def read_artifact_table(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    *,
+    cfg: ArtifactCfg | None = None,
+) -> Any:
+    """Arrow table for an artifact; missing `columns` are skipped. Raises FileNotFoundError."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    src = resolve_artifact(path)
+    if src is None:
+        raise FileNotFoundError(
+            f"No artifact at {path} (or {Path(path).with_suffix('.parquet').name})"
+        )
+    if src.suffix.lower() != ".parquet":
+        with span("artifacts.read_csv", path=src.name) as sp:
+            keep = set(columns) if columns is not None else None
+            df = pd.read_csv(
+                src, usecols=(lambda c: c in keep) if keep is not None else None, low_memory=False
+            )
+            sp.set(rows_out=len(df), bytes_read=src.stat().st_size)
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    cfg = cfg or ArtifactCfg.from_config()
+    entry = file_entry(src)  # recorded hash unless the file changed
+    table = _cache.get(entry["sha256"])
+    if table is None:
+        with span("artifacts.read_parquet", path=src.name) as sp:
+            table = pq.read_table(src, memory_map=True)
+            sp.set(rows_out=table.num_rows, bytes_read=entry["size_bytes"])
+        _cache.put(entry["sha256"], table, cfg.cache_bytes)
+    if columns is not None:
+        keep = set(columns)
+        # file order, like usecols
+        table = table.select([c for c in table.column_names if c in keep])
+    return table
+
+
+def read_artifact(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    *,
+    cfg: ArtifactCfg | None = None,
+) -> pd.DataFrame:
+    """DataFrame for an artifact (Parquet via the cache, legacy CSVs via read_csv)."""
+    return read_artifact_table(path, columns, cfg=cfg).to_pandas()
+
+
+# ---------------------------------------------------------------------------
+# 2.3.19 / 2.4.15 manifests
+# ---------------------------------------------------------------------------
+@traced("artifacts.artifact_manifest")
+def artifact_manifest(specs: Iterable[tuple[str, str | Path, str, str]]) -> pd.DataFrame:
+    """
+    specs: (artifact_name, path, section, stage) → ARTIFACT_MANIFEST_COLUMNS.
+
+    Table artifacts report their Parquet file (and CSV mirror); hashes are the ones
+    recorded at write time unless the file changed since.
+    """
+    rows: list[dict[str, Any]] = []
+    n_rehash = 0
+    for name, path, section, stage in specs:
+        src = resolve_artifact(path)
+        row: dict[str, Any] = {
+            "artifact_name": name,
+            "section": section,
+            "stage": stage,
+            "path": str(src or path),
+            "exists": src is not None,
+        }
+        if src is not None:
+            before = load_manifest(src.parent).get(src.name)
+            n_rehash += not _fresh(src, before)
+            e = file_entry(src) or {}
+            mirror = e.get("csv")
+            row.update(
+                {
+                    "format": e.get("format"),
+                    "size_bytes": e.get("size_bytes"),
+                    "n_rows": e.get("n_rows"),
+                    "n_cols": e.get("n_cols"),
+                    "sha256": e.get("sha256"),
+                    "last_modified": datetime.fromtimestamp(e["mtime_ns"] / 1e9).isoformat(),
+                    "csv_mirror": (
+                        str(src.parent / mirror)
+                        if mirror and (src.parent / mirror).exists()
+                        else ""
+                    ),
+                }
+            )
+        rows.append(row)
+    out = pd.DataFrame(rows, columns=ARTIFACT_MANIFEST_COLUMNS)
+    print(
+        f"📁 Artifact manifest: {int(out['exists'].sum())}/{len(out)} present, {n_rehash} re-hashed"
+    )
+    return out
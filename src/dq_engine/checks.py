@@ -0,0 +1,101 @@
+# src/dq_engine/checks.py
+"""
+Warehouse check results (one row per check in DQ_RESULTS).
+
+Field order matches the leading DQ_RESULTS columns; `ResultsStore.append`
+adds run_ts / run_date and inserts positionally.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    run_id: str
+    dataset_id: str
+    check_id: str
+    check_type: str
+    severity: str
+    status: str                    # PASS | WARN | FAIL
+    table_name: str
+    column_name: Optional[str]
+    metric_name: str
+    metric_value: float
+    threshold: Optional[float]
+    details_json: str
+
+
+def _status(ok: bool, severity: str) -> str:
+    if ok:
+        return "PASS"
+    return "FAIL" if str(severity).lower() == "fail" else "WARN"
+
+
+def _details(d: Dict[str, Any]) -> str:
+    return json.dumps(d, default=str)
+
+
+def accepted_values(
+    run_id: str,
+    dataset_id: str,
+    check_id: str,
+    severity: str,
+    table: str,
+    column: str,
+    allowed: Sequence[Any],
+    df: pd.DataFrame,
+) -> CheckResult:
+    """Share of non-null values of `column` outside `allowed` (0 passes)."""
+    s = df[column] if column in df.columns else df.iloc[:, 0]
+    s = s.dropna()
+    allowed_str = {str(v) for v in allowed}
+    bad = ~s.astype(str).isin(allowed_str)
+    n_bad = int(bad.sum())
+    pct_bad = float(n_bad / len(s)) if len(s) else 0.0
+    examples = s[bad].astype(str).value_counts().head(10).to_dict()
+    return CheckResult(
+        run_id=run_id,
+        dataset_id=dataset_id,
+        check_id=check_id,
+        check_type="accepted_values",
+        severity=severity,
+        status=_status(n_bad == 0, severity),
+        table_name=table,
+        column_name=column,
+        metric_name="pct_not_accepted",
+        metric_value=pct_bad,
+        threshold=0.0,
+        details_json=_details({"n_checked": int(len(s)), "n_not_accepted": n_bad, "examples": examples,
+                               "allowed": list(allowed)}),
+    )
+
+
+def row_count(
+    run_id: str,
+    dataset_id: str,
+    check_id: str,
+    severity: str,
+    table: str,
+    n: int,
+    min_rows: int = 1,
+) -> CheckResult:
+    """Table has at least `min_rows` rows."""
+    return CheckResult(
+        run_id=run_id,
+        dataset_id=dataset_id,
+        check_id=check_id,
+        check_type="row_count",
+        severity=severity,
+        status=_status(int(n) >= int(min_rows), severity),
+        table_name=table,
+        column_name=None,
+        metric_name="row_count",
+        metric_value=float(n),
+        threshold=float(min_rows),
+        details_json=_details({"n_rows": int(n)}),
+    )
@@ -0,0 +1,95 @@
+# src/dq_engine/cli.py
+"""
+`dq` console script (pyproject `[project.scripts]`).
+
+- `dq run CONFIG`: one pipeline run (pipeline.run).
+- `dq fanout CONFIG...`: every dataset of one or more configs / globs (fanout.run_fanout).
+- `dq watch CONFIG`: poll raw files and tables, rerunning only the affected checks (watch.watch).
+- `dq serve CONFIG`: watch, plus the HTTP status endpoint (watch.serve).
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+from dataclasses import replace
+
+
+def _watch_cfg(args: argparse.Namespace):
+    from dq_engine.config.config import load_config
+    from dq_engine.watch import WatchCfg
+
+    cfg = WatchCfg.from_config(load_config(args.config))
+    overrides = {
+        k: v
+        for k, v in (
+            ("interval_s", args.interval),
+            ("raw_dir", args.raw_dir),
+            ("run_dir", args.run_dir),
+        )
+        if v is not None
+    }
+    if args.no_initial_run:
+        overrides["initial_run"] = False
+    return replace(cfg, **overrides)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="dq", description="dq_engine data quality checks")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    r = sub.add_parser("run", help="run dbt + checks once")
+    r.add_argument("config")
+    r.add_argument("--skip-dbt", action="store_true")
+    r.add_argument("--run-dir")
+
+    f = sub.add_parser("fanout", help="run every dataset of one or more configs")
+    f.add_argument("configs", nargs="+")
+    f.add_argument("--skip-dbt", action="store_true")
+    f.add_argument("--run-dir")
+
+    for name, text in (
+        ("watch", "rerun affected checks when raw files or tables change"),
+        ("serve", "watch + HTTP status endpoint"),
+    ):
+        w = sub.add_parser(name, help=text)
+        w.add_argument("config")
+        w.add_argument("--interval", type=float, help="poll interval in seconds (watch.interval_s)")
+        w.add_argument(
+            "--raw-dir", help="raw files to watch (watch.raw_dir, default PATHS.RAW_DATA_DIR)"
+        )
+        w.add_argument("--run-dir", help="write each cycle's dq_results.csv / .json here")
+        w.add_argument(
+            "--no-initial-run",
+            action="store_true",
+            help="record fingerprints first, run on change only",
+        )
+        if name == "watch":
+            w.add_argument("--once", action="store_true", help="single poll, then exit")
+        else:
+            w.add_argument("--host")
+            w.add_argument("--port", type=int)
+
+    args = p.parse_args(argv)
+    if args.command == "run":
+        from dq_engine.pipeline import run
+
+        print(run(args.config, skip_dbt=args.skip_dbt, run_dir=args.run_dir))
+    elif args.command == "fanout":
+        from dq_engine.fanout import run_fanout
+
+        summary = run_fanout(args.configs, skip_dbt=args.skip_dbt, run_dir=args.run_dir)
+        return int((summary["status"] == "failed").any())
+    elif args.command == "watch":
+        from dq_engine.watch import watch
+
+        watch(args.config, cfg=_watch_cfg(args), once=args.once)
+    else:
+        from dq_engine.watch import serve
+
+        serve(args.config, cfg=_watch_cfg(args), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
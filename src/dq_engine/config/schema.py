@@ -0,0 +1,233 @@
+# src/dq_engine/config/schema.py
+"""
+Typed views of the config sections the engine reads most.
+
+Each section is a frozen dataclass whose lower-case fields map to the
+upper-case YAML keys (`z_threshold` <- TEMPORAL.Z_THRESHOLD). Keys not listed
+here are allowed (the YAML carries plenty of notebook-only knobs); listed keys
+are type-checked when the config is bound, so a bad value fails at load time
+instead of deep inside a section.
+"""
+from __future__ import annotations
+
+import dataclasses
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Type
+
+
+class ConfigError(ValueError):
+    """Raised when a bound config section does not match its schema."""
+
+
+@dataclass(frozen=True)
+class PathsSection:
+    runs_enabled: bool = True
+    runs_write_latest: bool = True
+    raw_data_dir: str = "data/_raw/"
+    processed_dir: str = "data/processed/"
+    resources_dir: str = "resources/"
+    artifacts: str = "resources/artifacts/"
+    reports: str = "resources/reports/"
+    figures: str = "resources/figures/"
+    models: str = "resources/models/"
+    outputs: str = "outputs/"
+    runs_dir: str = "runs/"
+    latest_dir: str = "resources/latest/"
+
+
+@dataclass(frozen=True)
+class TargetSection:
+    column: str = "Churn_flag"
+    raw_column: Optional[str] = None
+    positive_class: Optional[str] = None
+    negative_class: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DriftSection:
+    baseline_numeric_profile: Optional[str] = None
+    psi_warn: float = 0.10
+    psi_fail: float = 0.25
+    ks_warn: float = 0.10
+    ks_fail: float = 0.20
+
+
+@dataclass(frozen=True)
+class TemporalSection:
+    future_grace_days: int = 0
+    min_date: Optional[str] = None
+    time_column: Optional[str] = None
+    time_bucket: str = "M"
+    z_threshold: float = 3.0
+    z_window: Optional[int] = None
+    min_history_buckets: int = 3
+    corr_window: int = 3
+    corr_delta_threshold: float = 0.3
+    corr_min_n: int = 10
+    state_file: Optional[str] = None
+    state_refresh_buckets: int = 1
+    max_violation_rows: int = 1000
+    intervals: Dict[str, Any] = field(default_factory=dict)
+    pseudo_time: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class IntegrityIndexSection:
+    run_id: Optional[str] = None
+    weights: Dict[str, float] = field(default_factory=dict)
+    contract_penalties: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class QualityBandsSection:
+    enabled: bool = True
+    boundaries: Dict[str, float] = field(default_factory=dict)
+    labels: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class MulticollinearitySection:
+    enabled: bool = True
+    target_columns: Any = "numeric"          # "numeric" | list of columns
+    max_vif_threshold: float = 10.0
+    min_rows: int = 30
+    exclude_columns: List[str] = field(default_factory=list)
+    output_file: str = "vif_report.csv"
+
+
+@dataclass(frozen=True)
+class NumericCorrMatrixSection:
+    enabled: bool = True
+    df_source: Optional[str] = None
+    min_numeric_features: int = 2
+    methods: List[str] = field(default_factory=lambda: ["pearson", "spearman", "kendall"])
+    multicollinearity_threshold: float = 0.85
+    block_rows: int = 65_536
+    n_jobs: int = 1
+    output_matrix_file: str = "numeric_correlation_matrix.csv"
+    output_heatmap_file: str = "corr_heatmap.png"
+
+
+@dataclass(frozen=True)
+class MultipleTestingSection:
+    enabled: bool = True
+    method: str = "fdr_bh"
+    alpha: float = 0.05
+    max_tests: int = 5000
+    output_file: str = "multiple_testing_corrections.csv"
+    master_file: str = "inferential_statistics_master.csv"
+    sources: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class SamplingSection:
+    enabled: bool = False
+    method: str = "stratified"
+    max_rows: int = 100_000
+    fraction: Optional[float] = None
+    strata: List[str] = field(default_factory=list)
+    min_per_stratum: int = 50
+    random_seed: int = 42
+    confidence: float = 0.95
+    n_bootstraps: int = 200
+    escalate_margin: float = 0.10
+    pushdown: bool = True
+
+
+# Top-level YAML key -> typed section
+SECTION_SCHEMAS: Dict[str, Type[Any]] = {
+    "PATHS": PathsSection,
+    "TARGET": TargetSection,
+    "DRIFT": DriftSection,
+    "TEMPORAL": TemporalSection,
+    "INTEGRITY_INDEX": IntegrityIndexSection,
+    "QUALITY_BANDS": QualityBandsSection,
+    "MULTICOLLINEARITY": MulticollinearitySection,
+    "NUMERIC_CORR_MATRIX": NumericCorrMatrixSection,
+    "MULTIPLE_TESTING": MultipleTestingSection,
+    "SAMPLING": SamplingSection,
+}
+
+
+def _check(value: Any, tp: Any, path: str) -> Any:
+    """Validate (and lightly coerce int→float) `value` against annotation `tp`."""
+    if tp is Any:
+        return value
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if origin is typing.Union:
+        if value is None and type(None) in args:
+            return None
+        errors = []
+        for a in args:
+            if a is type(None):
+                continue
+            try:
+                return _check(value, a, path)
+            except ConfigError as e:
+                errors.append(str(e))
+        raise ConfigError(errors[0] if errors else f"{path}: invalid value {value!r}")
+
+    if origin in (list, List):
+        if not isinstance(value, (list, tuple)):
+            raise ConfigError(f"{path}: expected a list, got {type(value).__name__}")
+        inner = args[0] if args else Any
+        return [_check(v, inner, f"{path}[{i}]") for i, v in enumerate(value)]
+
+    if origin in (dict, Dict, Mapping):
+        if not isinstance(value, Mapping):
+            raise ConfigError(f"{path}: expected a mapping, got {type(value).__name__}")
+        vt = args[1] if len(args) == 2 else Any
+        return {k: _check(v, vt, f"{path}.{k}") for k, v in value.items()}
+
+    if tp is bool:
+        if not isinstance(value, bool):
+            raise ConfigError(f"{path}: expected bool, got {value!r}")
+        return value
+    if tp is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ConfigError(f"{path}: expected int, got {value!r}")
+        return value
+    if tp is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ConfigError(f"{path}: expected number, got {value!r}")
+        return float(value)
+    if tp is str:
+        if not isinstance(value, str):
+            raise ConfigError(f"{path}: expected str, got {value!r}")
+        return value
+    return value
+
+
+def build_section(name: str, raw: Any) -> Any:
+    """Instantiate the typed section for top-level key `name` from its raw mapping."""
+    cls = SECTION_SCHEMAS[name]
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, Mapping):
+        raise ConfigError(f"{name}: expected a mapping, got {type(raw).__name__}")
+    hints = typing.get_type_hints(cls)
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        key = f.name.upper()
+        if key in raw:
+            kwargs[f.name] = _check(raw[key], hints[f.name], f"{name}.{key}")
+    return cls(**kwargs)
+
+
+def validate_sections(cfg: Mapping[str, Any]) -> Dict[str, Any]:
+    """Build every typed section present in `cfg`; collects all errors into one ConfigError."""
+    out: Dict[str, Any] = {}
+    errors: List[str] = []
+    for name in SECTION_SCHEMAS:
+        if name not in cfg:
+            continue
+        try:
+            out[name] = build_section(name, cfg[name])
+        except ConfigError as e:
+            errors.append(str(e))
+    if errors:
+        raise ConfigError("❌ Config schema errors:\n" + "\n".join(f"   • {e}" for e in errors))
+    return out
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from typing import Optional
-import os, sys, shutil, subprocess, textwrap
+import sys, shutil, subprocess
 from pathlib import Path
 
+from dq_engine.dbt_runner import dbt_command
+
 def run_dbt(project_dir: Path, profiles_dir: Path, args=None):
     """
     Runs dbt via:
@@ -15,16 +17,9 @@ def run_dbt(project_dir: Path, profiles_dir: Path, args=None):
     project_dir = Path(project_dir).resolve()
     profiles_dir = Path(profiles_dir).resolve()
 
-    # Prefer dbt on PATH
+    cmd = dbt_command(args, project_dir, profiles_dir)
     dbt_exe = shutil.which("dbt")
-
-    if dbt_exe:
-        cmd = [dbt_exe] + args + ["--project-dir", str(project_dir), "--profiles-dir", str(profiles_dir)]
-        mode = f"dbt executable: {dbt_exe}"
-    else:
-        # Fallback: use the notebook's Python environment
-        cmd = [sys.executable, "-m", "dbt"] + args + ["--project-dir", str(project_dir), "--profiles-dir", str(profiles_dir)]
-        mode = f"python -m dbt (sys.executable: {sys.executable})"
+    mode = f"dbt executable: {dbt_exe}" if dbt_exe else f"python -m dbt (sys.executable: {sys.executable})"
 
     print("🧰 dbt run mode:", mode)
     print("▶️ cmd:", " ".join(cmd))
@@ -42,25 +37,18 @@ def run_dbt(project_dir: Path, profiles_dir: Path, args=None):
 
     return p
 
-# --- Diagnostic prints before running ---
-print("PYTHON:", sys.executable)
-print("DBT on PATH?:", shutil.which("dbt"))
-print("DBT_PROFILES_DIR:", os.environ.get("DBT_PROFILES_DIR"))
-
-# Run dbt
-p = run_dbt(DBT_PROJECT_DIR, DBT_PROFILES_DIR, args=["build"])
-
 def build(project_dir: str, profiles_dir: str, target: Optional[str] = None) -> None:
-    cmd = ["dbt", "build", "--project-dir", project_dir, "--profiles-dir", profiles_dir]
     """
-    build
+    Unconditional full `dbt build`. Prefer dq_engine.dbt_runner.run_dbt_build,
+    which skips or narrows the build to changed models.
     """
+    args = ["build"]
     if target:
-        cmd += ["--target", target]
-    p = subprocess.run(cmd, capture_output=True, text=True)
+        args += ["--target", target]
+    p = subprocess.run(dbt_command(args, Path(project_dir), Path(profiles_dir)), capture_output=True, text=True)
     if p.returncode != 0:
         raise RuntimeError(
             "dbt build failed\n"
             f"STDERR:\n{p.stderr[-4000:]}\n"
             f"STDOUT:\n{p.stdout[-4000:]}"
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,382 @@
+# src/dq_engine/dbt_runner.py
+"""
+Cached, manifest-aware dbt runner (what `pipeline.run` calls).
+
+- After every successful build the project fingerprint (sha256 of each model /
+  macro / seed / yml file, dbt_project.yml, profiles.yml, target, vars) and a copy
+  of `target/manifest.json` are kept under `target/.dq_state/`.
+- Next run: if nothing in the fingerprint changed, dbt is not started at all.
+  Otherwise the changed files are mapped to nodes through the saved manifest
+  and dbt runs `build --select state:modified+ --state target/.dq_state`.
+  Project-level changes (dbt_project.yml, profiles, target, vars) force a full build.
+- `target/partial_parse.msgpack` is left in place so dbt re-parses only the
+  changed files; it is invalidated by the same project-level changes.
+- Output is streamed line by line (only a tail is kept for the error message).
+- Per-model timings from `target/run_results.json` are returned and appended to
+  `target/.dq_state/build_timings.csv`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+STATE_DIRNAME = ".dq_state"
+FINGERPRINT_FILE = "fingerprint.json"
+TIMINGS_FILE = "build_timings.csv"
+
+# Files dbt parses; anything else under the project is ignored.
+_PROJECT_SUFFIXES = {".sql", ".py", ".yml", ".yaml", ".csv", ".md", ".jinja"}
+_DEFAULT_RESOURCE_DIRS = ("models", "macros", "seeds", "snapshots", "tests", "analyses")
+# Changes here alter every node (or the connection) -> full build, full reparse.
+_PROJECT_LEVEL_KEYS = (
+    "dbt_project.yml",
+    "packages.yml",
+    "dependencies.yml",
+    "profiles.yml",
+    "__target__",
+    "__vars__",
+)
+
+TIMING_COLUMNS = [
+    "invocation_id",
+    "built_at",
+    "unique_id",
+    "resource_type",
+    "status",
+    "execution_time_s",
+    "compile_s",
+    "execute_s",
+    "rows_affected",
+    "message",
+]
+
+
+@dataclass
+class DbtBuildResult:
+    status: str  # skipped | success
+    command: list[str] = field(default_factory=list)
+    selector: str | None = None  # None = full build
+    changed_files: list[str] = field(default_factory=list)
+    modified_nodes: list[str] = field(default_factory=list)
+    elapsed_s: float = 0.0
+    timings: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=TIMING_COLUMNS))
+
+
+# ---------------------------------------------------------------------------
+# Command resolution
+# ---------------------------------------------------------------------------
+def dbt_command(args: Sequence[str], project_dir: Path, profiles_dir: Path) -> list[str]:
+    """`dbt` on PATH if present, else `python -m dbt` in the current interpreter."""
+    exe = shutil.which("dbt")
+    base = [exe] if exe else [sys.executable, "-m", "dbt"]
+    return [*base, *args, "--project-dir", str(project_dir), "--profiles-dir", str(profiles_dir)]
+
+
+# ---------------------------------------------------------------------------
+# Fingerprinting
+# ---------------------------------------------------------------------------
+def file_checksum(path: Path) -> str:
+    """sha256 of the stripped file text — the same checksum dbt stores in manifest.json."""
+    text = Path(path).read_text(encoding="utf-8", errors="replace")
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+def _resource_dirs(project_dir: Path) -> list[str]:
+    proj = project_dir / "dbt_project.yml"
+    dirs: list[str] = []
+    try:
+        import yaml
+
+        spec = yaml.safe_load(proj.read_text(encoding="utf-8")) or {}
+        for key in (
+            "model-paths",
+            "macro-paths",
+            "seed-paths",
+            "snapshot-paths",
+            "test-paths",
+            "analysis-paths",
+        ):
+            dirs += list(spec.get(key) or [])
+    except Exception:
+        pass
+    return list(dict.fromkeys(dirs or _DEFAULT_RESOURCE_DIRS))
+
+
+def project_fingerprint(
+    project_dir: str | Path,
+    profiles_dir: str | Path,
+    target: str | None = None,
+    vars: Mapping[str, Any] | None = None,
+    extra: Mapping[str, str] | None = None,
+) -> dict[str, str]:
+    """
+    {relative path -> checksum} for every file dbt would parse, plus project-level
+    inputs. `extra` lets callers add their own keys (e.g. a hash of the raw files
+    behind a source: {"source:raw.telco": "<hash>"}); a changed `source:` key
+    selects that source's downstream models.
+    """
+    project_dir = Path(project_dir).resolve()
+    profiles_dir = Path(profiles_dir).resolve()
+    fp: dict[str, str] = {}
+
+    for d in _resource_dirs(project_dir):
+        root = project_dir / d
+        if not root.is_dir():
+            continue
+        for p in root.rglob("*"):
+            if p.is_file() and p.suffix.lower() in _PROJECT_SUFFIXES:
+                fp[p.relative_to(project_dir).as_posix()] = file_checksum(p)
+
+    for name in ("dbt_project.yml", "packages.yml", "dependencies.yml"):
+        if (project_dir / name).is_file():
+            fp[name] = file_checksum(project_dir / name)
+    if (profiles_dir / "profiles.yml").is_file():
+        fp["profiles.yml"] = file_checksum(profiles_dir / "profiles.yml")
+
+    fp["__target__"] = str(target or "")
+    fp["__vars__"] = json.dumps(dict(vars or {}), sort_keys=True, default=str)
+    for k, v in (extra or {}).items():
+        fp[str(k)] = str(v)
+    return fp
+
+
+def diff_fingerprints(old: Mapping[str, str], new: Mapping[str, str]) -> list[str]:
+    """Keys added, removed or changed between two fingerprints (sorted)."""
+    keys = set(old) | set(new)
+    return sorted(k for k in keys if old.get(k) != new.get(k))
+
+
+# ---------------------------------------------------------------------------
+# Manifest helpers
+# ---------------------------------------------------------------------------
+def load_manifest(path: str | Path) -> dict[str, Any] | None:
+    p = Path(path)
+    if not p.is_file():
+        return None
+    try:
+        return json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def nodes_for_files(manifest: Mapping[str, Any], files: Iterable[str]) -> list[str]:
+    """Models / seeds / snapshots / sources whose SQL or yml patch lives in `files`."""
+    files = set(files)
+    if not files or not manifest:
+        return []
+    hits = set()
+    for section in ("nodes", "sources"):
+        for uid, node in (manifest.get(section) or {}).items():
+            if node.get("resource_type") == "test":
+                continue
+            paths = {node.get("original_file_path")}
+            patch = node.get("patch_path") or ""
+            if "://" in patch:  # "project://models/schema.yml"
+                paths.add(patch.split("://", 1)[1])
+            if paths & files:
+                hits.add(uid)
+    return sorted(hits)
+
+
+def manifest_modified_nodes(state: Mapping[str, Any], current: Mapping[str, Any]) -> list[str]:
+    """Nodes whose stored checksum differs between two manifests (or that are new)."""
+    old = {
+        u: (n.get("checksum") or {}).get("checksum") for u, n in (state.get("nodes") or {}).items()
+    }
+    out = []
+    for uid, node in (current.get("nodes") or {}).items():
+        if node.get("resource_type") == "test":
+            continue
+        if old.get(uid) != (node.get("checksum") or {}).get("checksum"):
+            out.append(uid)
+    return sorted(out)
+
+
+def partial_parse_state(project_dir: str | Path, changed: Sequence[str]) -> str:
+    """'reuse' when dbt can partially parse, 'reparse' when it must rebuild it, else 'missing'."""
+    pp = Path(project_dir) / "target" / "partial_parse.msgpack"
+    if not pp.is_file():
+        return "missing"
+    if any(k in _PROJECT_LEVEL_KEYS for k in changed):
+        return "reparse"
+    return "reuse"
+
+
+# ---------------------------------------------------------------------------
+# Timings
+# ---------------------------------------------------------------------------
+def _phase_seconds(timing: Sequence[Mapping[str, Any]], name: str) -> float | None:
+    for t in timing or []:
+        if t.get("name") == name and t.get("started_at") and t.get("completed_at"):
+            try:
+                a = datetime.fromisoformat(str(t["started_at"]).replace("Z", "+00:00"))
+                b = datetime.fromisoformat(str(t["completed_at"]).replace("Z", "+00:00"))
+                return (b - a).total_seconds()
+            except ValueError:
+                return None
+    return None
+
+
+def read_run_timings(run_results_path: str | Path) -> pd.DataFrame:
+    """One row per executed node from dbt's run_results.json."""
+    rr = load_manifest(run_results_path)
+    if not rr:
+        return pd.DataFrame(columns=TIMING_COLUMNS)
+    meta = rr.get("metadata") or {}
+    rows = []
+    for r in rr.get("results") or []:
+        uid = r.get("unique_id", "")
+        rows.append(
+            {
+                "invocation_id": meta.get("invocation_id"),
+                "built_at": meta.get("generated_at"),
+                "unique_id": uid,
+                "resource_type": uid.split(".", 1)[0] if uid else None,
+                "status": r.get("status"),
+                "execution_time_s": r.get("execution_time"),
+                "compile_s": _phase_seconds(r.get("timing"), "compile"),
+                "execute_s": _phase_seconds(r.get("timing"), "execute"),
+                "rows_affected": (r.get("adapter_response") or {}).get("rows_affected"),
+                "message": r.get("message"),
+            }
+        )
+    return pd.DataFrame(rows, columns=TIMING_COLUMNS)
+
+
+# ---------------------------------------------------------------------------
+# Process
+# ---------------------------------------------------------------------------
+def stream_command(
+    cmd: Sequence[str],
+    log: Callable[[str], None] = print,
+    tail_lines: int = 200,
+    cwd: Path | None = None,
+) -> tuple[int, list[str]]:
+    """Run `cmd` in a child process, forwarding each output line to `log` as it arrives."""
+    tail: deque = deque(maxlen=tail_lines)
+    with subprocess.Popen(
+        list(cmd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=str(cwd) if cwd else None,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            tail.append(line)
+            log(line)
+        rc = proc.wait()
+    return rc, list(tail)
+
+
+def run_dbt_build(
+    project_dir: str | Path,
+    profiles_dir: str | Path,
+    target: str | None = None,
+    vars: Mapping[str, Any] | None = None,
+    source_fingerprints: Mapping[str, str] | None = None,
+    full: bool = False,
+    log: Callable[[str], None] = print,
+) -> DbtBuildResult:
+    """
+    Build only what changed since the last successful build; skip dbt when nothing did.
+
+    `source_fingerprints` ({"source:<source>.<table>": hash}) marks data-side changes
+    dbt cannot see (e.g. reloaded raw files). Raises RuntimeError when dbt fails;
+    the saved state is only advanced on success.
+    """
+    project_dir = Path(project_dir).resolve()
+    profiles_dir = Path(profiles_dir).resolve()
+    target_dir = project_dir / "target"
+    state_dir = target_dir / STATE_DIRNAME
+
+    fingerprint = project_fingerprint(project_dir, profiles_dir, target, vars, source_fingerprints)
+    prev_fp = load_manifest(state_dir / FINGERPRINT_FILE)
+    state_manifest = load_manifest(state_dir / "manifest.json")
+
+    have_state = bool(prev_fp) and state_manifest is not None
+    changed = diff_fingerprints(prev_fp or {}, fingerprint) if have_state else sorted(fingerprint)
+    project_level = [k for k in changed if k in _PROJECT_LEVEL_KEYS]
+
+    if have_state and not changed and not full:
+        log("🟢 dbt: no model, source or project changes since the last successful build — skipped")
+        return DbtBuildResult(status="skipped")
+
+    args = ["build"]
+    selector: str | None = None
+    modified: list[str] = []
+    if have_state and not full and not project_level:
+        selectors = ["state:modified+"]
+        selectors += [f"{k}+" for k in changed if k.startswith("source:")]
+        selector = " ".join(selectors)
+        modified = nodes_for_files(state_manifest, changed)
+        args += ["--select", selector, "--state", str(state_dir)]
+    if target:
+        args += ["--target", target]
+    if vars:
+        args += ["--vars", json.dumps(dict(vars), default=str)]
+
+    cmd = dbt_command(args, project_dir, profiles_dir)
+    reason = "full build" if selector is None else f"{len(changed)} changed input(s)"
+    log(f"🧰 dbt: {reason}; partial parse: {partial_parse_state(project_dir, changed)}")
+    log("▶️ cmd: " + " ".join(cmd))
+
+    t0 = time.perf_counter()
+    rc, tail = stream_command(cmd, log=log, cwd=project_dir)
+    elapsed = time.perf_counter() - t0
+
+    timings = read_run_timings(target_dir / "run_results.json")
+    if rc != 0:
+        raise RuntimeError(f"dbt build failed (returncode={rc})\n" + "\n".join(tail[-60:]))
+
+    # Advance state only after a clean build
+    state_dir.mkdir(parents=True, exist_ok=True)
+    if (target_dir / "manifest.json").is_file():
+        current = load_manifest(target_dir / "manifest.json")
+        if current and state_manifest:
+            modified = sorted(set(modified) | set(manifest_modified_nodes(state_manifest, current)))
+        shutil.copy2(target_dir / "manifest.json", state_dir / "manifest.json")
+    (state_dir / FINGERPRINT_FILE).write_text(
+        json.dumps(fingerprint, indent=2, sort_keys=True), encoding="utf-8"
+    )
+
+    if not timings.empty:
+        tpath = state_dir / TIMINGS_FILE
+        timings.to_csv(tpath, mode="a", header=not tpath.exists(), index=False)
+        slow = timings.sort_values("execution_time_s", ascending=False).head(5)
+        for _, r in slow.iterrows():
+            log(f"   ⏱ {r['unique_id']}: {float(r['execution_time_s'] or 0):.2f}s ({r['status']})")
+
+    log(f"✅ dbt build finished in {elapsed:.1f}s ({len(timings)} node(s))")
+    return DbtBuildResult(
+        status="success",
+        command=cmd,
+        selector=selector,
+        changed_files=changed,
+        modified_nodes=modified,
+        elapsed_s=elapsed,
+        timings=timings,
+    )
+
+
+def last_build_timings(project_dir: str | Path) -> pd.DataFrame:
+    """All recorded per-model timings for `project_dir` (empty if none yet)."""
+    p = Path(project_dir).resolve() / "target" / STATE_DIRNAME / TIMINGS_FILE
+    if not p.is_file():
+        return pd.DataFrame(columns=TIMING_COLUMNS)
+    return pd.read_csv(p)
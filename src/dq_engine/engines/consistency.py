@@ -0,0 +1,711 @@
+# src/dq_engine/engines/consistency.py
+"""
+Cross-domain consistency engine for 2.5.7 / 2.5.8 / 2.5.9 (num ↔ cat bridging).
+
+All three checks are grouped reductions over whole matrices; nothing loops
+over groups or rows in Python:
+
+- 2.5.7 CATNUM_ALIGNMENT: each group column is factorized once (`GroupIndex`,
+  shared with the 2.7 hypothesis engine). Every numeric column a rule set
+  touches for that group column is reduced together: counts / means via
+  `np.add.reduceat`, medians and quantiles by re-sorting each column's value
+  argsort (computed once per column) by group code and indexing straight
+  into each group's sorted segment. Monotonic and
+  pairwise (`group_a <= group_b`) expectations are then array comparisons.
+- 2.5.8 ONEHOT: one 0/1 incidence matrix (dummy column x group) over ALL
+  configured groups; a single sparse matmul gives every group's row sums.
+- 2.5.9 TOTALS: component columns are summed per rule with another incidence
+  matmul, and tolerance checks run on the (rows x rules) difference matrix.
+
+Report frames keep the notebook schemas (catnum_alignment_report.csv,
+onehot_integrity_report.csv, category_total_consistency.csv,
+reconciliation_helpers_2_5_9_report.csv).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.artifacts import write_artifact
+from dq_engine.engines.hypothesis import GroupIndex
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+try:
+    from scipy import sparse as _sparse
+
+    _HAS_SCIPY = True
+except Exception:
+    _sparse = None
+    _HAS_SCIPY = False
+
+ALIGNMENT_COLUMNS = [
+    "rule_id",
+    "group_col",
+    "group_value",
+    "numeric_col",
+    "mean_value",
+    "median_value",
+    "count",
+    "expected_relation",
+    "violation_flag",
+    "violation_gap",
+    "rule_severity",
+    "notes",
+]
+ONEHOT_COLUMNS = [
+    "group_id",
+    "mode",
+    "columns",
+    "n_rows",
+    "n_all_zero",
+    "n_single",
+    "n_multi",
+    "pct_all_zero",
+    "pct_multi",
+    "group_severity",
+    "notes",
+]
+TOTALS_COLUMNS = [
+    "rule_id",
+    "description",
+    "total_col",
+    "component_cols",
+    "n_rows",
+    "n_evaluated",
+    "n_violations",
+    "pct_violations",
+    "max_abs_diff",
+    "mean_abs_diff",
+    "max_rel_diff",
+    "tolerance_abs",
+    "tolerance_rel",
+    "rule_severity",
+    "notes",
+]
+RECON_HELPER_COLUMNS = [
+    "helper",
+    "present",
+    "n_total_rows",
+    "n_nonnull",
+    "pct_nonnull",
+    "min",
+    "max",
+    "mean",
+    "note",
+]
+
+_PAIRWISE = re.compile(r"^group_(.+?)\s*(<=|>=|<|>|==)\s*group_(.+)$")
+_OPS = {
+    "<=": np.less_equal,
+    ">=": np.greater_equal,
+    "<": np.less,
+    ">": np.greater,
+    "==": np.equal,
+}
+
+
+@dataclass(frozen=True)
+class ConsistencyCfg:
+    catnum_enabled: bool = True
+    catnum_rules: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    onehot_groups: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    totals_rules: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> ConsistencyCfg:
+        """CATNUM_ALIGNMENT.{ENABLED,RULES}, ONEHOT.GROUPS, TOTALS.RULES."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+
+        def as_map(v: Any) -> dict[str, dict[str, Any]]:
+            return {str(k): dict(r) for k, r in (v or {}).items() if isinstance(r, Mapping)}
+
+        return cls(
+            catnum_enabled=bool(get("CATNUM_ALIGNMENT.ENABLED", True)),
+            catnum_rules=as_map(get("CATNUM_ALIGNMENT.RULES", {})),
+            onehot_groups=as_map(get("ONEHOT.GROUPS", {})),
+            totals_rules=as_map(get("TOTALS.RULES", {})),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Sorted-segment reductions
+# ---------------------------------------------------------------------------
+def _numeric_matrix(df: pd.DataFrame, cols: Sequence[str]) -> np.ndarray:
+    X = df[list(cols)].apply(pd.to_numeric, errors="coerce")
+    return X.to_numpy(dtype="float64", na_value=np.nan).reshape(len(df), len(cols))
+
+
+def segment_quantiles(
+    gi: GroupIndex,
+    V: np.ndarray,
+    qs: Sequence[float],
+    value_order: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Per-group quantiles (linear interpolation, NaNs ignored) of every column of
+    `V` (rows aligned to the frame) → (len(qs), k, p).
+
+    Each column's value argsort (`value_order`, reusable across group columns)
+    is stably re-sorted by group code, so every group becomes a contiguous
+    ascending segment with NaNs last and quantile positions index straight
+    into [start, start + n_valid).
+    """
+    V = np.asarray(V, dtype="float64")
+    if V.ndim == 1:
+        V = V[:, None]
+    k, p, m = gi.k, V.shape[1], len(gi.rows)
+    qs = np.asarray(qs, dtype="float64")
+    out = np.full((len(qs), k, p), np.nan)
+    if m == 0 or p == 0:
+        return out
+    vo = np.argsort(V, axis=0) if value_order is None else value_order
+    by_code = np.argsort(gi.codes[vo], axis=0, kind="stable")  # null groups (code -1) sort first
+    S = np.take_along_axis(V, np.take_along_axis(vo, by_code, axis=0), axis=0)[len(V) - m :].T
+    n = gi.reduce(~np.isnan(V[gi.rows])).T  # p x k valid counts
+    starts = (np.cumsum(gi.counts) - gi.counts)[None, :]
+    has = n > 0
+    for i, q in enumerate(qs):
+        pos = q * np.maximum(n - 1, 0)
+        lo = np.floor(pos).astype("int64")
+        hi = np.minimum(lo + 1, np.maximum(n - 1, 0).astype("int64"))
+        a = np.take_along_axis(S, np.clip(starts + lo, 0, m - 1), axis=1)
+        b = np.take_along_axis(S, np.clip(starts + hi, 0, m - 1), axis=1)
+        out[i] = np.where(has, a + (b - a) * (pos - lo), np.nan).T
+    return out
+
+
+@dataclass
+class GroupStats:
+    """Per-group reductions of several numeric columns over one GroupIndex (k x p arrays)."""
+
+    index: GroupIndex
+    numeric_cols: list[str]
+    count: np.ndarray
+    mean: np.ndarray
+    quantiles: dict[float, np.ndarray]
+
+    @property
+    def median(self) -> np.ndarray:
+        return self.quantiles[0.5]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long table: group_value, numeric_col, count, mean, q<..>."""
+        k, p = self.count.shape
+        out = pd.DataFrame(
+            {
+                "group_value": np.repeat(np.asarray(self.index.levels, dtype=object), p),
+                "numeric_col": np.tile(np.asarray(self.numeric_cols, dtype=object), k),
+                "count": self.count.ravel().astype("int64"),
+                "mean": self.mean.ravel(),
+            }
+        )
+        for q, arr in self.quantiles.items():
+            out[f"q{q:g}"] = arr.ravel()
+        return out[out["count"] > 0].reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+class ConsistencyEngine:
+    """
+    Shared grouped state for 2.5.7–2.5.9 on one frame.
+
+    Usage:
+        eng = ConsistencyEngine(df)
+        align_df = eng.catnum_alignment(C("CATNUM_ALIGNMENT.RULES", {}))
+        onehot_df = eng.onehot_integrity(C("ONEHOT.GROUPS", {}))
+        totals_df = eng.totals_reconciliation(C("TOTALS.RULES", {}))
+    """
+
+    def __init__(self, df: pd.DataFrame, quantiles: Sequence[float] = (0.25, 0.5, 0.75)):
+        self.df = df
+        self.quantiles = tuple(sorted({float(q) for q in quantiles} | {0.5}))
+        self._groups: dict[str, GroupIndex] = {}
+        self._stats: dict[tuple[str, tuple[str, ...]], GroupStats] = {}
+        self._values: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        # "<source>:<rule id>" -> (violating row positions, columns involved, severity);
+        # filled by each check and consumed by the 2.5.10 violation network
+        self.row_flags: dict[str, tuple[np.ndarray, list[str], str]] = {}
+
+    def groups(self, col: str) -> GroupIndex:
+        if col not in self._groups:
+            self._groups[col] = GroupIndex(self.df[col])
+        return self._groups[col]
+
+    def values(self, col: str) -> tuple[np.ndarray, np.ndarray]:
+        """(float values, value argsort) per numeric column, shared by every group column."""
+        if col not in self._values:
+            v = _numeric_matrix(self.df, [col])[:, 0]
+            self._values[col] = (v, np.argsort(v))
+        return self._values[col]
+
+    @traced("engine.consistency.group_stats")
+    def group_stats(self, group_col: str, numeric_cols: Sequence[str]) -> GroupStats:
+        """Counts, means and quantiles of all `numeric_cols` per `group_col` level, in one pass."""
+        key = (group_col, tuple(numeric_cols))
+        if key not in self._stats:
+            gi = self.groups(group_col)
+            vals = [self.values(c) for c in numeric_cols]
+            X = np.column_stack([v for v, _ in vals])
+            Xs = X[gi.rows]
+            valid = ~np.isnan(Xs)
+            n = gi.reduce(valid)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.where(n > 0, gi.reduce(np.where(valid, Xs, 0.0)) / n, np.nan)
+            qv = segment_quantiles(gi, X, self.quantiles, np.column_stack([o for _, o in vals]))
+            self._stats[key] = GroupStats(
+                gi, list(numeric_cols), n, mean, dict(zip(self.quantiles, qv, strict=True))
+            )
+        return self._stats[key]
+
+    # ------------------------------------------------------------ 2.5.7
+    @traced("engine.consistency.catnum_alignment")
+    def catnum_alignment(self, rules: Mapping[str, Mapping[str, Any]]) -> pd.DataFrame:
+        """Per-group mean/median per rule + monotonic / pairwise violations (2.5.7 schema)."""
+        rules = {str(k): r for k, r in (rules or {}).items() if isinstance(r, Mapping)}
+        by_group: dict[str, list[str]] = {}
+        for r in rules.values():
+            g, x = (
+                str(r.get("group_col", "") or "").strip(),
+                str(r.get("numeric_col", "") or "").strip(),
+            )
+            if (
+                g in self.df.columns
+                and x in self.df.columns
+                and x not in by_group.setdefault(g, [])
+            ):
+                by_group[g].append(x)
+        stats = {g: self.group_stats(g, cols) for g, cols in by_group.items()}
+
+        frames = []
+        for rule_id, r in rules.items():
+            g = str(r.get("group_col", "") or "").strip()
+            x = str(r.get("numeric_col", "") or "").strip()
+            expectation = str(r.get("expectation", "") or "").strip()
+            stub = {
+                "rule_id": rule_id,
+                "group_col": g,
+                "group_value": "",
+                "numeric_col": x,
+                "mean_value": np.nan,
+                "median_value": np.nan,
+                "count": 0,
+                "expected_relation": expectation,
+                "violation_flag": False,
+                "violation_gap": np.nan,
+                "rule_severity": "info",
+            }
+            if not g or not x:
+                frames.append(
+                    pd.DataFrame(
+                        [{**stub, "notes": "Missing group_col or numeric_col in rule config"}]
+                    )
+                )
+                continue
+            if g not in self.df.columns or x not in self.df.columns:
+                frames.append(
+                    pd.DataFrame(
+                        [
+                            {
+                                **stub,
+                                "notes": "group_col or numeric_col not found in df; rule skipped",
+                            }
+                        ]
+                    )
+                )
+                continue
+            st = stats[g]
+            j = st.numeric_cols.index(x)
+            present = np.flatnonzero(st.count[:, j] > 0)
+            if present.size == 0:
+                frames.append(
+                    pd.DataFrame(
+                        [{**stub, "notes": "No valid rows (after NA filtering) to evaluate"}]
+                    )
+                )
+                continue
+            order = present[_group_order(st.index.levels, present, r.get("group_order"))]
+            means = st.mean[order, j]
+            flag, gap = _expectation_violations(st.index, order, means, expectation)
+            n_viol = int(flag.sum())
+            severity = "ok" if n_viol == 0 else ("warn" if n_viol / len(order) <= 0.25 else "fail")
+            if n_viol:
+                v, _ = self.values(x)
+                rows = np.flatnonzero(np.isin(st.index.codes, order[flag]) & ~np.isnan(v))
+                self.row_flags[f"catnum_alignment:{rule_id}"] = (rows, [g, x], severity)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "rule_id": rule_id,
+                        "group_col": g,
+                        "group_value": np.asarray(st.index.levels, dtype=object)[order],
+                        "numeric_col": x,
+                        "mean_value": means,
+                        "median_value": st.median[order, j],
+                        "count": st.count[order, j].astype("int64"),
+                        "expected_relation": expectation,
+                        "violation_flag": flag,
+                        "violation_gap": gap,
+                        "rule_severity": severity,
+                        "notes": "",
+                    }
+                )
+            )
+        if not frames:
+            return pd.DataFrame(columns=ALIGNMENT_COLUMNS)
+        return pd.concat(frames, ignore_index=True)[ALIGNMENT_COLUMNS]
+
+    # ------------------------------------------------------------ 2.5.8
+    @traced("engine.consistency.onehot_integrity")
+    def onehot_integrity(self, groups: Mapping[str, Mapping[str, Any]]) -> pd.DataFrame:
+        """Row-sum integrity of every one-hot group: one (rows x dummies) @ (dummies x groups)."""
+        n = int(len(self.df))
+        groups = {str(k): g for k, g in (groups or {}).items() if isinstance(g, Mapping)}
+        ids, modes, cols_cfg, present = [], [], [], []
+        for gid, g in groups.items():
+            cols = g.get("columns", [])
+            cols = list(cols) if isinstance(cols, (list, tuple)) else []
+            ids.append(gid)
+            modes.append(str(g.get("mode", "mutually_exclusive") or "mutually_exclusive").strip())
+            cols_cfg.append(cols)
+            present.append([c for c in cols if c in self.df.columns])
+
+        dummies = list(dict.fromkeys(c for cols in present for c in cols))
+        live = [i for i, cols in enumerate(present) if cols]
+        n_all_zero = np.zeros(len(ids), dtype="int64")
+        n_single = np.zeros(len(ids), dtype="int64")
+        n_multi = np.zeros(len(ids), dtype="int64")
+        if live and n:
+            pos = {c: i for i, c in enumerate(dummies)}
+            r = np.fromiter((pos[c] for i in live for c in present[i]), dtype="int64")
+            cidx = np.repeat(np.arange(len(live)), [len(present[i]) for i in live])
+            X = np.nan_to_num(_numeric_matrix(self.df, dummies), nan=0.0)
+            S = _incidence_matmul(X, r, cidx, (len(dummies), len(live)))
+            n_all_zero[live] = (S == 0).sum(axis=0)
+            n_single[live] = (S == 1).sum(axis=0)
+            n_multi[live] = (S > 1).sum(axis=0)
+            B = np.where(np.array([modes[i] == "mutually_exclusive" for i in live]), S > 1, S == 0)
+
+        out = pd.DataFrame(
+            {
+                "group_id": ids,
+                "mode": modes,
+                "columns": [", ".join(map(str, c)) for c in cols_cfg],
+                "n_rows": np.array([n if p else 0 for p in present], dtype="int64"),
+                "n_all_zero": n_all_zero,
+                "n_single": n_single,
+                "n_multi": n_multi,
+            },
+            columns=ONEHOT_COLUMNS[:7],
+        )
+        rows = out["n_rows"].to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out["pct_all_zero"] = np.where(rows > 0, n_all_zero / rows, np.nan)
+            out["pct_multi"] = np.where(rows > 0, n_multi / rows, np.nan)
+        exclusive = out["mode"].eq("mutually_exclusive").to_numpy()
+        bad = np.where(exclusive, n_multi, n_all_zero) > 0
+        mild = np.where(
+            exclusive, (out["pct_multi"] <= 0.01) & (n_multi <= 10), out["pct_all_zero"] <= 0.1
+        )
+        out["group_severity"] = np.select(
+            [rows == 0, ~bad, mild],
+            ["info", "ok", "warn"],
+            default="fail",
+        )
+        out["notes"] = [_onehot_note(cfg, p, n) for cfg, p in zip(cols_cfg, present, strict=True)]
+        for j, i in enumerate(live if n else []):
+            if bad[i]:
+                self.row_flags[f"onehot_integrity:{ids[i]}"] = (
+                    np.flatnonzero(B[:, j]),
+                    present[i],
+                    out.at[i, "group_severity"],
+                )
+        return out[ONEHOT_COLUMNS]
+
+    # ------------------------------------------------------------ 2.5.9
+    @traced("engine.consistency.totals_reconciliation")
+    def totals_reconciliation(self, rules: Mapping[str, Mapping[str, Any]]) -> pd.DataFrame:
+        """
+        total_col vs sum(component_cols) per rule (category_total_consistency.csv).
+
+        A row is evaluated when the total and every component are non-null; it
+        violates when |total - components| > max(tolerance_abs, tolerance_rel * |components|).
+        """
+        n = int(len(self.df))
+        rules = {str(k): r for k, r in (rules or {}).items() if isinstance(r, Mapping)}
+        meta = []
+        for rid, r in rules.items():
+            comps = r.get("component_cols", [])
+            comps = [comps] if isinstance(comps, str) else list(comps or [])
+            total = str(r.get("total_col", "") or "").strip()
+            missing = [c for c in [total, *comps] if c and c not in self.df.columns]
+            note = (
+                "Missing total_col or component_cols in rule config"
+                if not total or not comps
+                else f"Missing columns: {', '.join(missing)}" if missing else ""
+            )
+            meta.append(
+                {
+                    "rule_id": rid,
+                    "description": str(r.get("description", "") or ""),
+                    "total_col": total,
+                    "component_cols": ", ".join(comps),
+                    "n_rows": n,
+                    "tolerance_abs": float(r.get("tolerance_abs", 0.0) or 0.0),
+                    "tolerance_rel": float(r.get("tolerance_rel", 0.0) or 0.0),
+                    "notes": note,
+                    "_comps": comps,
+                }
+            )
+        out = pd.DataFrame(meta, columns=[*TOTALS_COLUMNS, "_comps"])
+        if out.empty:
+            return out[TOTALS_COLUMNS]
+
+        live = np.flatnonzero(out["notes"].eq("").to_numpy())
+        k = len(out)
+        n_eval = np.zeros(k, dtype="int64")
+        n_viol = np.zeros(k, dtype="int64")
+        max_abs, mean_abs, max_rel = np.full(k, np.nan), np.full(k, np.nan), np.full(k, np.nan)
+        if live.size and n:
+            comps = list(dict.fromkeys(c for i in live for c in out.at[i, "_comps"]))
+            totals = list(dict.fromkeys(out.at[i, "total_col"] for i in live))
+            pos = {c: i for i, c in enumerate(comps)}
+            r = np.fromiter((pos[c] for i in live for c in out.at[i, "_comps"]), dtype="int64")
+            cidx = np.repeat(np.arange(live.size), [len(out.at[i, "_comps"]) for i in live])
+            Xc = _numeric_matrix(self.df, comps)
+            miss = np.isnan(Xc)
+            # one matmul: component sums and missing-component counts side by side
+            SM = _incidence_matmul(
+                np.hstack([np.where(miss, 0.0, Xc), miss]),
+                np.concatenate([r, r + len(comps)]),
+                np.concatenate([cidx, cidx + live.size]),
+                (2 * len(comps), 2 * live.size),
+            )
+            expected, n_missing = SM[:, : live.size], SM[:, live.size :]
+            T = _numeric_matrix(self.df, totals)[
+                :, [totals.index(out.at[i, "total_col"]) for i in live]
+            ]
+            valid = ~np.isnan(T) & (n_missing == 0)
+            diff = np.abs(T - expected)
+            tol_abs = out["tolerance_abs"].to_numpy()[live]
+            tol_rel = out["tolerance_rel"].to_numpy()[live]
+            allowed = np.maximum(tol_abs, tol_rel * np.abs(expected))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rel = np.where(np.abs(expected) > 0, diff / np.abs(expected), np.nan)
+            viol = valid & (diff > allowed)
+            ne = valid.sum(axis=0)
+            n_eval[live] = ne
+            n_viol[live] = viol.sum(axis=0)
+            has = ne > 0
+            max_abs[live] = np.where(has, np.where(valid, diff, -np.inf).max(axis=0), np.nan)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean_abs[live] = np.where(has, np.where(valid, diff, 0.0).sum(axis=0) / ne, np.nan)
+            rel_ok = valid & ~np.isnan(rel)
+            max_rel[live] = np.where(
+                rel_ok.any(axis=0), np.where(rel_ok, rel, -np.inf).max(axis=0), np.nan
+            )
+
+        out["n_evaluated"] = n_eval
+        out["n_violations"] = n_viol
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out["pct_violations"] = np.where(n_eval > 0, n_viol / np.maximum(n_eval, 1), np.nan)
+        out["max_abs_diff"], out["mean_abs_diff"], out["max_rel_diff"] = max_abs, mean_abs, max_rel
+        out["rule_severity"] = np.select(
+            [n_eval == 0, n_viol == 0, out["pct_violations"].to_numpy() <= 0.01],
+            ["info", "ok", "warn"],
+            default="fail",
+        )
+        no_rows = (n_eval == 0) & out["notes"].eq("").to_numpy()
+        out.loc[no_rows, "notes"] = "No rows with total and all components present"
+        for j, i in enumerate(live if n else []):
+            if n_viol[i]:
+                self.row_flags[f"total_consistency:{out.at[i, 'rule_id']}"] = (
+                    np.flatnonzero(viol[:, j]),
+                    [out.at[i, "total_col"], *out.at[i, "_comps"]],
+                    out.at[i, "rule_severity"],
+                )
+        return out[TOTALS_COLUMNS]
+
+    @traced("engine.consistency.helper_stats")
+    def helper_stats(self, helpers: Sequence[str]) -> pd.DataFrame:
+        """Coverage + min/max/mean per reconciliation helper column (2.5.9 helper report)."""
+        helpers = list(dict.fromkeys(helpers))
+        n = int(len(self.df))
+        present = np.array([h in self.df.columns for h in helpers], dtype=bool)
+        out = pd.DataFrame(
+            {"helper": helpers, "present": present, "n_total_rows": n}, columns=RECON_HELPER_COLUMNS
+        )
+        nn = np.zeros(len(helpers), dtype="int64")
+        lo, hi, mu = (np.full(len(helpers), np.nan) for _ in range(3))
+        cols = [h for h, p in zip(helpers, present, strict=True) if p]
+        if cols:
+            X = _numeric_matrix(self.df, cols)
+            ok = ~np.isnan(X)
+            c = ok.sum(axis=0)
+            has = c > 0
+            nn[present] = c
+            lo[present] = np.where(has, np.where(ok, X, np.inf).min(axis=0, initial=np.inf), np.nan)
+            hi[present] = np.where(
+                has, np.where(ok, X, -np.inf).max(axis=0, initial=-np.inf), np.nan
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mu[present] = np.where(has, np.where(ok, X, 0.0).sum(axis=0) / c, np.nan)
+        out["n_nonnull"] = nn
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out["pct_nonnull"] = np.where(present, nn / n if n else np.nan, 0.0)
+        out["min"], out["max"], out["mean"] = lo, hi, mu
+        out["note"] = np.where(present, None, "missing_helper_column")
+        return out[RECON_HELPER_COLUMNS]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _incidence_matmul(
+    X: np.ndarray, rows: np.ndarray, cols: np.ndarray, shape: tuple[int, int]
+) -> np.ndarray:
+    """X @ G for a 0/1 incidence matrix G given by (rows, cols); sparse when scipy is available."""
+    if _HAS_SCIPY:
+        G = _sparse.csc_matrix((np.ones(len(rows)), (rows, cols)), shape=shape)
+        return np.asarray((G.T @ X.T).T)
+    G = np.zeros(shape)
+    np.add.at(G, (rows, cols), 1.0)
+    return X @ G
+
+
+def _group_order(levels: Sequence[Any], present: np.ndarray, group_order: Any) -> np.ndarray:
+    """Argsort of `present` level codes: configured group_order first, then sorted level order."""
+    if not isinstance(group_order, (list, tuple)) or not group_order:
+        return np.arange(present.size)
+    rank = {str(v): i for i, v in enumerate(group_order)}
+    key = np.array([rank.get(str(levels[c]), len(group_order)) for c in present], dtype="int64")
+    return np.argsort(key, kind="stable")
+
+
+def _expectation_violations(
+    gi: GroupIndex,
+    order: np.ndarray,
+    means: np.ndarray,
+    expectation: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(violation_flag, violation_gap) per ordered group: monotonic or `group_a <op> group_b`."""
+    flag = np.zeros(order.size, dtype=bool)
+    gap = np.zeros(order.size)
+    if expectation in ("monotonic_increasing", "monotonic_decreasing") and order.size > 1:
+        d = means[1:] - means[:-1]
+        step = -d if expectation == "monotonic_increasing" else d
+        bad = step > 0  # NaN compares False → skipped
+        flag[1:] = bad
+        gap[1:] = np.where(bad, step, 0.0)
+        return flag, gap
+    m = _PAIRWISE.match(expectation)
+    if m:
+        a, op, b = gi.code(m.group(1)), m.group(2), gi.code(m.group(3))
+        ia, ib = np.flatnonzero(order == a), np.flatnonzero(order == b)
+        if a is not None and b is not None and ia.size and ib.size:
+            va, vb = means[ia[0]], means[ib[0]]
+            if not (np.isnan(va) or np.isnan(vb)) and not _OPS[op](va, vb):
+                flag[ia[0]] = True
+                gap[ia[0]] = float(abs(va - vb))
+    return flag, gap
+
+
+def _onehot_note(cols: Sequence[str], present: Sequence[str], n_rows: int) -> str:
+    if not cols:
+        return "No columns configured for group"
+    missing = [c for c in cols if c not in present]
+    if not present:
+        return f"All configured columns missing from df: {', '.join(missing)}"
+    notes = "" if n_rows else "No rows to evaluate"
+    if missing:
+        notes = (notes + "; " if notes else "") + f"Missing columns: {', '.join(missing)}"
+    return notes
+
+
+def totals_helper_cols(rules: Mapping[str, Mapping[str, Any]]) -> list[str]:
+    """Unique component columns across TOTALS.RULES, in config order (the 2.5.9 helpers)."""
+    out: list[str] = []
+    for r in (rules or {}).values():
+        comps = r.get("component_cols", []) if isinstance(r, Mapping) else []
+        for c in ([comps] if isinstance(comps, str) else comps or []):
+            if c not in out:
+                out.append(c)
+    return out
+
+
+def section_status(df: pd.DataFrame, severity_col: str, n_configured: int) -> tuple[str, int, int]:
+    """(status, n_evaluated, n_with_violations) for the Section 2 ledger row."""
+    if df.empty or n_configured == 0:
+        return "INFO", 0, 0
+    sev = df.drop_duplicates(subset=[df.columns[0]])[severity_col]
+    n_eval = int((sev != "info").sum())
+    n_viol = int(sev.isin(["warn", "fail"]).sum())
+    if n_eval == 0:
+        return "INFO", 0, 0
+    return ("OK" if n_viol == 0 else "WARN"), n_eval, n_viol
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+@dataclass
+class ConsistencyResult:
+    alignment: pd.DataFrame
+    onehot: pd.DataFrame
+    totals: pd.DataFrame
+    helpers: pd.DataFrame
+
+
+@traced("engine.consistency.audit_consistency")
+def audit_consistency(
+    df: pd.DataFrame,
+    config: dict[str, Any] | None = None,
+    *,
+    out_dir: Path | None = None,
+    cfg: ConsistencyCfg | None = None,
+) -> ConsistencyResult:
+    """
+    2.5.7 / 2.5.8 / 2.5.9 from config; writes catnum_alignment_report.csv,
+    onehot_integrity_report.csv, category_total_consistency.csv and
+    reconciliation_helpers_2_5_9_report.csv when `out_dir` is given.
+    """
+    cfg = cfg or ConsistencyCfg.from_config(config)
+    eng = ConsistencyEngine(df)
+    alignment = (
+        eng.catnum_alignment(cfg.catnum_rules)
+        if cfg.catnum_enabled
+        else pd.DataFrame(columns=ALIGNMENT_COLUMNS)
+    )
+    onehot = eng.onehot_integrity(cfg.onehot_groups)
+    totals = eng.totals_reconciliation(cfg.totals_rules)
+    helpers = eng.helper_stats(totals_helper_cols(cfg.totals_rules))
+    result = ConsistencyResult(alignment, onehot, totals, helpers)
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_artifact(alignment, out_dir / "catnum_alignment_report.csv")
+        write_artifact(onehot, out_dir / "onehot_integrity_report.csv")
+        write_artifact(totals, out_dir / "category_total_consistency.csv")
+        write_artifact(helpers, out_dir / "reconciliation_helpers_2_5_9_report.csv")
+
+    s7, e7, v7 = section_status(
+        alignment, "rule_severity", len(cfg.catnum_rules) if cfg.catnum_enabled else 0
+    )
+    s8, e8, v8 = section_status(onehot, "group_severity", len(cfg.onehot_groups))
+    s9, e9, v9 = section_status(totals, "rule_severity", len(cfg.totals_rules))
+    print(
+        f"🔁 2.5.7 alignment {s7}: {e7} rule(s) evaluated, {v7} with violations | "
+        f"2.5.8 one-hot {s8}: {e8} group(s), {v8} with violations | "
+        f"2.5.9 totals {s9}: {e9} rule(s), {v9} with violations"
+    )
+    return result
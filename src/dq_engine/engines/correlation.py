@@ -0,0 +1,615 @@
+# src/dq_engine/engines/correlation.py
+"""
+Shared correlation + multicollinearity engine (2.7.4, 2.7.13, 2.11).
+
+One engine instance owns the numeric matrix, so Pearson / Spearman / Kendall,
+VIF and the CORR_CLUSTERING distance matrix all reuse the same work:
+
+- columns are sorted once (`RankIndex`); Spearman is Pearson on those ranks,
+  and pairs with different missing patterns are re-ranked on their shared
+  rows from the same sort order
+- Pearson is accumulated over row blocks with BLAS matmuls and NaN-aware
+  pairwise counts (same pairwise-complete semantics as `DataFrame.corr`);
+  the accumulator also takes out-of-core chunks (`pearson_from_chunks`)
+- VIF for every feature comes from one eigendecomposition of R; exact
+  dependencies give inf for the columns involved only
+- Kendall tau-b uses Knight's O(n log n) algorithm, run in parallel across pairs
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from dq_engine.utils.tracing import traced
+
+# Output schema of 2.11.1 (NUMERIC_CORR_MATRIX.OUTPUT_MATRIX_FILE)
+CORR_PAIR_COLUMNS = [
+    "feature_1",
+    "feature_2",
+    "pearson_r",
+    "spearman_rho",
+    "kendall_tau",
+    "collinear_flag",
+]
+
+# Output schema of 2.7.13 (MULTICOLLINEARITY.OUTPUT_FILE)
+VIF_COLUMNS = ["column", "vif_value", "vif_category", "notes"]
+
+_METHOD_COLS = {"pearson": "pearson_r", "spearman": "spearman_rho", "kendall": "kendall_tau"}
+
+
+def numeric_feature_cols(df: pd.DataFrame, exclude: Iterable[str] = ()) -> list[str]:
+    """Numeric, non-bool columns of `df` (same selection rule as 2.7.13 / 2.11.1)."""
+    excl = set(exclude or [])
+    return [
+        c
+        for c in df.columns
+        if c not in excl and is_numeric_dtype(df[c]) and not is_bool_dtype(df[c])
+    ]
+
+
+class RankIndex:
+    """
+    Per-column sort order and tie-group bounds of a matrix, computed once.
+
+    `ranks(cols, keep)` gives average ranks (ties share the mean rank, NaNs
+    stay NaN) of `cols` within the rows where `keep` is True, without sorting
+    again: one cumulative count of the kept rows in each column's sorted
+    order, read off at the tie-group bounds. Spearman re-ranks each pair of
+    missing patterns on its shared rows this way.
+    """
+
+    def __init__(self, X: np.ndarray):
+        X = np.asarray(X, dtype="float64")
+        n, p = X.shape
+        self.shape = (n, p)
+        # one row per column (contiguous), int32 positions while they fit
+        idx = np.int32 if n < np.iinfo(np.int32).max else np.int64
+        XT = np.ascontiguousarray(X.T)
+        self.order = np.argsort(XT, axis=1, kind="stable").astype(idx, copy=False)  # NaNs last
+        S = np.take_along_axis(XT, self.order, axis=1)
+        self.n_valid = (~np.isnan(XT)).sum(axis=1)
+        pos = np.arange(n, dtype=idx)
+        new = np.ones((p, n), dtype=bool)
+        new[:, 1:] = S[:, 1:] != S[:, :-1]
+        last = np.ones((p, n), dtype=bool)
+        last[:, :-1] = new[:, 1:]
+        # inclusive sorted-position bounds of each value's tie group
+        self.lo = np.maximum.accumulate(np.where(new, pos, idx(0)), axis=1)
+        self.hi = np.minimum.accumulate(np.where(last, pos, idx(n - 1))[:, ::-1], axis=1)[:, ::-1]
+
+    def ranks(
+        self,
+        cols: Sequence[int] | None = None,
+        keep: np.ndarray | None = None,
+        *,
+        center: bool = False,
+    ) -> np.ndarray:
+        """
+        n x len(cols) average ranks within the `keep` rows (all rows by default).
+
+        With center=True each column is shifted by its mean rank ((m + 1) / 2
+        over its m kept values) and excluded rows are 0 instead of NaN, ready
+        for a cross-product.
+        """
+        n, p = self.shape
+        cols = np.arange(p) if cols is None else np.asarray(cols, dtype=np.int64)
+        order, lo, hi = self.order[cols], self.lo[cols], self.hi[cols]
+        valid = np.arange(n) < self.n_valid[cols, None]
+        if keep is None:
+            kept = valid
+            avg = (lo + hi + 2) / 2.0
+            m = self.n_valid[cols]
+        else:
+            kept = valid & np.asarray(keep, dtype=bool)[order]
+            c = np.zeros((cols.size, n + 1), dtype=np.int64)
+            np.cumsum(kept, axis=1, out=c[:, 1:])
+            avg = (
+                np.take_along_axis(c, lo, axis=1) + np.take_along_axis(c, hi + 1, axis=1) + 1
+            ) / 2.0
+            m = c[:, -1]
+        if center:
+            vals, fill = np.where(kept, avg - (m[:, None] + 1) / 2.0, 0.0), 0.0
+        else:
+            vals, fill = np.where(kept, avg, np.nan), np.nan
+        R = np.full((cols.size, n), fill)
+        np.put_along_axis(R, order, vals, axis=1)
+        return R.T
+
+
+def rank_columns(X: np.ndarray) -> np.ndarray:
+    """
+    Average ranks per column (ties share the mean rank), NaNs stay NaN.
+
+    Equivalent to `DataFrame.rank(method="average")` but done once for the whole
+    matrix so Spearman and any later rank-based statistic can share it.
+    """
+    return RankIndex(X).ranks()
+
+
+class PearsonAccumulator:
+    """
+    Mergeable sufficient statistics for NaN-aware pairwise Pearson.
+
+    Feed row blocks with `update` (in-memory blocks or out-of-core chunks);
+    `result()` gives the same matrix as one pass over the stacked rows. The
+    statistics are taken around a fixed `shift` (column means when known,
+    otherwise the first block's means). The pairwise formula is
+    shift-invariant, and centering keeps the sums small (less cancellation
+    in n*sxy - sx*sy).
+    """
+
+    def __init__(self, p: int, shift: np.ndarray | None = None):
+        self.p = int(p)
+        self.shift = None if shift is None else np.where(np.isfinite(shift), shift, 0.0)
+        self.N = np.zeros((p, p))
+        self.SX = np.zeros((p, p))  # SX[i, j] = sum x_i over rows where i and j present
+        self.SXX = np.zeros((p, p))
+        self.SXY = np.zeros((p, p))
+
+    def update(self, X: np.ndarray, block_rows: int = 65_536) -> PearsonAccumulator:
+        X = np.asarray(X, dtype="float64")
+        if self.shift is None:
+            with np.errstate(invalid="ignore"):
+                m = np.nanmean(X, axis=0) if len(X) else np.zeros(self.p)
+            self.shift = np.where(np.isfinite(m), m, 0.0)
+        step = max(1, int(block_rows))
+        for start in range(0, len(X), step):
+            blk = X[start : start + step] - self.shift
+            M = (~np.isnan(blk)).astype("float64")
+            Z = np.where(M > 0, blk, 0.0)
+            self.N += M.T @ M
+            self.SX += Z.T @ M
+            self.SXX += (Z * Z).T @ M
+            self.SXY += Z.T @ Z
+        return self
+
+    def result(self, min_periods: int = 2) -> tuple[np.ndarray, np.ndarray]:
+        N, SX, SXX, SXY = self.N, self.SX, self.SXX, self.SXY
+        SY = SX.T
+        SYY = SXX.T
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = N * SXY - SX * SY
+            var_x = N * SXX - SX * SX
+            var_y = N * SYY - SY * SY
+            corr = cov / np.sqrt(var_x * var_y)
+
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[(N < max(2, min_periods)) | (var_x <= 0) | (var_y <= 0)] = np.nan
+        return corr, N.astype("int64")
+
+
+def pairwise_pearson(
+    X: np.ndarray,
+    *,
+    block_rows: int = 65_536,
+    min_periods: int = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    NaN-aware pairwise Pearson correlation via blocked matmuls.
+
+    For every pair (i, j) only rows where both columns are present are used,
+    matching `DataFrame.corr(method="pearson")`. Sufficient statistics are
+    accumulated per row block, so peak memory is O(block_rows * p + p^2).
+
+    Returns
+    -------
+    (corr, n_obs):
+        p x p correlation matrix and p x p pairwise observation counts.
+    """
+    X = np.asarray(X, dtype="float64")
+    n, p = X.shape
+    if p == 0:
+        return np.empty((0, 0)), np.empty((0, 0), dtype="int64")
+    with np.errstate(invalid="ignore"):
+        shift = np.nanmean(X, axis=0) if n else np.zeros(p)
+    return PearsonAccumulator(p, shift).update(X, block_rows).result(min_periods)
+
+
+def pairwise_spearman(
+    X: np.ndarray,
+    *,
+    block_rows: int = 65_536,
+    min_periods: int = 2,
+    ranks: np.ndarray | None = None,
+    index: RankIndex | None = None,
+) -> np.ndarray:
+    """
+    Pairwise Spearman with `DataFrame.corr(method="spearman")` semantics.
+
+    Each pair is ranked within the rows both columns share. Columns are
+    grouped by missing-value pattern. Pairs inside one group are exact from
+    the shared per-column ranks. For each pair of groups, a group is
+    re-ranked on the joint rows (`RankIndex.ranks`, no re-sort) only when the
+    other group is missing some of its rows, and the cross block is one
+    matmul of the centered ranks.
+    """
+    X = np.asarray(X, dtype="float64")
+    if ranks is None:
+        index = index if index is not None else RankIndex(X)
+        ranks = index.ranks()
+    corr, _ = pairwise_pearson(ranks, block_rows=block_rows, min_periods=min_periods)
+    miss = np.isnan(X)
+    if not miss.any():
+        return corr
+    patterns: dict[bytes, list[int]] = {}
+    for j, key in enumerate(np.packbits(miss, axis=0).T):
+        patterns.setdefault(key.tobytes(), []).append(j)
+    members = [np.asarray(m) for m in patterns.values()]
+    if len(members) < 2:
+        return corr
+    index = index if index is not None else RankIndex(X)
+    present = ~miss[:, [m[0] for m in members]]
+    n_present = present.sum(axis=0)
+
+    def centered(g: int, other: int, n_joint: int) -> np.ndarray:
+        if n_joint == n_present[g]:  # the joint rows are all of g's rows: global ranks hold
+            return np.where(present[:, [g]], ranks[:, members[g]] - (n_joint + 1) / 2.0, 0.0)
+        return index.ranks(members[g], present[:, other], center=True)
+
+    for a in range(len(members)):
+        for b in range(a + 1, len(members)):
+            ga, gb = members[a], members[b]
+            n_joint = int((present[:, a] & present[:, b]).sum())
+            if n_joint < max(2, min_periods):
+                block = np.full((ga.size, gb.size), np.nan)
+            else:
+                A, B = centered(a, b, n_joint), centered(b, a, n_joint)
+                ss = np.sqrt(np.outer((A * A).sum(axis=0), (B * B).sum(axis=0)))
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    block = np.clip((A.T @ B) / ss, -1.0, 1.0)
+                block[ss == 0] = np.nan
+            corr[np.ix_(ga, gb)] = block
+            corr[np.ix_(gb, ga)] = block.T
+    return corr
+
+
+def pearson_from_chunks(
+    chunks: Iterable[pd.DataFrame],
+    cols: Sequence[str],
+    *,
+    block_rows: int = 65_536,
+    min_periods: int = 2,
+) -> pd.DataFrame:
+    """Pairwise Pearson over a chunk stream (MEMORY_BUDGET chunked mode) → labelled p x p frame."""
+    acc = PearsonAccumulator(len(cols))
+    for chunk in chunks:
+        acc.update(
+            chunk[list(cols)]
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype="float64", na_value=np.nan),
+            block_rows,
+        )
+    corr, _ = acc.result(min_periods)
+    return pd.DataFrame(corr, index=list(cols), columns=list(cols))
+
+
+def vif_from_corr(corr: np.ndarray, *, tol: float = 1e-10) -> np.ndarray:
+    """
+    VIF for all features at once: VIF_j = [R^-1]_jj, per column.
+
+    - Columns whose correlations are undefined (constant, no pairwise overlap)
+      get NaN and are left out of the inverse.
+    - An exact linear dependency shows up as eigenvalues of R at ~0
+      (below `tol` x the largest one). Columns loading on those eigenvectors
+      get +inf. The other columns use the pseudo-inverse, which gives their
+      usual VIF.
+    - When R is computed from complete rows (no NaNs, or after imputation as
+      in `CorrelationEngine.vif`), this matches one OLS (with intercept) per
+      feature. A pairwise-complete R with NaNs only approximates it.
+    """
+    R = np.asarray(corr, dtype="float64")
+    p = R.shape[0]
+    vif = np.full(p, np.nan)
+    if p == 0:
+        return vif
+    keep = np.isfinite(np.diag(R))
+    while keep.any():  # drop the column with the most undefined entries
+        bad = (~np.isfinite(R[np.ix_(keep, keep)])).sum(axis=0)
+        if not bad.any():
+            break
+        keep[np.flatnonzero(keep)[int(np.argmax(bad))]] = False
+    idx = np.flatnonzero(keep)
+    if idx.size == 0:
+        return vif
+    Rk = (R[np.ix_(idx, idx)] + R[np.ix_(idx, idx)].T) / 2.0
+    w, V = np.linalg.eigh(Rk)
+    null = w <= tol * max(float(w.max()), 1.0)
+    inv_diag = ((V[:, ~null] ** 2) / w[~null]).sum(axis=1)
+    dependent = (V[:, null] ** 2).sum(axis=1) > 1e-8
+    vif[idx] = np.where(dependent, np.inf, np.maximum(inv_diag, 1.0))
+    return vif
+
+
+def _dense_codes(a: np.ndarray) -> np.ndarray:
+    """Map values to dense integer codes 0..k-1 preserving order."""
+    _, codes = np.unique(a, return_inverse=True)
+    return codes.astype("int64").ravel()
+
+
+def _tie_pairs(codes: np.ndarray) -> int:
+    """Sum of t*(t-1)/2 over tie groups."""
+    counts = np.bincount(codes)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _count_inversions(r: np.ndarray) -> int:
+    """
+    Number of pairs i<j with r[i] > r[j] (strict), via bottom-up merge levels.
+
+    Each level is a handful of vectorized sorts/searchsorted calls, so the whole
+    count is O(n log^2 n) in NumPy instead of an O(n^2) Python loop.
+    """
+    n = r.size
+    if n < 2:
+        return 0
+    a = r.astype("int64").copy()
+    big = int(a.max()) + 1
+    idx = np.arange(n, dtype="int64")
+    inv = 0
+    width = 1
+    while width < n:
+        block = idx // (2 * width)
+        is_right = ((idx // width) % 2) == 1
+        key = block * big + a
+        left_keys = key[~is_right]  # sorted runs, block-major => globally sorted
+        right_keys = key[is_right]
+        right_block = block[is_right]
+        lo = np.searchsorted(left_keys, right_keys, side="right")
+        hi = np.searchsorted(left_keys, (right_block + 1) * big, side="left")
+        inv += int((hi - lo).sum())
+        key.sort()
+        a = key % big
+        width *= 2
+    return inv
+
+
+def kendall_tau_b(x: np.ndarray, y: np.ndarray) -> float:
+    """Kendall tau-b (Knight's algorithm) on pairwise-complete observations."""
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    ok = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[ok], y[ok]
+    n = x.size
+    if n < 2:
+        return float("nan")
+
+    xc = _dense_codes(x)
+    yc = _dense_codes(y)
+    order = np.lexsort((yc, xc))
+    xs, ys = xc[order], yc[order]
+
+    n0 = n * (n - 1) // 2
+    n1 = _tie_pairs(xc)
+    n2 = _tie_pairs(yc)
+    n3 = _tie_pairs(_dense_codes(xs * (int(ys.max()) + 1) + ys))
+    swaps = _count_inversions(ys)
+
+    denom = np.sqrt(float(n0 - n1) * float(n0 - n2))
+    if denom == 0:
+        return float("nan")
+    return float((n0 - n1 - n2 + n3 - 2 * swaps) / denom)
+
+
+@traced("engine.correlation.pairwise_kendall")
+def pairwise_kendall(X: np.ndarray, *, n_jobs: int = 1) -> np.ndarray:
+    """Kendall tau-b matrix; the upper-triangle pairs run in parallel via joblib."""
+    X = np.asarray(X, dtype="float64")
+    p = X.shape[1]
+    out = np.eye(p)
+    pairs = [(i, j) for i in range(p) for j in range(i + 1, p)]
+    if not pairs:
+        return out
+
+    if n_jobs == 1 or len(pairs) == 1:
+        vals = [kendall_tau_b(X[:, i], X[:, j]) for i, j in pairs]
+    else:
+        from joblib import Parallel, delayed
+
+        vals = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(kendall_tau_b)(X[:, i], X[:, j]) for i, j in pairs
+        )
+
+    for (i, j), v in zip(pairs, vals, strict=True):
+        out[i, j] = out[j, i] = v
+    return out
+
+
+class CorrelationEngine:
+    """
+    Compute-once correlation state for a numeric frame.
+
+    Usage (2.11.1 / 2.11.2 / 2.7.13 share one instance):
+        eng = CorrelationEngine(df_28, numeric_feature_cols(df_28))
+        pairs_df = eng.pair_table(["pearson", "spearman", "kendall"], threshold=0.85)
+        dist = eng.distance_matrix()            # CORR_CLUSTERING input
+        vif_df = eng.vif_report(max_vif=10.0)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        cols: Sequence[str] | None = None,
+        *,
+        block_rows: int = 65_536,
+        n_jobs: int = 1,
+    ):
+        cols = list(cols) if cols is not None else numeric_feature_cols(df)
+        self.cols: list[str] = [c for c in cols if c in df.columns]
+        X = df[self.cols].apply(pd.to_numeric, errors="coerce")
+        X = X.dropna(how="all")
+        self.X: np.ndarray = X.to_numpy(dtype="float64", na_value=np.nan)
+        self.block_rows = int(block_rows)
+        self.n_jobs = int(n_jobs)
+        self._rank_index: RankIndex | None = None
+        self._ranks: np.ndarray | None = None
+        self._cache: dict[str, pd.DataFrame] = {}
+        self.n_obs: pd.DataFrame | None = None
+
+    @property
+    def rank_index(self) -> RankIndex:
+        if self._rank_index is None:
+            self._rank_index = RankIndex(self.X)
+        return self._rank_index
+
+    @property
+    def ranks(self) -> np.ndarray:
+        if self._ranks is None:
+            self._ranks = self.rank_index.ranks()
+        return self._ranks
+
+    def _frame(self, arr: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(arr, index=self.cols, columns=self.cols)
+
+    @traced("engine.correlation.matrix")
+    def matrix(self, method: str = "pearson") -> pd.DataFrame:
+        """Correlation matrix for `method` (pearson | spearman | kendall), cached."""
+        method = str(method).lower()
+        if method in self._cache:
+            return self._cache[method]
+
+        if method == "pearson":
+            corr, n_obs = pairwise_pearson(self.X, block_rows=self.block_rows)
+            self.n_obs = self._frame(n_obs)
+        elif method == "spearman":
+            corr = pairwise_spearman(
+                self.X, block_rows=self.block_rows, ranks=self.ranks, index=self.rank_index
+            )
+        elif method == "kendall":
+            corr = pairwise_kendall(self.X, n_jobs=self.n_jobs)
+        else:
+            raise ValueError(f"Unknown correlation method: {method!r}")
+
+        np.fill_diagonal(corr, 1.0)
+        out = self._frame(corr)
+        self._cache[method] = out
+        return out
+
+    @traced("engine.correlation.pair_table")
+    def pair_table(
+        self,
+        methods: Iterable[str] = ("pearson", "spearman", "kendall"),
+        *,
+        threshold: float = 0.85,
+    ) -> pd.DataFrame:
+        """Long-form upper-triangle table in the NUMERIC_CORR_MATRIX schema."""
+        methods = [str(m).lower() for m in methods]
+        p = len(self.cols)
+        if p < 2:
+            return pd.DataFrame(columns=CORR_PAIR_COLUMNS)
+
+        iu, ju = np.triu_indices(p, k=1)
+        out = pd.DataFrame(
+            {
+                "feature_1": np.asarray(self.cols, dtype=object)[iu],
+                "feature_2": np.asarray(self.cols, dtype=object)[ju],
+            }
+        )
+        for m, col in _METHOD_COLS.items():
+            out[col] = self.matrix(m).to_numpy()[iu, ju] if m in methods else np.nan
+
+        pr = out["pearson_r"].to_numpy(dtype="float64")
+        out["collinear_flag"] = ~np.isnan(pr) & (np.abs(pr) >= float(threshold))
+        return out[CORR_PAIR_COLUMNS]
+
+    def distance_matrix(self, method: str = "pearson") -> pd.DataFrame:
+        """1 - |r| distance for CORR_CLUSTERING (NaN correlations → max distance)."""
+        d = 1.0 - np.abs(self.matrix(method).to_numpy())
+        d = np.where(np.isfinite(d), d, 1.0)
+        np.fill_diagonal(d, 0.0)
+        return self._frame(d)
+
+    @traced("engine.correlation.vif")
+    def vif(self, *, impute: str = "mean", drop_constant: bool = True) -> pd.Series:
+        """
+        VIF per column from the inverse correlation matrix.
+
+        Missing values are imputed first (mean | median | zero), mirroring 2.7.13,
+        so the result matches per-feature OLS VIF on the imputed design.
+        """
+        X = self.X.copy()
+        if impute == "zero":
+            fill = np.zeros(X.shape[1])
+        elif impute == "median":
+            fill = np.nanmedian(X, axis=0) if X.size else np.zeros(X.shape[1])
+        else:
+            fill = np.nanmean(X, axis=0) if X.size else np.zeros(X.shape[1])
+        fill = np.where(np.isfinite(fill), fill, 0.0)
+        X = np.where(np.isnan(X), fill, X)
+
+        keep = np.ones(X.shape[1], dtype=bool)
+        if drop_constant and X.shape[0]:
+            keep = np.ptp(X, axis=0) > 0
+        cols = [c for c, k in zip(self.cols, keep, strict=True) if k]
+        if len(cols) < 2:
+            return pd.Series(dtype="float64", name="vif_value")
+
+        corr, _ = pairwise_pearson(X[:, keep], block_rows=self.block_rows)
+        np.fill_diagonal(corr, 1.0)
+        return pd.Series(vif_from_corr(corr), index=cols, name="vif_value")
+
+    def vif_report(
+        self,
+        *,
+        max_vif: float = 10.0,
+        impute: str = "mean",
+        drop_constant: bool = True,
+    ) -> pd.DataFrame:
+        """
+        VIF table in the MULTICOLLINEARITY schema, sorted desc.
+
+        Columns in an exact linear dependency are reported with VIF = inf;
+        columns with an undefined VIF (NaN) are left out.
+        """
+        vif = self.vif(impute=impute, drop_constant=drop_constant)
+        vif = vif[~np.isnan(vif.to_numpy())]
+        if vif.empty:
+            return pd.DataFrame(columns=VIF_COLUMNS)
+
+        vals = vif.to_numpy()
+        cat = np.select([vals < 5, vals < max_vif], ["low", "moderate"], default="high")
+        notes = np.where(
+            np.isinf(vals),
+            "exact linear dependency; drop one of the dependent columns",
+            np.where(cat == "high", f"VIF>={max_vif:.1f}; drop/regularize", ""),
+        )
+        out = pd.DataFrame(
+            {
+                "column": vif.index.to_numpy(dtype=object),
+                "vif_value": vals,
+                "vif_category": cat,
+                "notes": notes,
+            }
+        )
+        return out.sort_values("vif_value", ascending=False, ignore_index=True)
+
+
+def numeric_corr_status(pairs_df: pd.DataFrame) -> str:
+    """2.11.1 status rule: share of collinear pairs → OK / WARN / FAIL."""
+    n_pairs = int(pairs_df.shape[0])
+    if n_pairs == 0:
+        return "WARN"
+    frac = float(pairs_df["collinear_flag"].sum()) / n_pairs
+    if frac <= 0.3:
+        return "OK"
+    if frac <= 0.7:
+        return "WARN"
+    return "FAIL"
+
+
+def corr_engine_from_config(
+    df: pd.DataFrame, cfg: dict[str, Any] | None = None
+) -> CorrelationEngine:
+    """Build an engine using NUMERIC_CORR_MATRIX knobs (BLOCK_ROWS, N_JOBS)."""
+    cfg = cfg or {}
+    return CorrelationEngine(
+        df,
+        numeric_feature_cols(df, exclude=cfg.get("EXCLUDE_COLUMNS", []) or []),
+        block_rows=int(cfg.get("BLOCK_ROWS", 65_536)),
+        n_jobs=int(cfg.get("N_JOBS", 1)),
+    )
@@ -0,0 +1,706 @@
+# src/dq_engine/engines/hypothesis.py
+"""
+Batched hypothesis-testing engine for 2.7.5–2.7.10 (+ 2.8.6 corrections).
+
+Each categorical column is factorized ONCE into a `GroupIndex` (codes + row
+order sorted by code). Group counts / sums / sums of squares / rank sums for
+every numeric target then come from a single `np.add.reduceat` over that
+order, so ANOVA, Kruskal–Wallis, Levene, t-tests, Mann–Whitney and
+two-proportion z-tests all reuse the same grouped state.
+
+Every test family appends to one in-memory master p-value table
+(`test_id, p_raw, feature_or_pair, source_file, ...`), and
+`apply_corrections()` runs the 2.8.6 correction layer on it directly, with no
+CSV round-trip.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.engines.correlation import numeric_feature_cols, rank_columns
+from dq_engine.helpers.stats_corrections import adjust_pvalues
+from dq_engine.utils.tracing import traced
+
+try:
+    from scipy import special as _special
+    _HAS_SCIPY = True
+except Exception:
+    _special = None
+    _HAS_SCIPY = False
+
+# 2.8.6 master / correction schemas
+MASTER_COLUMNS = ["test_id", "p_raw", "feature_or_pair", "source_file", "test_family", "method", "statistic"]
+CORRECTION_COLUMNS = [
+    "p_corrected", "method", "alpha",
+    "reject_uncorrected", "reject_corrected", "inflation_flag",
+]
+
+_POSITIVE_TOKENS = {"yes", "y", "true", "t", "1", "churned", "positive"}
+
+
+def _require_scipy() -> None:
+    if not _HAS_SCIPY:
+        raise RuntimeError("❌ SciPy is required for p-values (pip install 'dq-engine[stats]').")
+
+
+def _p_f(F, d1, d2):
+    _require_scipy()
+    return _special.fdtrc(d1, d2, F)
+
+
+def _p_chi2(x, dof):
+    _require_scipy()
+    return _special.chdtrc(dof, x)
+
+
+def _p_t_two_sided(t, dof):
+    _require_scipy()
+    return 2.0 * _special.stdtr(dof, -np.abs(t))
+
+
+def _p_z_two_sided(z):
+    _require_scipy()
+    return 2.0 * _special.ndtr(-np.abs(z))
+
+
+def _match_level(levels: Sequence[Any], want: Any) -> Optional[int]:
+    """Find the code of `want` in `levels` (exact, then string, then bool-ish match)."""
+    for i, lv in enumerate(levels):
+        if lv == want:
+            return i
+    sw = str(want).strip().lower()
+    for i, lv in enumerate(levels):
+        if str(lv).strip().lower() == sw:
+            return i
+    if isinstance(want, bool):
+        for i, lv in enumerate(levels):
+            if str(lv).strip() == str(int(want)):
+                return i
+    return None
+
+
+class GroupIndex:
+    """
+    One factorization of a categorical column.
+
+    `rows` are the row positions with a non-null group, stably sorted by code,
+    so `reduce(V)` turns any row-aligned matrix into per-group sums with one
+    `np.add.reduceat` call.
+    """
+
+    def __init__(self, s: pd.Series):
+        codes, levels = pd.factorize(s, sort=True)
+        self.name = s.name
+        self.levels: List[Any] = list(levels)
+        self.codes: np.ndarray = codes.astype("int64")
+        valid = np.flatnonzero(self.codes >= 0)
+        self.rows: np.ndarray = valid[np.argsort(self.codes[valid], kind="stable")]
+        self.sorted_codes: np.ndarray = self.codes[self.rows]
+        self.counts: np.ndarray = np.bincount(self.sorted_codes, minlength=self.k)
+        self._nonempty = np.flatnonzero(self.counts > 0)
+        self._starts = (np.cumsum(self.counts) - self.counts)[self._nonempty]
+
+    @property
+    def k(self) -> int:
+        return len(self.levels)
+
+    def reduce(self, V: np.ndarray) -> np.ndarray:
+        """Per-group column sums of `V` (rows aligned to `self.rows`) → k x p."""
+        V = np.asarray(V, dtype="float64")
+        if V.ndim == 1:
+            V = V[:, None]
+        out = np.zeros((self.k, V.shape[1]))
+        if V.shape[0]:
+            out[self._nonempty] = np.add.reduceat(V, self._starts, axis=0)
+        return out
+
+    def code(self, level: Any) -> Optional[int]:
+        return _match_level(self.levels, level)
+
+
+class HypothesisEngine:
+    """
+    Shared grouped state for all 2.7 inferential tests on one frame.
+
+    Usage:
+        eng = HypothesisEngine(df_27)
+        anova_df = eng.anova_kruskal(C("CAT_NUM_RELATIONSHIPS.GROUP_BY", []))
+        chi_df = eng.chi_square(C("CAT_CAT_RELATIONSHIPS.PAIRS", []))
+        t_df = eng.t_tests(C("PARAMETRIC_TESTS.TEST_CASES", []))
+        mwu_df = eng.mann_whitney(C("NONPARAMETRIC_TESTS.TEST_CASES", []))
+        prop_df = eng.proportion_tests(C("PROPORTION_TESTS.TEST_CASES", []))
+        mt_df = apply_corrections(eng.master_table(), method="fdr_bh", alpha=0.05)
+    """
+
+    def __init__(self, df: pd.DataFrame, numeric_cols: Optional[Sequence[str]] = None):
+        self.df = df
+        self.numeric_cols: List[str] = list(numeric_cols) if numeric_cols is not None else numeric_feature_cols(df)
+        self._X: Optional[np.ndarray] = None
+        self._groups: Dict[str, GroupIndex] = {}
+        self._moments: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._master: List[pd.DataFrame] = []
+
+    # ------------------------------------------------------------------ state
+    @property
+    def X(self) -> np.ndarray:
+        if self._X is None:
+            X = self.df[self.numeric_cols].apply(pd.to_numeric, errors="coerce")
+            self._X = X.to_numpy(dtype="float64", na_value=np.nan)
+        return self._X
+
+    def groups(self, col: str) -> GroupIndex:
+        if col not in self._groups:
+            self._groups[col] = GroupIndex(self.df[col])
+        return self._groups[col]
+
+    def _col_idx(self, col: str) -> Optional[int]:
+        try:
+            return self.numeric_cols.index(col)
+        except ValueError:
+            return None
+
+    def _values(self, col: str) -> np.ndarray:
+        j = self._col_idx(col)
+        if j is not None:
+            return self.X[:, j]
+        return pd.to_numeric(self.df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    def moments(self, group_col: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(count, sum, sum of squares) per group x numeric target, computed once per group col."""
+        if group_col not in self._moments:
+            gi = self.groups(group_col)
+            Xs = self.X[gi.rows]
+            M = ~np.isnan(Xs)
+            Z = np.where(M, Xs, 0.0)
+            self._moments[group_col] = (gi.reduce(M), gi.reduce(Z), gi.reduce(Z * Z))
+        return self._moments[group_col]
+
+    def _record(self, family: str, source_file: str, test_ids, features, methods, stats, pvals) -> None:
+        self._master.append(pd.DataFrame({
+            "test_id": list(test_ids),
+            "p_raw": np.asarray(pvals, dtype="float64"),
+            "feature_or_pair": list(features),
+            "source_file": source_file,
+            "test_family": family,
+            "method": list(methods),
+            "statistic": np.asarray(stats, dtype="float64"),
+        }))
+
+    def master_table(self) -> pd.DataFrame:
+        """All p-values recorded so far (2.8.6 MASTER_FILE schema)."""
+        if not self._master:
+            return pd.DataFrame(columns=MASTER_COLUMNS)
+        out = pd.concat(self._master, ignore_index=True)
+        return out[out["p_raw"].notna()].reset_index(drop=True)
+
+    # ------------------------------------------------------------ 2.7.5
+    @traced("engine.hypothesis.anova_kruskal")
+    def anova_kruskal(
+        self,
+        group_cols: Iterable[str],
+        numeric_targets: Optional[Sequence[str]] = None,
+        *,
+        anova: bool = True,
+        kruskal: bool = True,
+        alpha: float = 0.05,
+        min_group_size: int = 2,
+        source_file: str = "anova_kruskal_results.csv",
+    ) -> pd.DataFrame:
+        """ANOVA + Kruskal–Wallis for every (group col, numeric target) in one batch per group col."""
+        targets = [c for c in (numeric_targets or self.numeric_cols) if self._col_idx(c) is not None]
+        tidx = np.array([self._col_idx(c) for c in targets], dtype="int64")
+        frames: List[pd.DataFrame] = []
+
+        for gcol in [g for g in group_cols if g in self.df.columns]:
+            gi = self.groups(gcol)
+            if gi.k < 2 or tidx.size == 0:
+                continue
+            cnt, s1, s2 = (m[:, tidx] for m in self.moments(gcol))
+            use = cnt >= min_group_size
+            n_g = np.where(use, cnt, 0.0)
+            s1u = np.where(use, s1, 0.0)
+            s2u = np.where(use, s2, 0.0)
+            N = n_g.sum(axis=0)
+            k = use.sum(axis=0)
+            ok = k >= 2
+            min_n = np.where(use, cnt, np.inf).min(axis=0)
+            notes = np.where(min_n < 10, "imbalanced groups", "")
+
+            if anova:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    grand = s1u.sum(axis=0) / N
+                    means = s1u / np.where(n_g > 0, n_g, 1.0)
+                    ss_b = (n_g * (means - grand) ** 2).sum(axis=0)
+                    ss_w = (s2u - np.where(n_g > 0, s1u ** 2 / np.where(n_g > 0, n_g, 1.0), 0.0)).sum(axis=0)
+                    ss_w = np.maximum(ss_w, 0.0)
+                    df_b, df_w = k - 1, N - k
+                    F = (ss_b / df_b) / (ss_w / df_w)
+                    p = np.where(ok, _p_f(F, df_b, df_w), np.nan)
+                    ss_t = ss_b + ss_w
+                    eta = np.where(ss_t > 0, ss_b / ss_t, np.nan)
+                frames.append(pd.DataFrame({
+                    "group_feature": gcol, "numeric_feature": targets, "method": "ANOVA",
+                    "statistic": np.where(ok, F, np.nan), "p_value": p,
+                    "significant": np.nan_to_num(p, nan=1.0) <= alpha, "notes": notes,
+                    "n_total": N.astype("int64"), "k_groups": k, "df_between": df_b,
+                    "df_within": df_w.astype("int64"), "ss_between": ss_b, "ss_within": ss_w,
+                    "ss_total": ss_t, "eta_squared": eta,
+                })[ok])
+
+            if kruskal:
+                H, pk = self._kruskal_batch(gi, tidx, use)
+                frames.append(pd.DataFrame({
+                    "group_feature": gcol, "numeric_feature": targets, "method": "KRUSKAL",
+                    "statistic": H, "p_value": pk,
+                    "significant": np.nan_to_num(pk, nan=1.0) <= alpha, "notes": notes,
+                })[ok])
+
+        out = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            columns=["group_feature", "numeric_feature", "method", "statistic", "p_value", "significant", "notes"]
+        )
+        if not out.empty:
+            self._record(
+                "anova_kruskal", source_file,
+                "catnum_" + out["method"].str.lower() + "_" + out["numeric_feature"].astype(str) + "_by_" + out["group_feature"].astype(str),
+                out["numeric_feature"].astype(str) + " ~ " + out["group_feature"].astype(str),
+                out["method"], out["statistic"], out["p_value"],
+            )
+        return out
+
+    def _kruskal_batch(self, gi: GroupIndex, tidx: np.ndarray, use: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Kruskal–Wallis H (tie-corrected) for all targets; groups failing `use` are excluded."""
+        Xs = self.X[gi.rows][:, tidx].copy()
+        # drop rows belonging to groups that are too small for that target
+        Xs[~use[gi.sorted_codes]] = np.nan
+        R = rank_columns(Xs)
+        M = ~np.isnan(R)
+        n_g = gi.reduce(M)
+        r_g = gi.reduce(np.where(M, R, 0.0))
+        N = n_g.sum(axis=0)
+        k = (n_g > 0).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            H = 12.0 / (N * (N + 1)) * np.where(n_g > 0, r_g ** 2 / np.where(n_g > 0, n_g, 1.0), 0.0).sum(axis=0) - 3.0 * (N + 1)
+            tie = np.empty(len(tidx))
+            for j in range(len(tidx)):
+                v = Xs[:, j]
+                _, t = np.unique(v[~np.isnan(v)], return_counts=True)
+                tie[j] = float((t ** 3 - t).sum())
+            corr = 1.0 - tie / (N ** 3 - N)
+            H = np.where(corr > 0, H / corr, np.nan)
+            p = np.where(k >= 2, _p_chi2(H, k - 1), np.nan)
+        return np.where(k >= 2, H, np.nan), p
+
+    # ------------------------------------------------------------ 2.7.6
+    @traced("engine.hypothesis.chi_square")
+    def chi_square(
+        self,
+        pairs: Iterable[Sequence[str]],
+        *,
+        alpha: float = 0.05,
+        source_file: str = "chi_square_results.csv",
+    ) -> pd.DataFrame:
+        """Chi-square independence for each pair; contingency tables via one bincount on codes."""
+        rows: List[Dict[str, Any]] = []
+        for pair in pairs or []:
+            if len(pair) != 2:
+                continue
+            c1, c2 = pair
+            if c1 not in self.df.columns or c2 not in self.df.columns:
+                continue
+            ga, gb = self.groups(c1), self.groups(c2)
+            ok = (ga.codes >= 0) & (gb.codes >= 0)
+            table = np.bincount(
+                ga.codes[ok] * gb.k + gb.codes[ok], minlength=ga.k * gb.k
+            ).reshape(ga.k, gb.k).astype("float64")
+            table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+            if table.shape[0] < 2 or table.shape[1] < 2:
+                continue
+
+            expected = table.sum(axis=1, keepdims=True) * table.sum(axis=0, keepdims=True) / table.sum()
+            dof = (table.shape[0] - 1) * (table.shape[1] - 1)
+            obs = table
+            if dof == 1:  # Yates continuity correction (scipy.stats.chi2_contingency default)
+                diff = expected - table
+                obs = table + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+            chi2 = float(((obs - expected) ** 2 / expected).sum())
+            p = float(_p_chi2(chi2, dof))
+
+            label = "Strongly Associated" if p < 0.01 else ("Weakly Associated" if p < alpha else "Independent")
+            small = int((expected < 5).sum())
+            rows.append({
+                "feature_1": c1, "feature_2": c2, "statistic": chi2, "p_value": p, "dof": dof,
+                "association_label": label,
+                "notes": f"{small} cells with expected count < 5" if small else "",
+            })
+
+        out = pd.DataFrame(rows, columns=["feature_1", "feature_2", "statistic", "p_value", "dof", "association_label", "notes"])
+        if not out.empty:
+            self._record(
+                "chi_square", source_file,
+                "chisq_" + out["feature_1"].astype(str) + "_" + out["feature_2"].astype(str),
+                out["feature_1"].astype(str) + " x " + out["feature_2"].astype(str),
+                ["chi_square"] * len(out), out["statistic"], out["p_value"],
+            )
+        return out
+
+    # ------------------------------------------------------------ 2.7.8
+    @traced("engine.hypothesis.t_tests")
+    def t_tests(
+        self,
+        cases: Iterable[Dict[str, Any]],
+        *,
+        equal_var: Any = "auto",
+        alpha: float = 0.05,
+        levene_alpha: float = 0.05,
+        source_file: str = "t_test_results.csv",
+    ) -> pd.DataFrame:
+        """Independent (Welch / pooled) and paired t-tests from the cached group moments."""
+        rows: List[Dict[str, Any]] = []
+        for case in cases or []:
+            ttype = str(case.get("type", "independent")).lower().strip()
+            row: Dict[str, Any] = {
+                "test_name": case.get("name", "unnamed_test"), "test_type": ttype,
+                "group_col": case.get("group_col"), "group_A_label": None, "group_B_label": None,
+                "numeric_col": case.get("numeric_col"),
+                "col_before": case.get("col_before"), "col_after": case.get("col_after"),
+                "n_group_A": np.nan, "mean_group_A": np.nan, "std_group_A": np.nan,
+                "n_group_B": np.nan, "mean_group_B": np.nan, "std_group_B": np.nan,
+                "n_pairs": np.nan, "t_statistic": np.nan, "p_value": np.nan,
+                "equal_var_assumed": None, "significant": False, "notes": "",
+            }
+
+            if ttype == "paired":
+                b, a = row["col_before"], row["col_after"]
+                if b not in self.df.columns or a not in self.df.columns:
+                    row["notes"] = "Required columns not present in dataframe"
+                    rows.append(row)
+                    continue
+                d = self._values(b) - self._values(a)
+                d = d[~np.isnan(d)]
+                n = d.size
+                row["n_pairs"] = n
+                if n < 2:
+                    row["notes"] = "Insufficient paired observations"
+                else:
+                    sd = d.std(ddof=1)
+                    t = d.mean() / (sd / np.sqrt(n)) if sd > 0 else np.nan
+                    row.update(t_statistic=t, p_value=float(_p_t_two_sided(t, n - 1)) if np.isfinite(t) else np.nan)
+                rows.append(row)
+                continue
+
+            gcol, ncol, groups = row["group_col"], row["numeric_col"], case.get("groups", [])
+            if gcol not in self.df.columns or self._col_idx(ncol) is None or len(groups or []) != 2:
+                row["notes"] = "Missing/invalid group_col, numeric_col or groups"
+                rows.append(row)
+                continue
+            gi = self.groups(gcol)
+            ia, ib = gi.code(groups[0]), gi.code(groups[1])
+            row["group_A_label"], row["group_B_label"] = groups[0], groups[1]
+            if ia is None or ib is None:
+                row["notes"] = "Group label(s) not present in data"
+                rows.append(row)
+                continue
+
+            j = self._col_idx(ncol)
+            cnt, s1, s2 = (m[:, j] for m in self.moments(gcol))
+            nA, nB = cnt[ia], cnt[ib]
+            if nA < 2 or nB < 2:
+                row.update(n_group_A=int(nA), n_group_B=int(nB), notes="Insufficient sample size in one or both groups")
+                rows.append(row)
+                continue
+            mA, mB = s1[ia] / nA, s1[ib] / nB
+            vA = max((s2[ia] - nA * mA ** 2) / (nA - 1), 0.0)
+            vB = max((s2[ib] - nB * mB ** 2) / (nB - 1), 0.0)
+
+            eq = equal_var
+            if isinstance(eq, str) and eq.lower() == "auto":
+                eq = self._levene_p(gi, j, (ia, ib)) >= levene_alpha
+            eq = bool(eq)
+
+            if eq:
+                dof = nA + nB - 2
+                sp2 = ((nA - 1) * vA + (nB - 1) * vB) / dof
+                se = np.sqrt(sp2 * (1.0 / nA + 1.0 / nB))
+            else:
+                se = np.sqrt(vA / nA + vB / nB)
+                dof = (vA / nA + vB / nB) ** 2 / (
+                    (vA / nA) ** 2 / (nA - 1) + (vB / nB) ** 2 / (nB - 1)
+                ) if se > 0 else np.nan
+            t = (mA - mB) / se if se > 0 else np.nan
+            p = float(_p_t_two_sided(t, dof)) if np.isfinite(t) else np.nan
+            row.update(
+                n_group_A=int(nA), mean_group_A=mA, std_group_A=np.sqrt(vA),
+                n_group_B=int(nB), mean_group_B=mB, std_group_B=np.sqrt(vB),
+                t_statistic=t, p_value=p, equal_var_assumed=eq,
+                significant=bool(np.isfinite(p) and p <= alpha),
+            )
+            rows.append(row)
+
+        out = pd.DataFrame(rows)
+        if not out.empty:
+            self._record(
+                "t_test", source_file, out["test_name"],
+                out["numeric_col"].fillna(out["col_before"]).astype(str),
+                out["test_type"], out["t_statistic"], out["p_value"],
+            )
+        return out
+
+    def _levene_p(self, gi: GroupIndex, j: int, codes: Tuple[int, ...]) -> float:
+        """Brown–Forsythe Levene p-value (median-centred) for the selected groups of target j."""
+        v = self.X[gi.rows, j]
+        sel = np.isin(gi.sorted_codes, codes) & ~np.isnan(v)
+        c, v = gi.sorted_codes[sel], v[sel]
+        med = np.zeros(gi.k)
+        for code in codes:
+            med[code] = np.median(v[c == code])
+        z = np.abs(v - med[c])
+        n = np.bincount(c, minlength=gi.k)[list(codes)].astype("float64")
+        s1 = np.bincount(c, weights=z, minlength=gi.k)[list(codes)]
+        s2 = np.bincount(c, weights=z * z, minlength=gi.k)[list(codes)]
+        N, k = n.sum(), len(codes)
+        grand = s1.sum() / N
+        ss_b = (n * (s1 / n - grand) ** 2).sum()
+        ss_w = (s2 - s1 ** 2 / n).sum()
+        if ss_w <= 0:
+            return float("nan")
+        return float(_p_f((ss_b / (k - 1)) / (ss_w / (N - k)), k - 1, N - k))
+
+    # ------------------------------------------------------------ 2.7.9
+    @traced("engine.hypothesis.mann_whitney")
+    def mann_whitney(
+        self,
+        cases: Iterable[Dict[str, Any]],
+        *,
+        alpha: float = 0.05,
+        source_file: str = "nonparametric_results.csv",
+    ) -> pd.DataFrame:
+        """
+        Mann–Whitney U (independent) / Wilcoxon signed-rank (paired), normal
+        approximation with tie + continuity correction. Cases that share a
+        (group_col, groups) pair are ranked together in one `rank_columns` call.
+        """
+        rows: List[Dict[str, Any]] = []
+        batches: Dict[Tuple[str, Any, Any], List[Dict[str, Any]]] = {}
+
+        for case in cases or []:
+            ttype = str(case.get("type", "independent")).lower().strip()
+            row: Dict[str, Any] = {
+                "test_name": case.get("name", "unnamed_test"), "test_type": ttype, "method": None,
+                "group_col": case.get("group_col"), "group_A_label": None, "group_B_label": None,
+                "numeric_col": case.get("numeric_col"),
+                "col_before": case.get("col_before"), "col_after": case.get("col_after"),
+                "n_group_A": np.nan, "n_group_B": np.nan, "n_pairs": np.nan,
+                "statistic": np.nan, "p_value": np.nan, "z_statistic": np.nan, "n_total": np.nan,
+                "effect_r": np.nan, "effect_type": None, "significant": False, "notes": "",
+            }
+            rows.append(row)
+            if ttype == "paired":
+                self._wilcoxon_row(row, alpha)
+                continue
+            groups = case.get("groups", [])
+            if row["group_col"] not in self.df.columns or row["numeric_col"] not in self.df.columns or len(groups or []) != 2:
+                row["notes"] = "Missing/invalid group_col, numeric_col or groups"
+                continue
+            row["group_A_label"], row["group_B_label"] = groups[0], groups[1]
+            batches.setdefault((row["group_col"], groups[0], groups[1]), []).append(row)
+
+        for (gcol, la, lb), brows in batches.items():
+            gi = self.groups(gcol)
+            ia, ib = gi.code(la), gi.code(lb)
+            if ia is None or ib is None:
+                for r in brows:
+                    r["notes"] = "Group label(s) not present in data"
+                continue
+            sel = np.isin(gi.sorted_codes, (ia, ib))
+            rws, c = gi.rows[sel], gi.sorted_codes[sel]
+            V = np.column_stack([self._values(r["numeric_col"])[rws] for r in brows])
+            R = rank_columns(V)
+            isA = (c == ia)[:, None]
+            M = ~np.isnan(V)
+            n1 = (M & isA).sum(axis=0).astype("float64")
+            n2 = (M & ~isA).sum(axis=0).astype("float64")
+            R1 = np.where(M & isA, R, 0.0).sum(axis=0)
+            U = R1 - n1 * (n1 + 1) / 2.0
+            N = n1 + n2
+            for j, r in enumerate(brows):
+                r.update(method="mannwhitney", n_group_A=int(n1[j]), n_group_B=int(n2[j]), n_total=int(N[j]))
+                if n1[j] < 1 or n2[j] < 1:
+                    r["notes"] = "Insufficient sample size in one or both groups"
+                    continue
+                v = V[:, j]
+                _, t = np.unique(v[~np.isnan(v)], return_counts=True)
+                tie = float((t ** 3 - t).sum())
+                mu = n1[j] * n2[j] / 2.0
+                sigma = np.sqrt(n1[j] * n2[j] / 12.0 * ((N[j] + 1) - tie / (N[j] * (N[j] - 1)))) if N[j] > 1 else 0.0
+                if sigma <= 0:
+                    r["notes"] = "Zero variance in pooled ranks"
+                    continue
+                z = (U[j] - mu - 0.5 * np.sign(U[j] - mu)) / sigma
+                p = float(_p_z_two_sided(z))
+                r.update(
+                    statistic=float(U[j]), p_value=p, z_statistic=float(z),
+                    effect_r=float(abs(z) / np.sqrt(N[j])), effect_type="r_from_z",
+                    significant=bool(p <= alpha),
+                )
+
+        out = pd.DataFrame(rows)
+        if not out.empty:
+            self._record(
+                "nonparametric", source_file, out["test_name"],
+                out["numeric_col"].fillna(out["col_before"]).astype(str),
+                out["method"].fillna(out["test_type"]), out["statistic"], out["p_value"],
+            )
+        return out
+
+    def _wilcoxon_row(self, row: Dict[str, Any], alpha: float) -> None:
+        b, a = row["col_before"], row["col_after"]
+        row["method"] = "wilcoxon"
+        if b not in self.df.columns or a not in self.df.columns:
+            row["notes"] = "Required columns not present in dataframe"
+            return
+        d = self._values(b) - self._values(a)
+        d = d[~np.isnan(d) & (d != 0)]  # zero_method="wilcox"
+        n = d.size
+        row["n_pairs"] = row["n_total"] = n
+        if n < 1:
+            row["notes"] = "No non-zero paired differences"
+            return
+        r = rank_columns(np.abs(d)[:, None])[:, 0]
+        w_pos = float(r[d > 0].sum())
+        w_neg = float(r[d < 0].sum())
+        T = min(w_pos, w_neg)
+        _, t = np.unique(np.abs(d), return_counts=True)
+        mu = n * (n + 1) / 4.0
+        sigma = np.sqrt(n * (n + 1) * (2 * n + 1) / 24.0 - float((t ** 3 - t).sum()) / 48.0)
+        if sigma <= 0:
+            row["notes"] = "Zero variance in signed ranks"
+            return
+        z = (T - mu) / sigma
+        p = float(_p_z_two_sided(z))
+        row.update(
+            statistic=T, p_value=p, z_statistic=float(z), effect_r=float(abs(z) / np.sqrt(n)),
+            effect_type="r_from_z", significant=bool(p <= alpha),
+        )
+
+    # ------------------------------------------------------------ 2.7.10
+    @traced("engine.hypothesis.proportion_tests")
+    def proportion_tests(
+        self,
+        cases: Iterable[Dict[str, Any]],
+        *,
+        alpha: float = 0.05,
+        min_group_size: int = 30,
+        positive_tokens: Iterable[str] = _POSITIVE_TOKENS,
+        source_file: str = "proportion_tests.csv",
+    ) -> pd.DataFrame:
+        """Two-proportion z-tests; successes per group via one bincount on the cached codes."""
+        pos = {str(t).strip().lower() for t in positive_tokens}
+        success_cache: Dict[str, np.ndarray] = {}
+        rows: List[Dict[str, Any]] = []
+
+        for case in cases or []:
+            ocol, gcol, groups = case.get("outcome_col"), case.get("group_col"), case.get("groups", [])
+            row: Dict[str, Any] = {
+                "test_name": case.get("name", "unnamed_test"), "outcome_col": ocol, "group_col": gcol,
+                "group_A_label": None, "group_B_label": None,
+                "n_A": np.nan, "success_A": np.nan, "rate_A": np.nan,
+                "n_B": np.nan, "success_B": np.nan, "rate_B": np.nan,
+                "method": case.get("method", "two_proportion_z"),
+                "z_statistic": np.nan, "p_value": np.nan, "absolute_diff": np.nan,
+                "relative_risk": np.nan, "significant": False, "underpowered": False, "notes": "",
+            }
+            rows.append(row)
+            if ocol not in self.df.columns or gcol not in self.df.columns or len(groups or []) != 2:
+                row["notes"] = "Missing/invalid outcome_col, group_col or groups"
+                continue
+            gi = self.groups(gcol)
+            ia, ib = gi.code(groups[0]), gi.code(groups[1])
+            row["group_A_label"], row["group_B_label"] = groups[0], groups[1]
+            if ia is None or ib is None:
+                row["notes"] = "Group label(s) not present in data"
+                continue
+
+            if ocol not in success_cache:
+                s = self.df[ocol]
+                success_cache[ocol] = s.astype(str).str.strip().str.lower().isin(pos).to_numpy() & s.notna().to_numpy()
+            succ = success_cache[ocol]
+            valid = self.df[ocol].notna().to_numpy()
+            ok = (gi.codes >= 0) & valid
+            n = np.bincount(gi.codes[ok], minlength=gi.k).astype("float64")
+            x = np.bincount(gi.codes[ok], weights=succ[ok].astype("float64"), minlength=gi.k)
+            nA, nB, xA, xB = n[ia], n[ib], x[ia], x[ib]
+            row.update(n_A=int(nA), success_A=int(xA), n_B=int(nB), success_B=int(xB))
+            row["underpowered"] = bool(min(nA, nB) < min_group_size)
+            if nA == 0 or nB == 0:
+                row["notes"] = "Empty group"
+                continue
+            rA, rB = xA / nA, xB / nB
+            pp = (xA + xB) / (nA + nB)
+            se = np.sqrt(pp * (1 - pp) * (1.0 / nA + 1.0 / nB))
+            z = (rA - rB) / se if se > 0 else np.nan
+            p = float(_p_z_two_sided(z)) if np.isfinite(z) else np.nan
+            row.update(
+                rate_A=rA, rate_B=rB, z_statistic=z, p_value=p, absolute_diff=rA - rB,
+                relative_risk=(rA / rB) if rB > 0 else np.nan,
+                significant=bool(np.isfinite(p) and p <= alpha),
+                notes="underpowered (min group < MIN_GROUP_SIZE)" if row["underpowered"] else "",
+            )
+
+        out = pd.DataFrame(rows)
+        if not out.empty:
+            self._record(
+                "proportion", source_file, out["test_name"],
+                out["outcome_col"].astype(str) + " by " + out["group_col"].astype(str),
+                out["method"], out["z_statistic"], out["p_value"],
+            )
+        return out
+
+
+@traced("engine.hypothesis.apply_corrections")
+def apply_corrections(
+    master: pd.DataFrame,
+    *,
+    method: str = "fdr_bh",
+    alpha: float = 0.05,
+    max_tests: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    2.8.6 correction layer on an in-memory master table.
+
+    Same output columns as the notebook's multiple_testing_corrections.csv
+    (p_corrected, method, alpha, reject_*, inflation_flag). The raw test method
+    from the master is kept as `test_method`.
+    """
+    df = master.copy()
+    if "method" in df.columns:
+        df = df.rename(columns={"method": "test_method"})
+    df["p_raw"] = pd.to_numeric(df.get("p_raw"), errors="coerce")
+    df = df[df["p_raw"].notna()].sort_values("p_raw", kind="stable")
+    if max_tests is not None:
+        df = df.head(int(max_tests))
+    df = df.reset_index(drop=True)
+
+    df["p_corrected"] = adjust_pvalues(df["p_raw"].to_numpy(dtype="float64"), method)
+    df["method"] = str(method).lower()
+    df["alpha"] = float(alpha)
+    df["reject_uncorrected"] = df["p_raw"] <= alpha
+    df["reject_corrected"] = df["p_corrected"] <= alpha
+    df["inflation_flag"] = df["reject_uncorrected"] & ~df["reject_corrected"]
+    return df
+
+
+def correction_status(corrected: pd.DataFrame) -> Tuple[str, float]:
+    """2.8.6 status heuristic: (status, inflation ratio uncorrected/corrected rejections)."""
+    if corrected.empty:
+        return "SKIPPED", float("nan")
+    n_unc = int(corrected["reject_uncorrected"].sum())
+    n_cor = int(corrected["reject_corrected"].sum())
+    ratio = (np.inf if n_unc > 0 else 1.0) if n_cor == 0 else n_unc / n_cor
+    if np.isinf(ratio) or ratio > 5:
+        return "FAIL", ratio
+    if ratio > 2:
+        return "WARN", ratio
+    return "OK", ratio
@@ -0,0 +1,727 @@
+# src/dq_engine/engines/keys.py
+"""
+Hash-based key audit engine (2.1.2 / 2.1.4 / 2.5.1 / 2.5.2).
+
+Key tuples are hashed once to uint64 (pandas' vectorized 64-bit hash, combined
+column by column); everything after that works on integer arrays:
+
+- uniqueness / duplicates: one argsort of the key hashes, run-length on the
+  sorted array (full-row duplicates the same way on the row hash);
+- conflicting key groups: lexsort on (key hash, row hash), count distinct row
+  hashes per duplicated key;
+- foreign keys: membership against a `RefKeyIndex` (sorted unique hashes +
+  searchsorted, or a Bloom filter for very large references), cached per
+  (ref table, ref column, version) so repeated runs skip the rebuild.
+
+Duplicate groups are confirmed with a second, independently keyed hash (and on
+the original values where the two disagree), so a 64-bit collision cannot
+invent a duplicate; FK membership trusts the hash (collision odds are
+~n / 2**64). `*_sql` variants run the same audit as DuckDB joins.
+
+Report frames keep the 2.5.1 / 2.5.2 schemas (id_integrity_report.csv,
+id_duplicates_detail.csv, foreign_key_violations.csv).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+ID_INTEGRITY_COLUMNS = [
+    "key_name",
+    "key_cols",
+    "n_rows",
+    "n_null_key_rows",
+    "n_duplicate_keys",
+    "n_conflicting_key_groups",
+    "severity",
+    "notes",
+]
+FK_COLUMNS = [
+    "fk_name",
+    "fk_col",
+    "ref_table",
+    "ref_col",
+    "n_rows",
+    "n_null_fk_rows",
+    "n_unmatched_fk",
+    "pct_unmatched_fk",
+    "severity",
+    "notes",
+]
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)  # golden-ratio multiplier for combining column hashes
+_CONFIRM_KEY = "dq-engine-keys-2"  # 16-byte key for the independent confirmation hash
+
+
+# ---------------------------------------------------------------------------
+# Hashing
+# ---------------------------------------------------------------------------
+def hash_series(s: pd.Series, hash_key: str | None = None) -> np.ndarray:
+    """uint64 hash per value (nulls hash to a fixed value; mask them separately)."""
+    kw = {"hash_key": hash_key} if hash_key else {}
+    if pd.api.types.is_float_dtype(s):
+        s = s + 0.0  # -0.0 -> 0.0 so hashing agrees with ==
+    return pd.util.hash_pandas_object(s, index=False, categorize=True, **kw).to_numpy(
+        dtype=np.uint64
+    )
+
+
+def hash_rows(
+    df: pd.DataFrame, cols: Sequence[str] | None = None, hash_key: str | None = None
+) -> np.ndarray:
+    """uint64 hash of each row's tuple over `cols` (all columns by default)."""
+    cols = list(df.columns) if cols is None else list(cols)
+    h = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for c in cols:
+            h = (h * _MIX) ^ hash_series(df[c], hash_key)
+    return h
+
+
+def _ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(s, s + c) for each (s, c), without a Python loop."""
+    total = int(counts.sum())
+    offs = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+    return np.arange(total) + offs
+
+
+def _align_key_dtypes(a: pd.Series, b: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Make non-null FK and ref values hash alike (2.5.2 compared them as strings)."""
+    a_num = pd.api.types.is_numeric_dtype(a) and not pd.api.types.is_bool_dtype(a)
+    b_num = pd.api.types.is_numeric_dtype(b) and not pd.api.types.is_bool_dtype(b)
+    if a_num and b_num:
+        if pd.api.types.is_float_dtype(a) or pd.api.types.is_float_dtype(b):
+            return a.astype("float64"), b.astype("float64")
+        return a.astype("int64"), b.astype("int64")
+    if a_num or b_num or a.dtype != b.dtype:
+        return a.astype("string"), b.astype("string")
+    return a, b
+
+
+# ---------------------------------------------------------------------------
+# Duplicates
+# ---------------------------------------------------------------------------
+@dataclass
+class DuplicateGroups:
+    order: np.ndarray  # argsort of the hashes
+    starts: np.ndarray  # start offset (into order) of each distinct hash
+    counts: np.ndarray  # size of each distinct hash group
+
+    @property
+    def n_unique(self) -> int:
+        return int(self.starts.size)
+
+    def duplicated(self) -> np.ndarray:
+        """Group indices with more than one member."""
+        return np.flatnonzero(self.counts > 1)
+
+    def members(self, g: int) -> np.ndarray:
+        s = self.starts[g]
+        return self.order[s : s + self.counts[g]]
+
+
+def group_hashes(h: np.ndarray) -> DuplicateGroups:
+    """Sort-based grouping of equal hashes (O(n log n), no Python-level hashing)."""
+    order = np.argsort(h, kind="stable")
+    hs = h[order]
+    if hs.size == 0:
+        empty = np.array([], dtype=np.int64)
+        return DuplicateGroups(order, empty, empty)
+    brk = np.flatnonzero(hs[1:] != hs[:-1]) + 1
+    starts = np.concatenate(([0], brk))
+    counts = np.diff(np.concatenate((starts, [hs.size])))
+    return DuplicateGroups(order, starts, counts)
+
+
+@traced("engine.keys.count_duplicate_rows")
+def count_duplicate_rows(df: pd.DataFrame, cols: Sequence[str] | None = None) -> int:
+    """Equivalent of df.duplicated(subset=cols).sum() (confirmed on values when hashes repeat)."""
+    if df.empty:
+        return 0
+    g = group_hashes(hash_rows(df, cols))
+    dup = g.duplicated()
+    if dup.size == 0:
+        return 0
+    # Only hash-duplicated rows need the exact pandas check.
+    idx = np.concatenate([g.members(i) for i in dup])
+    sub = df.iloc[np.sort(idx)]
+    return int(sub.duplicated(subset=None if cols is None else list(cols)).sum())
+
+
+@traced("engine.keys.key_uniqueness")
+def key_uniqueness(
+    df: pd.DataFrame,
+    key_cols: Sequence[str],
+    row_cols: Sequence[str] | None = None,
+    detail: bool = True,
+) -> tuple[dict[str, Any], pd.DataFrame]:
+    """
+    2.5.1 metrics for one key: null key rows, duplicated keys, conflicting groups.
+
+    Returns (metrics, detail_df) where detail_df has one row per duplicated key
+    (key columns + dup_count).
+    """
+    key_cols = list(key_cols)
+    null_mask = df[key_cols].isna().any(axis=1).to_numpy()
+    n_null = int(null_mask.sum())
+    valid = np.flatnonzero(~null_mask)
+    sub = df.iloc[valid] if n_null else df
+
+    g = group_hashes(hash_rows(sub, key_cols))
+    dup = g.duplicated()
+    starts, counts = g.starts[dup], g.counts[dup]
+
+    # Confirm with an independently keyed hash (vectorized); only groups where it
+    # disagrees (a genuine 64-bit collision) are split on the actual values.
+    if dup.size:
+        gid = np.repeat(np.arange(dup.size), counts)
+        rows = g.order[_ranges(starts, counts)]
+        h2 = hash_rows(sub.iloc[rows], key_cols, hash_key=_CONFIRM_KEY)
+        first = np.repeat(h2[np.concatenate(([0], np.cumsum(counts)[:-1]))], counts)
+        bad = np.unique(gid[h2 != first])
+        if bad.size:
+            keep = ~np.isin(gid, bad)
+            extra = []
+            for b in bad:
+                m = rows[gid == b]
+                for part in (
+                    sub.iloc[m].groupby(key_cols, sort=False, dropna=False).indices.values()
+                ):
+                    if len(part) > 1:
+                        extra.append(m[part])
+            rows = np.concatenate([rows[keep]] + extra) if extra else rows[keep]
+            counts = np.concatenate(
+                [counts[~np.isin(np.arange(dup.size), bad)], [len(m) for m in extra]]
+            ).astype(np.int64)
+            gid = np.repeat(np.arange(counts.size), counts)
+    else:
+        rows = gid = np.array([], dtype=np.int64)
+        counts = np.array([], dtype=np.int64)
+
+    n_dup_keys = int(counts.size)
+    n_conflicting = 0
+    nonkey = [c for c in (row_cols if row_cols is not None else df.columns) if c not in key_cols]
+    if n_dup_keys and nonkey:
+        rh = hash_rows(sub.iloc[rows], nonkey)
+        o = np.lexsort((rh, gid))
+        gid_s, rh_s = gid[o], rh[o]
+        new_val = np.ones(len(o), dtype=bool)
+        new_val[1:] = (gid_s[1:] != gid_s[:-1]) | (rh_s[1:] != rh_s[:-1])
+        n_conflicting = int((np.bincount(gid_s, weights=new_val, minlength=n_dup_keys) > 1).sum())
+
+    detail_df = pd.DataFrame(columns=["dup_count"] + key_cols)
+    if detail and n_dup_keys:
+        firsts = rows[np.concatenate(([0], np.cumsum(counts)[:-1]))]
+        detail_df = sub.iloc[firsts][key_cols].reset_index(drop=True)
+        detail_df.insert(0, "dup_count", counts.astype(int))
+
+    metrics = {
+        "n_rows": int(len(df)),
+        "n_null_key_rows": n_null,
+        "n_duplicate_keys": n_dup_keys,
+        "n_conflicting_key_groups": n_conflicting,
+    }
+    return metrics, detail_df
+
+
+# ---------------------------------------------------------------------------
+# Reference key index (FK membership)
+# ---------------------------------------------------------------------------
+class RefKeyIndex:
+    """
+    Membership index over reference key hashes.
+
+    kind="sorted": exact (on hashes) via np.searchsorted on the unique sorted hashes.
+    kind="bloom":  fixed-size bit array, k probes by double hashing; never misses a
+                   present key, may accept an absent one at rate ~`fpp`, so unmatched
+                   counts are a lower bound. Use when the reference is too big to sort.
+    """
+
+    def __init__(self, hashes: np.ndarray, kind: str = "sorted", fpp: float = 1e-3):
+        self.kind = kind
+        self.n_keys = int(hashes.size)
+        if kind == "sorted":
+            k = np.sort(hashes)
+            self.keys = k[np.concatenate(([True], k[1:] != k[:-1]))] if k.size else k
+        elif kind == "bloom":
+            n = max(self.n_keys, 1)
+            m = int(np.ceil(-n * np.log(fpp) / (np.log(2) ** 2)))
+            self.m = max(64, 1 << int(np.ceil(np.log2(m))))  # power of two -> mask instead of mod
+            self.k = max(1, int(round(self.m / n * np.log(2))))
+            flags = np.zeros(self.m, dtype=bool)  # build-time only; packed below
+            for pos in self._probes(hashes):
+                flags[pos] = True
+            self.bits = np.packbits(flags, bitorder="little")
+        else:
+            raise ValueError(f"Unknown RefKeyIndex kind: {kind!r} (expected 'sorted' or 'bloom')")
+
+    def _probes(self, h: np.ndarray):
+        mask = np.uint64(self.m - 1)
+        h1 = h
+        h2 = ((h >> np.uint64(33)) ^ h) | np.uint64(1)
+        with np.errstate(over="ignore"):
+            for i in range(self.k):
+                yield ((h1 + np.uint64(i) * h2) & mask).astype(np.int64)
+
+    def _hits_sorted(self, hs: np.ndarray) -> np.ndarray:
+        # Needles in ascending order keep searchsorted cache-friendly (~10x faster
+        # than random probes on large references).
+        if self.keys.size == 0:
+            return np.zeros(hs.size, dtype=bool)
+        pos = np.searchsorted(self.keys, hs)
+        pos[pos == self.keys.size] = 0
+        return self.keys[pos] == hs
+
+    def _hits_bloom(self, h: np.ndarray) -> np.ndarray:
+        out = np.ones(h.size, dtype=bool)
+        for pos in self._probes(h):
+            out &= ((self.bits[pos >> 3] >> (pos & 7).astype(np.uint8)) & 1).astype(bool)
+        return out
+
+    def contains(self, h: np.ndarray) -> np.ndarray:
+        """Boolean mask: True where the hash is (possibly, for bloom) in the reference."""
+        if self.kind == "bloom":
+            return self._hits_bloom(h)
+        order = np.argsort(h)
+        out = np.empty(h.size, dtype=bool)
+        out[order] = self._hits_sorted(h[order])
+        return out
+
+    def count_missing(self, h: np.ndarray) -> int:
+        """Number of hashes not in the reference (no per-row mask needed)."""
+        if self.kind == "bloom":
+            return int(h.size - self._hits_bloom(h).sum())
+        return int(h.size - self._hits_sorted(np.sort(h)).sum())
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.keys.nbytes if self.kind == "sorted" else self.bits.nbytes)
+
+
+_REF_INDEX_CACHE: dict[tuple[str, str, str, str], RefKeyIndex] = {}
+
+
+def _content_version(h: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(h).view(np.uint8), digest_size=16).hexdigest()
+
+
+def ref_index(
+    ref: pd.Series,
+    ref_table: str,
+    ref_col: str,
+    version: str | None = None,
+    kind: str = "sorted",
+    fpp: float = 1e-3,
+) -> RefKeyIndex:
+    """
+    Cached RefKeyIndex for `ref_table.ref_col`.
+
+    `version` identifies the reference snapshot (DuckDB table version, file mtime,
+    dataset hash...). Without it the hashed content is fingerprinted — linear, but
+    still skips the sort / Bloom build when the reference has not changed.
+    """
+    vals = ref.dropna()
+    h = hash_series(vals)
+    ver = version if version is not None else _content_version(h)
+    key = (str(ref_table), str(ref_col), str(ver), f"{kind}:{fpp}")
+    idx = _REF_INDEX_CACHE.get(key)
+    if idx is None:
+        # keep one version per (table, col, kind)
+        for k in [k for k in _REF_INDEX_CACHE if k[:2] == key[:2] and k[3] == key[3]]:
+            del _REF_INDEX_CACHE[k]
+        idx = _REF_INDEX_CACHE[key] = RefKeyIndex(h, kind=kind, fpp=fpp)
+    return idx
+
+
+def clear_ref_index_cache() -> None:
+    _REF_INDEX_CACHE.clear()
+
+
+@traced("engine.keys.fk_membership")
+def fk_membership(
+    fk: pd.Series,
+    ref: pd.Series,
+    ref_table: str = "",
+    ref_col: str = "",
+    version: str | None = None,
+    kind: str = "sorted",
+    fpp: float = 1e-3,
+) -> dict[str, Any]:
+    """n_null / n_unmatched / pct_unmatched (over non-null FK values) for one FK."""
+    valid = fk.notna().to_numpy()
+    n_null = int((~valid).sum())
+    n_valid = int(valid.sum())
+    # nulls are counted above and dropped before the cast (nullable Int* NA cannot become int64)
+    fk_vals, ref_vals = _align_key_dtypes(fk[valid] if n_null else fk, ref.dropna())
+    idx = ref_index(ref_vals, ref_table or "<ref>", ref_col or str(ref.name), version, kind, fpp)
+    n_unmatched = idx.count_missing(hash_series(fk_vals))
+    return {
+        "n_rows": int(len(fk)),
+        "n_null_fk_rows": n_null,
+        "n_unmatched_fk": n_unmatched,
+        "pct_unmatched_fk": float(n_unmatched / n_valid) if n_valid > 0 else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Config normalisation + severities (same rules as 2.5.1 / 2.5.2)
+# ---------------------------------------------------------------------------
+def primary_key_defs(pk_cfg: Any) -> list[tuple[str, list[str]]]:
+    """Normalise KEYS.PRIMARY_KEYS (dict / list / str) into [(key_name, key_cols)]."""
+    defs: list[tuple[str, list[str]]] = []
+
+    def as_cols(v: Any) -> list[str] | None:
+        if isinstance(v, str):
+            return [v]
+        return [str(c) for c in v] if isinstance(v, (list, tuple)) else None
+
+    if isinstance(pk_cfg, Mapping):
+        for name, cols in pk_cfg.items():
+            if as_cols(cols) is not None:
+                defs.append((str(name), as_cols(cols)))
+    elif isinstance(pk_cfg, (list, tuple)):
+        if pk_cfg and all(isinstance(x, str) for x in pk_cfg):
+            defs.append(("PRIMARY_KEY", [str(c) for c in pk_cfg]))
+        else:
+            for i, item in enumerate(pk_cfg):
+                if isinstance(item, Mapping):
+                    defs += [
+                        (str(n), as_cols(c)) for n, c in item.items() if as_cols(c) is not None
+                    ]
+                elif as_cols(item) is not None:
+                    defs.append((f"PK_{i:02d}", as_cols(item)))
+    elif isinstance(pk_cfg, str):
+        defs.append(("PRIMARY_KEY", [pk_cfg]))
+    return defs
+
+
+def foreign_key_defs(fk_cfg: Any) -> list[dict[str, Any]]:
+    """Normalise KEYS.FOREIGN_KEYS (dict of dicts / list of dicts)."""
+    items = (
+        [
+            dict(v, name=str(k)) | {"fk_col": v.get("fk_col", k)}
+            for k, v in fk_cfg.items()
+            if isinstance(v, Mapping)
+        ]
+        if isinstance(fk_cfg, Mapping)
+        else [
+            dict(v, name=str(v.get("name", f"FK:{i:02d}")))
+            for i, v in enumerate(fk_cfg or [])
+            if isinstance(v, Mapping)
+        ]
+    )
+    out = []
+    for it in items:
+        mup = it.get("max_unmatched_pct", 0.0)
+        out.append(
+            {
+                "name": it["name"],
+                "fk_col": str(it.get("fk_col")),
+                "ref_table": str(it.get("ref_table")),
+                "ref_col": str(it.get("ref_col")),
+                "max_unmatched_pct": float(mup) if mup is not None else 0.0,
+                "version": it.get("version"),
+            }
+        )
+    return out
+
+
+def key_severity(m: Mapping[str, Any]) -> tuple[str, str]:
+    if m["n_duplicate_keys"] == 0 and m["n_null_key_rows"] == 0:
+        return "ok", ""
+    if m["n_duplicate_keys"] > 0:
+        return "fail", "Duplicate keys detected"
+    return "warn", "Null key rows detected"
+
+
+def fk_severity(m: Mapping[str, Any], max_unmatched_pct: float) -> tuple[str, str]:
+    if m["n_unmatched_fk"] == 0:
+        return "ok", ""
+    if max_unmatched_pct > 0:
+        sev = "warn" if m["pct_unmatched_fk"] <= max_unmatched_pct else "fail"
+    else:
+        sev = "warn"
+    return sev, "Dangling foreign key values detected"
+
+
+# ---------------------------------------------------------------------------
+# In-memory audit
+# ---------------------------------------------------------------------------
+class KeyAuditEngine:
+    """
+    Runs 2.5.1 / 2.5.2 over one DataFrame.
+
+    ref_tables: {ref_table name -> DataFrame}; ref_versions optionally pins the
+    cache version per ref table (otherwise content-hashed).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        ref_tables: Mapping[str, pd.DataFrame] | None = None,
+        ref_versions: Mapping[str, str] | None = None,
+        index_kind: str = "sorted",
+        bloom_fpp: float = 1e-3,
+    ):
+        self.df = df
+        self.ref_tables = dict(ref_tables or {})
+        self.ref_versions = dict(ref_versions or {})
+        self.index_kind = index_kind
+        self.bloom_fpp = float(bloom_fpp)
+
+    @classmethod
+    def from_config(
+        cls, df: pd.DataFrame, ref_tables=None, ref_versions=None, config=None
+    ) -> KeyAuditEngine:
+        return cls(
+            df,
+            ref_tables,
+            ref_versions,
+            index_kind=str(C("KEYS.FK_INDEX", "sorted", config=config)),
+            bloom_fpp=float(C("KEYS.BLOOM_FPP", 1e-3, config=config)),
+        )
+
+    def duplicate_rows(self) -> int:
+        return count_duplicate_rows(self.df)
+
+    def primary_keys(
+        self, pk_defs: Sequence[tuple[str, Sequence[str]]]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        rows, details = [], []
+        n_rows = int(len(self.df))
+        for name, cols in pk_defs:
+            cols = [c for c in cols if c in self.df.columns]
+            if not cols:
+                rows.append(
+                    {
+                        "key_name": name,
+                        "key_cols": "[]",
+                        "n_rows": n_rows,
+                        "n_null_key_rows": np.nan,
+                        "n_duplicate_keys": np.nan,
+                        "n_conflicting_key_groups": np.nan,
+                        "severity": "warn",
+                        "notes": "Configured key columns not found in df",
+                    }
+                )
+                continue
+            m, det = key_uniqueness(self.df, cols)
+            sev, notes = key_severity(m)
+            rows.append(
+                {"key_name": name, "key_cols": str(cols), **m, "severity": sev, "notes": notes}
+            )
+            if not det.empty:
+                det.insert(0, "key_name", name)
+                details.append(det)
+        detail_df = (
+            pd.concat(details, ignore_index=True)
+            if details
+            else pd.DataFrame(columns=["key_name", "dup_count"])
+        )
+        return pd.DataFrame(rows, columns=ID_INTEGRITY_COLUMNS), detail_df
+
+    def foreign_keys(self, fk_defs: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        rows = []
+        n_rows = int(len(self.df))
+        for fk in fk_defs:
+            base = {
+                "fk_name": fk["name"],
+                "fk_col": fk["fk_col"],
+                "ref_table": fk["ref_table"],
+                "ref_col": fk["ref_col"],
+            }
+            ref_df = self.ref_tables.get(fk["ref_table"])
+            problem = (
+                "Foreign key column not found in df"
+                if fk["fk_col"] not in self.df.columns
+                else (
+                    "Reference table DataFrame not found"
+                    if not isinstance(ref_df, pd.DataFrame)
+                    else (
+                        "Reference column not found in reference table"
+                        if fk["ref_col"] not in ref_df.columns
+                        else None
+                    )
+                )
+            )
+            if problem:
+                rows.append(
+                    {
+                        **base,
+                        "n_rows": n_rows,
+                        "n_null_fk_rows": np.nan,
+                        "n_unmatched_fk": np.nan,
+                        "pct_unmatched_fk": np.nan,
+                        "severity": "warn",
+                        "notes": problem,
+                    }
+                )
+                continue
+            m = fk_membership(
+                self.df[fk["fk_col"]],
+                ref_df[fk["ref_col"]],
+                fk["ref_table"],
+                fk["ref_col"],
+                version=fk.get("version") or self.ref_versions.get(fk["ref_table"]),
+                kind=self.index_kind,
+                fpp=self.bloom_fpp,
+            )
+            sev, notes = fk_severity(m, fk["max_unmatched_pct"])
+            if self.index_kind == "bloom" and notes:
+                notes += " (bloom index: count is a lower bound)"
+            rows.append({**base, **m, "severity": sev, "notes": notes})
+        return pd.DataFrame(rows, columns=FK_COLUMNS)
+
+
+@traced("engine.keys.audit_keys")
+def audit_keys(
+    df: pd.DataFrame,
+    ref_tables: Mapping[str, pd.DataFrame] | None = None,
+    ref_versions: Mapping[str, str] | None = None,
+    config: dict[str, Any] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """(id_integrity_df, id_duplicates_detail_df, foreign_key_df) from KEYS.* config."""
+    eng = KeyAuditEngine.from_config(df, ref_tables, ref_versions, config=config)
+    id_df, dup_df = eng.primary_keys(primary_key_defs(C("KEYS.PRIMARY_KEYS", None, config=config)))
+    fk_df = eng.foreign_keys(foreign_key_defs(C("KEYS.FOREIGN_KEYS", None, config=config)))
+    return id_df, dup_df, fk_df
+
+
+# ---------------------------------------------------------------------------
+# DuckDB pushdown
+# ---------------------------------------------------------------------------
+def _q(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def key_uniqueness_sql(table: str, key_cols: Sequence[str], all_cols: Sequence[str]) -> str:
+    """One query -> n_rows, n_null_key_rows, n_duplicate_keys, n_conflicting_key_groups."""
+    keys = ", ".join(_q(c) for c in key_cols)
+    any_null = " or ".join(f"{_q(c)} is null" for c in key_cols)
+    nonkey = [c for c in all_cols if c not in key_cols]
+    row_hash = f"hash({', '.join(_q(c) for c in nonkey)})" if nonkey else "0"
+    return f"""
+    with base as (
+      select {keys}, {row_hash} as _rh, ({any_null}) as _null_key from {table}
+    ),
+    grp as (
+      select count(*) as c, count(distinct _rh) as d
+      from base where not _null_key
+      group by {keys}
+      having count(*) > 1
+    )
+    select
+      (select count(*) from base) as n_rows,
+      (select count(*) from base where _null_key) as n_null_key_rows,
+      (select count(*) from grp) as n_duplicate_keys,
+      (select count(*) from grp where d > 1) as n_conflicting_key_groups
+    """
+
+
+def fk_membership_sql(table: str, fk_col: str, ref_table: str, ref_col: str) -> str:
+    """One anti-join -> n_rows, n_null_fk_rows, n_unmatched_fk (string-compared like 2.5.2)."""
+    fk, rc = _q(fk_col), _q(ref_col)
+    return f"""
+    with ref as (select distinct cast({rc} as varchar) as k from {ref_table} where {rc} is not null)
+    select
+      count(*) as n_rows,
+      count(*) filter (where t.{fk} is null) as n_null_fk_rows,
+      count(*) filter (where t.{fk} is not null and ref.k is null) as n_unmatched_fk
+    from {table} t
+    left join ref on cast(t.{fk} as varchar) = ref.k
+    """
+
+
+def duplicate_rows_sql(table: str) -> str:
+    return (
+        f"select (select count(*) from {table})"
+        f" - (select count(*) from (select distinct * from {table})) as n"
+    )
+
+
+@traced("engine.keys.audit_keys_sql")
+def audit_keys_sql(
+    wh: Any,
+    table: str,
+    ref_tables: Mapping[str, str] | None = None,
+    config: dict[str, Any] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Same audit pushed down to the warehouse (`wh.read_df(sql)`; DuckDB dialect).
+
+    ref_tables maps config ref_table names to warehouse tables (defaults to the
+    name itself). Returns (id_integrity_df, foreign_key_df); duplicate detail rows
+    are not pulled back.
+    """
+    ref_tables = dict(ref_tables or {})
+    cols = list(wh.read_df(f"select * from {table} limit 0").columns)
+    rows = []
+    for name, kcols in primary_key_defs(C("KEYS.PRIMARY_KEYS", None, config=config)):
+        kcols = [c for c in kcols if c in cols]
+        if not kcols:
+            rows.append(
+                {
+                    "key_name": name,
+                    "key_cols": "[]",
+                    "n_rows": np.nan,
+                    "n_null_key_rows": np.nan,
+                    "n_duplicate_keys": np.nan,
+                    "n_conflicting_key_groups": np.nan,
+                    "severity": "warn",
+                    "notes": "Configured key columns not found in table",
+                }
+            )
+            continue
+        m = {
+            k: int(v) for k, v in wh.read_df(key_uniqueness_sql(table, kcols, cols)).iloc[0].items()
+        }
+        sev, notes = key_severity(m)
+        rows.append(
+            {"key_name": name, "key_cols": str(kcols), **m, "severity": sev, "notes": notes}
+        )
+
+    fk_rows = []
+    for fk in foreign_key_defs(C("KEYS.FOREIGN_KEYS", None, config=config)):
+        base = {
+            "fk_name": fk["name"],
+            "fk_col": fk["fk_col"],
+            "ref_table": fk["ref_table"],
+            "ref_col": fk["ref_col"],
+        }
+        if fk["fk_col"] not in cols:
+            fk_rows.append(
+                {
+                    **base,
+                    "n_rows": np.nan,
+                    "n_null_fk_rows": np.nan,
+                    "n_unmatched_fk": np.nan,
+                    "pct_unmatched_fk": np.nan,
+                    "severity": "warn",
+                    "notes": "Foreign key column not found in table",
+                }
+            )
+            continue
+        ref_fqn = ref_tables.get(fk["ref_table"], fk["ref_table"])
+        r = wh.read_df(fk_membership_sql(table, fk["fk_col"], ref_fqn, fk["ref_col"])).iloc[0]
+        n_valid = int(r["n_rows"]) - int(r["n_null_fk_rows"])
+        m = {
+            "n_rows": int(r["n_rows"]),
+            "n_null_fk_rows": int(r["n_null_fk_rows"]),
+            "n_unmatched_fk": int(r["n_unmatched_fk"]),
+            "pct_unmatched_fk": float(int(r["n_unmatched_fk"]) / n_valid) if n_valid > 0 else 0.0,
+        }
+        sev, notes = fk_severity(m, fk["max_unmatched_pct"])
+        fk_rows.append({**base, **m, "severity": sev, "notes": notes})
+
+    return pd.DataFrame(rows, columns=ID_INTEGRITY_COLUMNS), pd.DataFrame(
+        fk_rows, columns=FK_COLUMNS
+    )
@@ -0,0 +1,543 @@
+# src/dq_engine/engines/model_checks.py
+"""
+Model-based checks for 2.8.9 (predictive consistency) and 2.3.14 (SHAP-ready
+anomaly explainability), run through one parallel executor.
+
+- Inputs are prepared once (numeric features, float32, NaN kept) and saved
+  as .npy under the model cache; workers receive read-only memmaps, so a
+  loky process pool shares them instead of pickling copies per task.
+- Missing values are median-imputed per fold: medians come from the fold's
+  training rows only (all rows for the full-data SHAP model) and fill both
+  its training and held-out rows, so nothing leaks from the test split.
+- Fold models (plus one full-data model for SHAP) are fitted in parallel and
+  cached on disk, keyed by a hash of the data, target, fold assignment and
+  model config; a rerun on unchanged data skips every fit.
+- Permutation importance runs as (fold x feature chunk) tasks and TreeSHAP
+  as row-chunk tasks on a bounded subsample with a bounded interventional
+  background set.
+- The per-fold feature/target correlations of the original 2.8.9 cell are
+  computed for all features at once (no model needed, no scikit-learn).
+
+scikit-learn (`dq-engine[ml]`) is needed for model fits and shap
+(`dq-engine[xai]`) for TreeSHAP; both are imported lazily.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.artifacts import write_artifact
+from dq_engine.engines.correlation import numeric_feature_cols
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+CONSISTENCY_COLUMNS = [
+    "feature", "n_splits", "sign_flipped", "corr_mean", "corr_std", "corr_range", "stability_label", "status",
+]
+FOLD_SCORE_COLUMNS = ["fold", "n_train", "n_test", "metric", "score", "cache_hit", "fit_seconds"]
+PERMUTATION_COLUMNS = [
+    "feature", "importance_mean", "importance_std", "importance_min", "importance_max",
+    "n_folds", "sign_flipped", "stability_label", "status",
+]
+SHAP_COLUMNS = ["feature", "mean_abs_shap", "mean_shap", "shap_rank", "n_rows_explained", "background_size"]
+
+_MODELS = {
+    "random_forest": ("sklearn.ensemble", "RandomForestClassifier", "RandomForestRegressor"),
+    "extra_trees": ("sklearn.ensemble", "ExtraTreesClassifier", "ExtraTreesRegressor"),
+    "gradient_boosting": ("sklearn.ensemble", "GradientBoostingClassifier", "GradientBoostingRegressor"),
+}
+_MIN_FOLD_ROWS = 5
+
+
+def _require(module: str, extra: str):
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError as e:
+        raise RuntimeError(f"❌ {module} is required for this check (pip install 'dq-engine[{extra}]').") from e
+
+
+@dataclass(frozen=True)
+class ModelCheckCfg:
+    enabled: bool = True
+    target: Optional[str] = None
+    n_splits: int = 5
+    seed: int = 42
+    sign_flip: bool = True
+    corr_diff_abs: float = 0.05
+    output_file: str = "predictive_consistency_report.csv"
+    model_kind: str = "random_forest"
+    model_params: Mapping[str, Any] = field(default_factory=dict)
+    task: str = "auto"                         # auto | classification | regression
+    n_jobs: int = -1
+    max_nbytes: str = "1M"                     # joblib auto-memmap threshold for other array args
+    permutation: bool = True
+    n_repeats: int = 5
+    features_per_task: int = 8
+    cache_dir: Optional[str] = None
+    shap: bool = True
+    shap_max_rows: int = 2_000
+    shap_background: int = 100
+    shap_rows_per_task: int = 250
+    shap_perturbation: str = "interventional"  # interventional (uses background) | tree_path_dependent
+    exclude: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "ModelCheckCfg":
+        """PREDICTIVE_CONSISTENCY.*; ID_COLUMNS are never model features."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        cache = get("PREDICTIVE_CONSISTENCY.CACHE_DIR", "model_cache/")
+        artifacts = get("PATHS.ARTIFACTS", "resources/artifacts/")
+        return cls(
+            enabled=bool(get("PREDICTIVE_CONSISTENCY.ENABLED", True)),
+            target=get("PREDICTIVE_CONSISTENCY.TARGET", None) or get("TARGET.COLUMN", None),
+            n_splits=max(2, int(get("PREDICTIVE_CONSISTENCY.N_SPLITS", 5))),
+            seed=int(get("PREDICTIVE_CONSISTENCY.RANDOM_SEED", 42)),
+            sign_flip=bool(get("PREDICTIVE_CONSISTENCY.TOLERANCE.SIGN_FLIP", True)),
+            corr_diff_abs=float(get("PREDICTIVE_CONSISTENCY.TOLERANCE.CORR_DIFF_ABS", 0.05)),
+            output_file=str(get("PREDICTIVE_CONSISTENCY.OUTPUT_FILE", "predictive_consistency_report.csv")),
+            model_kind=str(get("PREDICTIVE_CONSISTENCY.MODEL.KIND", "random_forest")),
+            model_params=dict(get("PREDICTIVE_CONSISTENCY.MODEL.PARAMS", {}) or {}),
+            task=str(get("PREDICTIVE_CONSISTENCY.MODEL.TASK", "auto")),
+            n_jobs=int(get("PREDICTIVE_CONSISTENCY.N_JOBS", -1)),
+            max_nbytes=str(get("PREDICTIVE_CONSISTENCY.MAX_NBYTES", "1M")),
+            permutation=bool(get("PREDICTIVE_CONSISTENCY.PERMUTATION.ENABLED", True)),
+            n_repeats=max(1, int(get("PREDICTIVE_CONSISTENCY.PERMUTATION.N_REPEATS", 5))),
+            features_per_task=max(1, int(get("PREDICTIVE_CONSISTENCY.PERMUTATION.FEATURES_PER_TASK", 8))),
+            cache_dir=str(Path(artifacts) / cache) if cache else None,
+            shap=bool(get("PREDICTIVE_CONSISTENCY.SHAP.ENABLED", True)),
+            shap_max_rows=max(1, int(get("PREDICTIVE_CONSISTENCY.SHAP.MAX_ROWS", 2_000))),
+            shap_background=max(1, int(get("PREDICTIVE_CONSISTENCY.SHAP.BACKGROUND_SIZE", 100))),
+            shap_rows_per_task=max(1, int(get("PREDICTIVE_CONSISTENCY.SHAP.ROWS_PER_TASK", 250))),
+            shap_perturbation=str(get("PREDICTIVE_CONSISTENCY.SHAP.PERTURBATION", "interventional")),
+            exclude=tuple(get("ID_COLUMNS", []) or []),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Vectorized fold correlations (original 2.8.9 report)
+# ---------------------------------------------------------------------------
+def fold_assignment(n_rows: int, n_splits: int, seed: int) -> List[np.ndarray]:
+    """Shuffled, near-equal folds (same construction as the 2.8.9 cell)."""
+    idx = np.arange(n_rows)
+    np.random.default_rng(seed).shuffle(idx)
+    return np.array_split(idx, n_splits)
+
+
+def fold_correlations(X: np.ndarray, y: np.ndarray, folds: Sequence[np.ndarray]) -> np.ndarray:
+    """Pairwise-complete Pearson r of every column of X with y, per fold → (n_folds, p)."""
+    out = np.full((len(folds), X.shape[1]), np.nan)
+    for k, f in enumerate(folds):
+        if f.size < _MIN_FOLD_ROWS:
+            continue
+        Xk, yk = X[f], y[f]
+        M = ~np.isnan(Xk) & ~np.isnan(yk)[:, None]
+        n = M.sum(axis=0).astype("float64")
+        x0, y0 = np.where(M, Xk, 0.0), np.where(M, yk[:, None], 0.0)
+        sx, sy = x0.sum(axis=0), y0.sum(axis=0)
+        sxy, sxx, syy = (x0 * y0).sum(axis=0), (x0 * x0).sum(axis=0), (y0 * y0).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+        out[k] = np.where(n >= _MIN_FOLD_ROWS, np.clip(r, -1.0, 1.0), np.nan)
+    return out
+
+
+def stability_labels(values: np.ndarray, tol: float, sign_flip: bool) -> pd.DataFrame:
+    """mean / std / range / sign flip / label across folds (rows = folds) per column."""
+    ok = ~np.isnan(values)
+    n = ok.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(n > 0, np.where(ok, values, 0.0).sum(axis=0) / np.maximum(n, 1), np.nan)
+        dev = np.where(ok, values - mean, 0.0)
+        std = np.where(n > 1, np.sqrt((dev * dev).sum(axis=0) / np.maximum(n - 1, 1)), np.where(n == 1, 0.0, np.nan))
+    vmax = np.where(ok, values, -np.inf).max(axis=0, initial=-np.inf)
+    vmin = np.where(ok, values, np.inf).min(axis=0, initial=np.inf)
+    rng = np.where(n > 0, vmax - vmin, np.nan)
+    flipped = ((ok & (values > 0)).any(axis=0) & (ok & (values < 0)).any(axis=0))
+    label = np.select(
+        [n == 0, (sign_flip & flipped) | (rng > 2 * tol), (rng <= tol) & ~flipped],
+        ["unstable", "unstable", "stable"], default="moderate",
+    )
+    return pd.DataFrame({
+        "mean": mean, "std": std, "min": np.where(n > 0, vmin, np.nan), "max": np.where(n > 0, vmax, np.nan),
+        "range": rng, "n": n, "sign_flipped": flipped, "stability_label": label,
+        "status": np.where(label == "unstable", "WARN", "OK"),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Worker tasks (module level so loky can pickle them)
+# ---------------------------------------------------------------------------
+def _make_model(kind: str, task: str, params: Mapping[str, Any], seed: int):
+    if kind not in _MODELS:
+        raise ValueError(f"Unknown PREDICTIVE_CONSISTENCY.MODEL.KIND {kind!r}; expected one of {sorted(_MODELS)}")
+    module, clf, reg = _MODELS[kind]
+    mod = _require(module, "ml")
+    params = {"random_state": seed, **dict(params)}
+    return getattr(mod, clf if task == "classification" else reg)(**params)
+
+
+def _score(model, X: np.ndarray, y: np.ndarray, task: str) -> Tuple[str, float]:
+    metrics = _require("sklearn.metrics", "ml")
+    if task == "classification":
+        if len(np.unique(y)) == 2 and hasattr(model, "predict_proba"):
+            return "roc_auc", float(metrics.roc_auc_score(y, model.predict_proba(X)[:, 1]))
+        return "accuracy", float(metrics.accuracy_score(y, model.predict(X)))
+    return "r2", float(metrics.r2_score(y, model.predict(X)))
+
+
+def _fold_medians(X: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Per-column median of X[rows] ignoring NaN; all-missing columns fill with 0."""
+    Xr = np.asarray(X[rows], dtype="float64")
+    if Xr.size == 0:
+        return np.zeros(X.shape[1])
+    with np.errstate(all="ignore"):
+        ok = ~np.isnan(Xr).all(axis=0)
+        med = np.zeros(X.shape[1])
+        med[ok] = np.nanmedian(Xr[:, ok], axis=0)
+    return med
+
+
+def _impute(X: np.ndarray, medians: np.ndarray) -> np.ndarray:
+    """Copy of X (float32) with NaNs replaced by the column medians."""
+    out = np.array(X, dtype="float32")
+    miss = np.isnan(out)
+    if miss.any():
+        out[miss] = np.broadcast_to(medians.astype("float32"), out.shape)[miss]
+    return out
+
+
+def _load_model(path: str):
+    import joblib
+    return joblib.load(path)
+
+
+def _fit_task(fold: int, key: str, cache_dir: str, X: np.ndarray, y: np.ndarray,
+              train: np.ndarray, test: np.ndarray, kind: str, task: str,
+              params: Mapping[str, Any], seed: int) -> Dict[str, Any]:
+    """
+    Fit (or load) one fold model; cached as <cache_dir>/models/<key>.joblib.
+    The training rows' medians impute both splits and are returned for reuse.
+    """
+    import joblib
+
+    path = Path(cache_dir) / "models" / f"{key}.joblib"
+    t0 = time.perf_counter()
+    medians = _fold_medians(X, train)
+    hit = path.exists()
+    if hit:
+        model = joblib.load(path)
+    else:
+        model = _make_model(kind, task, params, seed)
+        model.fit(_impute(X[train], medians), y[train])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        joblib.dump(model, tmp)
+        os.replace(tmp, path)
+    metric, score = _score(model, _impute(X[test], medians), y[test], task) if test.size else ("", np.nan)
+    return {"fold": fold, "path": str(path), "n_train": int(train.size), "n_test": int(test.size),
+            "metric": metric, "score": score, "cache_hit": hit, "fit_seconds": time.perf_counter() - t0,
+            "medians": medians}
+
+
+def _permutation_task(fold: int, model_path: str, X: np.ndarray, y: np.ndarray, test: np.ndarray,
+                      medians: np.ndarray, cols: np.ndarray, n_repeats: int, task: str,
+                      seed: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Mean drop in score over `n_repeats` shuffles of each column in `cols` on the fold's held-out rows."""
+    model = _load_model(model_path)
+    Xt, yt = _impute(X[test], medians), y[test]
+    _, base = _score(model, Xt, yt, task)
+    rng = np.random.default_rng([seed, fold, int(cols[0])])
+    drops = np.empty(len(cols))
+    for i, j in enumerate(cols):
+        keep = Xt[:, j].copy()
+        scores = []
+        for _ in range(n_repeats):
+            Xt[:, j] = keep[rng.permutation(len(keep))]
+            scores.append(_score(model, Xt, yt, task)[1])
+        Xt[:, j] = keep
+        drops[i] = base - float(np.mean(scores))
+    return fold, cols, drops
+
+
+def _shap_task(model_path: str, X: np.ndarray, rows: np.ndarray, background: np.ndarray,
+               medians: np.ndarray, perturbation: str) -> np.ndarray:
+    """TreeSHAP values for `rows` (interventional: against a fixed background set) → (len(rows), p)."""
+    shap = _require("shap", "xai")
+    model = _load_model(model_path)
+    data = _impute(background, medians) if perturbation == "interventional" else None
+    explainer = shap.TreeExplainer(model, data=data, feature_perturbation=perturbation)
+    vals = explainer.shap_values(_impute(X[rows], medians), check_additivity=False)
+    if isinstance(vals, list):                  # older shap: one array per class
+        vals = vals[-1]
+    vals = np.asarray(vals)
+    if vals.ndim == 3:                          # (rows, features, classes) → positive class
+        vals = vals[..., -1]
+    return vals
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+class ModelCheckExecutor:
+    """
+    Shared, memmapped inputs + cached fold models for 2.8.9 / 2.3.14.
+
+    Usage:
+        ex = ModelCheckExecutor.from_frame(df, ModelCheckCfg.from_config())
+        consistency_df = ex.predictive_consistency()
+        folds_df, perm_df = ex.fit_folds(), ex.permutation_importance()
+        shap_df, shap_values = ex.shap_summary()
+    """
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, features: Sequence[str], cfg: ModelCheckCfg, task: str):
+        self.cfg = cfg
+        self.features = list(features)
+        self.task = task
+        self.data_hash = _array_hash(X, y)
+        self.cache_dir = Path(cfg.cache_dir or Path.cwd() / "model_cache")
+        self.X = self._shared(np.ascontiguousarray(X, dtype="float32"), "X")
+        self.y = self._shared(np.ascontiguousarray(y, dtype="float64"), "y")
+        self.folds = fold_assignment(len(y), cfg.n_splits, cfg.seed)
+        self._fits: Optional[List[Dict[str, Any]]] = None
+        self._full: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, cfg: ModelCheckCfg, features: Optional[Sequence[str]] = None) -> "ModelCheckExecutor":
+        if not cfg.target or cfg.target not in df.columns:
+            raise ValueError(f"Target column {cfg.target!r} not found for PREDICTIVE_CONSISTENCY")
+        y_raw = df[cfg.target]
+        if pd.api.types.is_numeric_dtype(y_raw) and not pd.api.types.is_bool_dtype(y_raw):
+            y = y_raw.to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            codes, _ = pd.factorize(y_raw)
+            y = np.where(codes < 0, np.nan, codes).astype("float64")
+        keep = ~np.isnan(y)
+        feats = list(features) if features is not None else numeric_feature_cols(df, exclude=(cfg.target, *cfg.exclude))
+        if not feats:
+            raise ValueError("No numeric features to evaluate for PREDICTIVE_CONSISTENCY")
+        X = df.loc[keep, feats].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        y = y[keep]
+        if len(y) < cfg.n_splits * 3:
+            raise ValueError(f"Dataset too small ({len(y)} rows) for N_SPLITS={cfg.n_splits}")
+        task = cfg.task
+        if task == "auto":
+            task = "classification" if (not pd.api.types.is_float_dtype(y_raw) and len(np.unique(y)) <= 20) else "regression"
+        return cls(X, y, feats, cfg, task)
+
+    # ------------------------------------------------------------------ state
+    def _shared(self, arr: np.ndarray, name: str) -> np.ndarray:
+        """Persist once per data hash and reopen read-only, so process workers share pages."""
+        path = self.cache_dir / "inputs" / f"{self.data_hash}_{name}.npy"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+            np.save(tmp, arr)
+            os.replace(tmp, path)
+        return np.load(path, mmap_mode="r")
+
+    def _parallel(self):
+        from joblib import Parallel
+        return Parallel(n_jobs=self.cfg.n_jobs, backend="loky", max_nbytes=self.cfg.max_nbytes, mmap_mode="r")
+
+    def model_key(self, fold: Any) -> str:
+        sk = _require("sklearn", "ml")
+        payload = {
+            "data": self.data_hash, "fold": fold, "n_splits": self.cfg.n_splits, "seed": self.cfg.seed,
+            "kind": self.cfg.model_kind, "params": dict(self.cfg.model_params), "task": self.task,
+            "sklearn": sk.__version__, "impute": "fold_median",
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:24]
+
+    # ------------------------------------------------------------ 2.8.9
+    @traced("engine.model_checks.predictive_consistency")
+    def predictive_consistency(self) -> pd.DataFrame:
+        """Per-fold feature/target correlation stability (predictive_consistency_report.csv)."""
+        r = fold_correlations(np.asarray(self.X, dtype="float64"), np.asarray(self.y), self.folds)
+        s = stability_labels(r, self.cfg.corr_diff_abs, self.cfg.sign_flip)
+        return pd.DataFrame({
+            "feature": self.features, "n_splits": self.cfg.n_splits, "sign_flipped": s["sign_flipped"],
+            "corr_mean": s["mean"], "corr_std": s["std"], "corr_range": s["range"],
+            "stability_label": s["stability_label"], "status": s["status"],
+        }, columns=CONSISTENCY_COLUMNS)
+
+    @traced("engine.model_checks.fit_folds")
+    def fit_folds(self) -> pd.DataFrame:
+        """Fit / load every fold model and the full-data SHAP model in one parallel batch."""
+        from joblib import delayed
+
+        if self._fits is None:
+            all_rows = np.arange(len(self.y))
+            jobs = [(k, np.setdiff1d(all_rows, f, assume_unique=True), f) for k, f in enumerate(self.folds)]
+            if self.cfg.shap:
+                jobs.append(("full", all_rows, np.zeros(0, dtype="int64")))
+            with span("model_checks.fit", n_tasks=len(jobs)):
+                out = self._parallel()(
+                    delayed(_fit_task)(k, self.model_key(k), str(self.cache_dir), self.X, self.y, tr, te,
+                                       self.cfg.model_kind, self.task, self.cfg.model_params, self.cfg.seed)
+                    for k, tr, te in jobs
+                )
+            self._fits = [o for o in out if o["fold"] != "full"]
+            self._full = next((o for o in out if o["fold"] == "full"), None)
+        return pd.DataFrame(self._fits, columns=FOLD_SCORE_COLUMNS)
+
+    @traced("engine.model_checks.permutation_importance")
+    def permutation_importance(self) -> pd.DataFrame:
+        """Held-out permutation importance per fold, then its stability across folds."""
+        from joblib import delayed
+
+        self.fit_folds()
+        p = len(self.features)
+        chunks = np.array_split(np.arange(p), max(1, -(-p // self.cfg.features_per_task)))
+        imp = np.full((len(self.folds), p), np.nan)
+        with span("model_checks.permutation", n_tasks=len(chunks) * len(self._fits)):
+            out = self._parallel()(
+                delayed(_permutation_task)(f["fold"], f["path"], self.X, self.y, self.folds[f["fold"]],
+                                           f["medians"], cols, self.cfg.n_repeats, self.task, self.cfg.seed)
+                for f in self._fits for cols in chunks if f["n_test"] >= _MIN_FOLD_ROWS
+            )
+        for fold, cols, drops in out:
+            imp[fold, cols] = drops
+        s = stability_labels(imp, self.cfg.corr_diff_abs, self.cfg.sign_flip)
+        return pd.DataFrame({
+            "feature": self.features, "importance_mean": s["mean"], "importance_std": s["std"],
+            "importance_min": s["min"], "importance_max": s["max"], "n_folds": s["n"],
+            "sign_flipped": s["sign_flipped"], "stability_label": s["stability_label"], "status": s["status"],
+        }, columns=PERMUTATION_COLUMNS).sort_values("importance_mean", ascending=False, kind="stable").reset_index(drop=True)
+
+    # ------------------------------------------------------------ 2.3.14
+    @traced("engine.model_checks.shap_summary")
+    def shap_summary(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        TreeSHAP on at most SHAP.MAX_ROWS sampled rows against a BACKGROUND_SIZE
+        background, split into row chunks across workers →
+        (feature summary, per-row SHAP values with a `row_index` column).
+        Values are cached next to the full model, keyed by its key + sampling.
+        """
+        from joblib import delayed
+
+        self.fit_folds()
+        if self._full is None:
+            raise RuntimeError("SHAP is disabled (PREDICTIVE_CONSISTENCY.SHAP.ENABLED: false)")
+        rng = np.random.default_rng(self.cfg.seed)
+        n = len(self.y)
+        rows = np.sort(rng.choice(n, size=min(n, self.cfg.shap_max_rows), replace=False))
+        background = np.asarray(self.X[np.sort(rng.choice(n, size=min(n, self.cfg.shap_background), replace=False))])
+        key = self.model_key(("shap", self.cfg.shap_max_rows, self.cfg.shap_background, self.cfg.shap_perturbation))
+        path = self.cache_dir / "shap" / f"{key}.npy"
+        if path.exists():
+            vals = np.load(path)
+        else:
+            chunks = np.array_split(rows, max(1, -(-rows.size // self.cfg.shap_rows_per_task)))
+            with span("model_checks.shap", n_rows=int(rows.size), n_tasks=len(chunks)):
+                parts = self._parallel()(
+                    delayed(_shap_task)(self._full["path"], self.X, c, background, self._full["medians"],
+                                        self.cfg.shap_perturbation)
+                    for c in chunks
+                )
+            vals = np.vstack(parts) if parts else np.zeros((0, len(self.features)))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+            np.save(tmp, vals)
+            os.replace(tmp, path)
+        mean_abs = np.abs(vals).mean(axis=0) if vals.size else np.full(len(self.features), np.nan)
+        summary = pd.DataFrame({
+            "feature": self.features, "mean_abs_shap": mean_abs,
+            "mean_shap": vals.mean(axis=0) if vals.size else np.nan,
+        })
+        summary["shap_rank"] = summary["mean_abs_shap"].rank(ascending=False, method="min").astype("Int64")
+        summary["n_rows_explained"] = int(rows.size)
+        summary["background_size"] = int(background.shape[0])
+        per_row = pd.DataFrame(vals, columns=self.features)
+        per_row.insert(0, "row_index", rows)
+        return summary[SHAP_COLUMNS].sort_values("shap_rank", kind="stable").reset_index(drop=True), per_row
+
+
+def _array_hash(*arrays: np.ndarray) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(str((a.dtype.str, a.shape)).encode())
+        h.update(a.data)
+    return h.hexdigest()
+
+
+def attach_shap(anomaly_index: pd.DataFrame, shap_summary: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add mean_abs_shap / shap_rank to the 2.3.14 anomaly index by feature; pair
+    features (`a__b`, correlation drift) take the stronger of the two.
+    """
+    out = anomaly_index.copy()
+    if out.empty or shap_summary.empty or "feature" not in out.columns:
+        out["mean_abs_shap"], out["shap_rank"] = np.nan, pd.array([pd.NA] * len(out), dtype="Int64")
+        return out
+    parts = out["feature"].astype(str).str.split("__").explode()
+    imp = parts.map(shap_summary.set_index("feature")["mean_abs_shap"])
+    rank = parts.map(shap_summary.set_index("feature")["shap_rank"]).astype("Float64")
+    out["mean_abs_shap"] = imp.groupby(level=0).max()
+    out["shap_rank"] = rank.groupby(level=0).min().astype("Int64")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+@dataclass
+class ModelCheckResult:
+    consistency: pd.DataFrame
+    fold_scores: pd.DataFrame
+    permutation: pd.DataFrame
+    shap_summary: pd.DataFrame
+    shap_values: pd.DataFrame
+
+
+@traced("engine.model_checks.run_model_checks")
+def run_model_checks(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None,
+    *,
+    out_dir: Optional[Path] = None,
+    features: Optional[Sequence[str]] = None,
+    models: bool = True,
+    cfg: Optional[ModelCheckCfg] = None,
+) -> ModelCheckResult:
+    """
+    2.8.9 correlation consistency, plus (models=True) fold scores, permutation
+    importance and TreeSHAP. Writes OUTPUT_FILE, model_fold_scores.csv,
+    permutation_importance.csv, shap_summary.csv and shap_values.parquet.
+    """
+    cfg = cfg or ModelCheckCfg.from_config(config)
+    ex = ModelCheckExecutor.from_frame(df, cfg, features)
+    consistency = ex.predictive_consistency()
+    folds = pd.DataFrame(columns=FOLD_SCORE_COLUMNS)
+    perm = pd.DataFrame(columns=PERMUTATION_COLUMNS)
+    shap_sum, shap_vals = pd.DataFrame(columns=SHAP_COLUMNS), pd.DataFrame(columns=["row_index"])
+    if models:
+        folds = ex.fit_folds()
+        if cfg.permutation:
+            perm = ex.permutation_importance()
+        if cfg.shap:
+            shap_sum, shap_vals = ex.shap_summary()
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_artifact(consistency, out_dir / cfg.output_file)
+        if models:
+            write_artifact(folds, out_dir / "model_fold_scores.csv")
+            write_artifact(perm, out_dir / "permutation_importance.csv")
+            write_artifact(shap_sum, out_dir / "shap_summary.csv")
+            write_artifact(shap_vals, out_dir / "shap_values.parquet", csv_mirror=False)
+
+    n_unstable = int((consistency["stability_label"] == "unstable").sum())
+    hits = int(folds["cache_hit"].sum()) if len(folds) else 0
+    print(f"🧮 2.8.9 predictive consistency: {len(consistency)} feature(s), {n_unstable} unstable"
+          + (f" | {len(folds)} fold model(s), {hits} from cache" if models else ""))
+    return ModelCheckResult(consistency, folds, perm, shap_sum, shap_vals)
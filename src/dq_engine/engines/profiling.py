@@ -0,0 +1,1001 @@
+# src/dq_engine/engines/profiling.py
+"""
+SQL profiling backend for 2.3 (numeric) and 2.4 (categorical) profiles.
+
+- When the data lives in DuckDB or Snowflake, the profile runs in the
+  warehouse. Each table gets a fixed number of scans, however many columns it has:
+    1. one wide aggregate: null / NaN / ±inf counts, min, max, mean, stddev,
+       quantiles, distinct count, and zero / negative / positive counts for
+       every numeric column, plus non-null counts for categoricals;
+    2. one UNPIVOT + GROUP BY over the categoricals: top-k values, with the
+       exact n_unique, log2 entropy and rare-level counts computed as window
+       aggregates, so only k rows per column come back;
+    3. one UNPIVOT + GROUPING SETS over the numerics: equal-width histogram
+       bins (bounds from pass 1) and the MAD.
+- Over APPROX_MIN_ROWS rows, quantiles and numeric distinct counts use
+  approx_quantile / APPROX_PERCENTILE and approx_count_distinct; smaller
+  tables get exact values. Categorical n_unique and entropy are always exact.
+- Categorical shares (entropy, pct_top_category, top-value pct, rare levels)
+  are taken over the non-null values, as `value_counts(normalize=True)`
+  does; nulls are reported only in pct_blank.
+- In-memory frames run the same three passes in numpy/pandas. The results
+  have the same shape as the SQL rows and go through the same assembly code,
+  so every backend returns the same numeric_profile_df /
+  categorical_profile_df schema.
+- Aggregates use the finite values only. ±inf is counted in the
+  non-finite columns rather than turning mean/std into inf.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+from dq_engine.out_of_core import MemoryBudget, SpilledTable, estimate_size
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+NUMERIC_PROFILE_COLUMNS = [
+    "column",
+    "dtype",
+    "n_rows",
+    "non_null",
+    "nulls",
+    "null_pct",
+    "n_nan",
+    "n_pos_inf",
+    "n_neg_inf",
+    "n_non_finite_total",
+    "nonfinite_pct",
+    "validity_status",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "median",
+    "mad",
+    "cv",
+    "p01",
+    "p05",
+    "p25",
+    "p75",
+    "p95",
+    "p99",
+    "n_unique",
+    "pct_zero",
+    "pct_negative",
+    "pct_positive",
+    "entropy_binned",
+    "distribution_shape",
+    "backend",
+    "approximate",
+]
+
+CATEGORICAL_PROFILE_COLUMNS = [
+    "column",
+    "dtype",
+    "n_rows",
+    "non_null",
+    "n_unique",
+    "pct_blank",
+    "pct_top_category",
+    "top_value",
+    "entropy",
+    "domain_shape",
+    "cardinality_ratio",
+    "high_cardinality",
+    "near_unique",
+    "n_rare_levels",
+    "entropy_level",
+    "is_near_constant",
+    "backend",
+]
+
+TOP_VALUES_COLUMNS = ["column", "rank", "value", "count", "pct"]
+HISTOGRAM_COLUMNS = ["column", "bin", "bin_left", "bin_right", "count"]
+
+_QUANTILES = (
+    ("p01", 0.01),
+    ("p05", 0.05),
+    ("p25", 0.25),
+    ("median", 0.50),
+    ("p75", 0.75),
+    ("p95", 0.95),
+    ("p99", 0.99),
+)
+_NUMERIC_SQL_TYPES = (
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "INT",
+    "BIGINT",
+    "HUGEINT",
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "FLOAT",
+    "REAL",
+    "DOUBLE",
+    "DECIMAL",
+    "NUMBER",
+    "NUMERIC",
+    "FIXED",
+    "BYTEINT",
+)
+_CATEGORICAL_SQL_TYPES = ("VARCHAR", "TEXT", "STRING", "CHAR", "ENUM", "BOOLEAN")
+_FRAME_VIEW = "_dq_profile_src"
+
+Source = pd.DataFrame | str | Path | SpilledTable | Any
+
+
+@dataclass(frozen=True)
+class ProfilingCfg:
+    backend: str = "auto"  # auto | pandas | duckdb | snowflake
+    approx_min_rows: int = 5_000_000  # approximate quantiles / distincts at or above this
+    top_k: int = 20
+    n_bins: int = 10  # NUMERIC.METRICS.N_BINS
+    null_warn_pct: float = 5.0
+    null_critical_pct: float = 20.0
+    nonfinite_warn_pct: float = 0.0
+    nonfinite_critical_pct: float = 1.0
+    zero_inflated_pct: float = 50.0
+    cv_high: float = 1.0
+    cv_low: float = 0.1
+    dominant_top_pct: float = 95.0
+    fragmented_top_pct: float = 5.0
+    high_cardinality: int = 50
+    near_unique_ratio: float = 0.9
+    rare_pct: float = 1.0
+    near_constant_top_pct: float = 95.0
+    exclude: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> ProfilingCfg:
+        """PROFILING.* for the backend; thresholds from the 2.3 / 2.4 blocks they mirror."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        return cls(
+            backend=str(get("PROFILING.BACKEND", "auto")).lower(),
+            approx_min_rows=int(get("PROFILING.APPROX_MIN_ROWS", 5_000_000)),
+            top_k=int(get("PROFILING.TOP_K", 20)),
+            n_bins=int(get("NUMERIC.METRICS.N_BINS", get("PROFILING.HIST_BINS", 10))),
+            null_warn_pct=float(get("NUMERIC.VALIDATION.NULL_WARN_PCT", 5.0)),
+            null_critical_pct=float(get("NUMERIC.VALIDATION.NULL_CRITICAL_PCT", 20.0)),
+            nonfinite_warn_pct=float(get("NUMERIC.VALIDATION.NONFINITE_WARN_PCT", 0.0)),
+            nonfinite_critical_pct=float(get("NUMERIC.VALIDATION.NONFINITE_CRITICAL_PCT", 1.0)),
+            zero_inflated_pct=float(get("NUMERIC.METRICS.ZERO_INFLATED_PCT", 50.0)),
+            cv_high=float(get("NUMERIC.METRICS.CV_HIGH_THRESHOLD", 1.0)),
+            cv_low=float(get("NUMERIC.METRICS.CV_LOW_THRESHOLD", 0.1)),
+            dominant_top_pct=float(get("CATEGORICAL.DOMINANT_TOP_PCT", 95.0)),
+            fragmented_top_pct=float(get("CATEGORICAL.FRAGMENTED_TOP_PCT", 5.0)),
+            high_cardinality=int(
+                get(
+                    "CATEGORICAL.HIGH_CARDINALITY_LIMIT",
+                    get("DATA_QUALITY.HIGH_CARD_THRESHOLD", 50),
+                )
+            ),
+            near_unique_ratio=float(get("CATEGORICAL.NEAR_UNIQUE_THRESHOLD", 0.9)),
+            rare_pct=float(
+                get("CATEGORICAL.RARE_PCT_THRESHOLD", get("DATA_QUALITY.RARE_PCT_THRESHOLD", 1.0))
+            ),
+            near_constant_top_pct=float(get("CATEGORICAL.NEAR_CONSTANT_TOP_PCT", 95.0)),
+            exclude=tuple(get("PROFILING.EXCLUDE", []) or []),
+        )
+
+
+@dataclass
+class ProfileResult:
+    numeric: pd.DataFrame
+    categorical: pd.DataFrame
+    top_values: pd.DataFrame
+    histograms: pd.DataFrame
+    backend: str
+    n_rows: int
+    approximate: bool
+    n_queries: int = 0
+    notes: list[str] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Dialect
+# ---------------------------------------------------------------------------
+def _q(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _lit(v: Any) -> str:
+    if v is None or (isinstance(v, float) and not np.isfinite(v)):
+        return "null"
+    if isinstance(v, str):
+        return "'" + v.replace("'", "''") + "'"
+    return repr(float(v))
+
+
+def _finite(x: str, dialect: str) -> str:
+    if dialect == "snowflake":
+        return f"({x} is not null and {x} <> 'NaN'::float and abs({x}) <> 'inf'::float)"
+    return f"isfinite({x})"
+
+
+def _nan(x: str, dialect: str) -> str:
+    return f"({x} = 'NaN'::float)" if dialect == "snowflake" else f"isnan({x})"
+
+
+def _inf(sign: str, dialect: str) -> str:
+    t = "float" if dialect == "snowflake" else "double"
+    return f"'{'-' if sign == '-' else ''}inf'::{t}"
+
+
+def _quantile(x: str, p: float, dialect: str, approx: bool) -> str:
+    if dialect == "snowflake":
+        return (
+            f"approx_percentile({x}, {p})"
+            if approx
+            else f"percentile_cont({p}) within group (order by {x})"
+        )
+    return f"approx_quantile({x}, {p})" if approx else f"quantile_cont({x}, {p})"
+
+
+def _quantile_aggs(f: str, x: str, dialect: str, approx: bool) -> list[str]:
+    """DuckDB takes a list of probabilities (one sort per column); Snowflake needs one call each."""
+    if dialect == "snowflake":
+        return [f"{_quantile(f, p, dialect, approx)} as {x}_{name}" for name, p in _QUANTILES]
+    probs = "[" + ", ".join(str(p) for _, p in _QUANTILES) + "]"
+    return [f"{'approx_quantile' if approx else 'quantile_cont'}({f}, {probs}) as {x}_q"]
+
+
+def _unpack_quantiles(agg: pd.Series, n_numeric: int) -> pd.Series:
+    extra = {}
+    for i in range(n_numeric):
+        qs = agg.get(f"n{i}_q")
+        if qs is None:
+            continue
+        vals = list(qs) if qs is not None and not (np.isscalar(qs) and pd.isna(qs)) else []
+        for k, (name, _) in enumerate(_QUANTILES):
+            extra[f"n{i}_{name}"] = (
+                float(vals[k]) if k < len(vals) and vals[k] is not None else float("nan")
+            )
+    return pd.concat([agg, pd.Series(extra, dtype="float64")]) if extra else agg
+
+
+def _distinct(x: str, approx: bool) -> str:
+    return f"approx_count_distinct({x})" if approx else f"count(distinct {x})"
+
+
+def _log2(x: str, dialect: str) -> str:
+    return f"log(2, {x})" if dialect == "snowflake" else f"log2({x})"
+
+
+def _unpivot(relation: str, aliases: Sequence[str], dialect: str) -> str:
+    cols = ", ".join(aliases)
+    if dialect == "snowflake":
+        return f"select col, val from {relation} unpivot (val for col in ({cols}))"
+    return f"select col, val from (unpivot {relation} on {cols} into name col value val)"
+
+
+def _values(rows: Sequence[tuple[Any, ...]], names: Sequence[str], dialect: str) -> str:
+    body = ", ".join("(" + ", ".join(_lit(v) for v in r) + ")" for r in rows)
+    alias = f"b({', '.join(names)})"
+    return (
+        f"select * from values {body} as {alias}"
+        if dialect == "snowflake"
+        else f"select * from (values {body}) {alias}"
+    )
+
+
+def _lower_cols(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = [str(c).lower() for c in df.columns]
+    return df
+
+
+# ---------------------------------------------------------------------------
+# SQL builders (one statement per pass)
+# ---------------------------------------------------------------------------
+def scalar_profile_sql(
+    table: str,
+    numeric_cols: Sequence[str],
+    cat_cols: Sequence[str],
+    *,
+    dialect: str = "duckdb",
+    approx: bool = False,
+) -> str:
+    """Pass 1: every scalar statistic for every column in a single scan."""
+    proj, aggs = [], ["count(*) as n_rows"]
+    for i, c in enumerate(numeric_cols):
+        x, f = f"n{i}", f"f{i}"
+        d = f"cast({_q(c)} as double)"
+        proj.append(f"{d} as {x}")
+        proj.append(f"case when {_finite(d, dialect)} then {d} end as {f}")
+        aggs += [
+            f"count({x}) as {x}_cnt",
+            f"count_if({_nan(x, dialect)}) as {x}_nan",
+            f"count_if({x} = {_inf('+', dialect)}) as {x}_pinf",
+            f"count_if({x} = {_inf('-', dialect)}) as {x}_ninf",
+            f"count({f}) as {x}_fin",
+            f"min({f}) as {x}_min",
+            f"max({f}) as {x}_max",
+            f"avg({f}) as {x}_mean",
+            f"stddev_samp({f}) as {x}_std",
+            *_quantile_aggs(f, x, dialect, approx),
+            f"{_distinct(f, approx)} as {x}_nuniq",
+            f"count_if({f} = 0) as {x}_zero",
+            f"count_if({f} < 0) as {x}_neg",
+            f"count_if({f} > 0) as {x}_pos",
+        ]
+    for j, c in enumerate(cat_cols):
+        proj.append(f"{_q(c)} as k{j}")
+        aggs.append(f"count(k{j}) as k{j}_cnt")
+    inner = ", ".join(proj) if proj else "1 as _one"
+    return f"select {', '.join(aggs)} from (select {inner} from {table}) s"
+
+
+def top_values_sql(
+    table: str,
+    cat_cols: Sequence[str],
+    *,
+    top_k: int = 20,
+    rare_pct: float = 1.0,
+    dialect: str = "duckdb",
+) -> str:
+    """Pass 2: top-k per categorical; exact n_unique / entropy / rare counts via windows."""
+    proj = ", ".join(f"cast({_q(c)} as varchar) as k{j}" for j, c in enumerate(cat_cols))
+    aliases = [f"k{j}" for j in range(len(cat_cols))]
+    p = "(cast(n as double) / non_null)"
+    return f"""
+    with u as ({_unpivot(f"(select {proj} from {table})", aliases, dialect)}),
+    g as (select col, val, count(*) as n from u where val is not null group by col, val),
+    f as (select col, val, n, sum(n) over (partition by col) as non_null from g)
+    select col, val, n,
+      row_number() over (partition by col order by n desc, val) as rk,
+      count(*) over (partition by col) as n_unique,
+      sum(-{p} * {_log2(p, dialect)}) over (partition by col) as entropy,
+      sum(case when 100.0 * {p} < {float(rare_pct)} then 1 else 0 end)
+        over (partition by col) as n_rare
+    from f
+    qualify row_number() over (partition by col order by n desc, val) <= {int(top_k)}
+    """
+
+
+def histogram_sql(
+    table: str,
+    numeric_cols: Sequence[str],
+    bounds: Sequence[tuple[float, float, float]],
+    *,
+    n_bins: int = 10,
+    dialect: str = "duckdb",
+    approx: bool = False,
+) -> str:
+    """
+    Pass 3: equal-width bin counts per numeric column plus MAD (GROUPING SETS).
+
+    bounds[i] = (min, max, median) from pass 1; rows with grouping flag 1 carry the MAD.
+    """
+    proj = ", ".join(f"cast({_q(c)} as double) as n{i}" for i, c in enumerate(numeric_cols))
+    aliases = [f"n{i}" for i in range(len(numeric_cols))]
+    b = _values(
+        [(f"n{i}", lo, hi, med) for i, (lo, hi, med) in enumerate(bounds)],
+        ["bcol", "lo", "hi", "med"],
+        dialect,
+    )
+    nb = int(n_bins)
+    bin_raw = f"cast(floor((v - lo) / nullif(hi - lo, 0) * {nb}) as integer)"
+    bin_expr = f"least({nb - 1}, greatest(0, coalesce({bin_raw}, 0)))"
+    return f"""
+    with u as ({_unpivot(f"(select {proj} from {table})", aliases, dialect)}),
+    b as ({b}),
+    x as (
+      select col, v, med, {bin_expr} as bin
+      from (
+        select u.col, cast(u.val as double) as v, b.lo, b.hi, b.med
+        from u join b on u.col = b.bcol
+      ) j
+      where {_finite("v", dialect)}
+    )
+    select col, bin, count(*) as n,
+      {_quantile("abs(v - med)", 0.5, dialect, approx)} as mad,
+      grouping(bin) as g
+    from x
+    group by grouping sets ((col, bin), (col))
+    """
+
+
+# ---------------------------------------------------------------------------
+# Column discovery / backend selection
+# ---------------------------------------------------------------------------
+def table_columns(wh: Any, table: str, dialect: str = "duckdb") -> list[tuple[str, str]]:
+    """[(column, SQL type)] for a warehouse table or table expression."""
+    if dialect == "snowflake":
+        d = _lower_cols(wh.read_df(f"describe table {table}"))
+        return list(zip(d["name"].astype(str), d["type"].astype(str), strict=True))
+    d = wh.read_df(f"describe select * from {table}")
+    return list(zip(d["column_name"].astype(str), d["column_type"].astype(str), strict=True))
+
+
+def split_sql_columns(
+    cols: Sequence[tuple[str, str]], exclude: Sequence[str] = ()
+) -> tuple[list[str], list[str]]:
+    """(numeric, categorical) by SQL type; dates, blobs and nested types are skipped."""
+    num, cat = [], []
+    for name, typ in cols:
+        if name in exclude:
+            continue
+        t = typ.upper().split("(")[0].strip()
+        if t in _NUMERIC_SQL_TYPES:
+            num.append(name)
+        elif t in _CATEGORICAL_SQL_TYPES or t.startswith("ENUM"):
+            cat.append(name)
+    return num, cat
+
+
+def select_backend(source: Source, cfg: ProfilingCfg | None = None) -> str:
+    """pandas for in-memory frames, otherwise the dialect of the warehouse that holds the data."""
+    cfg = cfg or ProfilingCfg()
+    if cfg.backend != "auto":
+        return cfg.backend
+    if isinstance(source, pd.DataFrame):
+        return "pandas"
+    if isinstance(source, (str, Path)):
+        return "duckdb"  # parquet / csv path read by DuckDB in place
+    if type(source).__name__ == "SnowflakeWarehouse":
+        return "snowflake"
+    if hasattr(source, "con") or type(source).__name__ == "DuckDBWarehouse":
+        return "duckdb"
+    raise ValueError(f"Cannot choose a profiling backend for {type(source).__name__}")
+
+
+def _frame_for_duckdb(df: pd.DataFrame, cols: Sequence[str]) -> pd.DataFrame:
+    """Shallow copy where mixed-type object columns become strings DuckDB can scan."""
+    out = df.loc[:, list(cols)].copy(deep=False)
+    for c in out.columns:
+        if out[c].dtype == object:
+            out[c] = out[c].astype("string")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Assembly
+# ---------------------------------------------------------------------------
+def _num(r: pd.Series, key: str) -> float:
+    v = r.get(key)
+    return float(v) if v is not None and not pd.isna(v) else float("nan")
+
+
+def _pct_of(r: pd.Series, key: str, non_null: int) -> float:
+    return 100.0 * int(r[key]) / non_null if non_null else 0.0
+
+
+def _validity(null_pct: float, nonfinite_pct: float, cfg: ProfilingCfg) -> str:
+    if null_pct <= cfg.null_warn_pct and nonfinite_pct <= cfg.nonfinite_warn_pct:
+        return "ok"
+    if null_pct <= cfg.null_critical_pct and nonfinite_pct <= cfg.nonfinite_critical_pct:
+        return "warn"
+    return "critical"
+
+
+def _shape(pct_zero: float, cv: float, cfg: ProfilingCfg) -> str:
+    if pct_zero >= cfg.zero_inflated_pct:
+        return "zero_inflated"
+    if np.isfinite(cv) and cv >= cfg.cv_high:
+        return "high_var"
+    if np.isfinite(cv) and cv <= cfg.cv_low:
+        return "low_var"
+    return "moderate_var"
+
+
+def _domain_shape(n_unique: int, pct_top: float, cfg: ProfilingCfg) -> str:
+    if n_unique <= 1 or pct_top >= cfg.dominant_top_pct:
+        return "dominant"
+    if pct_top <= cfg.fragmented_top_pct and n_unique > 5:
+        return "fragmented"
+    return "balanced"
+
+
+def _numeric_frame(
+    agg: pd.Series,
+    numeric_cols: Sequence[str],
+    dtypes: dict[str, str],
+    hist: pd.DataFrame,
+    cfg: ProfilingCfg,
+    backend: str,
+    approx: bool,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    n = int(agg["n_rows"])
+    rows, hist_rows = [], []
+    for i, c in enumerate(numeric_cols):
+        x = f"n{i}"
+        n_nan_only = int(agg[f"{x}_nan"])
+        non_null = int(agg[f"{x}_cnt"]) - n_nan_only  # pandas notna(): NULL and NaN both missing
+        nulls = n - non_null
+        pinf, ninf = int(agg[f"{x}_pinf"]), int(agg[f"{x}_ninf"])
+        nonfinite = nulls + pinf + ninf  # 2.3.1: n_nan counts every missing value
+        null_pct = round(100.0 * nulls / n, 3) if n else 0.0
+        nonfinite_pct = round(100.0 * nonfinite / n, 3) if n else 0.0
+        mean, std = _num(agg, f"{x}_mean"), _num(agg, f"{x}_std")
+        cv = (
+            std / abs(mean)
+            if np.isfinite(std) and np.isfinite(mean) and mean != 0
+            else float("nan")
+        )
+        fin = int(agg[f"{x}_fin"])
+
+        h = hist[(hist["col"] == x) & (hist["g"] == 0)] if not hist.empty else hist
+        m = hist[(hist["col"] == x) & (hist["g"] == 1)] if not hist.empty else hist
+        counts = np.zeros(cfg.n_bins, dtype="int64")
+        if not h.empty:
+            np.add.at(counts, h["bin"].astype(int).to_numpy(), h["n"].astype("int64").to_numpy())
+        ent = float("nan")
+        if fin:
+            p = counts[counts > 0] / counts.sum()
+            ent = float(-(p * np.log(p)).sum())
+            lo, hi = _num(agg, f"{x}_min"), _num(agg, f"{x}_max")
+            edges = np.linspace(lo, hi, cfg.n_bins + 1) if hi > lo else np.full(cfg.n_bins + 1, lo)
+            for b in range(cfg.n_bins):
+                hist_rows.append(
+                    {
+                        "column": c,
+                        "bin": b,
+                        "bin_left": float(edges[b]),
+                        "bin_right": float(edges[b + 1]),
+                        "count": int(counts[b]),
+                    }
+                )
+
+        row = {
+            "column": c,
+            "dtype": dtypes.get(c, "double"),
+            "n_rows": n,
+            "non_null": non_null,
+            "nulls": nulls,
+            "null_pct": null_pct,
+            "n_nan": nulls,
+            "n_pos_inf": pinf,
+            "n_neg_inf": ninf,
+            "n_non_finite_total": nonfinite,
+            "nonfinite_pct": nonfinite_pct,
+            "validity_status": _validity(null_pct, nonfinite_pct, cfg),
+            "min": _num(agg, f"{x}_min"),
+            "max": _num(agg, f"{x}_max"),
+            "mean": mean,
+            "std": std,
+            "median": _num(agg, f"{x}_median"),
+            "mad": _num(m.iloc[0], "mad") if not m.empty else float("nan"),
+            "cv": cv,
+            **{name: _num(agg, f"{x}_{name}") for name, _ in _QUANTILES if name != "median"},
+            "n_unique": int(agg[f"{x}_nuniq"]),
+            "pct_zero": _pct_of(agg, f"{x}_zero", non_null),
+            "pct_negative": _pct_of(agg, f"{x}_neg", non_null),
+            "pct_positive": _pct_of(agg, f"{x}_pos", non_null),
+            "entropy_binned": ent,
+            "backend": backend,
+            "approximate": approx,
+        }
+        row["distribution_shape"] = _shape(row["pct_zero"], cv, cfg)
+        rows.append(row)
+    return (
+        pd.DataFrame(rows, columns=NUMERIC_PROFILE_COLUMNS),
+        pd.DataFrame(hist_rows, columns=HISTOGRAM_COLUMNS),
+    )
+
+
+def _categorical_frame(
+    agg: pd.Series,
+    cat_cols: Sequence[str],
+    dtypes: dict[str, str],
+    top: pd.DataFrame,
+    cfg: ProfilingCfg,
+    backend: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    n = int(agg["n_rows"])
+    rows, top_rows = [], []
+    by_col = {k: g.sort_values("rk") for k, g in top.groupby("col")} if not top.empty else {}
+    for j, c in enumerate(cat_cols):
+        g = by_col.get(f"k{j}")
+        non_null = int(agg[f"k{j}_cnt"])
+        if g is None or g.empty:
+            n_unique, top_n, top_val, ent, n_rare = 0, 0, None, 0.0, 0
+        else:
+            first = g.iloc[0]
+            n_unique, top_n, top_val = int(first["n_unique"]), int(first["n"]), first["val"]
+            ent, n_rare = float(first["entropy"]), int(first["n_rare"])
+            for _, r in g.iterrows():
+                top_rows.append(
+                    {
+                        "column": c,
+                        "rank": int(r["rk"]),
+                        "value": r["val"],
+                        "count": int(r["n"]),
+                        "pct": 100.0 * int(r["n"]) / non_null if non_null else 0.0,
+                    }
+                )
+        pct_top = 100.0 * top_n / non_null if non_null else 0.0
+        ratio = n_unique / non_null if non_null else 0.0
+        rows.append(
+            {
+                "column": c,
+                "dtype": dtypes.get(c, "varchar"),
+                "n_rows": n,
+                "non_null": non_null,
+                "n_unique": n_unique,
+                "pct_blank": round(100.0 * (n - non_null) / n, 5) if n else 0.0,
+                "pct_top_category": round(pct_top, 5),
+                "top_value": top_val,
+                "entropy": round(ent, 5),
+                "domain_shape": _domain_shape(n_unique, pct_top, cfg),
+                "cardinality_ratio": ratio,
+                "high_cardinality": n_unique > cfg.high_cardinality,
+                "near_unique": ratio >= cfg.near_unique_ratio,
+                "n_rare_levels": n_rare,
+                "backend": backend,
+            }
+        )
+    out = pd.DataFrame(rows, columns=CATEGORICAL_PROFILE_COLUMNS)
+    if not out.empty:
+        # 2.4.8: entropy tertiles across the profiled columns
+        q33, q66 = out["entropy"].quantile([0.33, 0.66]).tolist()
+        out["entropy_level"] = np.where(
+            out["entropy"] <= q33, "low", np.where(out["entropy"] >= q66, "high", "medium")
+        )
+        out["is_near_constant"] = (out["entropy_level"] == "low") & (
+            out["pct_top_category"] >= cfg.near_constant_top_pct
+        )
+    return out, pd.DataFrame(top_rows, columns=TOP_VALUES_COLUMNS)
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+@traced("engine.profiling.profile_table")
+def profile_table(
+    wh: Any,
+    table: str,
+    cfg: ProfilingCfg | None = None,
+    *,
+    dialect: str = "duckdb",
+    numeric_cols: Sequence[str] | None = None,
+    cat_cols: Sequence[str] | None = None,
+    approximate: bool | None = None,
+    backend_label: str | None = None,
+) -> ProfileResult:
+    """
+    Profile a warehouse table (`wh.read_df(sql)`) in three statements plus a row count.
+
+    Columns default to every numeric / string column of `table`; approximate
+    defaults to n_rows >= cfg.approx_min_rows.
+    """
+    cfg = cfg or ProfilingCfg()
+    dialect = dialect.lower()
+    cols = table_columns(wh, table, dialect)
+    dtypes = {c: t for c, t in cols}
+    auto_num, auto_cat = split_sql_columns(cols, cfg.exclude)
+    numeric_cols = list(numeric_cols if numeric_cols is not None else auto_num)
+    cat_cols = list(cat_cols if cat_cols is not None else auto_cat)
+    n_queries = 1
+
+    n_rows = int(wh.read_df(f"select count(*) as n from {table}").iloc[0, 0])
+    n_queries += 1
+    approx = bool(approximate) if approximate is not None else n_rows >= cfg.approx_min_rows
+    backend = backend_label or dialect
+
+    with span(
+        "profiling.scalar",
+        table=table,
+        rows_in=n_rows,
+        n_numeric=len(numeric_cols),
+        n_categorical=len(cat_cols),
+    ):
+        agg = _lower_cols(
+            wh.read_df(
+                scalar_profile_sql(table, numeric_cols, cat_cols, dialect=dialect, approx=approx)
+            )
+        ).iloc[0]
+        agg = _unpack_quantiles(agg, len(numeric_cols))
+        n_queries += 1
+
+    top = pd.DataFrame(columns=["col", "val", "n", "rk", "n_unique", "entropy", "n_rare"])
+    if cat_cols:
+        with span("profiling.top_values", table=table, k=cfg.top_k):
+            top = _lower_cols(
+                wh.read_df(
+                    top_values_sql(
+                        table, cat_cols, top_k=cfg.top_k, rare_pct=cfg.rare_pct, dialect=dialect
+                    )
+                )
+            )
+            top["col"] = top["col"].astype(str).str.lower()
+            n_queries += 1
+
+    hist = pd.DataFrame(columns=["col", "bin", "n", "mad", "g"])
+    if numeric_cols:
+        bounds = [
+            (_num(agg, f"n{i}_min"), _num(agg, f"n{i}_max"), _num(agg, f"n{i}_median"))
+            for i in range(len(numeric_cols))
+        ]
+        with span("profiling.histograms", table=table, bins=cfg.n_bins):
+            hist = _lower_cols(
+                wh.read_df(
+                    histogram_sql(
+                        table,
+                        numeric_cols,
+                        bounds,
+                        n_bins=cfg.n_bins,
+                        dialect=dialect,
+                        approx=approx,
+                    )
+                )
+            )
+            hist["col"] = hist["col"].astype(str).str.lower()
+            n_queries += 1
+
+    num_df, hist_df = _numeric_frame(agg, numeric_cols, dtypes, hist, cfg, backend, approx)
+    cat_df, top_df = _categorical_frame(agg, cat_cols, dtypes, top, cfg, backend)
+    return ProfileResult(num_df, cat_df, top_df, hist_df, backend, n_rows, approx, n_queries)
+
+
+def _frame_passes(
+    df: pd.DataFrame,
+    numeric_cols: Sequence[str],
+    cat_cols: Sequence[str],
+    cfg: ProfilingCfg,
+) -> tuple[pd.Series, pd.DataFrame, pd.DataFrame]:
+    """The three SQL passes computed with numpy / pandas; same (agg, top, hist) shapes."""
+    n = len(df)
+    agg: dict[str, Any] = {"n_rows": n}
+    hist_rows: list[dict[str, Any]] = []
+    nb = cfg.n_bins
+    for i, c in enumerate(numeric_cols):
+        x = f"n{i}"
+        v = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        fin = np.isfinite(v)
+        f = v[fin]
+        agg.update(
+            {
+                f"{x}_cnt": int(n - np.isnan(v).sum()),
+                f"{x}_nan": 0,  # NULL and NaN are one thing here
+                f"{x}_pinf": int(np.isposinf(v).sum()),
+                f"{x}_ninf": int(np.isneginf(v).sum()),
+                f"{x}_fin": int(f.size),
+                f"{x}_nuniq": int(pd.unique(f).size),
+                f"{x}_zero": int((f == 0).sum()),
+                f"{x}_neg": int((f < 0).sum()),
+                f"{x}_pos": int((f > 0).sum()),
+            }
+        )
+        if f.size == 0:
+            for k in ("min", "max", "mean", "std", *(name for name, _ in _QUANTILES)):
+                agg[f"{x}_{k}"] = float("nan")
+            continue
+        lo, hi = float(f.min()), float(f.max())
+        qs = np.quantile(f, [p for _, p in _QUANTILES])
+        agg.update(
+            {
+                f"{x}_min": lo,
+                f"{x}_max": hi,
+                f"{x}_mean": float(f.mean()),
+                f"{x}_std": float(f.std(ddof=1)) if f.size > 1 else float("nan"),
+                **{f"{x}_{name}": float(q) for (name, _), q in zip(_QUANTILES, qs, strict=True)},
+            }
+        )
+        bins = (
+            np.clip(np.floor((f - lo) / (hi - lo) * nb), 0, nb - 1).astype("int64")
+            if hi > lo
+            else np.zeros(f.size, dtype="int64")
+        )
+        counts = np.bincount(bins, minlength=nb)
+        hist_rows += [
+            {"col": x, "bin": b, "n": int(k), "mad": np.nan, "g": 0}
+            for b, k in enumerate(counts)
+            if k
+        ]
+        hist_rows.append(
+            {
+                "col": x,
+                "bin": np.nan,
+                "n": int(f.size),
+                "mad": float(np.median(np.abs(f - agg[f"{x}_median"]))),
+                "g": 1,
+            }
+        )
+
+    top_rows: list[dict[str, Any]] = []
+    for j, c in enumerate(cat_cols):
+        s = df[c]
+        agg[f"k{j}_cnt"] = int(s.notna().sum())
+        vc = s.dropna().astype(str).value_counts()
+        if vc.empty:
+            continue
+        vc = vc.sort_index(kind="stable").sort_values(
+            ascending=False, kind="stable"
+        )  # SQL: n desc, val
+        p = vc.to_numpy(dtype="float64") / vc.sum()
+        ent = float(-(p * np.log2(p)).sum())
+        n_rare = int((100.0 * p < cfg.rare_pct).sum())
+        for rk, (val, cnt) in enumerate(vc.iloc[: cfg.top_k].items(), start=1):
+            top_rows.append(
+                {
+                    "col": f"k{j}",
+                    "val": val,
+                    "n": int(cnt),
+                    "rk": rk,
+                    "n_unique": int(vc.size),
+                    "entropy": ent,
+                    "n_rare": n_rare,
+                }
+            )
+    return (
+        pd.Series(agg, dtype="object"),
+        pd.DataFrame(top_rows, columns=["col", "val", "n", "rk", "n_unique", "entropy", "n_rare"]),
+        pd.DataFrame(hist_rows, columns=["col", "bin", "n", "mad", "g"]),
+    )
+
+
+@traced("engine.profiling.profile_frame")
+def profile_frame(
+    df: pd.DataFrame,
+    cfg: ProfilingCfg | None = None,
+    *,
+    numeric_cols: Sequence[str] | None = None,
+    cat_cols: Sequence[str] | None = None,
+) -> ProfileResult:
+    """In-memory path (exact); same frames as `profile_table`."""
+    cfg = cfg or ProfilingCfg()
+    if numeric_cols is None:
+        numeric_cols = [
+            c
+            for c in df.columns
+            if c not in cfg.exclude
+            and is_numeric_dtype(df[c].dtype)
+            and not is_bool_dtype(df[c].dtype)
+        ]
+    if cat_cols is None:
+        cat_cols = [
+            c
+            for c in df.columns
+            if c not in cfg.exclude
+            and c not in numeric_cols
+            and not is_datetime64_any_dtype(df[c].dtype)
+        ]
+    agg, top, hist = _frame_passes(df, list(numeric_cols), list(cat_cols), cfg)
+    dtypes = {str(c): str(df[c].dtype) for c in df.columns}
+    num_df, hist_df = _numeric_frame(agg, numeric_cols, dtypes, hist, cfg, "pandas", False)
+    cat_df, top_df = _categorical_frame(agg, cat_cols, dtypes, top, cfg, "pandas")
+    return ProfileResult(num_df, cat_df, top_df, hist_df, "pandas", len(df), False)
+
+
+@traced("engine.profiling.profile")
+def profile(
+    source: Source,
+    table: str | None = None,
+    *,
+    config: dict[str, Any] | None = None,
+    cfg: ProfilingCfg | None = None,
+    numeric_cols: Sequence[str] | None = None,
+    cat_cols: Sequence[str] | None = None,
+    budget: MemoryBudget | None = None,
+) -> ProfileResult:
+    """
+    Profile wherever the data lives (PROFILING.BACKEND=auto).
+
+    - DataFrame                              → pandas (numpy passes, exact)
+    - path (.parquet / .csv / parquet dir)   → DuckDB reads the files in place
+    - Arrow IPC spill (SpilledTable / .arrow) → DuckDB scans the mapped file
+    - DuckDB / Snowflake warehouse + `table` → pushed down in that dialect
+
+    Forcing BACKEND=duckdb on a DataFrame runs the SQL passes on an in-process
+    DuckDB over the frame (useful for frames that are wider than they are long).
+    With a MEMORY_BUDGET, every in-process DuckDB connection gets the budget's
+    memory_limit / temp_directory so it spills rather than OOMs. A frame or
+    file whose working set would not fit is profiled on DuckDB with
+    approximate quantiles (exact holistic aggregates cannot spill).
+    """
+    cfg = cfg or ProfilingCfg.from_config(config)
+    if isinstance(source, SpilledTable):
+        source = source.path
+    backend = select_backend(source, cfg)
+    approximate = None
+    if (
+        budget is not None
+        and isinstance(source, (pd.DataFrame, str, Path))
+        and not budget.fits(estimate_size(source)[0])
+    ):
+        approximate = True
+        if backend == "pandas" and cfg.backend == "auto":
+            backend = "duckdb"
+
+    if isinstance(source, pd.DataFrame):
+        if backend == "pandas":
+            return profile_frame(source, cfg, numeric_cols=numeric_cols, cat_cols=cat_cols)
+        import duckdb
+
+        df = source
+        cols = list(dict.fromkeys(list(numeric_cols or []) + list(cat_cols or []))) or list(
+            df.columns
+        )
+        con = _connect(duckdb, budget)
+        try:
+            con.register(_FRAME_VIEW, _frame_for_duckdb(df, cols))
+            return profile_table(
+                _ConnReader(con),
+                _FRAME_VIEW,
+                cfg,
+                dialect="duckdb",
+                numeric_cols=numeric_cols,
+                cat_cols=cat_cols,
+                approximate=approximate,
+            )
+        finally:
+            con.close()
+
+    if isinstance(source, (str, Path)):
+        import duckdb
+
+        p = Path(source)
+        ipc = p.suffix.lower() in (".arrow", ".ipc", ".feather")
+        # joins over a registered Arrow scan cannot spill; over budget, stage the IPC
+        # file into a scratch DuckDB database (native storage spills to disk)
+        scratch = (
+            Path(budget.spill_dir) / f"profile_{os.getpid()}_{id(source):x}.duckdb"
+            if ipc and approximate and budget is not None and budget.spill_dir
+            else None
+        )
+        if scratch is not None:
+            scratch.parent.mkdir(parents=True, exist_ok=True)
+        con = _connect(duckdb, budget, str(scratch) if scratch is not None else ":memory:")
+        try:
+            if ipc:
+                con.register(_FRAME_VIEW, SpilledTable(p).dataset())
+                relation = _FRAME_VIEW
+                if scratch is not None:
+                    con.execute(f"create table _dq_profile_stage as select * from {_FRAME_VIEW}")
+                    relation = "_dq_profile_stage"
+            else:
+                glob = str(p / "**" / "*.parquet") if p.is_dir() else str(p)
+                reader = (
+                    "read_parquet"
+                    if p.is_dir() or p.suffix in (".parquet", ".pq")
+                    else "read_csv_auto"
+                )
+                relation = f"{reader}({_lit(glob)})"
+            return profile_table(
+                _ConnReader(con),
+                relation,
+                cfg,
+                dialect="duckdb",
+                numeric_cols=numeric_cols,
+                cat_cols=cat_cols,
+                approximate=approximate,
+            )
+        finally:
+            con.close()
+            if scratch is not None:
+                for f in (scratch, scratch.with_name(scratch.name + ".wal")):
+                    f.unlink(missing_ok=True)
+
+    if not table:
+        raise ValueError(
+            "profile(warehouse, table): a table name is required for warehouse sources"
+        )
+    return profile_table(
+        source, table, cfg, dialect=backend, numeric_cols=numeric_cols, cat_cols=cat_cols
+    )
+
+
+def _connect(duckdb: Any, budget: MemoryBudget | None, database: str = ":memory:") -> Any:
+    con = duckdb.connect(database)
+    return budget.configure_duckdb(con) if budget is not None else con
+
+
+class _ConnReader:
+    """Minimal `read_df` adapter over a raw DuckDB connection."""
+
+    def __init__(self, con: Any):
+        self.con = con
+
+    def read_df(self, sql: str) -> pd.DataFrame:
+        return self.con.execute(sql).df()
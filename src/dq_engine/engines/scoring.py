@@ -0,0 +1,479 @@
+# src/dq_engine/engines/scoring.py
+"""
+Vectorized composite scoring (2.5.17 integrity, 2.6.17 readiness, 2.8.10 SRI,
+2.9.6 component formulas, 2.9.7 quality bands).
+
+- `compile_formula` parses a QUALITY_SCORE.COMPONENT_FORMULAS expression once,
+  rejects anything outside a small AST whitelist (arithmetic, comparisons,
+  and/or/not, `a if c else b`, min/max/abs/clip/log/exp/sqrt), rewrites it to
+  NumPy calls and compiles it. Evaluating it over a frame is one expression over
+  whole columns — no per-row dict, no `eval` of untrusted code.
+- Banding uses `np.searchsorted` over sorted boundaries.
+- `score_frame` computes every index for every row (one row per run or per
+  feature) in a single pass over the component columns.
+
+Semantics follow the inline cells: a formula that fails (unknown column,
+division by zero) yields NaN; indices are clipped to their ranges; SRI weights
+are renormalised over the components present in each row.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+
+class FormulaError(ValueError):
+    """Raised when a scoring formula uses syntax outside the whitelist."""
+
+
+# ---------------------------------------------------------------------------
+# Formula compilation
+# ---------------------------------------------------------------------------
+_BIN_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY_OPS = (ast.UAdd, ast.USub, ast.Not)
+_CMP_OPS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+_ALLOWED_NODES = (
+    (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp, ast.IfExp, ast.Call)
+    + (ast.Name, ast.Constant, ast.Load, ast.And, ast.Or)
+    + _BIN_OPS
+    + _UNARY_OPS
+    + _CMP_OPS
+)
+
+_RUNTIME: dict[str, Any] = {
+    "__builtins__": {},
+    "_where": np.where,
+    "_and": np.logical_and,
+    "_or": np.logical_or,
+    "_not": np.logical_not,
+    "_min": lambda *a: _reduce(np.fmin, a),
+    "_max": lambda *a: _reduce(np.fmax, a),
+    "abs": np.abs,
+    "clip": np.clip,
+    "log": np.log,
+    "log1p": np.log1p,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+    "isnan": pd.isna,
+    "nan": np.nan,
+    "pi": np.pi,
+}
+_FUNCS = {
+    "min": "_min",
+    "max": "_max",
+    "abs": "abs",
+    "clip": "clip",
+    "log": "log",
+    "log1p": "log1p",
+    "exp": "exp",
+    "sqrt": "sqrt",
+    "isnan": "isnan",
+}
+_CONSTS = {"nan", "pi", "True", "False"}
+
+
+def _reduce(fn: Callable, args: Sequence[Any]) -> Any:
+    out = args[0]
+    for a in args[1:]:
+        out = fn(out, a)
+    return out
+
+
+def _call(name: str, args: list[ast.expr]) -> ast.Call:
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+
+class _ToNumpy(ast.NodeTransformer):
+    """Validate against the whitelist and rewrite scalar-only constructs to NumPy calls."""
+
+    def __init__(self):
+        self.names: list[str] = []
+
+    def generic_visit(self, node):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise FormulaError(f"disallowed syntax: {type(node).__name__}")
+        return super().generic_visit(node)
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (int, float, bool, str)) or node.value is None:
+            raise FormulaError(f"disallowed constant: {node.value!r}")
+        return node
+
+    def visit_Name(self, node):
+        if node.id.startswith("_"):
+            raise FormulaError(f"disallowed name: {node.id}")
+        if node.id not in _CONSTS and node.id not in self.names:
+            self.names.append(node.id)
+        return node
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCS or node.keywords:
+            raise FormulaError(f"disallowed call: {ast.unparse(node)}")
+        return _call(_FUNCS[node.func.id], [self.visit(a) for a in node.args])
+
+    def visit_IfExp(self, node):
+        return _call(
+            "_where", [self.visit(node.test), self.visit(node.body), self.visit(node.orelse)]
+        )
+
+    def visit_BoolOp(self, node):
+        fn = "_and" if isinstance(node.op, ast.And) else "_or"
+        vals = [self.visit(v) for v in node.values]
+        out = vals[0]
+        for v in vals[1:]:
+            out = _call(fn, [out, v])
+        return out
+
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.Not):
+            return _call("_not", [self.visit(node.operand)])
+        return self.generic_visit(node)
+
+    def visit_Compare(self, node):
+        # a < b < c  ->  (a < b) & (b < c), elementwise
+        parts, left = [], self.visit(node.left)
+        for op, comp in zip(node.ops, node.comparators, strict=True):
+            if not isinstance(op, _CMP_OPS):
+                raise FormulaError(f"disallowed comparison: {type(op).__name__}")
+            right = self.visit(comp)
+            parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+        out = parts[0]
+        for p in parts[1:]:
+            out = _call("_and", [out, p])
+        return out
+
+
+@dataclass(frozen=True)
+class CompiledFormula:
+    source: str
+    names: tuple[str, ...]
+    code: Any = field(repr=False, compare=False)
+
+    def __call__(self, frame: pd.DataFrame) -> np.ndarray:
+        """Evaluate over all rows of `frame`; NaN where the formula cannot be computed."""
+        n = len(frame)
+        if any(nm not in frame.columns for nm in self.names):
+            return np.full(n, np.nan)
+        env = dict(_RUNTIME)
+        for nm in self.names:
+            col = frame[nm]
+            if pd.api.types.is_bool_dtype(col) or pd.api.types.is_numeric_dtype(col):
+                env[nm] = col.to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                env[nm] = col.to_numpy(dtype=object)
+        try:
+            with np.errstate(all="ignore"):
+                out = eval(self.code, env)  # noqa: S307 — AST whitelisted in compile_formula
+            out = np.broadcast_to(np.asarray(out, dtype="float64"), (n,)).copy()
+        except Exception:
+            return np.full(n, np.nan)
+        out[~np.isfinite(out)] = np.nan
+        return out
+
+
+_FORMULA_CACHE: dict[str, CompiledFormula] = {}
+
+
+def compile_formula(expr: str) -> CompiledFormula:
+    """Parse + whitelist + compile once (cached by source text)."""
+    expr = str(expr).strip()
+    hit = _FORMULA_CACHE.get(expr)
+    if hit is not None:
+        return hit
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise FormulaError(f"cannot parse formula {expr!r}: {e.msg}") from e
+    tx = _ToNumpy()
+    tree = ast.fix_missing_locations(tx.visit(tree))
+    out = CompiledFormula(
+        source=expr, names=tuple(tx.names), code=compile(tree, "<formula>", "eval")
+    )
+    _FORMULA_CACHE[expr] = out
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Banding + label maps
+# ---------------------------------------------------------------------------
+def band(
+    values: Any, boundaries: Sequence[float], labels: Sequence[str], na_label: str | None = None
+) -> np.ndarray:
+    """
+    labels[i] for boundaries[i-1] <= v < boundaries[i] (boundaries ascending,
+    len(labels) == len(boundaries) + 1). NaN -> `na_label` (default: lowest label).
+    """
+    v = np.asarray(values, dtype="float64")
+    b = np.asarray(boundaries, dtype="float64")
+    idx = np.searchsorted(b, v, side="right")
+    out = np.asarray(labels, dtype=object)[idx]
+    out[np.isnan(v)] = labels[0] if na_label is None else na_label
+    return out
+
+
+@dataclass(frozen=True)
+class QualityBands:
+    excellent_min: float = 90.0
+    moderate_min: float = 70.0
+    excellent: str = "🟩 Excellent"
+    moderate: str = "🟨 Moderate"
+    poor: str = "🟥 Poor"
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> QualityBands:
+        b = (
+            C("QUALITY_BANDS.BOUNDARIES", None, config=config)
+            or C("QUALITY_BANDS", {}, config=config)
+            or {}
+        )
+        lab = (
+            C("QUALITY_BANDS.LABELS", None, config=config)
+            or C("QUALITY_BANDS", {}, config=config)
+            or {}
+        )
+        return cls(
+            excellent_min=float(b.get("EXCELLENT_MIN", 90)),
+            moderate_min=float(b.get("MODERATE_MIN", 70)),
+            excellent=lab.get("EXCELLENT", cls.excellent),
+            moderate=lab.get("MODERATE", cls.moderate),
+            poor=lab.get("POOR", cls.poor),
+        )
+
+    def assign(self, scores: Any) -> np.ndarray:
+        return band(
+            scores,
+            [self.moderate_min, self.excellent_min],
+            [self.poor, self.moderate, self.excellent],
+        )
+
+
+SRI_LABELS = (("poor", 0.0), ("borderline", 0.50), ("good", 0.70), ("excellent", 0.85))
+SRI_STATUS = {
+    "excellent": "OK",
+    "good": "OK",
+    "borderline": "WARN",
+    "poor": "FAIL",
+    "unknown": "FAIL",
+}
+
+
+def map_stability_labels(labels: pd.Series) -> np.ndarray:
+    """Vectorized 2.8.10 `_map_stability_label`."""
+    s = labels.astype("string").str.lower()
+    na = s.isna().to_numpy()
+    s = s.fillna("")
+    conds = [
+        s.str.contains("highly").to_numpy(),
+        (s.str.contains("stable") & ~s.str.contains("moderately")).to_numpy(),
+        s.str.contains("moderate").to_numpy(),
+        (s.str.contains("uncertain") | s.str.contains("unstable")).to_numpy(),
+    ]
+    out = np.select(conds, [1.0, 0.85, 0.6, 0.3], default=0.5)
+    out[na] = np.nan
+    return out
+
+
+def map_signal_labels(labels: pd.Series) -> np.ndarray:
+    """Vectorized 2.8.10 `_map_signal_label`."""
+    s = labels.astype("string").str.lower()
+    out = (
+        s.map({"high": 1.0, "medium": 0.7, "low": 0.3})
+        .astype("float64")
+        .fillna(0.5)
+        .to_numpy(copy=True)
+    )
+    out[labels.isna().to_numpy()] = np.nan
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Index definitions
+# ---------------------------------------------------------------------------
+_DEFAULT_CONTRACT_PENALTIES = {"OK": 0.0, "WARN": -10.0, "FAIL": -25.0}
+_DEFAULT_DRI_WEIGHTS = {
+    "missingness": 0.25,
+    "outliers": 0.20,
+    "domain": 0.20,
+    "logic_repairs": 0.15,
+    "revalidation": 0.20,
+}
+_DRI_COLUMNS = {
+    "missingness": "missingness_score",
+    "outliers": "outlier_score",
+    "domain": "domain_score",
+    "logic_repairs": "logic_score",
+    "revalidation": "revalidation_score",
+}
+_DEFAULT_SRI_WEIGHTS = {
+    "VARIANCE_STABILITY": 0.25,
+    "CI_WIDTHS": 0.20,
+    "SNR": 0.25,
+    "EFFECT_STABILITY": 0.20,
+    "CORR_STABILITY": 0.10,
+}
+
+
+@dataclass(frozen=True)
+class ScoringCfg:
+    integrity_weights: Mapping[str, float]
+    contract_penalties: Mapping[str, float]
+    dri_weights: Mapping[str, float]
+    dri_base_weight: float
+    dri_use_integrity_base: bool
+    sri_weights: Mapping[str, float]
+    component_formulas: Mapping[str, str]
+    component_weights: Mapping[str, float]
+    clip_components: bool
+    bands: QualityBands
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> ScoringCfg:
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        w = get("INTEGRITY_INDEX.WEIGHTS", {}) or {}
+        pen = dict(_DEFAULT_CONTRACT_PENALTIES)
+        for k, v in (get("INTEGRITY_INDEX.CONTRACT_PENALTIES", {}) or {}).items():
+            try:
+                pen[str(k).upper()] = float(v)
+            except (TypeError, ValueError):
+                pass
+        return cls(
+            integrity_weights={
+                "numeric": float(w.get("numeric", 0.3)),
+                "categorical": float(w.get("categorical", 0.3)),
+                "logic": float(w.get("logic", 0.3)),
+                "contract_modifier": float(w.get("contract_modifier", 0.1)),
+            },
+            contract_penalties=pen,
+            dri_weights=dict(get("DATA_READINESS_INDEX.WEIGHTS", None) or _DEFAULT_DRI_WEIGHTS),
+            dri_base_weight=float(get("DATA_READINESS_INDEX.BASE_WEIGHT", 0.5)),
+            dri_use_integrity_base=bool(
+                get("DATA_READINESS_INDEX.USE_INTEGRITY_INDEX_AS_BASE", True)
+            ),
+            sri_weights=dict(
+                get("STATISTICAL_READINESS_INDEX.WEIGHTS", None) or _DEFAULT_SRI_WEIGHTS
+            ),
+            component_formulas=dict(get("QUALITY_SCORE.COMPONENT_FORMULAS", {}) or {}),
+            component_weights=dict(get("QUALITY_SCORE.WEIGHTS", {}) or {}),
+            clip_components=bool(get("QUALITY_SCORE.CLIP_COMPONENTS_TO_01", True)),
+            bands=QualityBands.from_config(config),
+        )
+
+
+def _col(frame: pd.DataFrame, name: str, default: float = np.nan) -> np.ndarray:
+    if name in frame.columns:
+        return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype="float64")
+    return np.full(len(frame), default)
+
+
+def integrity_index(frame: pd.DataFrame, cfg: ScoringCfg) -> dict[str, np.ndarray]:
+    """2.5.17 over every row: numeric/categorical/logic_score (default 100) + contract_status."""
+    w = cfg.integrity_weights
+    num = np.nan_to_num(_col(frame, "numeric_score", 100.0), nan=100.0)
+    cat = np.nan_to_num(_col(frame, "categorical_score", 100.0), nan=100.0)
+    log = np.nan_to_num(_col(frame, "logic_score", 100.0), nan=100.0)
+    if "contract_status" in frame.columns:
+        st = frame["contract_status"].astype("string").str.upper()
+        penalty = st.map(dict(cfg.contract_penalties)).astype("float64").fillna(0.0).to_numpy()
+    else:
+        penalty = np.zeros(len(frame))
+    base = w["numeric"] * num + w["categorical"] * cat + w["logic"] * log
+    return {
+        "integrity_index": np.clip(base + w["contract_modifier"] * penalty, 0.0, 100.0),
+        "contract_penalty": penalty,
+    }
+
+
+def readiness_index(
+    frame: pd.DataFrame, cfg: ScoringCfg, integrity: np.ndarray | None = None
+) -> np.ndarray:
+    """2.6.17: weighted clean-up components (missing -> 70), blended with the integrity base."""
+    total = sum(float(v) for v in cfg.dri_weights.values()) or 1.0
+    clean = np.zeros(len(frame))
+    for k, wt in cfg.dri_weights.items():
+        clean += float(wt) * np.nan_to_num(_col(frame, _DRI_COLUMNS.get(k, f"{k}_score")), nan=70.0)
+    clean /= total
+    if integrity is None and "integrity_index" in frame.columns:
+        integrity = _col(frame, "integrity_index")
+    if cfg.dri_use_integrity_base and integrity is not None:
+        bw = min(1.0, max(0.0, cfg.dri_base_weight))
+        has_base = ~np.isnan(integrity)
+        clean = np.where(has_base, bw * np.nan_to_num(integrity) + (1.0 - bw) * clean, clean)
+    return np.clip(clean, 0.0, 100.0)
+
+
+def statistical_readiness_index(frame: pd.DataFrame, cfg: ScoringCfg) -> dict[str, np.ndarray]:
+    """2.8.10: weights renormalised per row over the components present (0–1 score + label)."""
+    keys = list(cfg.sri_weights)
+    S = np.column_stack([_col(frame, k) for k in keys]) if keys else np.empty((len(frame), 0))
+    W = np.array([float(cfg.sri_weights[k] or 0.0) for k in keys])
+    present = ~np.isnan(S) & (W > 0)
+    wsum = (present * W).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.where(present, np.nan_to_num(S) * W, 0.0).sum(axis=1) / wsum
+    score[wsum <= 0] = np.nan
+    labels = band(
+        score, [t for _, t in SRI_LABELS[1:]], [lab for lab, _ in SRI_LABELS], na_label="unknown"
+    )
+    return {"sri_score": score, "sri_label": labels}
+
+
+def component_scores(frame: pd.DataFrame, cfg: ScoringCfg) -> pd.DataFrame:
+    """2.9.6: each COMPONENT_FORMULAS entry over whole columns + weighted quality_score (0–100)."""
+    out: dict[str, np.ndarray] = {}
+    q01 = np.zeros(len(frame))
+    comp_cols = {}
+    for name, formula in cfg.component_formulas.items():
+        col = f"{str(name).lower()}_score"
+        v = compile_formula(formula)(frame)
+        if cfg.clip_components:
+            v = np.clip(v, 0.0, 1.0)
+        out[col] = v
+        comp_cols[name] = col
+    for name, wt in cfg.component_weights.items():
+        if name in comp_cols:
+            q01 += np.nan_to_num(out[comp_cols[name]]) * float(wt)
+    out["quality_score_0_1"] = q01
+    out["quality_score"] = np.round(q01 * 100.0, 1)
+    return pd.DataFrame(out, index=frame.index)
+
+
+@traced("engine.scoring.score_frame")
+def score_frame(
+    frame: pd.DataFrame, config: dict[str, Any] | None = None, cfg: ScoringCfg | None = None
+) -> pd.DataFrame:
+    """
+    All indices for every row of `frame` in one pass.
+
+    Columns used when present: numeric/categorical/logic_score, contract_status
+    (integrity); missingness/outlier/domain/logic/revalidation_score (readiness);
+    SRI component columns (VARIANCE_STABILITY, ...); formula inputs (quality score).
+    """
+    cfg = cfg or ScoringCfg.from_config(config)
+    res = frame.copy()
+    ii = integrity_index(frame, cfg)
+    res["integrity_index"] = ii["integrity_index"]
+    res["contract_penalty"] = ii["contract_penalty"]
+    res["data_readiness_index"] = readiness_index(frame, cfg, ii["integrity_index"])
+    sri = statistical_readiness_index(frame, cfg)
+    res["sri_score"] = sri["sri_score"]
+    res["sri_label"] = sri["sri_label"]
+    res["sri_status"] = pd.Series(sri["sri_label"], index=frame.index).map(SRI_STATUS).to_numpy()
+    if cfg.component_formulas:
+        comps = component_scores(frame, cfg)
+        for c in comps.columns:
+            res[c] = comps[c].to_numpy()
+        q = res["quality_score"].to_numpy(dtype="float64")
+        res["quality_band"] = cfg.bands.assign(q)
+        res["is_recommended_for_model"] = q >= cfg.bands.moderate_min
+        res["priority_for_improvement"] = q < cfg.bands.moderate_min
+    return res
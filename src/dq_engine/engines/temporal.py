@@ -0,0 +1,731 @@
+# src/dq_engine/engines/temporal.py
+"""
+Incremental temporal / pseudo-temporal profiler (2.3.7.x, TEMPORAL block).
+
+- Rows are bucketed on TEMPORAL.TIME_COLUMN at TIME_BUCKET (pandas period
+  alias). Without a time column they are bucketed on PSEUDO_TIME.COLUMN in
+  BUCKET_WIDTH steps (tenure years).
+- Each bucket keeps pairwise-complete moments for every feature pair (i <= j):
+  n, mean_i, mean_j, m2_i, m2_j and the co-moment c_ij. These are centred
+  sums of squares / cross-products; the diagonal is the per-feature marginal.
+  They are built from shifted matrix products, so one bucket costs a few
+  BLAS calls.
+- Buckets are merged with the parallel (Chan) update, so a window's
+  variance / correlation equals what a full rescan would give, without the
+  precision loss of raw sums of squares.
+- The state is persisted to Parquet (TEMPORAL.STATE_FILE under
+  PATHS.ARTIFACTS). `refresh` recomputes only buckets that are new or among
+  the last STATE_REFRESH_BUCKETS (still filling). `append` folds a batch of new
+  rows into the state. Older buckets are never rescanned.
+- Rolling z compares each bucket mean with the trailing Z_WINDOW bucket means
+  (expanding when null). Correlation deltas compare consecutive CORR_WINDOW
+  windows. Both read only the state.
+- `validate_intervals` checks every INTERVALS entry at once: starts / ends
+  stack into int64 matrices and one subtraction gives every duration.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+from dq_engine.artifacts import write_artifact
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+STATE_VERSION = 1
+
+STATE_COLUMNS = [
+    "bucket",
+    "bucket_order",
+    "feature_i",
+    "feature_j",
+    "n",
+    "mean_i",
+    "mean_j",
+    "m2_i",
+    "m2_j",
+    "c_ij",
+]
+
+TS_OUTLIER_COLUMNS = [
+    "feature",
+    "time_bucket",
+    "bucket_order",
+    "n",
+    "metric_mean",
+    "baseline_mean",
+    "baseline_std",
+    "z_score",
+    "is_outlier",
+]
+
+CORR_DELTA_COLUMNS = [
+    "feature_i",
+    "feature_j",
+    "time_window",
+    "corr_prev",
+    "corr_curr",
+    "delta",
+    "abs_delta",
+    "n_prev",
+    "n_curr",
+    "is_alert",
+]
+
+INTERVAL_CHECK_COLUMNS = [
+    "interval",
+    "start_col",
+    "end_col",
+    "unit",
+    "min_duration",
+    "max_duration",
+    "n_rows",
+    "n_checked",
+    "n_missing",
+    "n_negative",
+    "n_below_min",
+    "n_above_max",
+    "n_violations",
+    "pct_violations",
+    "duration_min",
+    "duration_median",
+    "duration_max",
+    "status",
+]
+
+INTERVAL_VIOLATION_COLUMNS = ["row_index", "interval", "duration", "reason"]
+
+_UNIT_NS = {
+    "seconds": 1_000_000_000,
+    "minutes": 60 * 1_000_000_000,
+    "hours": 3_600 * 1_000_000_000,
+    "days": 86_400 * 1_000_000_000,
+    "weeks": 7 * 86_400 * 1_000_000_000,
+}
+_MOMENTS = ("n", "mean_i", "mean_j", "m2_i", "m2_j", "c_ij")
+
+
+@dataclass(frozen=True)
+class TemporalCfg:
+    time_column: str | None = None
+    time_bucket: str = "M"
+    z_threshold: float = 3.0
+    z_window: int | None = None  # trailing buckets for the z baseline; None = expanding
+    min_history: int = 3  # buckets needed before a z-score is emitted
+    corr_window: int = 3
+    corr_delta_threshold: float = 0.3
+    corr_min_n: int = 10  # rows per window (pairwise complete) to report a delta
+    intervals: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    pseudo_column: str | None = None
+    pseudo_width: float = 12.0
+    state_path: str | None = None
+    refresh_buckets: int = 1
+    max_violation_rows: int = 1_000  # per interval, in interval_violations.csv
+    exclude: tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> TemporalCfg:
+        """TEMPORAL.*; ID_COLUMNS / TARGET.COLUMN are never profiled as features."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        pseudo = get("TEMPORAL.PSEUDO_TIME", {}) or {}
+        state_file = get("TEMPORAL.STATE_FILE", "temporal/temporal_state.parquet")
+        artifacts = get("PATHS.ARTIFACTS", "resources/artifacts/")
+        target = get("TARGET.COLUMN", None)
+        z_window = get("TEMPORAL.Z_WINDOW", None)
+        return cls(
+            time_column=get("TEMPORAL.TIME_COLUMN", None),
+            time_bucket=str(get("TEMPORAL.TIME_BUCKET", "M") or "M"),
+            z_threshold=float(get("TEMPORAL.Z_THRESHOLD", 3.0)),
+            z_window=int(z_window) if z_window else None,
+            min_history=int(get("TEMPORAL.MIN_HISTORY_BUCKETS", 3)),
+            corr_window=max(1, int(get("TEMPORAL.CORR_WINDOW", 3))),
+            corr_delta_threshold=float(get("TEMPORAL.CORR_DELTA_THRESHOLD", 0.3)),
+            corr_min_n=int(get("TEMPORAL.CORR_MIN_N", 10)),
+            intervals=dict(get("TEMPORAL.INTERVALS", {}) or {}),
+            pseudo_column=pseudo.get("COLUMN"),
+            pseudo_width=float(pseudo.get("BUCKET_WIDTH", 12) or 12),
+            state_path=str(Path(artifacts) / state_file) if state_file else None,
+            refresh_buckets=max(0, int(get("TEMPORAL.STATE_REFRESH_BUCKETS", 1))),
+            max_violation_rows=int(get("TEMPORAL.MAX_VIOLATION_ROWS", 1_000)),
+            exclude=tuple(list(get("ID_COLUMNS", []) or []) + ([target] if target else [])),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Bucketing
+# ---------------------------------------------------------------------------
+def bucket_axis(df: pd.DataFrame, cfg: TemporalCfg) -> tuple[str | None, str]:
+    """('time' | 'pseudo' | None, column) — the time column wins when present."""
+    if cfg.time_column and cfg.time_column in df.columns:
+        return "time", cfg.time_column
+    if cfg.pseudo_column and cfg.pseudo_column in df.columns:
+        return "pseudo", cfg.pseudo_column
+    return None, ""
+
+
+def bucket_codes(df: pd.DataFrame, cfg: TemporalCfg) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row bucket order (int64; invalid rows masked) + validity mask."""
+    axis, col = bucket_axis(df, cfg)
+    if axis == "time":
+        t = (
+            df[col]
+            if is_datetime64_any_dtype(df[col].dtype)
+            else pd.to_datetime(df[col], errors="coerce")
+        )
+        valid = t.notna().to_numpy()
+        order = np.zeros(len(df), dtype="int64")
+        if valid.any():
+            order[valid] = pd.PeriodIndex(t[valid], freq=cfg.time_bucket).asi8
+        return order, valid
+    if axis == "pseudo":
+        v = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        valid = np.isfinite(v)
+        order = np.zeros(len(df), dtype="int64")
+        order[valid] = np.floor(v[valid] / cfg.pseudo_width).astype("int64")
+        return order, valid
+    raise ValueError(
+        f"No temporal axis: TEMPORAL.TIME_COLUMN={cfg.time_column!r} and "
+        f"PSEUDO_TIME.COLUMN={cfg.pseudo_column!r} are both missing from the frame"
+    )
+
+
+def bucket_labels(orders: Sequence[int], axis: str, column: str, cfg: TemporalCfg) -> list[str]:
+    orders = np.asarray(orders, dtype="int64")
+    if axis == "time":
+        return [str(p) for p in pd.PeriodIndex.from_ordinals(orders, freq=cfg.time_bucket)]
+    w = cfg.pseudo_width
+    return [f"{column}_{o * w:03g}-{(o + 1) * w - 1:03g}" for o in orders]
+
+
+# ---------------------------------------------------------------------------
+# Moments
+# ---------------------------------------------------------------------------
+def bucket_moments(X: np.ndarray) -> np.ndarray:
+    """Pairwise-complete moments of one bucket → (6, p, p): n, mean_i, mean_j, m2_i, m2_j, c_ij."""
+    M = ~np.isnan(X)
+    Mf = M.astype("float64")
+    cnt = Mf.sum(axis=0)
+    shift = np.divide(np.where(M, X, 0.0).sum(axis=0), cnt, out=np.zeros(X.shape[1]), where=cnt > 0)
+    Z = np.where(M, X - shift, 0.0)
+    N = Mf.T @ Mf
+    S = Z.T @ Mf  # S[i, j] = Σ z_i over rows where i and j are both present
+    Q = (Z * Z).T @ Mf
+    P = Z.T @ Z
+    with np.errstate(invalid="ignore", divide="ignore"):
+        inv = np.where(N > 0, 1.0 / N, 0.0)
+        mean_i = shift[:, None] + S * inv
+        mean_j = shift[None, :] + S.T * inv
+        m2_i = Q - S * S * inv
+        m2_j = Q.T - S.T * S.T * inv
+        c = P - S * S.T * inv
+    out = np.stack([N, mean_i, mean_j, np.maximum(m2_i, 0.0), np.maximum(m2_j, 0.0), c])
+    out[1:, N == 0] = np.nan
+    return out
+
+
+def merge_moments(parts: np.ndarray) -> np.ndarray:
+    """Chan merge of (k, 6, p, p) bucket moments → (6, p, p)."""
+    n_b = parts[:, 0]
+    n = n_b.sum(axis=0)
+    w = np.nan_to_num(n_b)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mi = np.nansum(w * parts[:, 1], axis=0) / n
+        mj = np.nansum(w * parts[:, 2], axis=0) / n
+        di = np.where(n_b > 0, parts[:, 1] - mi, 0.0)
+        dj = np.where(n_b > 0, parts[:, 2] - mj, 0.0)
+        m2_i = np.nansum(parts[:, 3], axis=0) + (w * di * di).sum(axis=0)
+        m2_j = np.nansum(parts[:, 4], axis=0) + (w * dj * dj).sum(axis=0)
+        c = np.nansum(parts[:, 5], axis=0) + (w * di * dj).sum(axis=0)
+    out = np.stack([n, mi, mj, m2_i, m2_j, c])
+    out[1:, n == 0] = np.nan
+    return out
+
+
+def _corr(m: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return m[5] / np.sqrt(m[3] * m[4])
+
+
+# ---------------------------------------------------------------------------
+# Persisted state
+# ---------------------------------------------------------------------------
+class TemporalState:
+    """Per-bucket moments keyed by bucket order; `signature` pins axis / bucket size / features."""
+
+    def __init__(self, features: Sequence[str], axis: str, column: str, bucket: str):
+        self.features = list(features)
+        self.axis, self.column, self.bucket = axis, column, bucket
+        self.buckets: dict[int, np.ndarray] = {}
+        self.labels: dict[int, str] = {}
+
+    @property
+    def signature(self) -> dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "axis": self.axis,
+            "column": self.column,
+            "bucket": self.bucket,
+            "features": self.features,
+        }
+
+    @property
+    def orders(self) -> list[int]:
+        return sorted(self.buckets)
+
+    def to_frame(self) -> pd.DataFrame:
+        p = len(self.features)
+        iu, ju = np.triu_indices(p)
+        frames = []
+        for o in self.orders:
+            m = self.buckets[o]
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "bucket": self.labels[o],
+                        "bucket_order": o,
+                        "feature_i": np.asarray(self.features, dtype=object)[iu],
+                        "feature_j": np.asarray(self.features, dtype=object)[ju],
+                        **{k: m[t][iu, ju] for t, k in enumerate(_MOMENTS)},
+                    }
+                )
+            )
+        return (
+            pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=STATE_COLUMNS)
+        )
+
+    def save(self, path: str | Path) -> Path:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(self.to_frame()[STATE_COLUMNS], preserve_index=False)
+        table = table.replace_schema_metadata(
+            {b"dq_temporal_state": json.dumps(self.signature).encode()}
+        )
+        tmp = path.with_suffix(".tmp.parquet")
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path, expect: dict[str, Any] | None = None) -> TemporalState | None:
+        """Stored state, or None when missing or written for another axis, bucket or features."""
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        if not path.exists():
+            return None
+        table = pq.read_table(path)
+        sig = json.loads((table.schema.metadata or {}).get(b"dq_temporal_state", b"{}"))
+        if expect is not None and sig != expect:
+            return None
+        st = cls(sig["features"], sig["axis"], sig["column"], sig["bucket"])
+        df = table.to_pandas()
+        pos = {f: k for k, f in enumerate(st.features)}
+        p = len(st.features)
+        for o, g in df.groupby("bucket_order", sort=True):
+            m = np.full((6, p, p), np.nan)
+            i = g["feature_i"].map(pos).to_numpy()
+            j = g["feature_j"].map(pos).to_numpy()
+            for t, k in enumerate(_MOMENTS):
+                m[t, i, j] = g[k].to_numpy()
+            # mirror the upper triangle: (j, i) swaps the roles of mean / m2
+            m[0, j, i] = m[0, i, j]
+            m[1, j, i], m[2, j, i] = m[2, i, j], m[1, i, j]
+            m[3, j, i], m[4, j, i] = m[4, i, j], m[3, i, j]
+            m[5, j, i] = m[5, i, j]
+            st.buckets[int(o)] = m
+            st.labels[int(o)] = str(g["bucket"].iloc[0])
+        return st
+
+
+# ---------------------------------------------------------------------------
+# Profiler
+# ---------------------------------------------------------------------------
+def temporal_features(df: pd.DataFrame, cfg: TemporalCfg) -> list[str]:
+    _, axis_col = bucket_axis(df, cfg)
+    skip = set(cfg.exclude) | {axis_col}
+    return [
+        c
+        for c in df.columns
+        if c not in skip
+        and is_numeric_dtype(df[c].dtype)
+        and not pd.api.types.is_bool_dtype(df[c].dtype)
+    ]
+
+
+class TemporalProfiler:
+    """Bucketed moment state + the 2.3.7.x diagnostics computed from it."""
+
+    def __init__(self, cfg: TemporalCfg, features: Sequence[str], axis: str, column: str):
+        self.cfg = cfg
+        self.state = TemporalState(
+            features, axis, column, cfg.time_bucket if axis == "time" else f"{cfg.pseudo_width:g}"
+        )
+        self.updated: list[int] = []
+
+    @classmethod
+    def for_frame(
+        cls,
+        df: pd.DataFrame,
+        cfg: TemporalCfg,
+        features: Sequence[str] | None = None,
+        *,
+        load: bool = True,
+    ) -> TemporalProfiler:
+        axis, column = bucket_axis(df, cfg)
+        if axis is None:
+            bucket_codes(df, cfg)  # raises the descriptive error
+        prof = cls(cfg, features or temporal_features(df, cfg), axis, column)
+        if load and cfg.state_path:
+            stored = TemporalState.load(cfg.state_path, expect=prof.state.signature)
+            if stored is not None:
+                prof.state = stored
+        return prof
+
+    @traced("engine.temporal.update")
+    def update(self, df: pd.DataFrame, mode: str = "refresh") -> list[int]:
+        """
+        refresh: `df` is the full history → recompute new buckets + the last
+                 STATE_REFRESH_BUCKETS only.
+        append:  `df` holds only new rows  → merge their moments into the stored buckets.
+        """
+        order, valid = bucket_codes(df, self.cfg)
+        present = np.unique(order[valid])
+        known = self.state.orders
+        if mode == "refresh":
+            tail = set(known[-self.cfg.refresh_buckets :]) if self.cfg.refresh_buckets else set()
+            todo = np.array(
+                [o for o in present if o not in self.state.buckets or o in tail], dtype="int64"
+            )
+        elif mode == "append":
+            todo = present
+        else:
+            raise ValueError(f"Unknown temporal update mode: {mode!r} (refresh | append)")
+
+        rows = valid & np.isin(order, todo)
+        if not rows.any():
+            self.updated = []
+            return []
+        X = df.loc[rows, self.state.features].to_numpy(dtype="float64", na_value=np.nan)
+        codes = order[rows]
+        srt = np.argsort(codes, kind="stable")
+        X, codes = X[srt], codes[srt]
+        cut = np.flatnonzero(np.diff(codes)) + 1
+        names = bucket_labels(todo, self.state.axis, self.state.column, self.cfg)
+        labels = dict(zip(todo.tolist(), names, strict=True))
+        for block, o in zip(np.split(X, cut), codes[np.r_[0, cut]], strict=True):
+            m = bucket_moments(block)
+            o = int(o)
+            if mode == "append" and o in self.state.buckets:
+                m = merge_moments(np.stack([self.state.buckets[o], m]))
+            self.state.buckets[o] = m
+            self.state.labels[o] = labels[o]
+        self.updated = [int(o) for o in todo]
+        return self.updated
+
+    def save(self) -> Path | None:
+        return self.state.save(self.cfg.state_path) if self.cfg.state_path else None
+
+    # -- diagnostics -----------------------------------------------------------
+    def bucket_means(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """(means, counts): buckets × features, in bucket order."""
+        orders = self.state.orders
+        d = np.arange(len(self.state.features))
+        means = np.array([self.state.buckets[o][1][d, d] for o in orders]).reshape(len(orders), -1)
+        counts = np.array([self.state.buckets[o][0][d, d] for o in orders]).reshape(len(orders), -1)
+        idx = pd.Index(orders, name="bucket_order")
+        return (
+            pd.DataFrame(means, index=idx, columns=self.state.features),
+            pd.DataFrame(counts, index=idx, columns=self.state.features),
+        )
+
+    def ts_outliers(self) -> pd.DataFrame:
+        """Rolling z of each bucket mean vs trailing Z_WINDOW bucket means (TS_OUTLIER_COLUMNS)."""
+        means, counts = self.bucket_means()
+        if means.empty:
+            return pd.DataFrame(columns=TS_OUTLIER_COLUMNS)
+        prior = means.shift(1)
+        roll = (
+            prior.rolling(self.cfg.z_window, min_periods=self.cfg.min_history)
+            if self.cfg.z_window
+            else prior.expanding(min_periods=self.cfg.min_history)
+        )
+        mu, sd = roll.mean(), roll.std(ddof=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = (means - mu) / sd.where(sd > 0)
+        long = pd.DataFrame(
+            {
+                "feature": np.tile(means.columns.to_numpy(dtype=object), len(means)),
+                "bucket_order": np.repeat(means.index.to_numpy(), means.shape[1]),
+                "n": counts.to_numpy().ravel().astype("int64"),
+                "metric_mean": means.to_numpy().ravel(),
+                "baseline_mean": mu.to_numpy().ravel(),
+                "baseline_std": sd.to_numpy().ravel(),
+                "z_score": z.to_numpy().ravel(),
+            }
+        )
+        long = long[long["z_score"].notna()].copy()
+        long["time_bucket"] = long["bucket_order"].map(self.state.labels)
+        long["is_outlier"] = long["z_score"].abs() > self.cfg.z_threshold
+        return (
+            long[TS_OUTLIER_COLUMNS].sort_values(["feature", "bucket_order"]).reset_index(drop=True)
+        )
+
+    def corr_deltas(self) -> pd.DataFrame:
+        """Correlation of each CORR_WINDOW-bucket window vs the previous (CORR_DELTA_COLUMNS)."""
+        orders, W = self.state.orders, self.cfg.corr_window
+        p = len(self.state.features)
+        if len(orders) < 2 * W or p < 2:
+            return pd.DataFrame(columns=CORR_DELTA_COLUMNS)
+        stack = np.stack([self.state.buckets[o] for o in orders])
+        iu, ju = np.triu_indices(p, k=1)
+        fi = np.asarray(self.state.features, dtype=object)
+        frames = []
+        for t in range(2 * W - 1, len(orders)):
+            prev = merge_moments(stack[t - 2 * W + 1 : t - W + 1])
+            curr = merge_moments(stack[t - W + 1 : t + 1])
+            cp, cc = _corr(prev)[iu, ju], _corr(curr)[iu, ju]
+            n_prev, n_curr = prev[0][iu, ju], curr[0][iu, ju]
+            keep = (
+                (n_prev >= self.cfg.corr_min_n)
+                & (n_curr >= self.cfg.corr_min_n)
+                & np.isfinite(cp)
+                & np.isfinite(cc)
+            )
+            if not keep.any():
+                continue
+            lab = self.state.labels
+            window = (
+                f"{lab[orders[t - 2 * W + 1]]}..{lab[orders[t - W]]} → "
+                f"{lab[orders[t - W + 1]]}..{lab[orders[t]]}"
+            )
+            delta = (cc - cp)[keep]
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "feature_i": fi[iu][keep],
+                        "feature_j": fi[ju][keep],
+                        "time_window": window,
+                        "corr_prev": cp[keep],
+                        "corr_curr": cc[keep],
+                        "delta": delta,
+                        "abs_delta": np.abs(delta),
+                        "n_prev": n_prev[keep].astype("int64"),
+                        "n_curr": n_curr[keep].astype("int64"),
+                        "is_alert": np.abs(delta) >= self.cfg.corr_delta_threshold,
+                    }
+                )
+            )
+        if not frames:
+            return pd.DataFrame(columns=CORR_DELTA_COLUMNS)
+        return pd.concat(frames, ignore_index=True)[CORR_DELTA_COLUMNS]
+
+
+# ---------------------------------------------------------------------------
+# Intervals
+# ---------------------------------------------------------------------------
+def _as_ns(s: pd.Series, unit_ns: int) -> tuple[np.ndarray, np.ndarray]:
+    """int64 nanoseconds + validity; numeric columns are taken to be in the interval's unit."""
+    if is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        v = s.to_numpy(dtype="float64", na_value=np.nan)
+        ok = np.isfinite(v)
+        return np.where(ok, np.round(np.where(ok, v, 0.0) * unit_ns), 0).astype("int64"), ok
+    t = s if is_datetime64_any_dtype(s.dtype) else pd.to_datetime(s, errors="coerce")
+    if getattr(t.dt, "tz", None) is not None:
+        t = t.dt.tz_convert("UTC").dt.tz_localize(None)
+    ok = t.notna().to_numpy()
+    return t.to_numpy(dtype="datetime64[ns]").view("int64"), ok
+
+
+@traced("engine.temporal.validate_intervals")
+def validate_intervals(
+    df: pd.DataFrame,
+    intervals: Mapping[str, Mapping[str, Any]],
+    *,
+    max_violation_rows: int = 1_000,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """All INTERVALS in one pass → (INTERVAL_CHECK_COLUMNS summary, INTERVAL_VIOLATION_COLUMNS)."""
+    names, specs, starts, ends, valid, rows = [], [], [], [], [], []
+    for name, spec in (intervals or {}).items():
+        unit = str(spec.get("unit", "days")).lower()
+        base = {
+            "interval": name,
+            "start_col": spec.get("start_col"),
+            "end_col": spec.get("end_col"),
+            "unit": unit,
+            "min_duration": spec.get("min_duration"),
+            "max_duration": spec.get("max_duration"),
+            "n_rows": len(df),
+        }
+        missing = [c for c in (spec.get("start_col"), spec.get("end_col")) if c not in df.columns]
+        if unit not in _UNIT_NS or missing:
+            why = (
+                "unknown unit"
+                if unit not in _UNIT_NS
+                else "missing " + ", ".join(map(str, missing))
+            )
+            rows.append({**base, "status": f"SKIP ({why})"})
+            continue
+        s_ns, s_ok = _as_ns(df[spec["start_col"]], _UNIT_NS[unit])
+        e_ns, e_ok = _as_ns(df[spec["end_col"]], _UNIT_NS[unit])
+        names.append(name)
+        specs.append((base, unit))
+        starts.append(s_ns)
+        ends.append(e_ns)
+        valid.append(s_ok & e_ok)
+
+    viol_frames: list[pd.DataFrame] = []
+    if names:
+        S, E, V = np.column_stack(starts), np.column_stack(ends), np.column_stack(valid)
+        unit_ns = np.array([_UNIT_NS[u] for _, u in specs], dtype="float64")
+        lo = np.array(
+            [np.nan if b["min_duration"] is None else float(b["min_duration"]) for b, _ in specs]
+        )
+        hi = np.array(
+            [np.nan if b["max_duration"] is None else float(b["max_duration"]) for b, _ in specs]
+        )
+        D = np.where(V, (E - S) / unit_ns, np.nan)  # n × k durations, one subtraction
+        with np.errstate(invalid="ignore"):
+            neg = D < 0
+            below = ~neg & (D < lo)
+            above = D > hi
+        bad = neg | below | above
+        n_checked = V.sum(axis=0)
+        with np.errstate(invalid="ignore"):
+            qs = (
+                np.nanquantile(np.where(V, D, np.nan), [0.0, 0.5, 1.0], axis=0)
+                if V.any()
+                else np.full((3, len(names)), np.nan)
+            )
+        for k, (base, _) in enumerate(specs):
+            nv = int(bad[:, k].sum())
+            rows.append(
+                {
+                    **base,
+                    "n_checked": int(n_checked[k]),
+                    "n_missing": int(len(df) - n_checked[k]),
+                    "n_negative": int(neg[:, k].sum()),
+                    "n_below_min": int(below[:, k].sum()),
+                    "n_above_max": int(above[:, k].sum()),
+                    "n_violations": nv,
+                    "pct_violations": round(100.0 * nv / n_checked[k], 4) if n_checked[k] else 0.0,
+                    "duration_min": qs[0, k],
+                    "duration_median": qs[1, k],
+                    "duration_max": qs[2, k],
+                    "status": (
+                        "SKIP (no complete rows)" if n_checked[k] == 0 else ("FAIL" if nv else "OK")
+                    ),
+                }
+            )
+        r, c = np.nonzero(bad)
+        if r.size:
+            cap = pd.Series(c).groupby(c).cumcount().to_numpy() < max_violation_rows
+            r, c = r[cap], c[cap]
+            reason = np.where(
+                neg[r, c], "negative", np.where(below[r, c], "below_min", "above_max")
+            )
+            viol_frames.append(
+                pd.DataFrame(
+                    {
+                        "row_index": df.index.to_numpy()[r],
+                        "interval": np.asarray(names, dtype=object)[c],
+                        "duration": D[r, c],
+                        "reason": reason,
+                    }
+                )
+            )
+    pos = {name: k for k, name in enumerate(intervals or {})}
+    rows.sort(key=lambda r: pos[r["interval"]])
+    summary = pd.DataFrame(rows, columns=INTERVAL_CHECK_COLUMNS)
+    violations = (
+        pd.concat(viol_frames, ignore_index=True)
+        if viol_frames
+        else pd.DataFrame(columns=INTERVAL_VIOLATION_COLUMNS)
+    )
+    return summary, violations
+
+
+# ---------------------------------------------------------------------------
+# Section entry point
+# ---------------------------------------------------------------------------
+@dataclass
+class TemporalResult:
+    ts_outliers: pd.DataFrame
+    corr_deltas: pd.DataFrame
+    interval_checks: pd.DataFrame
+    interval_violations: pd.DataFrame
+    updated_buckets: list[str]
+    n_buckets: int
+
+
+def profile_temporal(
+    df: pd.DataFrame,
+    config: dict[str, Any] | None = None,
+    *,
+    out_dir: Path | None = None,
+    features: Sequence[str] | None = None,
+    mode: str = "refresh",
+    cfg: TemporalCfg | None = None,
+) -> TemporalResult:
+    """
+    2.3.7 / 2.3.7.1 / 2.3.7.5: update the bucket state, then write time_series_outliers.csv,
+    correlation_anomalies.csv (alerts) + corr_deltas.csv, interval_checks.csv,
+    interval_violations.csv.
+    """
+    cfg = cfg or TemporalCfg.from_config(config)
+    checks, violations = validate_intervals(
+        df, cfg.intervals, max_violation_rows=cfg.max_violation_rows
+    )
+
+    axis, _ = bucket_axis(df, cfg)
+    if axis is None:
+        print(
+            f"⚠️ Temporal: no time column ({cfg.time_column!r}) or pseudo-time column "
+            f"({cfg.pseudo_column!r}) — bucket diagnostics skipped."
+        )
+        ts, corr, updated, n_buckets = (
+            pd.DataFrame(columns=TS_OUTLIER_COLUMNS),
+            pd.DataFrame(columns=CORR_DELTA_COLUMNS),
+            [],
+            0,
+        )
+    else:
+        prof = TemporalProfiler.for_frame(df, cfg, features)
+        prof.update(df, mode=mode)
+        prof.save()
+        ts, corr = prof.ts_outliers(), prof.corr_deltas()
+        updated = [prof.state.labels[o] for o in prof.updated]
+        n_buckets = len(prof.state.buckets)
+
+    result = TemporalResult(ts, corr, checks, violations, updated, n_buckets)
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_artifact(ts, out_dir / "time_series_outliers.csv")
+        write_artifact(
+            corr[corr["is_alert"].astype(bool)] if not corr.empty else corr,
+            out_dir / "correlation_anomalies.csv",
+        )
+        write_artifact(corr, out_dir / "corr_deltas.csv")
+        write_artifact(checks, out_dir / "interval_checks.csv")
+        write_artifact(violations, out_dir / "interval_violations.csv")
+
+    n_out = int(ts["is_outlier"].sum()) if not ts.empty else 0
+    n_alert = int(corr["is_alert"].sum()) if not corr.empty else 0
+    n_viol = int(checks["n_violations"].fillna(0).sum()) if not checks.empty else 0
+    print(
+        f"⏱️ Temporal: {n_buckets} bucket(s), {len(updated)} recomputed; "
+        f"{n_out} outlier bucket(s), {n_alert} correlation alert(s), {n_viol} interval violation(s)"
+    )
+    return result
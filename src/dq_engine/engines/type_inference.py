@@ -0,0 +1,548 @@
+# src/dq_engine/engines/type_inference.py
+"""
+Type auto-detection and coercion (2.2.1 / 2.2.2) in one vectorized pass.
+
+- Candidate types come from a stratified sample (TARGET.COLUMN + SAMPLING.STRATA,
+  see sampling.stratified_sample) of TYPE_DETECTION.SAMPLE_ROWS rows.
+  Arrow compute classifies them: the numeric regex, boolean tokens, one
+  `strptime` per DATETIME_FORMATS entry, and uniqueness for IDs. No
+  per-element `pd.to_datetime` dateutil fallback.
+- Each candidate is then checked on the full column with one masked Arrow
+  cast. Cells that fail the classifier become null before the cast, so a
+  single bad value never aborts the column, and the same mask gives the
+  failure counts and sample fail values.
+- Blank / whitespace-only strings (e.g. TotalCharges) are missing, not parse
+  failures. They count in `new_nulls` / `n_blank`, not in `n_invalid`.
+- `infer_types` returns the summary (TYPE_SUMMARY_COLUMNS), the coercion log
+  (COERCION_LOG_COLUMNS) and column_type_map. With APPLY_COERCION the
+  coerced columns are already in the returned frame.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+)
+
+from dq_engine.sampling import WEIGHT_COL, stratified_sample
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+TYPE_SUMMARY_COLUMNS = [
+    "column",
+    "pandas_dtype",
+    "type_group_base",
+    "type_group_inferred",
+    "semantic_type",
+    "non_null",
+    "nulls",
+    "null_pct",
+    "n_blank",
+    "n_unique",
+    "pct_numeric_like",
+    "numeric_like_flag",
+    "pct_boolean_like",
+    "boolean_like_flag",
+    "pct_datetime_like",
+    "datetime_like_flag",
+    "datetime_format",
+    "id_like_flag",
+    "sample_values",
+    "sample_rows",
+    "is_id",
+    "is_target",
+    "n_rows",
+]
+
+COERCION_LOG_COLUMNS = [
+    "column",
+    "target_kind",
+    "semantic_type",
+    "reason",
+    "attempted",
+    "ok",
+    "pre_dtype",
+    "post_dtype",
+    "pre_non_null",
+    "post_non_null",
+    "new_nulls",
+    "n_blank",
+    "n_invalid",
+    "success_ratio",
+    "applied",
+    "sample_fail_values",
+    "error",
+]
+
+_DEFAULT_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d-%m-%Y",
+    "%Y%m%d",
+)
+
+
+@dataclass(frozen=True)
+class TypeInferenceCfg:
+    numeric_regex: str = r"^[\+\-]?\d+(\.\d+)?$"
+    numeric_threshold: float = 0.95
+    boolean_true: tuple[str, ...] = ("true", "t", "yes", "y", "1")
+    boolean_false: tuple[str, ...] = ("false", "f", "no", "n", "0")
+    boolean_threshold: float = 0.95
+    datetime_threshold: float = 0.8
+    datetime_formats: tuple[str, ...] = _DEFAULT_DATETIME_FORMATS
+    id_unique_ratio: float = 0.99
+    sample_rows: int = 10_000
+    strata: tuple[str, ...] = ()
+    seed: int = 42
+    min_success_numeric: float = 0.90
+    min_success_datetime: float = 0.85
+    min_success_boolean: float = 0.95
+    target_numeric: str = "float64"
+    apply_coercion: bool = False
+    id_columns: tuple[str, ...] = ()
+    target_column: str | None = None
+    n_fail_samples: int = 10
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> TypeInferenceCfg:
+        """TYPE_DETECTION.* (2.2.1 / 2.2.2 keys), ID_COLUMNS, TARGET.COLUMN, SAMPLING.STRATA."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        target = get("TARGET.COLUMN", None)
+        strata = [target] if target else []
+        strata += [s for s in (get("SAMPLING.STRATA", []) or []) if s not in strata]
+        lower = lambda v: tuple(str(x).strip().lower() for x in v)  # noqa: E731
+        return cls(
+            numeric_regex=str(get("TYPE_DETECTION.NUMERIC_REGEX", cls.numeric_regex)),
+            numeric_threshold=float(get("TYPE_DETECTION.NUMERIC_THRESHOLD", 0.95)),
+            boolean_true=lower(get("TYPE_DETECTION.BOOLEAN_TRUE_VALUES", cls.boolean_true) or ()),
+            boolean_false=lower(
+                get("TYPE_DETECTION.BOOLEAN_FALSE_VALUES", cls.boolean_false) or ()
+            ),
+            boolean_threshold=float(get("TYPE_DETECTION.BOOLEAN_THRESHOLD", 0.95)),
+            datetime_threshold=float(get("TYPE_DETECTION.DATETIME_THRESHOLD", 0.8)),
+            datetime_formats=tuple(
+                get("TYPE_DETECTION.DATETIME_FORMATS", _DEFAULT_DATETIME_FORMATS) or ()
+            ),
+            id_unique_ratio=float(get("TYPE_DETECTION.ID_UNIQUE_RATIO", 0.99)),
+            sample_rows=int(get("TYPE_DETECTION.SAMPLE_ROWS", 10_000)),
+            strata=tuple(strata),
+            seed=int(get("SAMPLING.RANDOM_SEED", 42)),
+            min_success_numeric=float(get("TYPE_DETECTION.COERCION_MIN_SUCCESS_NUMERIC", 0.90)),
+            min_success_datetime=float(get("TYPE_DETECTION.COERCION_MIN_SUCCESS_DATETIME", 0.85)),
+            min_success_boolean=float(get("TYPE_DETECTION.COERCION_MIN_SUCCESS_BOOLEAN", 0.95)),
+            target_numeric=str(get("TYPE_DETECTION.COERCION_TARGET_NUMERIC", "float64")),
+            apply_coercion=bool(get("TYPE_DETECTION.APPLY_COERCION", False)),
+            id_columns=tuple(get("ID_COLUMNS", []) or ()),
+            target_column=target,
+            n_fail_samples=int(get("TYPE_DETECTION.N_FAIL_SAMPLES", 10)),
+        )
+
+
+@dataclass
+class TypeInferenceResult:
+    frame: pd.DataFrame  # input frame, coerced columns replaced when APPLY_COERCION
+    summary: pd.DataFrame  # TYPE_SUMMARY_COLUMNS
+    coercion_log: pd.DataFrame  # COERCION_LOG_COLUMNS
+    column_type_map: dict[str, dict[str, Any]]
+
+
+def _base_group(s: pd.Series) -> str:
+    if is_bool_dtype(s.dtype):
+        return "boolean"
+    if is_numeric_dtype(s.dtype):
+        return "numeric"
+    if is_datetime64_any_dtype(s.dtype):
+        return "datetime"
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return "categorical"
+    return "string_like"
+
+
+def _to_arrow_str(s: pd.Series) -> pa.Array:
+    """Trimmed Arrow utf8 view of a column; non-string objects are stringified."""
+    try:
+        arr = pa.array(s, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = pa.array(s.astype("string"), type=pa.string(), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    return pc.utf8_trim_whitespace(arr)
+
+
+def _n_unique_str(arr: pa.Array) -> int:
+    return len(pc.unique(arr.drop_null()))
+
+
+def _fill(mask: pa.Array) -> np.ndarray:
+    return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+
+
+class _Classifier:
+    """Vectorized per-cell classifiers on a trimmed utf8 array; masks are False on null / blank."""
+
+    def __init__(self, cfg: TypeInferenceCfg):
+        self.cfg = cfg
+        self.bool_true = pa.array(list(cfg.boolean_true), pa.string())
+        self.bool_tokens = pa.array(list(cfg.boolean_true) + list(cfg.boolean_false), pa.string())
+
+    @staticmethod
+    def present(arr: pa.Array) -> np.ndarray:
+        return _fill(pc.and_(pc.is_valid(arr), pc.not_equal(arr, "")))
+
+    def numeric(self, arr: pa.Array) -> np.ndarray:
+        try:
+            return _fill(pc.match_substring_regex(arr, self.cfg.numeric_regex))
+        except pa.ArrowInvalid:  # pattern RE2 can't compile → Python regex
+            return (
+                pd.Series(arr.to_pandas(), dtype="string")
+                .str.match(self.cfg.numeric_regex)
+                .fillna(False)
+                .to_numpy(bool)
+            )
+
+    def boolean(self, arr: pa.Array) -> np.ndarray:
+        return _fill(pc.is_in(pc.utf8_lower(arr), value_set=self.bool_tokens))
+
+    def datetime(self, arr: pa.Array, fmt: str) -> tuple[np.ndarray, pa.Array]:
+        parsed = pc.strptime(arr, format=fmt, unit="s", error_is_null=True)
+        return _fill(pc.is_valid(parsed)), parsed
+
+    def best_datetime(self, arr: pa.Array, present: np.ndarray) -> tuple[float, str | None]:
+        n = int(present.sum())
+        if n == 0:
+            return 0.0, None
+        best, best_fmt = 0.0, None
+        for fmt in self.cfg.datetime_formats:
+            ok, _ = self.datetime(arr, fmt)
+            share = float((ok & present).sum()) / n
+            if share > best:
+                best, best_fmt = share, fmt
+            if best == 1.0:
+                break
+        return best, best_fmt
+
+
+def _stratified(df: pd.DataFrame, cfg: TypeInferenceCfg) -> pd.DataFrame:
+    if len(df) <= cfg.sample_rows:
+        return df
+    return stratified_sample(df, cfg.strata, cfg.sample_rows, seed=cfg.seed).frame.drop(
+        columns=[WEIGHT_COL]
+    )
+
+
+def _log_row(col: str, **kw: Any) -> dict[str, Any]:
+    row = dict.fromkeys(COERCION_LOG_COLUMNS)
+    row.update(
+        column=col,
+        attempted=False,
+        ok=True,
+        applied=False,
+        new_nulls=0,
+        n_blank=0,
+        n_invalid=0,
+        success_ratio=1.0,
+    )
+    row.update(kw)
+    return row
+
+
+@traced("engine.type_inference.infer_types")
+def infer_types(df: pd.DataFrame, cfg: TypeInferenceCfg | None = None) -> TypeInferenceResult:
+    """2.2.1 inference on a stratified sample + 2.2.2 full-column verification / coercion."""
+    cfg = cfg or TypeInferenceCfg()
+    clf = _Classifier(cfg)
+    sample = _stratified(df, cfg)
+    n_rows = len(df)
+    out = df.copy(deep=False) if cfg.apply_coercion else df
+    id_cols, summary_rows, log_rows = set(cfg.id_columns), [], []
+
+    for col in df.columns:
+        s = df[col]
+        base = _base_group(s)
+        pre_non_null = int(s.notna().sum())
+        row: dict[str, Any] = {
+            "column": col,
+            "pandas_dtype": str(s.dtype),
+            "type_group_base": base,
+            "non_null": pre_non_null,
+            "nulls": n_rows - pre_non_null,
+            "null_pct": round(100.0 * (n_rows - pre_non_null) / n_rows, 3) if n_rows else 0.0,
+            "n_blank": 0,
+            "pct_numeric_like": 0.0,
+            "numeric_like_flag": False,
+            "pct_boolean_like": 0.0,
+            "boolean_like_flag": False,
+            "pct_datetime_like": 0.0,
+            "datetime_like_flag": False,
+            "datetime_format": None,
+            "id_like_flag": False,
+            "sample_values": json.dumps(sample[col].dropna().astype("string").head(5).tolist()),
+            "sample_rows": len(sample),
+            "is_id": col in id_cols,
+            "is_target": col == cfg.target_column,
+            "n_rows": n_rows,
+        }
+        inferred, semantic = base, base
+        full: pa.Array | None = None
+
+        if base == "string_like":
+            arr = _to_arrow_str(sample[col])
+            present = clf.present(arr)
+            n_present = int(present.sum())
+            if n_present:
+                row["pct_numeric_like"] = round(
+                    float((clf.numeric(arr) & present).sum()) / n_present, 4
+                )
+                row["pct_boolean_like"] = round(
+                    float((clf.boolean(arr) & present).sum()) / n_present, 4
+                )
+                row["numeric_like_flag"] = row["pct_numeric_like"] >= cfg.numeric_threshold
+                row["boolean_like_flag"] = row["pct_boolean_like"] >= cfg.boolean_threshold
+                if not (row["numeric_like_flag"] or row["boolean_like_flag"]):
+                    share, fmt = clf.best_datetime(arr, present)
+                    row["pct_datetime_like"], row["datetime_format"] = round(share, 4), fmt
+                    row["datetime_like_flag"] = share >= cfg.datetime_threshold
+
+            full = _to_arrow_str(s)
+            row["n_blank"] = int(_fill(pc.equal(full, "")).sum())
+            # precedence (2.2.1): boolean → numeric → datetime → identifier → categorical
+            if row["boolean_like_flag"]:
+                inferred, semantic = "boolean", "boolean_like_string"
+            elif row["numeric_like_flag"]:
+                inferred, semantic = "numeric", "numeric_like_string"
+            elif row["datetime_like_flag"]:
+                inferred, semantic = "datetime", "datetime_like_string"
+            else:
+                row["n_unique"] = _n_unique_str(full)
+                row["id_like_flag"] = bool(
+                    pre_non_null > 1 and row["n_unique"] / pre_non_null >= cfg.id_unique_ratio
+                )
+                inferred = "categorical"
+                semantic = "identifier" if row["id_like_flag"] or col in id_cols else "categorical"
+        else:
+            row["n_unique"] = int(s.nunique(dropna=True))
+        row["type_group_inferred"], row["semantic_type"] = inferred, semantic
+        summary_rows.append(row)
+
+        # -- 2.2.2: verify on the full column, one masked cast -------------------
+        kind = {
+            "numeric_like_string": "numeric",
+            "datetime_like_string": "datetime",
+            "boolean_like_string": "boolean",
+        }.get(semantic)
+        if kind is not None and (col in id_cols or col == cfg.target_column):
+            row["n_unique"] = _n_unique_str(full)
+        if col in id_cols or col == cfg.target_column:
+            log_rows.append(
+                _log_row(
+                    col,
+                    semantic_type=semantic,
+                    reason="id_or_target",
+                    pre_dtype=str(s.dtype),
+                    post_dtype=str(s.dtype),
+                    pre_non_null=pre_non_null,
+                    post_non_null=pre_non_null,
+                )
+            )
+            continue
+        if kind is None:
+            continue
+        log_rows.append(_coerce(out, col, s, full, kind, semantic, row, clf, cfg))
+
+    summary = (
+        pd.DataFrame(summary_rows, columns=TYPE_SUMMARY_COLUMNS)
+        .sort_values(["type_group_inferred", "column"])
+        .reset_index(drop=True)
+    )
+    log = pd.DataFrame(log_rows, columns=COERCION_LOG_COLUMNS)
+    return TypeInferenceResult(out, summary, log, column_type_map(summary))
+
+
+def _coerce(
+    out: pd.DataFrame,
+    col: str,
+    s: pd.Series,
+    full: pa.Array,
+    kind: str,
+    semantic: str,
+    row: dict[str, Any],
+    clf: _Classifier,
+    cfg: TypeInferenceCfg,
+) -> dict[str, Any]:
+    pre_non_null = int(s.notna().sum())
+    present = clf.present(full)
+    n_present = int(present.sum())
+    if n_present == 0:
+        row["n_unique"] = 0
+        return _log_row(
+            col,
+            target_kind=kind,
+            semantic_type=semantic,
+            reason="all_null_or_empty",
+            pre_dtype=str(s.dtype),
+            post_dtype=str(s.dtype),
+            pre_non_null=pre_non_null,
+            post_non_null=pre_non_null,
+        )
+    try:
+        if kind == "numeric":
+            try:  # common case: every non-blank cell parses → no regex pass
+                cast = pc.cast(
+                    pc.if_else(pa.array(present), full, pa.scalar(None, pa.string())), pa.float64()
+                )
+                good = present
+            except pa.ArrowInvalid:
+                good = clf.numeric(full) & present
+                cast = pc.cast(
+                    pc.if_else(pa.array(good), full, pa.scalar(None, pa.string())), pa.float64()
+                )
+            floor = cfg.min_success_numeric
+        elif kind == "datetime":
+            good, cast = clf.datetime(full, row["datetime_format"])
+            good &= present
+            floor = cfg.min_success_datetime
+        else:
+            good = clf.boolean(full) & present
+            cast = pc.if_else(
+                pa.array(good),
+                pc.is_in(pc.utf8_lower(full), value_set=clf.bool_true),
+                pa.scalar(None, pa.bool_()),
+            )
+            floor = cfg.min_success_boolean
+        n_good = int(good.sum())
+        invalid = present & ~good
+        parsed = cast.to_numpy(zero_copy_only=False)[good]
+        row["n_unique"] = len(np.unique(parsed.view("int64") if kind == "datetime" else parsed))
+        ratio = n_good / n_present
+        ok = ratio >= floor
+        fails = []
+        if invalid.any():
+            bad = pd.Series(full.filter(pa.array(invalid)).to_pandas())
+            fails = pd.unique(bad)[: cfg.n_fail_samples].tolist()
+
+        applied, post_dtype, err = False, str(s.dtype), None
+        if cfg.apply_coercion and ok:
+            try:
+                new = cast.to_pandas()
+                if kind == "numeric":
+                    new = new.astype(cfg.target_numeric)
+                elif kind == "boolean":
+                    new = new.astype("boolean")
+                new.index = s.index
+                out[col] = new
+                applied, post_dtype = True, str(new.dtype)
+            except (TypeError, ValueError) as e:
+                ok, err = False, f"astype_failed: {e}"
+        return _log_row(
+            col,
+            target_kind=kind,
+            semantic_type=semantic,
+            reason=semantic,
+            attempted=True,
+            ok=ok,
+            pre_dtype=str(s.dtype),
+            post_dtype=post_dtype,
+            pre_non_null=pre_non_null,
+            post_non_null=n_good if applied else pre_non_null,
+            new_nulls=pre_non_null - n_good,
+            n_blank=pre_non_null - n_present,
+            n_invalid=int(invalid.sum()),
+            success_ratio=round(ratio, 4),
+            applied=applied,
+            sample_fail_values=json.dumps(fails, default=str),
+            error=err,
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, ValueError) as e:
+        row["n_unique"] = _n_unique_str(full)
+        return _log_row(
+            col,
+            target_kind=kind,
+            semantic_type=semantic,
+            reason="coercion_exception",
+            attempted=True,
+            ok=False,
+            pre_dtype=str(s.dtype),
+            post_dtype=str(s.dtype),
+            pre_non_null=pre_non_null,
+            post_non_null=pre_non_null,
+            new_nulls=None,
+            success_ratio=None,
+            error=str(e),
+        )
+
+
+def column_type_map(summary: pd.DataFrame) -> dict[str, dict[str, Any]]:
+    """column_type_map.json layout (2.2.1)."""
+    return {
+        r["column"]: {
+            "raw_dtype": r["pandas_dtype"],
+            "type_group": r["type_group_inferred"],
+            "semantic_type": r["semantic_type"],
+            "datetime_format": r["datetime_format"],
+            "is_id": bool(r["is_id"]),
+            "is_target": bool(r["is_target"]),
+            "hints": {
+                "n_unique": int(r["n_unique"]),
+                "null_pct": float(r["null_pct"]),
+                "n_blank": int(r["n_blank"]),
+                "pct_numeric_like": float(r["pct_numeric_like"]),
+                "pct_boolean_like": float(r["pct_boolean_like"]),
+                "pct_datetime_like": float(r["pct_datetime_like"]),
+            },
+        }
+        for r in summary.to_dict(orient="records")
+    }
+
+
+def write_type_artifacts(result: TypeInferenceResult, out_dir: Path) -> dict[str, Path]:
+    """type_detection_summary.csv, coercion_log.csv, column_type_map.json (atomic writes)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "summary": out_dir / "type_detection_summary.csv",
+        "coercion_log": out_dir / "coercion_log.csv",
+        "type_map": out_dir / "column_type_map.json",
+    }
+    for key, frame in (("summary", result.summary), ("coercion_log", result.coercion_log)):
+        tmp = paths[key].with_suffix(".tmp.csv")
+        frame.to_csv(tmp, index=False)
+        os.replace(tmp, paths[key])
+    tmp = paths["type_map"].with_suffix(".tmp.json")
+    tmp.write_text(json.dumps(result.column_type_map, indent=2), encoding="utf-8")
+    os.replace(tmp, paths["type_map"])
+    return paths
+
+
+def detect_and_coerce(
+    df: pd.DataFrame, out_dir: Path, config: dict[str, Any] | None = None
+) -> TypeInferenceResult:
+    """Section entry point (2.2.1 + 2.2.2): infer, verify, write the three artifacts, print."""
+    result = infer_types(df, TypeInferenceCfg.from_config(config))
+    paths = write_type_artifacts(result, out_dir)
+    counts = result.summary["type_group_inferred"].value_counts().to_dict()
+    log = result.coercion_log
+    n_attempted = int(log["attempted"].sum()) if not log.empty else 0
+    n_ok = int((log["attempted"] & log["ok"]).sum()) if not log.empty else 0
+    print(
+        f"🧬 Type detection: {len(result.summary)} column(s) "
+        f"({', '.join(f'{k}={v}' for k, v in sorted(counts.items()))}); "
+        f"coercion {n_ok}/{n_attempted} ok → {paths['summary'].parent}"
+    )
+    return result
@@ -0,0 +1,595 @@
+# src/dq_engine/engines/violations.py
+"""
+Rule-violation co-occurrence network for 2.5.10.
+
+Violations live in one rows x rules sparse 0/1 matrix `V` (plus a rules x
+columns incidence `R` for the columns each rule involves). Everything the
+network needs is a sparse product over those two matrices:
+
+- rule–rule co-occurrence: `Vᵀ·V` (diagonal = rows violating each rule);
+- column–column co-occurrence: `Bᵀ·B` with `B = (V·R) > 0` (a row "touches"
+  a column when any rule it violates involves that column);
+- the report-level 2.5.10 graph (logic_violation_edges.csv): `Rᵀ·diag(w)·R`
+  over the 2.5.x report rows, replacing the iterrows/combinations loop.
+
+Edge weights, Jaccard (`n_co / (n_a + n_b - n_co)`) and lift
+(`n_co * N / (n_a * n_b)`) are computed on the upper-triangle COO arrays, so
+cost scales with the number of violations and surviving edges, not rules².
+Edge lists are written as zstd Parquet for the dashboard.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.artifacts import artifact_exists, read_artifact, write_artifact
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+try:
+    from scipy import sparse as _sparse
+
+    _HAS_SCIPY = True
+except Exception:
+    _sparse = None
+    _HAS_SCIPY = False
+
+RULE_EDGE_COLUMNS = [
+    "source_rule",
+    "target_rule",
+    "n_co",
+    "n_source",
+    "n_target",
+    "jaccard",
+    "lift",
+    "max_severity",
+]
+COLUMN_EDGE_COLUMNS = [
+    "source_column",
+    "target_column",
+    "n_co",
+    "n_source",
+    "n_target",
+    "jaccard",
+    "lift",
+    "n_rules",
+]
+# 2.5.10 notebook schema (logic_violation_edges.csv)
+LOGIC_EDGE_COLUMNS = [
+    "source_column",
+    "target_column",
+    "edge_weight",
+    "n_rules",
+    "max_severity",
+    "rules_contributing",
+]
+VIOLATION_ROW_COLUMNS = ["source", "rule_id", "columns_involved", "severity", "weight"]
+
+BLOCK_NNZ = 20_000_000  # max (rows x columns) fill materialized per column_edges block
+_SEV_RANK = {"info": 0, "ok": 0, "warn": 1, "fail": 2}
+_SEV_NAME = np.array(["info", "warn", "fail"], dtype=object)
+
+# 2.5.10 inputs: source name -> (report file, fields naming the columns involved)
+_REPORT_SOURCES = {
+    "mutual_exclusion": ("mutual_exclusion_report.csv", ("col_a", "col_b")),
+    "dependency_violations": ("dependency_violations.csv", ("left_col", "right_col")),
+    "catnum_alignment": ("catnum_alignment_report.csv", ("group_col", "numeric_col")),
+    "onehot_integrity": ("onehot_integrity_report.csv", ()),
+    "total_consistency": ("category_total_consistency.csv", ("total_col", "component_cols")),
+}
+_SEVERITY_CANDIDATES = ("severity", "group_severity", "rule_severity", "status")
+_WEIGHT_CANDIDATES = (
+    "n_violations",
+    "n_multi",
+    "n_over_tolerance",
+    "n_groups_with_violations",
+    "n_rules_failing_reconciliation",
+)
+
+
+def _require_scipy() -> None:
+    if not _HAS_SCIPY:
+        raise RuntimeError(
+            "❌ SciPy is required for the violation network (pip install 'dq-engine[stats]')."
+        )
+
+
+@dataclass(frozen=True)
+class NetworkCfg:
+    enabled: bool = True
+    include_severities: tuple[str, ...] = ("warn", "fail")
+    min_edge_weight: float = 1.0  # report-level graph (logic_violation_edges)
+    min_co_count: int = 1  # row-level rule/column edges
+    max_edges: int | None = None  # keep the strongest N edges per edge list
+    default_severity: str = "warn"
+    rule_features: Mapping[str, tuple[str, ...]] = field(
+        default_factory=dict
+    )  # LOGIC.NETWORK.RULES
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> NetworkCfg:
+        """LOGIC.NETWORK.*"""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        sev = get("LOGIC.NETWORK.INCLUDE_SEVERITIES", None)
+        max_edges = get("LOGIC.NETWORK.MAX_EDGES", None)
+        rules = get("LOGIC.NETWORK.RULES", {}) or {}
+        return cls(
+            enabled=bool(get("LOGIC.NETWORK.ENABLED", True)),
+            include_severities=(
+                tuple(str(s).lower() for s in sev)
+                if isinstance(sev, (list, tuple))
+                else ("warn", "fail")
+            ),
+            min_edge_weight=float(get("LOGIC.NETWORK.MIN_EDGE_WEIGHT", 1.0)),
+            min_co_count=max(1, int(get("LOGIC.NETWORK.MIN_CO_COUNT", 1))),
+            max_edges=int(max_edges) if max_edges else None,
+            default_severity=str(get("LOGIC.NETWORK.DEFAULT_SEVERITY", "warn")).lower(),
+            rule_features={
+                str(r.get("rule_id", k)): tuple(r.get("feature_names", []) or [])
+                for k, r in rules.items()
+                if isinstance(r, Mapping)
+            },
+        )
+
+
+# ---------------------------------------------------------------------------
+# Sparse helpers
+# ---------------------------------------------------------------------------
+def _binary(rows: np.ndarray, cols: np.ndarray, shape: tuple[int, int]):
+    """Deduplicated 0/1 CSR matrix from (row, col) index pairs."""
+    M = _sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=shape)
+    M.sum_duplicates()
+    M.data[:] = 1
+    return M
+
+
+def _split_cols(s: pd.Series) -> pd.Series:
+    """Comma-joined column strings (or lists) -> exploded, stripped, non-empty names, index kept."""
+    s = s.dropna()
+    if s.empty:
+        return pd.Series(dtype=object)
+    lists = s.map(
+        lambda v: list(v) if isinstance(v, (list, tuple, np.ndarray)) else str(v).split(",")
+    )
+    out = lists.explode().dropna().astype(str).str.strip()
+    return out[out.ne("") & out.ne("nan")]
+
+
+def cooccurrence_edges(
+    co,
+    labels: Sequence[Any],
+    n_total: int,
+    min_count: int = 1,
+    max_edges: int | None = None,
+) -> pd.DataFrame:
+    """
+    Upper-triangle edge list of a symmetric co-occurrence matrix (diagonal =
+    marginal counts): source, target, n_co, n_source, n_target, jaccard, lift.
+    """
+    co = _sparse.csr_matrix(co)
+    diag = np.asarray(co.diagonal(), dtype="float64")
+    up = _sparse.triu(co, k=1).tocoo()
+    keep = up.data >= min_count
+    i, j, c = up.row[keep], up.col[keep], up.data[keep].astype("float64")
+    if max_edges is not None and c.size > max_edges:
+        top = np.argpartition(-c, max_edges - 1)[:max_edges]
+        i, j, c = i[top], j[top], c[top]
+    ni, nj = diag[i], diag[j]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        jaccard = c / (ni + nj - c)
+        lift = c * float(n_total) / (ni * nj)
+    labels = np.asarray(labels, dtype=object)
+    out = pd.DataFrame(
+        {
+            "source": labels[i],
+            "target": labels[j],
+            "n_co": c.astype("int64"),
+            "n_source": ni.astype("int64"),
+            "n_target": nj.astype("int64"),
+            "jaccard": jaccard,
+            "lift": lift,
+            "_i": i,
+            "_j": j,
+        }
+    )
+    return out.sort_values(["n_co", "jaccard"], ascending=False, kind="stable").reset_index(
+        drop=True
+    )
+
+
+# ---------------------------------------------------------------------------
+# Row-level violation matrix
+# ---------------------------------------------------------------------------
+class ViolationMatrix:
+    """
+    Sparse rows x rules violation matrix with the columns each rule involves.
+
+    `n_total` is the population used for lift (all rows checked, not just
+    violating ones); it defaults to the number of distinct violating rows.
+    """
+
+    def __init__(
+        self,
+        V,
+        rule_ids: Sequence[str],
+        R,
+        columns: Sequence[str],
+        severities: Sequence[str],
+        row_keys: np.ndarray | None = None,
+        n_total: int | None = None,
+    ):
+        _require_scipy()
+        self.V = _sparse.csr_matrix(V)
+        self.rule_ids: list[str] = list(map(str, rule_ids))
+        self.R = _sparse.csr_matrix(R)
+        self.columns: list[str] = list(map(str, columns))
+        self.severities = np.asarray([str(s).lower() for s in severities], dtype=object)
+        self.row_keys = row_keys
+        self.n_total = (
+            int(n_total) if n_total is not None else int(np.count_nonzero(self.V.getnnz(axis=1)))
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.V.shape
+
+    @classmethod
+    @traced("engine.violations.from_records")
+    def from_records(
+        cls,
+        records: pd.DataFrame,
+        *,
+        row_col: str = "row_key",
+        rule_col: str = "rule_id",
+        feature_cols: Sequence[str] = ("columns_involved",),
+        severity_col: str | None = "severity",
+        rule_features: Mapping[str, Sequence[str]] | None = None,
+        default_severity: str = "warn",
+        n_total: int | None = None,
+    ) -> ViolationMatrix:
+        """
+        Long violation records (one row per violating row x rule) -> matrix.
+
+        Columns per rule come from `feature_cols` (comma-joined strings or lists,
+        e.g. left_col/right_col) plus `rule_features` (LOGIC.NETWORK.RULES).
+        """
+        _require_scipy()
+        row_codes, row_keys = pd.factorize(records[row_col], sort=False)
+        rule_codes, rule_ids = pd.factorize(records[rule_col].astype(str), sort=True)
+        ok = (row_codes >= 0) & (rule_codes >= 0)
+        V = _binary(row_codes[ok], rule_codes[ok], (len(row_keys), len(rule_ids)))
+
+        parts = []
+        for c in feature_cols:
+            if c in records.columns:
+                # split each distinct (rule, value) once, not once per violating row
+                u = (
+                    records[[rule_col, c]]
+                    .dropna()
+                    .astype(str)
+                    .drop_duplicates()
+                    .reset_index(drop=True)
+                )
+                parts.append(_split_cols(u[c]).rename("column").to_frame().join(u[[rule_col]]))
+        if rule_features:
+            extra = pd.Series({k: list(v) for k, v in rule_features.items()}, dtype=object)
+            extra = _split_cols(extra)
+            parts.append(
+                pd.DataFrame({"column": extra.to_numpy(), rule_col: extra.index.astype(str)})
+            )
+        pairs = (
+            pd.concat(parts, ignore_index=True).drop_duplicates()
+            if parts
+            else pd.DataFrame(columns=["column", rule_col])
+        )
+        pairs = pairs[pairs[rule_col].isin(rule_ids)]
+        col_codes, columns = pd.factorize(pairs["column"], sort=True)
+        R = _binary(rule_ids.get_indexer(pairs[rule_col]), col_codes, (len(rule_ids), len(columns)))
+
+        rank = np.zeros(len(rule_ids), dtype="int64")
+        if severity_col and severity_col in records.columns:
+            r = (
+                records[severity_col]
+                .astype(str)
+                .str.lower()
+                .map(_SEV_RANK)
+                .fillna(0)
+                .to_numpy("int64")
+            )
+            np.maximum.at(rank, rule_codes[ok], r[ok])
+            has_sev = np.zeros(len(rule_ids), dtype=bool)
+            has_sev[rule_codes[ok]] = True
+            rank[~has_sev] = _SEV_RANK.get(default_severity, 1)
+        else:
+            rank[:] = _SEV_RANK.get(default_severity, 1)
+        return cls(V, rule_ids, R, columns, _SEV_NAME[rank], np.asarray(row_keys), n_total)
+
+    @classmethod
+    def from_flags(
+        cls,
+        flags: Mapping[str, tuple[np.ndarray, Sequence[str], str]],
+        n_rows: int,
+    ) -> ViolationMatrix:
+        """
+        From `{rule_id: (row positions or bool mask, columns, severity)}`,
+        e.g. ConsistencyEngine.row_flags.
+        """
+        _require_scipy()
+        rule_ids = list(flags)
+        rows = [
+            np.flatnonzero(r) if np.asarray(r).dtype == bool else np.asarray(r, dtype="int64")
+            for r, _, _ in flags.values()
+        ]
+        rr = np.concatenate(rows) if rows else np.zeros(0, dtype="int64")
+        rc = np.repeat(np.arange(len(rule_ids)), [len(r) for r in rows])
+        V = _binary(rr, rc, (int(n_rows), len(rule_ids)))
+        cols_per_rule = [list(dict.fromkeys(map(str, c))) for _, c, _ in flags.values()]
+        codes, columns = pd.factorize(
+            pd.Series([c for cs in cols_per_rule for c in cs], dtype=object), sort=True
+        )
+        ri = np.repeat(np.arange(len(rule_ids)), [len(c) for c in cols_per_rule])
+        R = _binary(ri, codes, (len(rule_ids), len(columns)))
+        return cls(
+            V, rule_ids, R, list(columns), [s for _, _, s in flags.values()], None, int(n_rows)
+        )
+
+    def filter_severity(self, include: Sequence[str]) -> ViolationMatrix:
+        """Keep only rules whose severity is in `include` (empty = keep all)."""
+        if not include:
+            return self
+        keep = np.flatnonzero(np.isin(self.severities, [s.lower() for s in include]))
+        return ViolationMatrix(
+            self.V[:, keep],
+            [self.rule_ids[k] for k in keep],
+            self.R[keep],
+            self.columns,
+            self.severities[keep],
+            self.row_keys,
+            self.n_total,
+        )
+
+    def _row_blocks(self, max_nnz: int = BLOCK_NNZ) -> list[tuple[int, int]]:
+        """Row ranges whose V·R fill (upper bound) stays under `max_nnz`, bounding peak memory."""
+        fill = np.cumsum(self.V @ self.R.getnnz(axis=1).astype("int64"))
+        if not fill.size or fill[-1] <= max_nnz:
+            return [(0, self.V.shape[0])]
+        cuts = np.unique(np.searchsorted(fill, np.arange(max_nnz, fill[-1], max_nnz), side="right"))
+        edges = np.concatenate(([0], cuts[(cuts > 0) & (cuts < len(fill))], [len(fill)]))
+        return list(zip(edges[:-1].tolist(), edges[1:].tolist(), strict=True))
+
+    def rule_counts(self) -> np.ndarray:
+        return np.asarray(self.V.sum(axis=0)).ravel().astype("int64")
+
+    @traced("engine.violations.rule_edges")
+    def rule_edges(self, min_count: int = 1, max_edges: int | None = None) -> pd.DataFrame:
+        """Rule–rule co-occurrence from Vᵀ·V."""
+        co = self.V.T.tocsr() @ self.V
+        e = cooccurrence_edges(co, self.rule_ids, self.n_total, min_count, max_edges)
+        rank = pd.Series(self.severities, dtype=object).map(_SEV_RANK).fillna(0).to_numpy("int64")
+        e["max_severity"] = _SEV_NAME[np.maximum(rank[e["_i"]], rank[e["_j"]])] if len(e) else []
+        e = e.rename(columns={"source": "source_rule", "target": "target_rule"})
+        return e[RULE_EDGE_COLUMNS]
+
+    @traced("engine.violations.column_edges")
+    def column_edges(self, min_count: int = 1, max_edges: int | None = None) -> pd.DataFrame:
+        """Column–column co-occurrence from Bᵀ·B, B = (V·R) > 0; n_rules from Rᵀ·R."""
+        co = _sparse.csr_matrix((len(self.columns), len(self.columns)), dtype=np.int64)
+        for lo, hi in self._row_blocks():
+            B = (self.V[lo:hi] @ self.R).tocsr()
+            B.data[:] = 1
+            co = co + (B.T.tocsr() @ B)
+        e = cooccurrence_edges(co, self.columns, self.n_total, min_count, max_edges)
+        RR = (self.R.T.tocsr() @ self.R).tocsr()
+        e["n_rules"] = (
+            np.asarray(RR[e["_i"].to_numpy(), e["_j"].to_numpy()]).ravel().astype("int64")
+            if len(e)
+            else np.zeros(0, dtype="int64")
+        )
+        e = e.rename(columns={"source": "source_column", "target": "target_column"})
+        return e[COLUMN_EDGE_COLUMNS]
+
+
+# ---------------------------------------------------------------------------
+# Report-level graph (2.5.10 logic_violation_edges.csv)
+# ---------------------------------------------------------------------------
+def _first_present(df: pd.DataFrame, candidates: Sequence[str]) -> str | None:
+    return next((c for c in candidates if c in df.columns), None)
+
+
+def report_violations(reports: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    2.5.x report frames ({source name -> frame}) -> one row per report row:
+    source, rule_id, columns_involved (sorted list), severity, weight.
+    """
+    out = []
+    for src, df in reports.items():
+        if df is None or df.empty:
+            continue
+        df = df.reset_index(drop=True)
+        fields = _REPORT_SOURCES.get(src, ("", ()))[1]
+        parts = [_split_cols(df[c]) for c in fields if c in df.columns]
+        if "columns" in df.columns and (src != "total_consistency" or not parts):
+            parts.append(_split_cols(df["columns"]))
+        cols = pd.concat(parts) if parts else pd.Series(dtype=object)
+        involved = (
+            cols.groupby(level=0).agg(lambda v: sorted(set(v)))
+            if len(cols)
+            else pd.Series(dtype=object)
+        )
+
+        sev_col, w_col = _first_present(df, _SEVERITY_CANDIDATES), _first_present(
+            df, _WEIGHT_CANDIDATES
+        )
+        rule_id = (
+            df["rule_id"].astype(str)
+            if "rule_id" in df.columns
+            else src + "_" + pd.Series(df.index.astype(str), index=df.index)
+        )
+        weight = (
+            pd.to_numeric(df[w_col], errors="coerce").fillna(1.0)
+            if w_col
+            else pd.Series(1.0, index=df.index)
+        )
+        frame = pd.DataFrame(
+            {
+                "source": src,
+                "rule_id": rule_id,
+                "columns_involved": involved.reindex(df.index),
+                "severity": df[sev_col].astype(str).str.lower() if sev_col else "info",
+                "weight": weight.astype("float64"),
+            }
+        )
+        out.append(frame[frame["columns_involved"].notna()])
+    if not out:
+        return pd.DataFrame(columns=VIOLATION_ROW_COLUMNS)
+    return pd.concat(out, ignore_index=True)[VIOLATION_ROW_COLUMNS]
+
+
+@traced("engine.violations.logic_violation_edges")
+def logic_violation_edges(
+    violations: pd.DataFrame,
+    include_severities: Sequence[str] = ("warn", "fail"),
+    min_edge_weight: float = 1.0,
+) -> pd.DataFrame:
+    """
+    Column–column edges over report rows (notebook 2.5.10 semantics): edge_weight =
+    Σ weight and n_rules = count of report rows whose columns include both ends,
+    via Rᵀ·diag(w)·R; max_severity from one Rᵀ·R per severity level.
+    """
+    _require_scipy()
+    v = violations
+    if include_severities:
+        v = v[v["severity"].isin([s.lower() for s in include_severities])]
+    v = v[v["columns_involved"].map(len) >= 2].reset_index(drop=True)
+    if v.empty:
+        return pd.DataFrame(columns=LOGIC_EDGE_COLUMNS)
+
+    long = v["columns_involved"].explode()
+    codes, columns = pd.factorize(long, sort=True)
+    R = _binary(long.index.to_numpy(), codes, (len(v), len(columns)))
+    w = v["weight"].fillna(1.0).to_numpy("float64")
+    W = (R.T.multiply(w).tocsr() @ R).tocsr()
+    N = (R.T.tocsr() @ R).tocsr()
+
+    up = _sparse.triu(W, k=1).tocoo()
+    n_rules = np.asarray(N[up.row, up.col]).ravel().astype("int64")
+    keep = (up.data >= min_edge_weight) & (n_rules > 0)
+    i, j, weight, n_rules = up.row[keep], up.col[keep], up.data[keep], n_rules[keep]
+
+    rank = v["severity"].map(_SEV_RANK).fillna(0).to_numpy("int64")
+    sev = np.zeros(len(i), dtype="int64")
+    for level in (1, 2):
+        Rl = R[np.flatnonzero(rank == level)]
+        if Rl.shape[0]:
+            hit = np.asarray((Rl.T.tocsr() @ Rl)[i, j]).ravel() > 0
+            sev = np.where(hit, level, sev)
+
+    labels = np.asarray(columns, dtype=object)
+    edges = pd.DataFrame(
+        {
+            "source_column": labels[i],
+            "target_column": labels[j],
+            "edge_weight": weight,
+            "n_rules": n_rules,
+            "max_severity": _SEV_NAME[sev],
+        }
+    )
+    # rules_contributing: one vectorized (rule, a, b) self-join restricted to surviving edges
+    pairs = pd.DataFrame({"r": long.index.to_numpy(), "c": codes})
+    trip = pairs.merge(pairs, on="r")
+    trip = trip[trip["c_x"] < trip["c_y"]]
+    trip = trip.merge(pd.DataFrame({"c_x": i, "c_y": j}), on=["c_x", "c_y"])
+    trip["rule_id"] = v["rule_id"].to_numpy()[trip["r"].to_numpy()]
+    contrib = (
+        trip.drop_duplicates(["c_x", "c_y", "rule_id"])
+        .sort_values("rule_id")
+        .groupby(["c_x", "c_y"])["rule_id"]
+        .agg(", ".join)
+    )
+    edges["rules_contributing"] = contrib.reindex(pd.MultiIndex.from_arrays([i, j])).to_numpy()
+    return edges[LOGIC_EDGE_COLUMNS].reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+@dataclass
+class NetworkResult:
+    logic_edges: pd.DataFrame
+    rule_edges: pd.DataFrame
+    column_edges: pd.DataFrame
+    n_rules: int
+    n_violating_rows: int
+
+
+def load_reports(reports_dir: Path) -> dict[str, pd.DataFrame]:
+    """Read whichever 2.5.3–2.5.9 reports exist under `reports_dir` (Parquet artifact or CSV)."""
+    out = {}
+    for src, (fname, _) in _REPORT_SOURCES.items():
+        path = Path(reports_dir) / fname
+        if artifact_exists(path):
+            try:
+                out[src] = read_artifact(path)
+            except Exception as e:
+                print(f"   ⚠️ Could not read {path}: {e}")
+    return out
+
+
+@traced("engine.violations.build_violation_network")
+def build_violation_network(
+    reports: Mapping[str, pd.DataFrame] | None = None,
+    matrix: ViolationMatrix | None = None,
+    config: dict[str, Any] | None = None,
+    *,
+    out_dir: Path | None = None,
+    cfg: NetworkCfg | None = None,
+) -> NetworkResult:
+    """
+    2.5.10: report-level column graph from `reports` and, when a row-level
+    `matrix` is given, rule–rule / column–column co-occurrence edges. Writes
+    logic_violation_edges.csv + .parquet, rule_cooccurrence_edges.parquet and
+    column_cooccurrence_edges.parquet when `out_dir` is given.
+    """
+    cfg = cfg or NetworkCfg.from_config(config)
+    logic = (
+        logic_violation_edges(
+            report_violations(reports), cfg.include_severities, cfg.min_edge_weight
+        )
+        if reports
+        else pd.DataFrame(columns=LOGIC_EDGE_COLUMNS)
+    )
+    rule_e, col_e = pd.DataFrame(columns=RULE_EDGE_COLUMNS), pd.DataFrame(
+        columns=COLUMN_EDGE_COLUMNS
+    )
+    n_rules = n_rows = 0
+    if matrix is not None:
+        m = matrix.filter_severity(cfg.include_severities)
+        rule_e = m.rule_edges(cfg.min_co_count, cfg.max_edges)
+        col_e = m.column_edges(cfg.min_co_count, cfg.max_edges)
+        n_rules, n_rows = m.shape[1], int(np.count_nonzero(m.V.getnnz(axis=1)))
+    result = NetworkResult(logic, rule_e, col_e, n_rules, n_rows)
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_artifact(logic, out_dir / "logic_violation_edges.csv")
+        write_artifact(rule_e, out_dir / "rule_cooccurrence_edges.parquet", csv_mirror=False)
+        write_artifact(col_e, out_dir / "column_cooccurrence_edges.parquet", csv_mirror=False)
+
+    n_nodes = (
+        len(pd.unique(logic[["source_column", "target_column"]].to_numpy().ravel()))
+        if len(logic)
+        else 0
+    )
+    print(
+        f"📈 2.5.10 violation network: {n_nodes} column node(s), {len(logic)} report edge(s); "
+        f"{n_rules} rule(s) over {n_rows:,} violating row(s) → "
+        f"{len(rule_e)} rule edge(s), {len(col_e)} column edge(s)"
+    )
+    return result
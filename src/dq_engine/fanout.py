@@ -0,0 +1,472 @@
+# src/dq_engine/fanout.py
+"""
+Multi-dataset fan-out: run every dataset in a project (or in a glob of
+project configs) in one process pool.
+
+- Jobs come from the `datasets:` block. A dataset uses its own `checks:` when
+  it has them; otherwise it gets the global `checks:`, with `{dataset_id}`,
+  `{source_table}`, `{staging}`, `{mart}` (any `models:` key) filled into
+  table / column / id. A config without `datasets:` is one job
+  (project.dataset_id). A dataset may also override `warehouse:` keys.
+- The parent schedules and the workers only read. `per_warehouse` limits how
+  many datasets run at once against each warehouse (target + database /
+  duckdb file). Workers keep a warm connection per warehouse for as long as
+  the process lives, so consecutive datasets reuse it.
+- Baselines are read once per warehouse before scheduling, as one
+  `ResultsStore.latest_status()` query instead of one per dataset. Each job
+  gets only its own (warehouse, dataset_id) slice, and the summary counts
+  regressions against it (PASS → WARN/FAIL).
+- Results come back to the parent and are written in batches via
+  `ResultsStore.append`. Snowflake flushes every `flush_every` rows. A DuckDB
+  file allows only one writer process, so its batch is written once the pool
+  has drained and the read-only worker connections are closed.
+- An error in a dataset, even a crashed worker, becomes a `failed` summary row.
+  The other datasets keep running. The consolidated run summary is written
+  to fanout_summary.csv / .json, next to dq_results.csv.
+"""
+
+from __future__ import annotations
+
+import glob as _glob
+import json
+import multiprocessing as mp
+import time
+import traceback
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from dq_engine.config.config import load_config
+from dq_engine.dbt_runner import run_dbt_build
+from dq_engine.pipeline import run_checks
+from dq_engine.results_store import ResultsStore
+from dq_engine.utils.tracing import span, traced
+from dq_engine.warehouse import DuckDBWarehouse, Warehouse, WarehouseConnCfg, make_warehouse
+
+FANOUT_SUMMARY_COLUMNS = [
+    "dataset_id",
+    "config_path",
+    "warehouse",
+    "status",  # ok | failed
+    "n_checks",
+    "n_pass",
+    "n_warn",
+    "n_fail",
+    "n_regressed",  # PASS (baseline) → WARN / FAIL
+    "seconds",
+    "error",
+]
+
+_STATUS_RANK = {"PASS": 0, "WARN": 1, "FAIL": 2}
+_TEMPLATED = ("id", "table", "column")
+
+
+@dataclass(frozen=True)
+class FanoutCfg:
+    max_workers: int = 4
+    per_warehouse: int = 2  # concurrent datasets per warehouse
+    per_warehouse_overrides: Mapping[str, int] = field(default_factory=dict)
+    flush_every: int = 5_000  # result rows per batched insert (Snowflake)
+
+    @classmethod
+    def from_config(cls, cfg: dict[str, Any] | None = None) -> FanoutCfg:
+        """
+        `fanout:` block of the project config; per_warehouse may be an int or
+        {warehouse_key: n, default: n}.
+        """
+        f = (cfg or {}).get("fanout") or {}
+        pw = f.get("per_warehouse", 2)
+        overrides = (
+            {str(k): int(v) for k, v in pw.items() if k != "default"}
+            if isinstance(pw, dict)
+            else {}
+        )
+        default = int(pw.get("default", 2)) if isinstance(pw, dict) else int(pw)
+        return cls(
+            max_workers=max(1, int(f.get("max_workers", 4))),
+            per_warehouse=max(1, default),
+            per_warehouse_overrides=overrides,
+            flush_every=max(1, int(f.get("flush_every", 5_000))),
+        )
+
+    def limit(self, warehouse_key: str) -> int:
+        return max(1, int(self.per_warehouse_overrides.get(warehouse_key, self.per_warehouse)))
+
+
+@dataclass(frozen=True)
+class DatasetJob:
+    dataset_id: str
+    config_path: str
+    warehouse: dict[str, Any]
+    checks: tuple[dict[str, Any], ...]
+
+    @property
+    def warehouse_key(self) -> str:
+        return warehouse_key(self.warehouse)
+
+
+def warehouse_key(wcfg: Mapping[str, Any]) -> str:
+    """Warehouse identity for limits / pooling: `duckdb:<abs path>` or `snowflake:<database>`."""
+    target = str(wcfg.get("target", "snowflake")).lower()
+    if target == "duckdb":
+        return f"duckdb:{Path(str(wcfg.get('duckdb_path'))).resolve()}"
+    return f"{target}:{wcfg.get('database')}"
+
+
+def _is_duckdb(key: str) -> bool:
+    return key.startswith("duckdb:")
+
+
+class _Template(dict):
+    def __missing__(self, k: str) -> str:  # leave unknown placeholders untouched
+        return "{" + k + "}"
+
+
+def expand_checks(
+    checks: Sequence[dict[str, Any]], dataset_id: str, dataset: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    """Fill `{dataset_id}` / `{source_table}` / `{<model>}` in each check's id, table and column."""
+    values = _Template(dataset_id=dataset_id, source_table=dataset.get("source_table", ""))
+    values.update({str(k): str(v) for k, v in (dataset.get("models") or {}).items()})
+    out = []
+    for chk in checks:
+        c = dict(chk)
+        for k in _TEMPLATED:
+            if isinstance(c.get(k), str):
+                c[k] = c[k].format_map(values)
+        out.append(c)
+    return out
+
+
+def discover_jobs(sources: str | Path | Sequence[str | Path]) -> list[DatasetJob]:
+    """Config paths / globs → one DatasetJob per dataset (sorted paths, config order per file)."""
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    paths: list[str] = []
+    for s in sources:
+        hits = sorted(_glob.glob(str(s), recursive=True)) if _glob.has_magic(str(s)) else [str(s)]
+        paths.extend(h for h in hits if h not in paths)
+    if not paths:
+        raise ValueError(f"No project configs match {list(map(str, sources))}")
+
+    jobs: list[DatasetJob] = []
+    for path in paths:
+        cfg = load_config(path)
+        wcfg = dict(cfg["warehouse"])
+        checks = cfg.get("checks") or []
+        datasets = cfg.get("datasets") or {cfg["project"]["dataset_id"]: {}}
+        for dataset_id, ds in datasets.items():
+            ds = ds or {}
+            jobs.append(
+                DatasetJob(
+                    dataset_id=str(dataset_id),
+                    config_path=str(Path(path).resolve()),
+                    warehouse={**wcfg, **(ds.get("warehouse") or {})},
+                    checks=tuple(expand_checks(ds.get("checks", checks), str(dataset_id), ds)),
+                )
+            )
+    seen = set()
+    for j in jobs:
+        if (j.warehouse_key, j.dataset_id) in seen:
+            raise ValueError(f"Duplicate dataset_id {j.dataset_id!r} on {j.warehouse_key}")
+        seen.add((j.warehouse_key, j.dataset_id))
+    return jobs
+
+
+def _conn_cfg(wcfg: Mapping[str, Any]) -> WarehouseConnCfg:
+    return WarehouseConnCfg(
+        target=wcfg["target"],
+        database=wcfg["database"],
+        raw_schema=wcfg["raw_schema"],
+        analytics_schema=wcfg["analytics_schema"],
+        dq_schema=wcfg["dq_schema"],
+        duckdb_path=wcfg.get("duckdb_path"),
+    )
+
+
+# -- worker side --------------------------------------------------------------
+_POOL: dict[str, Warehouse] = {}
+
+
+def _pooled(wcfg: Mapping[str, Any]) -> Warehouse:
+    """Per-process warm connection; DuckDB opens read-only so workers never take the write lock."""
+    key = warehouse_key(wcfg)
+    wh = _POOL.get(key)
+    if wh is None:
+        if _is_duckdb(key):
+            wh = DuckDBWarehouse(str(wcfg["duckdb_path"]), read_only=True)
+        else:
+            wh = make_warehouse(_conn_cfg(wcfg))
+        _POOL[key] = wh
+    return wh
+
+
+def _drop_pooled(key: str) -> None:
+    wh = _POOL.pop(key, None)
+    if wh is not None:
+        try:
+            wh.close()
+        except Exception:
+            pass
+
+
+def _close_pool() -> None:
+    for key in list(_POOL):
+        _drop_pooled(key)
+
+
+def _run_job(job: DatasetJob, run_id: str, baseline: dict[str, str]) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    out: dict[str, Any] = {"dataset_id": job.dataset_id, "results": [], "error": ""}
+    try:
+        wh = _pooled(job.warehouse)
+        with span("fanout.dataset", dataset_id=job.dataset_id, warehouse=job.warehouse_key):
+            results = run_checks(wh, list(job.checks), run_id, job.dataset_id)
+        out["results"] = [asdict(r) for r in results]
+        out["n_regressed"] = sum(
+            1
+            for r in results
+            if _STATUS_RANK.get(r.status, 0) > _STATUS_RANK.get(baseline.get(r.check_id, "PASS"), 0)
+            and baseline.get(r.check_id) is not None
+        )
+    except Exception as e:
+        # don't hand a possibly broken connection to the next job (and free
+        # its DuckDB handle, or the parent's writer cannot open the file)
+        _drop_pooled(job.warehouse_key)
+        out["error"] = f"{type(e).__name__}: {e}"
+        out["traceback"] = traceback.format_exc()
+    out["seconds"] = round(time.perf_counter() - t0, 3)
+    return out
+
+
+# -- parent side --------------------------------------------------------------
+def _summary_row(job: DatasetJob, res: dict[str, Any]) -> dict[str, Any]:
+    statuses = [r["status"] for r in res.get("results", [])]
+    return {
+        "dataset_id": job.dataset_id,
+        "config_path": job.config_path,
+        "warehouse": job.warehouse_key,
+        "status": "failed" if res.get("error") else "ok",
+        "n_checks": len(statuses),
+        "n_pass": statuses.count("PASS"),
+        "n_warn": statuses.count("WARN"),
+        "n_fail": statuses.count("FAIL"),
+        "n_regressed": int(res.get("n_regressed", 0)),
+        "seconds": res.get("seconds", 0.0),
+        "error": res.get("error", ""),
+    }
+
+
+class _Writer:
+    """One writer connection + ResultsStore per warehouse; buffers rows, appends in batches."""
+
+    def __init__(self, wcfg: Mapping[str, Any], grains: Sequence[str], run_ts: pd.Timestamp):
+        self.wcfg = dict(wcfg)
+        self.grains = tuple(grains)
+        self.run_ts = run_ts
+        self.buffer: list[dict[str, Any]] = []
+        self.wh: Warehouse | None = None
+        self.n_written = 0
+
+    def store(self) -> ResultsStore:
+        if self.wh is None:
+            self.wh = make_warehouse(_conn_cfg(self.wcfg))
+        return ResultsStore(
+            self.wh,
+            self.wcfg["database"],
+            self.wcfg["dq_schema"],
+            self.wcfg["target"],
+            grains=self.grains,
+        )
+
+    def baselines(self) -> dict[tuple[str, str, str], str]:
+        """Latest status per (warehouse_key, dataset_id, check_id) in this warehouse's results."""
+        store = self.store()
+        store.ensure()
+        latest = store.latest_status()
+        key = warehouse_key(self.wcfg)
+        return {
+            (key, str(r.dataset_id), str(r.check_id)): str(r.status)
+            for r in latest.itertuples(index=False)
+        }
+
+    def flush(self) -> None:
+        if self.buffer:
+            df = pd.DataFrame(self.buffer)
+            df["run_ts"] = self.run_ts
+            with span("fanout.flush", warehouse=warehouse_key(self.wcfg), rows=len(df)):
+                self.store().append(df)
+            self.n_written += len(df)
+            self.buffer = []
+
+    def release(self) -> None:
+        if self.wh is not None:
+            self.wh.close()
+            self.wh = None
+
+
+@traced("engine.fanout.run_fanout")
+def run_fanout(
+    sources: str | Path | Sequence[str | Path],
+    *,
+    skip_dbt: bool = False,
+    run_dir: str | None = None,
+    cfg: FanoutCfg | None = None,
+    run_id: str | None = None,
+) -> pd.DataFrame:
+    """
+    Run every dataset from `sources` (config paths / globs) → consolidated
+    summary (FANOUT_SUMMARY_COLUMNS).
+    """
+    jobs = discover_jobs(sources)
+    first = load_config(jobs[0].config_path)
+    cfg = cfg or FanoutCfg.from_config(first)
+    run_id = run_id or uuid.uuid4().hex
+    run_ts = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    t0 = time.perf_counter()
+
+    if not skip_dbt:
+        builds = dict.fromkeys(
+            (c["dbt"]["project_dir"], c["dbt"]["profiles_dir"])
+            for c in (load_config(p) for p in dict.fromkeys(j.config_path for j in jobs))
+            if c.get("dbt")
+        )
+        for project_dir, profiles_dir in builds:
+            with span("dbt.build", section="dbt", stage="build"):
+                run_dbt_build(project_dir, profiles_dir)
+
+    grains = (first.get("results_store") or {}).get("rollups", ("daily", "weekly"))
+    writers: dict[str, _Writer] = {}
+    baselines: dict[tuple[str, str, str], str] = {}  # dataset_id may repeat across warehouses
+    for j in jobs:
+        if j.warehouse_key not in writers:
+            w = writers[j.warehouse_key] = _Writer(j.warehouse, grains, run_ts)
+            baselines.update(w.baselines())
+            if _is_duckdb(j.warehouse_key):
+                w.release()  # readers need the file lock free
+
+    pending: dict[str, deque] = defaultdict(deque)
+    for j in jobs:
+        pending[j.warehouse_key].append(j)
+    inflight: dict[str, int] = defaultdict(int)
+    rows: list[dict[str, Any]] = []
+    all_results: list[dict[str, Any]] = []
+
+    def _baseline(job: DatasetJob) -> dict[str, str]:
+        key = (job.warehouse_key, job.dataset_id)
+        return {cid: s for (wk, ds, cid), s in baselines.items() if (wk, ds) == key}
+
+    def _collect(job: DatasetJob, res: dict[str, Any]) -> None:
+        row = _summary_row(job, res)
+        rows.append(row)
+        if res.get("error"):
+            print(f"❌ {job.dataset_id}: {res['error'].splitlines()[0]}")
+        w = writers[job.warehouse_key]
+        w.buffer.extend(res.get("results", []))
+        all_results.extend(res.get("results", []))
+        if not _is_duckdb(job.warehouse_key) and len(w.buffer) >= cfg.flush_every:
+            w.flush()
+
+    def _next_jobs(free: int) -> list[DatasetJob]:
+        picked: list[DatasetJob] = []
+        progressed = True
+        while free > 0 and progressed:  # round-robin across warehouses
+            progressed = False
+            for key, q in pending.items():
+                if free > 0 and q and inflight[key] < cfg.limit(key):
+                    picked.append(q.popleft())
+                    inflight[key] += 1
+                    free -= 1
+                    progressed = True
+        return picked
+
+    if cfg.max_workers == 1 or len(jobs) == 1:
+        for j in jobs:
+            _collect(j, _run_job(j, run_id, _baseline(j)))
+        _close_pool()
+    else:
+        ctx = mp.get_context("spawn")  # no inherited warehouse sockets / DuckDB handles
+        pool = ProcessPoolExecutor(max_workers=min(cfg.max_workers, len(jobs)), mp_context=ctx)
+        futures: dict[Any, DatasetJob] = {}
+        try:
+            while futures or any(pending.values()):
+                for j in _next_jobs(cfg.max_workers - len(futures)):
+                    futures[pool.submit(_run_job, j, run_id, _baseline(j))] = j
+                done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                broken = False
+                for fut in done:
+                    j = futures.pop(fut)
+                    inflight[j.warehouse_key] -= 1
+                    exc = fut.exception()
+                    if exc is None:  # finished before the pool died
+                        _collect(j, fut.result())
+                    elif isinstance(exc, BrokenProcessPool):
+                        broken = True
+                        _collect(j, {"error": f"worker crashed: {exc}"})
+                    else:
+                        _collect(j, {"error": f"{type(exc).__name__}: {exc}"})
+                if broken:  # every future on the dead pool fails: requeue them
+                    for j in futures.values():
+                        inflight[j.warehouse_key] -= 1
+                        pending[j.warehouse_key].appendleft(j)
+                    futures.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = ProcessPoolExecutor(
+                        max_workers=min(cfg.max_workers, len(jobs)), mp_context=ctx
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    for w in writers.values():
+        try:
+            w.flush()
+        finally:
+            w.release()
+
+    order = {(j.warehouse_key, j.dataset_id): i for i, j in enumerate(jobs)}
+    summary = pd.DataFrame(rows, columns=FANOUT_SUMMARY_COLUMNS)
+    summary = summary.iloc[
+        sorted(
+            range(len(summary)),
+            key=lambda i: order[(summary.at[i, "warehouse"], summary.at[i, "dataset_id"])],
+        )
+    ]
+    summary = summary.reset_index(drop=True)
+
+    n_failed = int((summary["status"] == "failed").sum())
+    print(
+        f"{'✅' if n_failed == 0 else '⚠️'} Fan-out {run_id[:8]}: {len(summary)} dataset(s), "
+        f"{n_failed} failed, {int(summary['n_fail'].sum())} FAIL / "
+        f"{int(summary['n_warn'].sum())} WARN check(s), "
+        f"{int(summary['n_regressed'].sum())} regressed in {time.perf_counter() - t0:,.1f}s"
+    )
+
+    if run_dir:
+        p = Path(run_dir).resolve()
+        p.mkdir(parents=True, exist_ok=True)
+        summary.to_csv(p / "fanout_summary.csv", index=False)
+        (p / "fanout_summary.json").write_text(
+            json.dumps(
+                {
+                    "run_id": run_id,
+                    "run_ts": run_ts.isoformat(),
+                    "n_datasets": len(summary),
+                    "n_failed": n_failed,
+                    "datasets": summary.to_dict(orient="records"),
+                },
+                indent=2,
+                default=str,
+            ),
+            encoding="utf-8",
+        )
+        res_df = pd.DataFrame(all_results)
+        res_df.to_csv(p / "dq_results.csv", index=False)
+        print(f"💾 Fan-out summary → {p / 'fanout_summary.csv'}")
+    return summary
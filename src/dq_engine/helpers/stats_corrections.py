@@ -26,4 +26,44 @@ def by_fdr(pvals: np.ndarray):
     adj = pvals.copy().astype(float)
     adj[order] = pvals[order] * n * c_n / ranked
     adj[order] = np.minimum.accumulate(adj[order][::-1])[::-1]
-    return np.clip(adj, 0.0, 1.0)
\ No newline at end of file
+    return np.clip(adj, 0.0, 1.0)
+
+# helper: Bonferroni
+def bonferroni(pvals: np.ndarray):
+    pvals = np.asarray(pvals, dtype=float)
+    return np.clip(pvals * len(pvals), 0.0, 1.0)
+
+# helper: Holm step-down
+def holm(pvals: np.ndarray):
+    pvals = np.asarray(pvals, dtype=float)
+    n = len(pvals)
+    if n == 0:
+        return np.array([], dtype=float)
+    order = np.argsort(pvals)
+    ranked = np.arange(1, n + 1)
+    adj = pvals.copy()
+    # step-down: running max from the smallest p upward
+    adj[order] = np.maximum.accumulate(pvals[order] * (n - ranked + 1))
+    return np.clip(adj, 0.0, 1.0)
+
+# dispatcher used by 2.8.6 and engines.hypothesis
+_CORRECTIONS = {
+    "bonferroni": bonferroni,
+    "holm": holm,
+    "fdr_bh": bh_fdr,
+    "fdr_by": by_fdr,
+}
+
+def adjust_pvalues(pvals: np.ndarray, method: str = "fdr_bh") -> np.ndarray:
+    """
+    Apply a multiple-testing correction by name (bonferroni | holm | fdr_bh | fdr_by).
+    NaN p-values are passed through and do not count towards the family size.
+    """
+    key = str(method).lower()
+    if key not in _CORRECTIONS:
+        raise ValueError(f"Unknown multiple-testing method: {method!r}")
+    pvals = np.asarray(pvals, dtype=float)
+    out = np.full(pvals.shape, np.nan)
+    ok = ~np.isnan(pvals)
+    out[ok] = _CORRECTIONS[key](pvals[ok])
+    return out
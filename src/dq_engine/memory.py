@@ -0,0 +1,236 @@
+# src/dq_engine/memory.py
+"""
+Memory optimizer for the working frame (runs after 2.1.7.5 / 2.2.2 schema enforcement).
+
+- Low-cardinality strings become `category`. Columns listed in EXPECTED_LEVELS
+  use that vocabulary plus any observed out-of-domain values, so the values
+  that domain checks should flag are kept, not turned into NaN. Categories are
+  sorted lexically, so factorize/groupby give the same level order as on
+  object columns.
+- Integers shrink to the smallest signed type that holds the observed range
+  (nullable Int8..Int64 when the column already has nulls).
+- Float columns stay float, so NaN keeps its meaning in the engines and
+  exact comparisons (`== 20.05`, range / allowed-value rules) keep working.
+  With DOWNCAST_FLOATS (off by default) a column goes to float32 only when
+  every value round-trips exactly (FLOAT_RTOL = 0) or within FLOAT_RTOL when
+  that is set. INTEGRAL_FLOATS_TO_INT (off by default) opts integral floats
+  into nullable Int*, which changes their null semantics.
+  High-cardinality strings (IDs) go to Arrow-backed `string[pyarrow]`.
+- `optimize_frame` returns the compact frame plus a per-column report
+  (memory_optimization_report.csv) with bytes before/after and the action taken.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+MEMORY_REPORT_COLUMNS = [
+    "column",
+    "dtype_before",
+    "dtype_after",
+    "bytes_before",
+    "bytes_after",
+    "bytes_saved",
+    "pct_saved",
+    "action",
+    "notes",
+]
+
+_INT_TYPES = ("int8", "int16", "int32", "int64")
+_F32_MAX = float(np.finfo("float32").max)
+
+
+@dataclass(frozen=True)
+class MemoryOptCfg:
+    enabled: bool = True
+    category_max_unique: int = 1_000
+    category_max_ratio: float = 0.5          # unique / non-null rows
+    downcast_ints: bool = True
+    downcast_floats: bool = False
+    float_rtol: float = 0.0                  # 0 = exact float32 round-trip only
+    integral_floats_to_int: bool = False
+    string_storage: str = "pyarrow"          # pyarrow | python | none
+    exclude: Tuple[str, ...] = ()
+    levels: Mapping[str, Tuple[str, ...]] = None  # type: ignore[assignment]
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "MemoryOptCfg":
+        """MEMORY_OPTIMIZATION.*; ID_COLUMNS never become categories."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        levels = get("EXPECTED_LEVELS", {}) or {}
+        return cls(
+            enabled=bool(get("MEMORY_OPTIMIZATION.ENABLED", True)),
+            category_max_unique=int(get("MEMORY_OPTIMIZATION.CATEGORY_MAX_UNIQUE", 1_000)),
+            category_max_ratio=float(get("MEMORY_OPTIMIZATION.CATEGORY_MAX_RATIO", 0.5)),
+            downcast_ints=bool(get("MEMORY_OPTIMIZATION.DOWNCAST_INTS", True)),
+            downcast_floats=bool(get("MEMORY_OPTIMIZATION.DOWNCAST_FLOATS", False)),
+            float_rtol=float(get("MEMORY_OPTIMIZATION.FLOAT_RTOL", 0.0) or 0.0),
+            integral_floats_to_int=bool(get("MEMORY_OPTIMIZATION.INTEGRAL_FLOATS_TO_INT", False)),
+            string_storage=str(get("MEMORY_OPTIMIZATION.STRING_STORAGE", "pyarrow")).lower(),
+            exclude=tuple(dict.fromkeys(
+                list(get("MEMORY_OPTIMIZATION.EXCLUDE", []) or []) + list(get("ID_COLUMNS", []) or [])
+            )),
+            levels={str(k): tuple(str(x) for x in v) for k, v in levels.items() if isinstance(v, (list, tuple))},
+        )
+
+
+def _int_dtype(lo: float, hi: float, nullable: bool) -> str:
+    for t in _INT_TYPES:
+        info = np.iinfo(t)
+        if info.min <= lo and hi <= info.max:
+            return t.capitalize() if nullable else t
+    return "Int64" if nullable else "int64"
+
+
+def _downcast_numeric(s: pd.Series, cfg: MemoryOptCfg) -> Tuple[pd.Series, str]:
+    if is_bool_dtype(s.dtype):
+        return s, ""
+    has_na = bool(s.isna().any())
+
+    if is_integer_dtype(s.dtype):
+        if not cfg.downcast_ints or not s.notna().any():
+            return s, ""
+        nullable = has_na or isinstance(s.dtype, pd.api.extensions.ExtensionDtype)
+        target = _int_dtype(int(s.min()), int(s.max()), nullable)
+        return (s.astype(target), f"int → {target}") if target != str(s.dtype) else (s, "")
+
+    if not is_float_dtype(s.dtype):
+        return s, ""
+    vals = s.to_numpy(dtype="float64", na_value=np.nan)
+    finite = vals[np.isfinite(vals)]
+    if finite.size == 0:
+        return s, ""
+    all_finite = finite.size == np.count_nonzero(~np.isnan(vals))
+    if cfg.integral_floats_to_int and cfg.downcast_ints and all_finite and np.all(finite == np.round(finite)):
+        target = _int_dtype(finite.min(), finite.max(), nullable=has_na)
+        return s.astype(target), f"integral float → {target}"
+    if cfg.downcast_floats and str(s.dtype) in ("float64", "Float64") and np.abs(finite).max() < _F32_MAX:
+        f32 = finite.astype("float32").astype("float64")
+        if cfg.float_rtol > 0:
+            rel = np.abs(f32 - finite) / np.maximum(np.abs(finite), np.finfo("float32").tiny)
+            err = float(rel.max(initial=0.0))
+            ok = err <= cfg.float_rtol
+        else:
+            err, ok = 0.0, bool(np.array_equal(f32, finite))
+        if ok:
+            target = "Float32" if str(s.dtype) == "Float64" else "float32"
+            return s.astype(target), f"float → {target} (max rel err {err:.1e})"
+    return s, ""
+
+
+def _to_category(s: pd.Series, levels: Optional[Sequence[str]]) -> Tuple[pd.Series, str]:
+    observed = {str(v) for v in pd.unique(s.dropna())}
+    if levels:
+        extra = observed - set(levels)
+        note = f"EXPECTED_LEVELS ({len(levels)})" + (f" + {len(extra)} out-of-domain" if extra else "")
+        return s.astype(pd.CategoricalDtype(sorted(set(levels) | observed))), note
+    return s.astype(pd.CategoricalDtype(sorted(observed))), f"{len(observed)} observed levels"
+
+
+def _is_text(s: pd.Series) -> bool:
+    if is_string_dtype(s.dtype) and not is_object_dtype(s.dtype):
+        return True
+    return is_object_dtype(s.dtype) and pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+
+
+@traced("engine.memory.optimize_frame")
+def optimize_frame(
+    df: pd.DataFrame,
+    cfg: Optional[MemoryOptCfg] = None,
+    *,
+    inplace: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Compact `df` per MemoryOptCfg → (optimized frame, per-column report)."""
+    cfg = cfg or MemoryOptCfg()
+    levels = cfg.levels or {}
+    out = df if inplace else df.copy(deep=False)
+    if not cfg.enabled:
+        return out, pd.DataFrame(columns=MEMORY_REPORT_COLUMNS)
+    rows: List[Dict[str, Any]] = []
+    before = df.memory_usage(index=False, deep=True)
+
+    for col in df.columns:
+        s = df[col]
+        new, action, notes = s, "", ""
+        try:
+            if col in cfg.exclude:
+                if is_object_dtype(s.dtype) and _is_text(s) and cfg.string_storage in ("pyarrow", "python"):
+                    new, action = s.astype(f"string[{cfg.string_storage}]"), f"string[{cfg.string_storage}]"
+                notes = "excluded from category / numeric downcast"
+            elif isinstance(s.dtype, pd.CategoricalDtype):
+                notes = "already category"
+            elif is_numeric_dtype(s.dtype):
+                new, action = _downcast_numeric(s, cfg)
+            elif _is_text(s):
+                n = int(s.notna().sum())
+                nunique = int(s.nunique(dropna=True))
+                lv = levels.get(str(col))
+                if lv or (nunique <= cfg.category_max_unique and (n == 0 or nunique / n <= cfg.category_max_ratio)):
+                    new, notes = _to_category(s, lv)
+                    action = "category"
+                elif is_object_dtype(s.dtype) and cfg.string_storage in ("pyarrow", "python"):
+                    new, action = s.astype(f"string[{cfg.string_storage}]"), f"string[{cfg.string_storage}]"
+                    notes = f"{nunique} unique (too many for category)"
+            elif is_object_dtype(s.dtype) and pd.api.types.infer_dtype(s, skipna=True) == "boolean":
+                new, action = s.astype("boolean"), "nullable boolean"
+        except (TypeError, ValueError) as e:
+            new, action, notes = s, "", f"kept: {e}"
+
+        b0 = int(before[col])
+        b1 = int(new.memory_usage(index=False, deep=True)) if new is not s else b0
+        if b1 > b0:                                   # never trade up
+            new, action, notes, b1 = s, "", (notes + "; " if notes else "") + "reverted (no saving)", b0
+        if new is not s:
+            out[col] = new
+        rows.append({
+            "column": col,
+            "dtype_before": str(s.dtype),
+            "dtype_after": str(new.dtype),
+            "bytes_before": b0,
+            "bytes_after": b1,
+            "bytes_saved": b0 - b1,
+            "pct_saved": round(100.0 * (b0 - b1) / b0, 2) if b0 else 0.0,
+            "action": action or "unchanged",
+            "notes": notes,
+        })
+    report = pd.DataFrame(rows, columns=MEMORY_REPORT_COLUMNS)
+    return out, report
+
+
+def memory_summary(report: pd.DataFrame) -> Dict[str, Any]:
+    """Totals for the diagnostics row / console line."""
+    b0 = int(report["bytes_before"].sum()) if not report.empty else 0
+    b1 = int(report["bytes_after"].sum()) if not report.empty else 0
+    return {
+        "bytes_before": b0,
+        "bytes_after": b1,
+        "bytes_saved": b0 - b1,
+        "reduction_x": round(b0 / b1, 2) if b1 else None,
+        "n_columns_changed": int((report["action"] != "unchanged").sum()) if not report.empty else 0,
+    }
+
+
+def optimize_working_frame(df: pd.DataFrame, config: Optional[Dict[str, Any]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Section entry point: optimize with MEMORY_OPTIMIZATION.* and print the saving."""
+    out, report = optimize_frame(df, MemoryOptCfg.from_config(config))
+    if not report.empty:
+        s = memory_summary(report)
+        print(
+            f"🧮 Memory optimizer: {s['bytes_before'] / 1e6:,.1f} MB → {s['bytes_after'] / 1e6:,.1f} MB "
+            f"({s['reduction_x']}×, {s['n_columns_changed']} column(s) changed)"
+        )
+    return out, report
@@ -0,0 +1,473 @@
+# src/dq_engine/out_of_core.py
+"""
+MEMORY_BUDGET: choose in-memory or chunked execution, and spill intermediates
+to Arrow IPC under PATHS.ARTIFACTS.
+
+- `MemoryBudget.plan(source)` estimates the in-memory size of a frame,
+  Parquet file/directory, CSV or spilled IPC table (Parquet from footer
+  metadata only, no data read). The estimate is multiplied by
+  WORKING_SET_FACTOR (the copies cleaning / profiling / stats make) and
+  compared with LIMIT. Within budget → `in_memory`. Otherwise → `chunked`,
+  with `chunk_rows` sized so that one chunk's working set fits in CHUNK_BYTES.
+- `iter_chunks` streams any of those sources as pandas chunks through
+  pyarrow scanners, so only one chunk (plus whatever state the consumer
+  keeps) is resident at a time.
+- `SpillStore` writes chunk streams (e.g. the cleaned frame) to Arrow IPC
+  files in a per-run scratch directory. `SpilledTable` reads them back
+  whole (memory-mapped, zero-copy; for column subsets) or batch by batch.
+  The scratch directory is removed when the store closes.
+- DuckDB-backed passes (profiling) get `memory_limit` / `temp_directory`
+  from the same budget, so the warehouse spills as well. Over-budget
+  profiles switch to approximate quantiles / distinct counts, because exact
+  holistic aggregates cannot spill.
+
+Chunk-aware consumers: profiling (DuckDB over files / IPC), correlation
+(`PearsonAccumulator`), temporal (`TemporalProfiler.update(chunk, "append")`).
+Everything else still takes a whole frame and ignores the budget: the
+warehouse pipeline (`pipeline.run`, whose checks read query results, not
+the raw frame), keys, consistency, violations, hypothesis tests, type
+inference and model checks. Over budget, run those on a sample or on
+`SpilledTable.to_pandas(columns)` column subsets.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+ChunkSource = Union[pd.DataFrame, str, Path, "SpilledTable"]
+
+_UNITS = {"": 1, "b": 1, "k": 1 << 10, "kb": 1 << 10, "kib": 1 << 10, "m": 1 << 20, "mb": 1 << 20, "mib": 1 << 20,
+          "g": 1 << 30, "gb": 1 << 30, "gib": 1 << 30, "t": 1 << 40, "tb": 1 << 40, "tib": 1 << 40}
+_SIZE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([a-zA-Z]*)\s*$")
+_IPC_SUFFIXES = (".arrow", ".ipc", ".feather")
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_CSV_INFLATION = 2.0        # in-memory bytes per CSV byte (object/str columns); refined from a sample when possible
+
+
+def parse_bytes(value: Union[int, float, str, None]) -> Optional[int]:
+    """'24GB' / '512 MiB' / 1e9 → bytes (binary units); None / 'auto' → None."""
+    if value is None or (isinstance(value, str) and value.strip().lower() in ("", "auto", "none")):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    m = _SIZE.match(str(value))
+    if not m or m.group(2).lower() not in _UNITS:
+        raise ValueError(f"Cannot parse byte size {value!r} (e.g. '24GB', '512MB')")
+    return int(float(m.group(1)) * _UNITS[m.group(2).lower()])
+
+
+def available_memory() -> int:
+    """Physical RAM, capped by a cgroup (container) limit when one is set."""
+    total = 8 << 30
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        pass
+    for p in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            raw = Path(p).read_text().strip()
+        except OSError:
+            continue
+        if raw.isdigit():
+            total = min(total, int(raw))
+    return int(total)
+
+
+# ---------------------------------------------------------------------------
+# Budget + plan
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ExecutionPlan:
+    mode: str                       # in_memory | chunked
+    est_bytes: int                  # estimated in-memory size of the source
+    n_rows: Optional[int]
+    bytes_per_row: float
+    chunk_rows: int
+    budget_bytes: int
+
+    @property
+    def in_memory(self) -> bool:
+        return self.mode == "in_memory"
+
+    @property
+    def n_chunks(self) -> Optional[int]:
+        return None if self.n_rows is None else max(1, -(-self.n_rows // self.chunk_rows))
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    limit_bytes: int
+    working_set_factor: float = 3.0
+    chunk_bytes: int = 256 << 20
+    spill_dir: Optional[str] = None
+    force_mode: str = "auto"                  # auto | in_memory | chunked
+    keep_spill: bool = False
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "MemoryBudget":
+        """MEMORY_BUDGET.*; LIMIT: auto = FRACTION x available RAM."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        limit = parse_bytes(get("MEMORY_BUDGET.LIMIT", "auto"))
+        if limit is None:
+            limit = int(float(get("MEMORY_BUDGET.FRACTION", 0.6)) * available_memory())
+        spill = get("MEMORY_BUDGET.SPILL_DIR", "spill/")
+        return cls(
+            limit_bytes=int(limit),
+            working_set_factor=max(1.0, float(get("MEMORY_BUDGET.WORKING_SET_FACTOR", 3.0))),
+            chunk_bytes=parse_bytes(get("MEMORY_BUDGET.CHUNK_BYTES", "256MB")) or (256 << 20),
+            spill_dir=str(Path(get("PATHS.ARTIFACTS", "resources/artifacts/")) / spill) if spill else None,
+            force_mode=str(get("MEMORY_BUDGET.MODE", "auto")).lower(),
+            keep_spill=bool(get("MEMORY_BUDGET.KEEP_SPILL", False)),
+        )
+
+    def fits(self, nbytes: int) -> bool:
+        return nbytes * self.working_set_factor <= self.limit_bytes
+
+    @traced("out_of_core.plan")
+    def plan(self, source: ChunkSource) -> ExecutionPlan:
+        est, n_rows = estimate_size(source)
+        bpr = est / n_rows if n_rows else float(est or 1)
+        mode = self.force_mode if self.force_mode in ("in_memory", "chunked") else (
+            "in_memory" if self.fits(est) else "chunked")
+        chunk_rows = max(1_000, int(self.chunk_bytes / max(bpr * self.working_set_factor, 1.0)))
+        if n_rows is not None and mode == "in_memory":
+            chunk_rows = max(n_rows, 1)
+        plan = ExecutionPlan(mode, int(est), n_rows, float(bpr), int(chunk_rows), self.limit_bytes)
+        print(f"🧠 Memory budget {self.limit_bytes / 2**30:.1f} GiB | source ≈ {est / 2**30:.2f} GiB"
+              f" x{self.working_set_factor:g} → {mode}" + (f" ({chunk_rows:,} rows/chunk)" if mode == "chunked" else ""))
+        return plan
+
+    def duckdb_settings(self) -> Dict[str, str]:
+        """memory_limit / temp_directory for DuckDB passes that run under this budget."""
+        out = {"memory_limit": f"{max(self.limit_bytes >> 20, 64)}MB", "preserve_insertion_order": "false"}
+        if self.spill_dir:
+            out["temp_directory"] = str(Path(self.spill_dir) / "duckdb")
+        return out
+
+    def configure_duckdb(self, con: Any) -> Any:
+        for k, v in self.duckdb_settings().items():
+            con.execute(f"SET {k} = '{v}'")
+        return con
+
+
+def frame_bytes(df: pd.DataFrame, sample_rows: int = 2_000) -> int:
+    """
+    In-memory size of a frame with object columns priced from a row sample
+    (`memory_usage(deep=True)` on the whole frame is itself O(n) Python work).
+    """
+    shallow = df.memory_usage(index=False, deep=False)
+    obj = [c for c in df.columns if df[c].dtype == object]
+    if not obj or len(df) == 0:
+        return int(shallow.sum())
+    head = df[obj].iloc[: sample_rows] if len(df) <= sample_rows else df[obj].sample(sample_rows, random_state=0)
+    per_row = head.memory_usage(index=False, deep=True).sum() / len(head)
+    return int(shallow.drop(labels=obj).sum() + per_row * len(df))
+
+
+def _is_ipc(p: Path) -> bool:
+    return p.suffix.lower() in _IPC_SUFFIXES
+
+
+def _parquet_files(p: Path) -> List[Path]:
+    return sorted(p.rglob("*.parquet")) if p.is_dir() else [p]
+
+
+def estimate_size(source: ChunkSource) -> Tuple[int, Optional[int]]:
+    """(estimated in-memory bytes, n_rows or None) without loading the data."""
+    if isinstance(source, pd.DataFrame):
+        return frame_bytes(source), len(source)
+    if isinstance(source, SpilledTable):
+        return source.nbytes, source.n_rows
+    p = Path(source)
+    if p.is_dir() or p.suffix.lower() in _PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+
+        files = _parquet_files(p)
+        rows = sum(pq.ParquetFile(f).metadata.num_rows for f in files)
+        # price a row from the first row group as pandas would hold it (footer sizes
+        # are encoded sizes: dictionary-encoded strings look far smaller than they are)
+        first = next((f for f in files if pq.ParquetFile(f).metadata.num_row_groups), None)
+        if first is None or rows == 0:
+            return 0, rows
+        head = pq.ParquetFile(first).read_row_group(0).to_pandas()
+        return int(frame_bytes(head) / max(len(head), 1) * rows), rows
+    if _is_ipc(p):
+        t = SpilledTable(p)
+        return t.nbytes, t.n_rows
+    size = p.stat().st_size
+    try:                                        # CSV: price a small head sample, scale by file size
+        head = pd.read_csv(p, nrows=10_000)
+        if len(head):
+            with open(p, "rb") as fh:
+                sample_bytes = sum(len(fh.readline()) for _ in range(len(head) + 1))
+            ratio = frame_bytes(head) / max(sample_bytes, 1)
+            return int(size * max(ratio, 1.0)), None
+    except (OSError, ValueError):
+        pass
+    return int(size * _CSV_INFLATION), None
+
+
+# ---------------------------------------------------------------------------
+# Chunk streams
+# ---------------------------------------------------------------------------
+def iter_chunks(source: ChunkSource, chunk_rows: int, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Stream `source` as pandas chunks of ≤ chunk_rows rows (one resident at a time)."""
+    cols = list(columns) if columns is not None else None
+    chunk_rows = max(1, int(chunk_rows))
+    if isinstance(source, pd.DataFrame):
+        df = source if cols is None else source[cols]
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+        return
+    if isinstance(source, SpilledTable):
+        yield from source.iter_chunks(chunk_rows, cols)
+        return
+    p = Path(source)
+    if _is_ipc(p):
+        yield from SpilledTable(p).iter_chunks(chunk_rows, cols)
+        return
+    if p.is_dir() or p.suffix.lower() in _PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+
+        # file by file, no fragment readahead: at most one decoded row group is resident
+        for f in _parquet_files(p):
+            for batch in pq.ParquetFile(f).iter_batches(batch_size=chunk_rows, columns=cols):
+                if batch.num_rows:
+                    yield batch.to_pandas()
+        return
+    yield from pd.read_csv(p, usecols=cols, chunksize=chunk_rows)
+
+
+# ---------------------------------------------------------------------------
+# Spill
+# ---------------------------------------------------------------------------
+class SpilledTable:
+    """An Arrow IPC file on disk (whole reads memory-mapped, chunk reads streamed)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._meta: Optional[Tuple[int, int, Any]] = None
+
+    def _reader(self, mapped: bool = True):
+        import pyarrow as pa
+
+        src = pa.memory_map(str(self.path), "r") if mapped else pa.OSFile(str(self.path), "rb")
+        return pa.ipc.open_file(src)
+
+    def _load_meta(self) -> Tuple[int, int, Any]:
+        if self._meta is None:
+            r = self._reader()
+            n = nb = 0
+            for i in range(r.num_record_batches):
+                b = r.get_batch(i)
+                n += b.num_rows
+                nb += b.nbytes
+            self._meta = (n, nb, r.schema)
+        return self._meta
+
+    @property
+    def n_rows(self) -> int:
+        return self._load_meta()[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self._load_meta()[1]
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._load_meta()[2].names)
+
+    def to_arrow(self, columns: Optional[Sequence[str]] = None):
+        t = self._reader().read_all()
+        return t.select(list(columns)) if columns is not None else t
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Whole table (or a column subset) → pandas; numeric buffers stay mapped until converted."""
+        return self.to_arrow(columns).to_pandas()
+
+    def iter_chunks(self, chunk_rows: int, columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+        """Batch-by-batch reads (not mapped): only the current batch is resident."""
+        r = self._reader(mapped=False)
+        cols = list(columns) if columns is not None else None
+        for i in range(r.num_record_batches):
+            b = r.get_batch(i)
+            if cols is not None:
+                b = b.select(cols)
+            for off in range(0, b.num_rows, max(1, int(chunk_rows))):
+                yield b.slice(off, chunk_rows).to_pandas()
+
+    def dataset(self):
+        """pyarrow dataset over the file (DuckDB can scan it lazily via `con.register`)."""
+        import pyarrow.dataset as ds
+
+        return ds.dataset(str(self.path), format="ipc")
+
+
+class SpillStore:
+    """
+    Per-run scratch directory of Arrow IPC files.
+
+    Usage:
+        with SpillStore.for_budget(budget) as spill:
+            clean = spill.map(raw_path, clean_chunk, "clean", chunk_rows=plan.chunk_rows)
+            for chunk in clean.iter_chunks(plan.chunk_rows, cols): ...
+    """
+
+    def __init__(self, root: Union[str, Path], *, keep: bool = False):
+        self.root = Path(root) / f"run_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self.keep = keep
+        self.tables: Dict[str, SpilledTable] = {}
+
+    @classmethod
+    def for_budget(cls, budget: MemoryBudget) -> "SpillStore":
+        return cls(budget.spill_dir or Path.cwd() / "spill", keep=budget.keep_spill)
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self.keep:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    @traced("out_of_core.spill")
+    def write(self, name: str, chunks: Iterable[pd.DataFrame]) -> SpilledTable:
+        """
+        Stream `chunks` into `<root>/<name>.arrow`. The first chunk sets the
+        schema; a later chunk whose types disagree promotes it (null → any,
+        int → float, ...; columns with no common type, e.g. an all-NaN float
+        chunk followed by strings, become string) and the batches already
+        written are rewritten once under the promoted schema. New columns are
+        appended (null in earlier rows).
+        """
+        import pyarrow as pa
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / f"{name}.arrow"
+        tmp = path.with_suffix(".tmp.arrow")
+        writer = schema = None
+        n = 0
+        try:
+            with span("out_of_core.spill.write", table=name) as sp:
+                for df in chunks:
+                    if df is None:
+                        continue
+                    t = pa.Table.from_pandas(df, preserve_index=False)
+                    if writer is None:
+                        schema = t.schema
+                        writer = pa.ipc.new_file(str(tmp), schema)
+                    elif not t.schema.equals(schema, check_metadata=False):
+                        promoted = _promote_schema(schema, t.schema)
+                        if not promoted.equals(schema, check_metadata=False):
+                            writer.close()
+                            old, schema = tmp, promoted
+                            tmp = path.with_suffix(f".tmp{uuid.uuid4().hex[:6]}.arrow")
+                            writer = _rewrite_ipc(old, tmp, schema)
+                            old.unlink()
+                        t = _conform(t, schema)
+                    for b in t.to_batches():
+                        writer.write_batch(b)
+                    n += t.num_rows
+                if writer is None:
+                    writer = pa.ipc.new_file(str(tmp), pa.schema([]))
+                writer.close()
+                sp.set(rows_out=n)
+        except BaseException:
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            for f in self.root.glob(f"{name}.tmp*.arrow"):
+                f.unlink(missing_ok=True)
+            raise
+        os.replace(tmp, path)
+        self.tables[name] = SpilledTable(path)
+        return self.tables[name]
+
+    def map(self, source: ChunkSource, fn: Callable[[pd.DataFrame], pd.DataFrame], name: str, *,
+            chunk_rows: int, columns: Optional[Sequence[str]] = None) -> SpilledTable:
+        """Apply a row-local transform chunk by chunk and spill its output."""
+        return self.write(name, (fn(c) for c in iter_chunks(source, chunk_rows, columns)))
+
+
+def _promote_schema(schema: Any, other: Any) -> Any:
+    """Field-wise permissive promotion of `schema` with `other`; string where no type fits both."""
+    import pyarrow as pa
+
+    fields = []
+    for f in schema:
+        i = other.get_field_index(f.name)
+        g = other.field(i) if i >= 0 else None
+        if g is None or g.type == f.type:
+            fields.append(f)
+            continue
+        try:
+            pair = [pa.schema([f]), pa.schema([g])]
+            merged = pa.unify_schemas(pair, promote_options="permissive")
+            fields.append(merged.field(0))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            fields.append(pa.field(f.name, pa.string()))
+    fields += [g for g in other if schema.get_field_index(g.name) < 0]
+    # pandas metadata of a retyped column would make to_pandas restore its old dtype
+    changed = {f.name for f, g in zip(schema, fields, strict=False) if f.type != g.type}
+    meta = dict(schema.metadata or {})
+    if changed and b"pandas" in meta:
+        pd_meta = json.loads(meta[b"pandas"])
+        pd_meta["columns"] = [c for c in pd_meta.get("columns", []) if c.get("name") not in changed]
+        meta[b"pandas"] = json.dumps(pd_meta).encode()
+    return pa.schema(fields, metadata=meta or None)
+
+
+def _conform(t: Any, schema: Any) -> Any:
+    """`t` in `schema`'s column order and types; columns it lacks are all-null."""
+    import pyarrow as pa
+
+    cols = [t.column(f.name).cast(f.type) if t.schema.get_field_index(f.name) >= 0
+            else pa.nulls(t.num_rows, f.type) for f in schema]
+    return pa.Table.from_arrays(cols, schema=schema)
+
+
+def _rewrite_ipc(src: Path, dst: Path, schema: Any) -> Any:
+    """Copy `src`'s batches into a new IPC file at `dst` under `schema`; returns its open writer."""
+    import pyarrow as pa
+
+    writer = pa.ipc.new_file(str(dst), schema)
+    with pa.memory_map(str(src)) as f:
+        reader = pa.ipc.open_file(f)
+        for i in range(reader.num_record_batches):
+            for b in _conform(pa.Table.from_batches([reader.get_batch(i)]), schema).to_batches():
+                writer.write_batch(b)
+    return writer
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+def materialize(source: ChunkSource, plan: ExecutionPlan, columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+    """The whole source as one frame when the plan allows it, else None (stream with `iter_chunks`)."""
+    if not plan.in_memory:
+        return None
+    if isinstance(source, pd.DataFrame):
+        return source if columns is None else source[list(columns)]
+    if isinstance(source, SpilledTable):
+        return source.to_pandas(columns)
+    p = Path(source)
+    if _is_ipc(p):
+        return SpilledTable(p).to_pandas(columns)
+    if p.is_dir() or p.suffix.lower() in _PARQUET_SUFFIXES:
+        return pd.read_parquet(p, columns=list(columns) if columns is not None else None)
+    return pd.read_csv(p, usecols=list(columns) if columns is not None else None)
@@ -0,0 +1,1170 @@
+# src/dq_engine/partitioned.py
+"""
+Partitioned parallel execution: split a dataset into partitions, compute
+mergeable partial states per partition in a process pool, combine them.
+
+- Partitioning:
+  - `by="key"` hashes the KEYS.PRIMARY_KEYS columns (keys.hash_rows) into
+    `n_partitions` buckets. Every copy of a key lands in the same bucket, so
+    duplicate detection is partition-local and exact (detail rows included).
+    A frame is sharded in the parent. A Parquet dataset is shuffled: map
+    tasks read row groups and write one Arrow IPC file per bucket, then each
+    reduce task reads its bucket.
+  - `by="rows"` uses contiguous row ranges: slices of a frame, or row-group
+    ranges of a Parquet file / directory (read in place, no shuffle).
+    Duplicates are then tracked as (key hash, row hash) pairs across
+    partitions, so counts stay exact but the detail rows are hash-only.
+  - Frame partitions are spilled to Arrow IPC (out_of_core.SpillStore) and
+    memory-mapped by the workers instead of being pickled to them.
+- Partial states are plain dataclasses of numpy arrays / pandas objects:
+  - ColumnMoments: counts, min / max, Chan-merged mean and M2;
+  - HistogramState: fixed edges, additive counts;
+  - DistinctState: exact hash sets up to a limit, then HyperLogLog;
+  - FrequencyState: value counts;
+  - RuleCountState: LOGIC_RULES violation counts;
+  - DuplicateState: key audit counts / candidates.
+  Each has `merge(other)` (associative and commutative; refuses states with a
+  different signature) and pickles cleanly, so the same reduction can run as
+  a tree across nodes (Dask / Ray / any transport that ships pickles).
+- Two pool rounds. Round 1 computes everything that needs no global input,
+  plus the global min / max. Round 2 computes fine histograms on the merged
+  bounds; the profile's quantiles, MAD and the N_BINS histogram come from
+  them, so those are marked approximate (error ≤ one fine bin width). Drift
+  histograms on caller-supplied edges (e.g. a baseline's) are counted in the
+  same round.
+- Results reuse the profiling schemas (NUMERIC_PROFILE_COLUMNS /
+  CATEGORICAL_PROFILE_COLUMNS / HISTOGRAM_COLUMNS) and keys.ID_INTEGRITY_COLUMNS.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+from dq_engine.engines.keys import (
+    ID_INTEGRITY_COLUMNS,
+    hash_rows,
+    key_severity,
+    key_uniqueness,
+    primary_key_defs,
+)
+from dq_engine.engines.profiling import (
+    _QUANTILES,
+    HISTOGRAM_COLUMNS,
+    ProfileResult,
+    ProfilingCfg,
+    _categorical_frame,
+    _numeric_frame,
+)
+from dq_engine.out_of_core import SpilledTable, SpillStore, _parquet_files
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+NULL_COUNT_COLUMNS = ["column", "dtype", "n_rows", "n_null", "null_pct"]
+RULE_COUNT_COLUMNS = [
+    "rule_id",
+    "rule_type",  # MUTUAL_EXCLUSION | DEPENDENCIES | RATIO_CHECKS
+    "n_rows",
+    "n_applicable",  # rows the rule applies to (IF true / both sides non-null / all rows)
+    "n_violations",
+    "pct_violations",  # n_violations / n_applicable
+    "mean_rel_error",  # RATIO_CHECKS only
+    "max_rel_error",
+    "severity",
+    "notes",
+]
+PARTITION_COLUMNS = ["partition", "n_rows", "seconds"]
+
+STATE_VERSION = 1
+_RULE_TYPES = ("MUTUAL_EXCLUSION", "DEPENDENCIES", "RATIO_CHECKS")
+
+
+@dataclass(frozen=True)
+class PartitionCfg:
+    n_jobs: int = -1
+    n_partitions: int = 0  # 0 → one per worker
+    by: str = "auto"  # auto | key | rows
+    key: str | None = None  # KEYS.PRIMARY_KEYS entry to shard on (default: the first)
+    fine_bins: int = 2048  # round-2 histogram resolution (quantiles / MAD)
+    exact_distinct_max: int = 1_000_000  # per column; larger distinct sets switch to HyperLogLog
+    hll_precision: int = 14  # 2**p registers, ~1.04 / sqrt(2**p) relative error
+    spill_dir: str | None = None
+    keep_spill: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> PartitionCfg:
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        by = str(get("PARTITIONED.BY", "auto")).lower()
+        if by not in ("auto", "key", "rows"):
+            raise ValueError(f"PARTITIONED.BY must be auto, key or rows, got {by!r}")
+        spill = get("PARTITIONED.SPILL_DIR", None) or get("MEMORY_BUDGET.SPILL_DIR", None)
+        if spill and not Path(spill).is_absolute() and get("PATHS.ARTIFACTS", None):
+            spill = str(Path(get("PATHS.ARTIFACTS")) / spill)
+        return cls(
+            n_jobs=int(get("PARTITIONED.N_JOBS", -1)),
+            n_partitions=int(get("PARTITIONED.N_PARTITIONS", 0) or 0),
+            by=by,
+            key=get("PARTITIONED.KEY", None),
+            fine_bins=max(16, int(get("PARTITIONED.FINE_BINS", 2048))),
+            exact_distinct_max=int(get("PARTITIONED.EXACT_DISTINCT_MAX", 1_000_000)),
+            hll_precision=min(18, max(4, int(get("PARTITIONED.HLL_PRECISION", 14)))),
+            spill_dir=spill,
+            keep_spill=bool(get("MEMORY_BUDGET.KEEP_SPILL", False)),
+        )
+
+    @property
+    def workers(self) -> int:
+        return self.n_jobs if self.n_jobs > 0 else max(1, (os.cpu_count() or 1) + 1 + self.n_jobs)
+
+
+# ---------------------------------------------------------------------------
+# Merge protocol
+# ---------------------------------------------------------------------------
+class StateMismatch(ValueError):
+    """Two partial states describe different columns / edges / rules and cannot be merged."""
+
+
+def _check(a: Any, b: Any, what: str) -> None:
+    if a != b:
+        raise StateMismatch(f"Cannot merge {what}: {a!r} != {b!r}")
+
+
+@dataclass
+class ColumnMoments:
+    """
+    Per numeric column: missing / non-finite / sign counts, min / max and
+    (n, mean, M2) of the finite values.
+    """
+
+    columns: tuple[str, ...]
+    n_rows: int
+    cnt: np.ndarray  # non-null (NaN counts as null, as in profile_frame)
+    pinf: np.ndarray
+    ninf: np.ndarray
+    zero: np.ndarray
+    neg: np.ndarray
+    pos: np.ndarray
+    fin: np.ndarray
+    vmin: np.ndarray
+    vmax: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def of(cls, X: np.ndarray, columns: Sequence[str]) -> ColumnMoments:
+        fin = np.isfinite(X)
+        F = np.where(fin, X, 0.0)
+        n = fin.sum(axis=0)
+        mean = np.divide(F.sum(axis=0), n, out=np.zeros(X.shape[1]), where=n > 0)
+        m2 = (np.where(fin, X - mean, 0.0) ** 2).sum(axis=0)
+        return cls(
+            tuple(columns),
+            X.shape[0],
+            cnt=(~np.isnan(X)).sum(axis=0),
+            pinf=np.isposinf(X).sum(axis=0),
+            ninf=np.isneginf(X).sum(axis=0),
+            zero=(fin & (X == 0)).sum(axis=0),
+            neg=(fin & (X < 0)).sum(axis=0),
+            pos=(fin & (X > 0)).sum(axis=0),
+            fin=n,
+            vmin=np.where(fin, X, np.inf).min(axis=0, initial=np.inf),
+            vmax=np.where(fin, X, -np.inf).max(axis=0, initial=-np.inf),
+            mean=mean,
+            m2=m2,
+        )
+
+    def merge(self, o: ColumnMoments) -> ColumnMoments:
+        _check(self.columns, o.columns, "moments")
+        n = self.fin + o.fin
+        d = o.mean - self.mean
+        w = np.divide(o.fin, n, out=np.zeros(n.shape), where=n > 0)
+        return ColumnMoments(
+            self.columns,
+            self.n_rows + o.n_rows,
+            *(
+                getattr(self, k) + getattr(o, k)
+                for k in ("cnt", "pinf", "ninf", "zero", "neg", "pos")
+            ),
+            fin=n,
+            vmin=np.minimum(self.vmin, o.vmin),
+            vmax=np.maximum(self.vmax, o.vmax),
+            mean=self.mean + d * w,
+            m2=self.m2 + o.m2 + d**2 * self.fin * w,
+        )
+
+    @property
+    def std(self) -> np.ndarray:
+        return (
+            np.divide(self.m2, self.fin - 1, out=np.full(self.m2.shape, np.nan), where=self.fin > 1)
+            ** 0.5
+        )
+
+
+@dataclass
+class HistogramState:
+    """Equal-width or explicit-edge bin counts per column; edges are part of the signature."""
+
+    columns: tuple[str, ...]
+    edges: tuple[tuple[float, ...], ...]
+    counts: np.ndarray  # (n_columns, n_bins) int64
+
+    @classmethod
+    def of(
+        cls, X: np.ndarray, columns: Sequence[str], edges: Sequence[Sequence[float]]
+    ) -> HistogramState:
+        edges = tuple(tuple(float(x) for x in e) for e in edges)
+        nb = max((len(e) - 1 for e in edges), default=0)
+        counts = np.zeros((len(edges), nb), dtype=np.int64)
+        for i, e in enumerate(edges):
+            v = X[:, i]
+            v = v[np.isfinite(v)]
+            counts[i, : len(e) - 1] = bin_counts(v, np.asarray(e))
+        return cls(tuple(columns), edges, counts)
+
+    def merge(self, o: HistogramState) -> HistogramState:
+        _check((self.columns, self.edges), (o.columns, o.edges), "histograms")
+        return HistogramState(self.columns, self.edges, self.counts + o.counts)
+
+    def to_frame(self) -> pd.DataFrame:
+        rows = [
+            {
+                "column": c,
+                "bin": b,
+                "bin_left": e[b],
+                "bin_right": e[b + 1],
+                "count": int(self.counts[i, b]),
+            }
+            for i, (c, e) in enumerate(zip(self.columns, self.edges, strict=True))
+            for b in range(len(e) - 1)
+        ]
+        return pd.DataFrame(rows, columns=HISTOGRAM_COLUMNS)
+
+
+def bin_counts(v: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Counts per [e_i, e_i+1) bin (last bin closed); values outside the edges go to end bins."""
+    nb = len(edges) - 1
+    if nb <= 0 or v.size == 0:
+        return np.zeros(max(nb, 0), dtype=np.int64)
+    lo, hi = edges[0], edges[-1]
+    if hi > lo and np.allclose(np.diff(edges), (hi - lo) / nb):
+        b = np.floor((v - lo) / (hi - lo) * nb)  # same rule as profiling's SQL / numpy passes
+    else:
+        b = np.searchsorted(edges, v, side="right") - 1.0
+    return np.bincount(np.clip(b, 0, nb - 1).astype(np.int64), minlength=nb)
+
+
+def _splitmix(h: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        z = h.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+@dataclass
+class DistinctState:
+    """Distinct count of one column: sorted unique hashes while small, then HyperLogLog."""
+
+    precision: int
+    limit: int
+    hashes: np.ndarray | None = None  # exact mode
+    registers: np.ndarray | None = None  # HLL mode (uint8, 2**precision)
+
+    @classmethod
+    def of(cls, h: np.ndarray, precision: int, limit: int) -> DistinctState:
+        return cls(precision, limit, hashes=np.unique(h))._compact()
+
+    def _compact(self) -> DistinctState:
+        if self.hashes is not None and self.hashes.size > self.limit:
+            self.registers = self._hll(self.hashes)
+            self.hashes = None
+        return self
+
+    def _hll(self, h: np.ndarray) -> np.ndarray:
+        p = self.precision
+        z = _splitmix(h)
+        idx = (z >> np.uint64(64 - p)).astype(np.int64)
+        w = (z << np.uint64(p)) | np.uint64(1 << (p - 1))  # sentinel bit caps the run length
+        # leading zeros + 1 via the float exponent of w (exact for the top bit)
+        rank = (64 - np.floor(np.log2(w.astype(np.float64))).astype(np.int64)).astype(np.uint8)
+        reg = np.zeros(1 << p, dtype=np.uint8)
+        np.maximum.at(reg, idx, rank)
+        return reg
+
+    def merge(self, o: DistinctState) -> DistinctState:
+        _check((self.precision, self.limit), (o.precision, o.limit), "distinct states")
+        if self.hashes is not None and o.hashes is not None:
+            return DistinctState(
+                self.precision, self.limit, hashes=np.union1d(self.hashes, o.hashes)
+            )._compact()
+        a = self.registers if self.registers is not None else self._hll(self.hashes)
+        b = o.registers if o.registers is not None else self._hll(o.hashes)
+        return DistinctState(self.precision, self.limit, registers=np.maximum(a, b))
+
+    @property
+    def exact(self) -> bool:
+        return self.hashes is not None
+
+    def estimate(self) -> int:
+        if self.hashes is not None:
+            return int(self.hashes.size)
+        m = float(self.registers.size)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        est = alpha * m * m / float(np.sum(2.0 ** -self.registers.astype(np.float64)))
+        zeros = int((self.registers == 0).sum())
+        if est <= 2.5 * m and zeros:
+            est = m * np.log(m / zeros)  # linear counting for the small range
+        return int(round(est))
+
+
+@dataclass
+class FrequencyState:
+    """Per categorical column: non-null count and value counts (as strings, like profile_frame)."""
+
+    columns: tuple[str, ...]
+    n_rows: int
+    non_null: np.ndarray
+    counts: tuple[pd.Series, ...]
+
+    @classmethod
+    def of(cls, df: pd.DataFrame, columns: Sequence[str]) -> FrequencyState:
+        nn, vcs = [], []
+        for c in columns:
+            s = df[c]
+            nn.append(int(s.notna().sum()))
+            vcs.append(s.dropna().astype(str).value_counts(sort=False).astype(np.int64))
+        return cls(tuple(columns), len(df), np.asarray(nn, dtype=np.int64), tuple(vcs))
+
+    def merge(self, o: FrequencyState) -> FrequencyState:
+        _check(self.columns, o.columns, "frequencies")
+        return FrequencyState(
+            self.columns,
+            self.n_rows + o.n_rows,
+            self.non_null + o.non_null,
+            tuple(
+                a.add(b, fill_value=0).astype(np.int64)
+                for a, b in zip(self.counts, o.counts, strict=True)
+            ),
+        )
+
+
+@dataclass
+class RuleCountState:
+    """LOGIC_RULES counts; ratio rules also carry the rel-error sum and max."""
+
+    rules: tuple[tuple[str, str], ...]  # (rule_type, rule_id)
+    n_rows: int
+    applicable: np.ndarray
+    violations: np.ndarray
+    rel_sum: np.ndarray
+    rel_max: np.ndarray
+    errors: tuple[str, ...]
+
+    def merge(self, o: RuleCountState) -> RuleCountState:
+        _check(self.rules, o.rules, "rule counts")
+        return RuleCountState(
+            self.rules,
+            self.n_rows + o.n_rows,
+            self.applicable + o.applicable,
+            self.violations + o.violations,
+            self.rel_sum + o.rel_sum,
+            np.fmax(self.rel_max, o.rel_max),
+            tuple(a or b for a, b in zip(self.errors, o.errors, strict=True)),
+        )
+
+
+@dataclass
+class DuplicateState:
+    """
+    One primary key. `colocated` (key-hash partitions): exact key_uniqueness metrics per
+    partition, which add up. Otherwise the unique (key hash, row hash) pairs with counts,
+    regrouped on merge.
+    """
+
+    key_name: str
+    key_cols: tuple[str, ...]
+    colocated: bool
+    n_rows: int
+    n_null: int
+    n_dup: int = 0
+    n_conflicting: int = 0
+    detail: pd.DataFrame | None = None
+    pairs: np.ndarray | None = None  # (k, 2) uint64 sorted unique (key hash, row hash)
+    pair_counts: np.ndarray | None = None
+
+    def merge(self, o: DuplicateState) -> DuplicateState:
+        _check(
+            (self.key_name, self.key_cols, self.colocated),
+            (o.key_name, o.key_cols, o.colocated),
+            "duplicate states",
+        )
+        if self.colocated:
+            det = [d for d in (self.detail, o.detail) if d is not None and not d.empty]
+            return DuplicateState(
+                self.key_name,
+                self.key_cols,
+                True,
+                self.n_rows + o.n_rows,
+                self.n_null + o.n_null,
+                self.n_dup + o.n_dup,
+                self.n_conflicting + o.n_conflicting,
+                pd.concat(det, ignore_index=True) if det else self.detail,
+            )
+        pairs, counts = _group_pairs(
+            np.concatenate([self.pairs, o.pairs]), np.concatenate([self.pair_counts, o.pair_counts])
+        )
+        return DuplicateState(
+            self.key_name,
+            self.key_cols,
+            False,
+            self.n_rows + o.n_rows,
+            self.n_null + o.n_null,
+            pairs=pairs,
+            pair_counts=counts,
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        if self.colocated:
+            return {
+                "n_rows": self.n_rows,
+                "n_null_key_rows": self.n_null,
+                "n_duplicate_keys": self.n_dup,
+                "n_conflicting_key_groups": self.n_conflicting,
+            }
+        kh = (
+            self.pairs[:, 0]
+            if self.pairs is not None and self.pairs.size
+            else np.array([], dtype=np.uint64)
+        )
+        brk = (
+            np.flatnonzero(np.r_[True, kh[1:] != kh[:-1]])
+            if kh.size
+            else np.array([], dtype=np.int64)
+        )
+        per_key = (
+            np.add.reduceat(self.pair_counts, brk) if kh.size else np.array([], dtype=np.int64)
+        )
+        variants = np.diff(np.r_[brk, kh.size]) if kh.size else np.array([], dtype=np.int64)
+        return {
+            "n_rows": self.n_rows,
+            "n_null_key_rows": self.n_null,
+            "n_duplicate_keys": int((per_key > 1).sum()),
+            "n_conflicting_key_groups": int(((per_key > 1) & (variants > 1)).sum()),
+        }
+
+
+def _group_pairs(pairs: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    if pairs.size == 0:
+        return pairs.reshape(0, 2), counts
+    uniq, inv = np.unique(pairs, axis=0, return_inverse=True)
+    return uniq, np.bincount(inv.ravel(), weights=counts, minlength=len(uniq)).astype(np.int64)
+
+
+def merge_states(parts: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Fold a list of {name: state} dicts (None = not computed) with each state's `merge`."""
+    out: dict[str, Any] = {}
+    for p in parts:
+        for k, v in p.items():
+            if v is None:
+                continue
+            if k not in out:
+                out[k] = v
+            elif isinstance(v, (list, tuple)):
+                out[k] = [a.merge(b) for a, b in zip(out[k], v, strict=True)]
+            elif isinstance(v, (int, float, np.ndarray)):
+                out[k] = out[k] + v
+            else:
+                out[k] = out[k].merge(v)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Partitions
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class Partition:
+    """What a worker loads: IPC files (frame shards, shuffle buckets) or Parquet row groups."""
+
+    index: int
+    ipc: tuple[str, ...] = ()
+    parquet: tuple[tuple[str, tuple[int, ...]], ...] = ()
+
+    def load(self, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        frames = [SpilledTable(p).to_pandas(columns) for p in self.ipc]
+        if self.parquet:
+            import pyarrow.parquet as pq
+
+            for path, groups in self.parquet:
+                frames.append(
+                    pq.ParquetFile(path).read_row_groups(list(groups), columns=columns).to_pandas()
+                )
+        if not frames:
+            return pd.DataFrame(columns=list(columns or []))
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def _bucket_of(df: pd.DataFrame, key_cols: Sequence[str], n: int) -> np.ndarray:
+    return (_splitmix(hash_rows(df, key_cols)) % np.uint64(n)).astype(np.int64)
+
+
+def _row_groups(paths: Sequence[Path]) -> list[tuple[str, int, int]]:
+    import pyarrow.parquet as pq
+
+    out = []
+    for p in paths:
+        md = pq.ParquetFile(str(p)).metadata
+        out += [(str(p), g, md.row_group(g).num_rows) for g in range(md.num_row_groups)]
+    return out
+
+
+def _split_groups(
+    groups: Sequence[tuple[str, int, int]], n: int
+) -> list[tuple[tuple[str, tuple[int, ...]], ...]]:
+    """Contiguous row-group ranges with roughly n equal row totals."""
+    total = sum(g[2] for g in groups)
+    target = max(1, -(-total // max(1, n)))
+    parts, cur, acc = [], [], 0
+    for g in groups:
+        cur.append(g)
+        acc += g[2]
+        if acc >= target and len(parts) < n - 1:
+            parts.append(cur)
+            cur, acc = [], 0
+    if cur:
+        parts.append(cur)
+    out = []
+    for part in parts:
+        by_file: dict[str, list[int]] = {}
+        for path, g, _ in part:
+            by_file.setdefault(path, []).append(g)
+        out.append(tuple((p, tuple(gs)) for p, gs in by_file.items()))
+    return out
+
+
+def _shuffle_task(
+    part: Partition, key_cols: Sequence[str], n: int, root: str
+) -> list[tuple[int, str]]:
+    """Map side of the key shuffle: one IPC file per non-empty bucket."""
+    import pyarrow as pa
+
+    df = part.load()
+    b = _bucket_of(df, key_cols, n)
+    order = np.argsort(b, kind="stable")
+    bounds = np.searchsorted(b[order], np.arange(n + 1))
+    out = []
+    for k in range(n):
+        if bounds[k + 1] > bounds[k]:
+            path = Path(root) / f"bucket{k:04d}_part{part.index:04d}.arrow"
+            t = pa.Table.from_pandas(
+                df.iloc[order[bounds[k] : bounds[k + 1]]], preserve_index=False
+            )
+            with pa.ipc.new_file(str(path), t.schema) as w:
+                w.write_table(t)
+            out.append((k, str(path)))
+    return out
+
+
+def plan_partitions(
+    source: pd.DataFrame | str | Path,
+    store: SpillStore,
+    cfg: PartitionCfg,
+    key_cols: Sequence[str] | None = None,
+    pool: Callable[..., Iterator[Any]] | None = None,
+) -> tuple[list[Partition], str]:
+    """Split `source` → (partitions, "key" | "rows")."""
+    n = cfg.n_partitions or cfg.workers
+    by = cfg.by if cfg.by != "auto" else ("key" if key_cols else "rows")
+    if by == "key" and not key_cols:
+        raise ValueError("PARTITIONED.BY=key needs KEYS.PRIMARY_KEYS (or key_cols)")
+    store.root.mkdir(parents=True, exist_ok=True)
+
+    if isinstance(source, pd.DataFrame):
+        if by == "key":
+            b = _bucket_of(source, key_cols, n)
+            order = np.argsort(b, kind="stable")
+            bounds = np.searchsorted(b[order], np.arange(n + 1))
+            slices = [order[bounds[k] : bounds[k + 1]] for k in range(n)]
+        else:
+            slices = np.array_split(np.arange(len(source)), n)
+        parts = []
+        with span("partitioned.shard", by=by, partitions=n, rows_in=len(source)):
+            for k, idx in enumerate(slices):
+                if len(idx):
+                    t = store.write(f"part{k:04d}", [source.iloc[idx]])
+                    parts.append(Partition(len(parts), ipc=(str(t.path),)))
+            if not parts:
+                parts.append(
+                    Partition(0, ipc=(str(store.write("part0000", [source.iloc[:0]]).path),))
+                )
+        return parts, by
+
+    p = Path(source)
+    files = _parquet_files(p) if p.is_dir() else [p]
+    if any(f.suffix.lower() not in (".parquet", ".pq") for f in files):
+        raise ValueError(f"Partitioned execution reads DataFrames or Parquet; got {source}")
+    groups = _split_groups(_row_groups(files), n) or [((str(files[0]), ()),)]
+    ranges = [Partition(i, parquet=g) for i, g in enumerate(groups)]
+    if by == "rows":
+        return ranges, by
+
+    with span("partitioned.shuffle", partitions=n, map_tasks=len(ranges)):
+        outs = list(
+            (pool or _serial)(
+                _shuffle_task, [(r, list(key_cols), n, str(store.root)) for r in ranges]
+            )
+        )
+    buckets: dict[int, list[str]] = {}
+    for res in outs:
+        for k, path in res:
+            buckets.setdefault(k, []).append(path)
+    if not buckets:
+        return ranges, by
+    return [Partition(i, ipc=tuple(sorted(buckets[k]))) for i, k in enumerate(sorted(buckets))], by
+
+
+def _serial(fn: Callable[..., Any], args: Sequence[tuple[Any, ...]]) -> Iterator[Any]:
+    for a in args:
+        yield fn(*a)
+
+
+def _loky(n_jobs: int) -> Callable[..., Iterator[Any]]:
+    def run(fn: Callable[..., Any], args: Sequence[tuple[Any, ...]]) -> Iterator[Any]:
+        if n_jobs == 1 or len(args) <= 1:
+            yield from _serial(fn, args)
+            return
+        from joblib import Parallel, delayed
+
+        yield from Parallel(
+            n_jobs=min(n_jobs, len(args)), backend="loky", return_as="generator_unordered"
+        )(delayed(fn)(*a) for a in args)
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Per-partition work
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Spec:
+    numeric: tuple[str, ...]
+    categorical: tuple[str, ...]
+    null_cols: tuple[str, ...]
+    rules: tuple[tuple[str, str, Mapping[str, Any]], ...]
+    keys: tuple[tuple[str, tuple[str, ...]], ...]
+    colocated: bool
+    precision: int
+    limit: int
+
+
+def _numeric_matrix(df: pd.DataFrame, cols: Sequence[str]) -> np.ndarray:
+    X = np.empty((len(df), len(cols)), dtype=np.float64)
+    for i, c in enumerate(cols):
+        X[:, i] = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return X
+
+
+def _truthy(s: Any, n: int) -> np.ndarray:
+    if np.isscalar(s):
+        return np.full(n, bool(s))
+    return pd.Series(s).fillna(False).astype(bool).to_numpy()
+
+
+def rule_counts(
+    df: pd.DataFrame, rules: Sequence[tuple[str, str, Mapping[str, Any]]]
+) -> RuleCountState:
+    """2.5.3 – 2.5.5 counts for one partition (same df.eval semantics as the notebook cells)."""
+    k = len(rules)
+    app, vio = np.zeros(k, dtype=np.int64), np.zeros(k, dtype=np.int64)
+    rel_sum, rel_max = np.zeros(k), np.full(k, np.nan)
+    errors = [""] * k
+    n = len(df)
+    for i, (rtype, _, r) in enumerate(rules):
+        try:
+            if rtype == "MUTUAL_EXCLUSION":
+                expr = r.get("violation_expr", "")
+                if not expr:
+                    errors[i] = "No violation_expr specified"
+                    continue
+                app[i], vio[i] = n, int(_truthy(df.eval(expr), n).sum())
+            elif rtype == "DEPENDENCIES":
+                if_expr, then_expr = r.get("if_expr", r.get("if", "")), r.get(
+                    "then_expr", r.get("then", "")
+                )
+                if not if_expr or not then_expr:
+                    errors[i] = "Missing IF or THEN expression"
+                    continue
+                m_if = _truthy(df.eval(if_expr), n)
+                app[i], vio[i] = int(m_if.sum()), int(
+                    (m_if & ~_truthy(df.eval(then_expr), n)).sum()
+                )
+            else:
+                lhs, rhs_expr = r.get("lhs", ""), r.get("rhs_expr", "")
+                if not lhs or not rhs_expr:
+                    errors[i] = "Missing lhs or rhs_expr"
+                    continue
+                if lhs not in df.columns:
+                    errors[i] = f"lhs column '{lhs}' not in df"
+                    continue
+                a = pd.to_numeric(df[lhs], errors="coerce").to_numpy(
+                    dtype="float64", na_value=np.nan
+                )
+                b = pd.to_numeric(pd.Series(df.eval(rhs_expr)), errors="coerce").to_numpy(
+                    dtype="float64", na_value=np.nan
+                )
+                ok = ~np.isnan(a) & ~np.isnan(b)
+                diff = np.abs(a[ok] - b[ok])
+                rel = diff / (np.abs(b[ok]) + 1e-9)
+                bad = rel > float(r.get("max_rel_error", 0.1))
+                if r.get("max_abs_error") is not None:
+                    bad |= diff > float(r["max_abs_error"])
+                app[i], vio[i] = int(ok.sum()), int(bad.sum())
+                rel_sum[i] = float(rel.sum())
+                rel_max[i] = float(rel.max()) if rel.size else np.nan
+        except Exception as e:
+            errors[i] = f"Evaluation error: {str(e)[:120]}"
+    return RuleCountState(
+        tuple((t, rid) for t, rid, _ in rules), n, app, vio, rel_sum, rel_max, tuple(errors)
+    )
+
+
+def _duplicates(
+    df: pd.DataFrame, name: str, cols: Sequence[str], colocated: bool
+) -> DuplicateState:
+    cols = [c for c in cols if c in df.columns]
+    if colocated:
+        m, det = key_uniqueness(df, cols)
+        return DuplicateState(
+            name,
+            tuple(cols),
+            True,
+            m["n_rows"],
+            m["n_null_key_rows"],
+            m["n_duplicate_keys"],
+            m["n_conflicting_key_groups"],
+            det,
+        )
+    null = df[cols].isna().any(axis=1).to_numpy()
+    sub = df.loc[~null]
+    nonkey = [c for c in df.columns if c not in cols]
+    pairs = np.column_stack(
+        [hash_rows(sub, cols), hash_rows(sub, nonkey) if nonkey else np.zeros(len(sub), np.uint64)]
+    )
+    uniq, counts = _group_pairs(pairs, np.ones(len(sub), dtype=np.int64))
+    return DuplicateState(
+        name, tuple(cols), False, len(df), int(null.sum()), pairs=uniq, pair_counts=counts
+    )
+
+
+def _distinct_hashes(X: np.ndarray, i: int) -> np.ndarray:
+    v = X[:, i]
+    return (v[np.isfinite(v)] + 0.0).view(np.uint64)  # -0.0 → 0.0, then the IEEE bits
+
+
+def _round1(part: Partition, spec: _Spec) -> tuple[dict[str, Any], tuple[int, int, float]]:
+    t0 = time.perf_counter()
+    df = part.load()  # null counts, rules and row hashes need every column
+    X = _numeric_matrix(df, spec.numeric)
+    out: dict[str, Any] = {
+        "moments": ColumnMoments.of(X, spec.numeric),
+        "distinct": [
+            DistinctState.of(_distinct_hashes(X, i), spec.precision, spec.limit)
+            for i in range(len(spec.numeric))
+        ],
+        "frequencies": FrequencyState.of(df, spec.categorical),
+        "nulls": np.asarray([int(df[c].isna().sum()) for c in spec.null_cols], dtype=np.int64),
+        "rules": rule_counts(df, spec.rules) if spec.rules else None,
+        "keys": [_duplicates(df, name, cols, spec.colocated) for name, cols in spec.keys] or None,
+    }
+    return out, (part.index, len(df), time.perf_counter() - t0)
+
+
+def _round2(
+    part: Partition,
+    numeric: tuple[str, ...],
+    fine: Sequence[Sequence[float]],
+    drift_cols: tuple[str, ...],
+    drift: Sequence[Sequence[float]],
+) -> dict[str, Any]:
+    cols = list(dict.fromkeys(list(numeric) + list(drift_cols)))
+    df = part.load(cols)
+    out = {"fine": HistogramState.of(_numeric_matrix(df, numeric), numeric, fine)}
+    if drift_cols:
+        out["drift"] = HistogramState.of(_numeric_matrix(df, drift_cols), drift_cols, drift)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Finalisation
+# ---------------------------------------------------------------------------
+def _hist_quantiles(counts: np.ndarray, edges: np.ndarray, probs: Sequence[float]) -> np.ndarray:
+    """Quantiles by linear interpolation inside the fine bin that holds each rank."""
+    total = counts.sum()
+    if total == 0:
+        return np.full(len(probs), np.nan)
+    cum = np.cumsum(counts)
+    out = []
+    for p in probs:
+        r = p * (total - 1) + 0.5
+        b = int(np.searchsorted(cum, r))
+        prev = cum[b - 1] if b else 0
+        frac = (r - prev) / counts[b] if counts[b] else 0.0
+        out.append(edges[b] + frac * (edges[b + 1] - edges[b]))
+    return np.asarray(out)
+
+
+def _hist_mad(counts: np.ndarray, edges: np.ndarray, median: float) -> float:
+    if counts.sum() == 0 or not np.isfinite(median):
+        return float("nan")
+    centers = (edges[:-1] + edges[1:]) / 2
+    dev = np.abs(centers - median)
+    o = np.argsort(dev, kind="stable")
+    cum = np.cumsum(counts[o])
+    return float(dev[o][int(np.searchsorted(cum, cum[-1] / 2))])
+
+
+def _fine_edges(lo: float, hi: float, nb: int) -> np.ndarray:
+    return (
+        np.linspace(lo, hi, nb + 1)
+        if np.isfinite(lo) and hi > lo
+        else np.full(2, lo if np.isfinite(lo) else 0.0)
+    )
+
+
+def _profile(
+    merged: dict[str, Any], spec: _Spec, cfg: ProfilingCfg, dtypes: dict[str, str]
+) -> ProfileResult:
+    mo: ColumnMoments = merged["moments"]
+    fine: HistogramState | None = merged.get("fine")
+    n = mo.n_rows
+    agg: dict[str, Any] = {"n_rows": n}
+    hist_rows: list[dict[str, Any]] = []
+    approx = False
+    std = mo.std
+    for i, _ in enumerate(spec.numeric):
+        x = f"n{i}"
+        d: DistinctState = merged["distinct"][i]
+        approx |= not d.exact
+        agg.update(
+            {
+                f"{x}_cnt": int(mo.cnt[i]),
+                f"{x}_nan": 0,
+                f"{x}_pinf": int(mo.pinf[i]),
+                f"{x}_ninf": int(mo.ninf[i]),
+                f"{x}_fin": int(mo.fin[i]),
+                f"{x}_nuniq": d.estimate(),
+                f"{x}_zero": int(mo.zero[i]),
+                f"{x}_neg": int(mo.neg[i]),
+                f"{x}_pos": int(mo.pos[i]),
+            }
+        )
+        if mo.fin[i] == 0:
+            for k in ("min", "max", "mean", "std", *(name for name, _ in _QUANTILES)):
+                agg[f"{x}_{k}"] = float("nan")
+            continue
+        lo, hi = float(mo.vmin[i]), float(mo.vmax[i])
+        e = np.asarray(fine.edges[i])
+        cnt = fine.counts[i, : len(e) - 1]
+        if hi > lo:
+            qs = _hist_quantiles(cnt, e, [p for _, p in _QUANTILES])
+            approx = True
+        else:
+            qs = np.full(len(_QUANTILES), lo)
+        agg.update(
+            {
+                f"{x}_min": lo,
+                f"{x}_max": hi,
+                f"{x}_mean": float(mo.mean[i]),
+                f"{x}_std": float(std[i]),
+                **{f"{x}_{name}": float(q) for (name, _), q in zip(_QUANTILES, qs, strict=True)},
+            }
+        )
+        # the fine grid is an exact refinement of the N_BINS grid, so the coarse counts are exact
+        nb = cfg.n_bins
+        coarse = (
+            cnt.reshape(nb, -1).sum(axis=1)
+            if hi > lo and cnt.size % nb == 0
+            else np.r_[cnt.sum(), np.zeros(nb - 1, np.int64)]
+        )
+        hist_rows += [
+            {"col": x, "bin": b, "n": int(k), "mad": np.nan, "g": 0}
+            for b, k in enumerate(coarse)
+            if k
+        ]
+        mad = _hist_mad(cnt, e, agg[f"{x}_median"]) if hi > lo else 0.0
+        hist_rows.append({"col": x, "bin": np.nan, "n": int(mo.fin[i]), "mad": mad, "g": 1})
+
+    fr: FrequencyState = merged["frequencies"]
+    top_rows: list[dict[str, Any]] = []
+    for j, _ in enumerate(spec.categorical):
+        agg[f"k{j}_cnt"] = int(fr.non_null[j])
+        vc = fr.counts[j]
+        if vc.empty:
+            continue
+        vc = vc.sort_index(kind="stable").sort_values(ascending=False, kind="stable")
+        p = vc.to_numpy(dtype="float64") / vc.sum()
+        ent = float(-(p * np.log2(p)).sum())
+        n_rare = int((100.0 * p < cfg.rare_pct).sum())
+        for rk, (val, k) in enumerate(vc.iloc[: cfg.top_k].items(), start=1):
+            top_rows.append(
+                {
+                    "col": f"k{j}",
+                    "val": val,
+                    "n": int(k),
+                    "rk": rk,
+                    "n_unique": int(vc.size),
+                    "entropy": ent,
+                    "n_rare": n_rare,
+                }
+            )
+
+    agg_s = pd.Series(agg, dtype="object")
+    hist = pd.DataFrame(hist_rows, columns=["col", "bin", "n", "mad", "g"])
+    top = pd.DataFrame(top_rows, columns=["col", "val", "n", "rk", "n_unique", "entropy", "n_rare"])
+    num_df, hist_df = _numeric_frame(agg_s, spec.numeric, dtypes, hist, cfg, "partitioned", approx)
+    cat_df, top_df = _categorical_frame(agg_s, spec.categorical, dtypes, top, cfg, "partitioned")
+    return ProfileResult(num_df, cat_df, top_df, hist_df, "partitioned", n, approx)
+
+
+def _rules_frame(st: RuleCountState | None) -> pd.DataFrame:
+    if st is None:
+        return pd.DataFrame(columns=RULE_COUNT_COLUMNS)
+    rows = []
+    for i, (rtype, rid) in enumerate(st.rules):
+        a, v = int(st.applicable[i]), int(st.violations[i])
+        pct = v / a if a else 0.0
+        if st.errors[i]:
+            sev = "warn"
+        elif rtype == "DEPENDENCIES" and a == 0:
+            sev = "info"
+        else:
+            sev = "ok" if v == 0 else "warn" if pct <= 0.01 else "fail"
+        rows.append(
+            {
+                "rule_id": rid,
+                "rule_type": rtype,
+                "n_rows": st.n_rows,
+                "n_applicable": a,
+                "n_violations": v,
+                "pct_violations": pct,
+                "mean_rel_error": st.rel_sum[i] / a if rtype == "RATIO_CHECKS" and a else np.nan,
+                "max_rel_error": st.rel_max[i] if rtype == "RATIO_CHECKS" else np.nan,
+                "severity": sev,
+                "notes": st.errors[i],
+            }
+        )
+    return pd.DataFrame(rows, columns=RULE_COUNT_COLUMNS)
+
+
+def _keys_frames(states: Sequence[DuplicateState] | None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rows, details = [], []
+    for st in states or ():
+        if not st.key_cols:
+            rows.append(
+                {
+                    "key_name": st.key_name,
+                    "key_cols": "[]",
+                    "n_rows": st.n_rows,
+                    "n_null_key_rows": np.nan,
+                    "n_duplicate_keys": np.nan,
+                    "n_conflicting_key_groups": np.nan,
+                    "severity": "warn",
+                    "notes": "Configured key columns not found in df",
+                }
+            )
+            continue
+        m = st.metrics()
+        sev, notes = key_severity(m)
+        if not st.colocated and m["n_duplicate_keys"]:
+            notes += " (row-range partitions: hash-level counts, no detail rows)"
+        rows.append(
+            {
+                "key_name": st.key_name,
+                "key_cols": str(list(st.key_cols)),
+                **m,
+                "severity": sev,
+                "notes": notes,
+            }
+        )
+        if st.detail is not None and not st.detail.empty:
+            det = st.detail.copy()
+            det.insert(0, "key_name", st.key_name)
+            details.append(det)
+    detail_df = (
+        pd.concat(details, ignore_index=True)
+        if details
+        else pd.DataFrame(columns=["key_name", "dup_count"])
+    )
+    return pd.DataFrame(rows, columns=ID_INTEGRITY_COLUMNS), detail_df
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+@dataclass
+class PartitionedResult:
+    profile: ProfileResult
+    null_counts: pd.DataFrame  # NULL_COUNT_COLUMNS
+    rules: pd.DataFrame  # RULE_COUNT_COLUMNS
+    id_integrity: pd.DataFrame  # keys.ID_INTEGRITY_COLUMNS
+    id_duplicates: pd.DataFrame
+    drift_histograms: pd.DataFrame  # HISTOGRAM_COLUMNS on the caller's edges
+    partitions: pd.DataFrame  # PARTITION_COLUMNS
+    by: str
+    states: dict[str, Any] = field(
+        default_factory=dict
+    )  # merged partial states (mergeable with other runs' / nodes')
+
+
+def logic_rule_defs(rules_cfg: Any) -> list[tuple[str, str, Mapping[str, Any]]]:
+    """LOGIC_RULES.{MUTUAL_EXCLUSION, DEPENDENCIES, RATIO_CHECKS} → [(rule_type, rule_id, rule)]."""
+    out = []
+    for rtype in _RULE_TYPES:
+        for rid, r in ((rules_cfg or {}).get(rtype) or {}).items():
+            if isinstance(r, Mapping):
+                out.append((rtype, str(rid), dict(r)))
+    return out
+
+
+def _frame_dtypes(source: pd.DataFrame | str | Path) -> dict[str, Any]:
+    if isinstance(source, pd.DataFrame):
+        return dict(source.dtypes.items())
+    import pyarrow.parquet as pq
+
+    p = Path(source)
+    f = _parquet_files(p)[0] if p.is_dir() else p
+    return dict(pq.read_schema(str(f)).empty_table().to_pandas().dtypes.items())
+
+
+@traced("engine.partitioned.run_partitioned")
+def run_partitioned(
+    source: pd.DataFrame | str | Path,
+    *,
+    config: dict[str, Any] | None = None,
+    cfg: PartitionCfg | None = None,
+    profiling_cfg: ProfilingCfg | None = None,
+    numeric_cols: Sequence[str] | None = None,
+    cat_cols: Sequence[str] | None = None,
+    rules: Sequence[tuple[str, str, Mapping[str, Any]]] | None = None,
+    key_defs: Sequence[tuple[str, Sequence[str]]] | None = None,
+    drift_edges: Mapping[str, Sequence[float]] | None = None,
+) -> PartitionedResult:
+    """
+    Profile + null counts + LOGIC_RULES counts + key audit + drift histograms of `source`
+    (DataFrame or Parquet file / directory) across PARTITIONED.N_JOBS processes.
+
+    rules / key_defs default to LOGIC_RULES / KEYS.PRIMARY_KEYS; pass [] to skip them.
+    """
+    cfg = cfg or PartitionCfg.from_config(config)
+    pcfg = profiling_cfg or ProfilingCfg.from_config(config)
+    dtypes = _frame_dtypes(source)
+    if numeric_cols is None:
+        numeric_cols = [
+            c
+            for c, t in dtypes.items()
+            if c not in pcfg.exclude and is_numeric_dtype(t) and not is_bool_dtype(t)
+        ]
+    if cat_cols is None:
+        cat_cols = [
+            c
+            for c, t in dtypes.items()
+            if c not in pcfg.exclude and c not in numeric_cols and not is_datetime64_any_dtype(t)
+        ]
+    rules = logic_rule_defs(C("LOGIC_RULES", None, config=config)) if rules is None else list(rules)
+    key_defs = (
+        primary_key_defs(C("KEYS.PRIMARY_KEYS", None, config=config))
+        if key_defs is None
+        else list(key_defs)
+    )
+    key_defs = [(n, [c for c in cols if c in dtypes]) for n, cols in key_defs]
+    shard_key = next(
+        (cols for n, cols in key_defs if cols and (cfg.key is None or n == cfg.key)), None
+    )
+    drift_edges = {c: e for c, e in (drift_edges or {}).items() if c in dtypes}
+
+    pool = _loky(cfg.workers)
+    t0 = time.perf_counter()
+    store = SpillStore(cfg.spill_dir or Path.cwd() / "spill", keep=cfg.keep_spill)
+    try:
+        parts, by = plan_partitions(source, store, cfg, shard_key, pool)
+        spec = _Spec(
+            tuple(numeric_cols),
+            tuple(cat_cols),
+            tuple(dtypes),
+            tuple(rules),
+            tuple((n, tuple(cols)) for n, cols in key_defs),
+            colocated=by == "key" and all(list(c) == list(shard_key) for _, c in key_defs),
+            precision=cfg.hll_precision,
+            limit=cfg.exact_distinct_max,
+        )
+
+        with span("partitioned.round1", partitions=len(parts), n_jobs=cfg.workers, by=by) as sp:
+            timings, merged = [], {}
+            for states, timing in pool(_round1, [(p, spec) for p in parts]):
+                merged = merge_states(
+                    [merged, states]
+                )  # streaming reduce: one partial held at a time
+                timings.append(timing)
+            sp.set(rows_in=sum(t[1] for t in timings))
+
+        mo: ColumnMoments | None = merged.get("moments")
+        nb = pcfg.n_bins * max(1, cfg.fine_bins // max(1, pcfg.n_bins))
+        fine = (
+            [
+                tuple(_fine_edges(float(mo.vmin[i]), float(mo.vmax[i]), nb))
+                for i in range(len(spec.numeric))
+            ]
+            if mo
+            else []
+        )
+        d_cols = tuple(drift_edges)
+        d_edges = [tuple(float(x) for x in drift_edges[c]) for c in d_cols]
+        with span(
+            "partitioned.round2", partitions=len(parts), fine_bins=nb, drift_columns=len(d_cols)
+        ):
+            for states in pool(_round2, [(p, spec.numeric, fine, d_cols, d_edges) for p in parts]):
+                merged = merge_states([merged, states])
+    finally:
+        store.close()
+
+    prof = _profile(merged, spec, pcfg, {str(c): str(t) for c, t in dtypes.items()})
+    n_rows = prof.n_rows
+    nulls = merged.get("nulls", np.zeros(len(spec.null_cols), dtype=np.int64))
+    null_df = pd.DataFrame(
+        {
+            "column": list(spec.null_cols),
+            "dtype": [str(dtypes[c]) for c in spec.null_cols],
+            "n_rows": n_rows,
+            "n_null": nulls.astype(int),
+            "null_pct": np.round(100.0 * nulls / n_rows, 3) if n_rows else 0.0,
+        },
+        columns=NULL_COUNT_COLUMNS,
+    )
+    id_df, dup_df = _keys_frames(merged.get("keys"))
+    drift = merged.get("drift")
+    part_df = pd.DataFrame(sorted(timings), columns=PARTITION_COLUMNS)
+
+    print(
+        f"🧩 Partitioned run: {n_rows:,} rows in {len(parts)} {by} partition(s) "
+        f"on {cfg.workers} worker(s) in {time.perf_counter() - t0:,.1f}s"
+    )
+    return PartitionedResult(
+        profile=prof,
+        null_counts=null_df,
+        rules=_rules_frame(merged.get("rules")),
+        id_integrity=id_df,
+        id_duplicates=dup_df,
+        drift_histograms=(
+            drift.to_frame() if drift is not None else pd.DataFrame(columns=HISTOGRAM_COLUMNS)
+        ),
+        partitions=part_df,
+        by=by,
+        states={**merged, "version": STATE_VERSION},
+    )
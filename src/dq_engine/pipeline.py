@@ -6,78 +6,92 @@ from pathlib import Path
 from typing import List, Optional
 import pandas as pd
 
-from dq_engine.config import load_config
+from dq_engine.config.config import load_config
 from dq_engine.warehouse import WarehouseConnCfg, make_warehouse
 from dq_engine.dbt_runner import run_dbt_build
 from dq_engine.checks import CheckResult, accepted_values, row_count
+from dq_engine.results_store import ResultsStore
+from dq_engine.utils.tracing import configure_tracing, export_trace, span, tracing_enabled
 
-def ensure_dq_table(wh, database: str, dq_schema: str) -> str:
-    schema_fqn = f"{database}.{dq_schema}"
-    wh.execute(f"create schema if not exists {schema_fqn}")
-    table_fqn = f"{schema_fqn}.DQ_RESULTS"
-    wh.execute(f"""
-    create table if not exists {table_fqn} (
-      run_id string,
-      dataset_id string,
-      check_id string,
-      check_type string,
-      severity string,
-      status string,
-      table_name string,
-      column_name string,
-      metric_name string,
-      metric_value double,
-      threshold double,
-      details_json variant
-    )
-    """)
-    return table_fqn
+def ensure_dq_table(wh, database: str, dq_schema: str, target: str = "snowflake") -> str:
+    """DQ_RESULTS (+ daily/weekly rollups); see results_store.ResultsStore."""
+    return ResultsStore(wh, database, dq_schema, target).ensure()
 
-def run(config_path: str, skip_dbt: bool = False, run_dir: Optional[str] = None) -> str:
-    cfg = load_config(config_path)
-    run_id = uuid.uuid4().hex
+def _check_sql(chk: dict) -> str:
+    ctype = chk["type"]
+    if ctype == "accepted_values":
+        return f"select {chk['column']} from {chk['table']}"
+    if ctype == "row_count":
+        return f"select count(*) as n from {chk['table']}"
+    raise ValueError(f"Unknown check type: {ctype}")
 
-    wh = make_warehouse(WarehouseConnCfg(
-        target=cfg.warehouse.target,
-        database=cfg.warehouse.database,
-        raw_schema=cfg.warehouse.raw_schema,
-        analytics_schema=cfg.warehouse.analytics_schema,
-        dq_schema=cfg.warehouse.dq_schema,
-        duckdb_path=cfg.warehouse.duckdb_path,
-    ))
+def run_checks(wh, checks: List[dict], run_id: str, dataset_id: str) -> List[CheckResult]:
+    """Evaluate `checks` (the config `checks:` list) against `wh`, one span per check.
 
-    if not skip_dbt:
-        run_dbt_build(cfg.dbt.project_dir, cfg.dbt.profiles_dir)
-
-    dq_table = ensure_dq_table(wh, cfg.warehouse.database, cfg.warehouse.dq_schema)
+    Every check query is submitted before any result is read, so on Snowflake
+    they run concurrently server-side (`Warehouse.submit` / `gather`).
+    """
+    sqls = [_check_sql(chk) for chk in checks]
+    with span("checks.submit", stage="checks", queries=len(sqls)):
+        frames = wh.gather([wh.submit(q) for q in sqls])
 
     results: List[CheckResult] = []
-    for chk in cfg.checks:
+    for chk, df in zip(checks, frames, strict=True):
         ctype = chk["type"]
         table = chk["table"]
         sev = chk.get("severity", "warn")
         cid = chk["id"]
 
-        if ctype == "accepted_values":
-            col = chk["column"]
-            allowed = chk["params"]["values"]
-            df = wh.read_df(f"select {col} from {table}")
-            results.append(accepted_values(run_id, cfg.project.dataset_id, cid, sev, table, col, allowed, df))
+        with span(f"check.{ctype}", section=cid, section_name=ctype, stage="checks", table=table):
+            if ctype == "accepted_values":
+                col = chk["column"]
+                allowed = chk["params"]["values"]
+                results.append(accepted_values(run_id, dataset_id, cid, sev, table, col, allowed, df))
+
+            elif ctype == "row_count":
+                n = int(df.iloc[0,0])
+                min_rows = int((chk.get("params") or {}).get("min_rows", 1))
+                results.append(row_count(run_id, dataset_id, cid, sev, table, n, min_rows))
+    return results
+
+def run(config_path: str, skip_dbt: bool = False, run_dir: Optional[str] = None) -> str:
+    cfg = load_config(config_path)
+    run_id = uuid.uuid4().hex
+    wcfg = cfg["warehouse"]
+    dataset_id = cfg["project"]["dataset_id"]
+
+    configure_tracing(cfg, run_id)
+
+    with span("pipeline.run", dataset_id=dataset_id, run_id=run_id):
+        wh = make_warehouse(WarehouseConnCfg(
+            target=wcfg["target"],
+            database=wcfg["database"],
+            raw_schema=wcfg["raw_schema"],
+            analytics_schema=wcfg["analytics_schema"],
+            dq_schema=wcfg["dq_schema"],
+            duckdb_path=wcfg.get("duckdb_path"),
+        ))
+
+        if not skip_dbt:
+            with span("dbt.build", section="dbt", stage="build"):
+                run_dbt_build(cfg["dbt"]["project_dir"], cfg["dbt"]["profiles_dir"])
 
-        elif ctype == "row_count":
-            n = int(wh.read_df(f"select count(*) as n from {table}").iloc[0,0])
-            results.append(row_count(run_id, cfg.project.dataset_id, cid, sev, table, n))
+        store = ResultsStore(wh, wcfg["database"], wcfg["dq_schema"], wcfg["target"],
+                             grains=(cfg.get("results_store") or {}).get("rollups", ("daily", "weekly")))
+        store.ensure()
+        run_ts = pd.Timestamp.now(tz="UTC").tz_localize(None)
 
-        else:
-            raise ValueError(f"Unknown check type: {ctype}")
+        results = run_checks(wh, cfg.get("checks", []), run_id, dataset_id)
 
-    out_df = pd.DataFrame([asdict(r) for r in results])
-    wh.write_df(out_df, dq_table, mode="append")
+        out_df = pd.DataFrame([asdict(r) for r in results])
+        store.append(out_df, run_ts=run_ts)
 
     if run_dir:
         p = Path(run_dir).resolve()
         p.mkdir(parents=True, exist_ok=True)
         out_df.to_csv(p / "dq_results.csv", index=False)
         (p / "dq_results.json").write_text(json.dumps(out_df.to_dict(orient="records"), indent=2), encoding="utf-8")
+        if tracing_enabled():
+            export_trace(p, cfg)
 
     return run_id
@@ -0,0 +1,675 @@
+# src/dq_engine/rendering.py
+"""
+Figure and dashboard rendering for 2.10 / 2.11 (FIG_ROOTS) and the 2.5.16,
+2.5.18, 2.6.16 and 2.7.15 HTML dashboards.
+
+- A figure is a `FigureSpec`: kind + labels + plot params + the small
+  aggregate it draws (histogram counts/edges, top-k counts, box stats, a
+  correlation matrix). Spec builders compute the aggregates once in the
+  parent, vectorised, so workers never receive raw frames.
+- `spec_hash` covers the aggregate bytes and every param. Each output
+  directory keeps a `.render_manifest.json` {file name: spec_hash}. A figure
+  whose file exists with the same hash is skipped, so a re-run on unchanged
+  data renders nothing.
+- Stale specs render in a joblib process pool (loky) with the headless Agg
+  backend. Each file is written to a tmp path and moved into place with
+  os.replace. One figure failing never stops the batch.
+- Dashboards are filled from metric dicts / small aggregate frames (the
+  section CSVs), never raw frames. The hash covers template + metrics +
+  tables, so an unchanged dashboard is not rewritten either.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from html import escape
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dq_engine.artifacts import artifact_exists, read_artifact
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+FIGURE_INDEX_COLUMNS = [
+    "figure_id",
+    "kind",
+    "path",
+    "spec_hash",
+    "status",  # rendered | skipped | failed
+    "seconds",
+    "error",
+]
+
+RENDER_VERSION = 1  # bump when a renderer's output changes for the same spec
+MANIFEST_NAME = ".render_manifest.json"
+
+
+@dataclass(frozen=True)
+class RenderingCfg:
+    enabled: bool = True
+    n_jobs: int = -1  # joblib convention: -1 = all cores
+    min_parallel: int = 8  # fewer stale figures than this render in-process
+    dpi: int = 100
+    force: bool = False  # ignore the manifest and re-render everything
+    versioned_dashboards: bool = True  # also write <name>_<YYYYmmddHHMM>.html when content changes
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> RenderingCfg:
+        """RENDERING.*"""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        return cls(
+            enabled=bool(get("RENDERING.ENABLED", True)),
+            n_jobs=int(get("RENDERING.N_JOBS", -1)),
+            min_parallel=int(get("RENDERING.MIN_PARALLEL", 8)),
+            dpi=int(get("RENDERING.DPI", 100)),
+            force=bool(get("RENDERING.FORCE", False)),
+            versioned_dashboards=bool(get("RENDERING.VERSIONED_DASHBOARDS", True)),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Specs
+# ---------------------------------------------------------------------------
+def _feed(h: hashlib._Hash, v: Any) -> None:
+    if isinstance(v, np.ndarray):
+        h.update(f"nd:{v.dtype.str}:{v.shape}".encode())
+        h.update(
+            np.ascontiguousarray(v).tobytes()
+            if v.dtype != object
+            else json.dumps(v.tolist(), default=str).encode()
+        )
+    elif isinstance(v, Mapping):
+        for k in sorted(v):
+            h.update(f"k:{k}".encode())
+            _feed(h, v[k])
+    elif isinstance(v, (list, tuple)):
+        h.update(f"seq:{len(v)}".encode())
+        for x in v:
+            _feed(h, x)
+    else:
+        h.update(f"v:{type(v).__name__}:{v!r}".encode())
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    figure_id: str
+    kind: str  # hist | overlay_hist | bar | box | heatmap
+    path: str
+    title: str = ""
+    xlabel: str = ""
+    ylabel: str = ""
+    data: Mapping[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def spec_hash(self) -> str:
+        h = hashlib.sha256()
+        _feed(
+            h,
+            (
+                RENDER_VERSION,
+                self.kind,
+                self.title,
+                self.xlabel,
+                self.ylabel,
+                Path(self.path).suffix,
+            ),
+        )
+        _feed(h, dict(self.params))
+        _feed(h, dict(self.data))
+        return h.hexdigest()[:32]
+
+
+def _finite(values: Any) -> np.ndarray:
+    v = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return v[np.isfinite(v)]
+
+
+def hist_spec(
+    col: str, values: Any, out_dir: Path | str, *, bins: int = 30, figsize=(5, 3), **labels: str
+) -> FigureSpec:
+    """2.10.3 numeric histogram (`<col>_hist.png`)."""
+    v = _finite(values)
+    counts, edges = np.histogram(v, bins=bins) if v.size else (np.zeros(0, "int64"), np.zeros(0))
+    return FigureSpec(
+        figure_id=f"{col}:hist",
+        kind="hist",
+        path=str(Path(out_dir) / f"{col}_hist.png"),
+        title=labels.get("title", f"{col} – Histogram"),
+        xlabel=labels.get("xlabel", col),
+        ylabel=labels.get("ylabel", "Count"),
+        data={"counts": counts.astype("int64"), "edges": edges.astype("float64")},
+        params={"figsize": tuple(figsize), "alpha": 0.8},
+    )
+
+
+def overlay_hist_spec(
+    col: str,
+    before: Any,
+    after: Any,
+    out_dir: Path | str,
+    *,
+    bins: int = 30,
+    labels: tuple[str, str] = ("pre-Apply", "post-Apply"),
+    figsize=(5, 3),
+    title: str = "",
+) -> FigureSpec:
+    """2.9.11 pre/post density overlay on shared bin edges (`<col>_pre_post_hist.png`)."""
+    a, b = _finite(before), _finite(after)
+    both = np.concatenate([a, b])
+    edges = np.histogram_bin_edges(both, bins=bins) if both.size else np.zeros(0)
+    da = np.histogram(a, bins=edges, density=True)[0] if a.size and edges.size else np.zeros(0)
+    db = np.histogram(b, bins=edges, density=True)[0] if b.size and edges.size else np.zeros(0)
+    return FigureSpec(
+        figure_id=f"{col}:pre_post_hist",
+        kind="overlay_hist",
+        path=str(Path(out_dir) / f"{col}_pre_post_hist.png"),
+        title=title or f"{col} – Pre vs Post",
+        xlabel=col,
+        ylabel="Density",
+        data={"edges": edges, "series": [da, db], "labels": list(labels)},
+        params={"figsize": tuple(figsize), "alpha": 0.5},
+    )
+
+
+def bar_spec(
+    col: str, values: Any, out_dir: Path | str, *, top_k: int = 30, figsize=(6, 3)
+) -> FigureSpec:
+    """2.10.3 categorical frequency bars (`<col>_bar.png`); top_k levels by count."""
+    vc = pd.Series(values).value_counts(dropna=False).head(top_k)
+    return FigureSpec(
+        figure_id=f"{col}:bar",
+        kind="bar",
+        path=str(Path(out_dir) / f"{col}_bar.png"),
+        title=f"{col} – Frequency",
+        xlabel=col,
+        ylabel="Count",
+        data={"labels": [str(x) for x in vc.index], "counts": vc.to_numpy(dtype="int64")},
+        params={"figsize": tuple(figsize)},
+    )
+
+
+def box_spec(
+    col: str, groups: Mapping[str, Any], out_dir: Path | str, *, figsize=(4, 4), suffix: str = "box"
+) -> FigureSpec:
+    """Box plot from precomputed Tukey stats per group (matplotlib `bxp`), no raw values shipped."""
+    stats = []
+    for label, values in groups.items():
+        v = _finite(values)
+        if not v.size:
+            continue
+        q1, med, q3 = np.quantile(v, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        lo, hi = v[v >= q1 - 1.5 * iqr], v[v <= q3 + 1.5 * iqr]
+        stats.append(
+            {
+                "label": str(label),
+                "q1": float(q1),
+                "med": float(med),
+                "q3": float(q3),
+                "whislo": float(lo.min()),
+                "whishi": float(hi.max()),
+            }
+        )
+    return FigureSpec(
+        figure_id=f"{col}:{suffix}",
+        kind="box",
+        path=str(Path(out_dir) / f"{col}_{suffix}.png"),
+        title=f"{col} – Box plot",
+        ylabel=col,
+        data={"stats": stats},
+        params={"figsize": tuple(figsize)},
+    )
+
+
+def heatmap_spec(
+    name: str,
+    matrix: pd.DataFrame,
+    out_path: Path | str,
+    *,
+    vmin: float = -1.0,
+    vmax: float = 1.0,
+    title: str = "",
+    cbar_label: str = "r",
+    figsize=(6, 5),
+) -> FigureSpec:
+    """2.10.4 / 2.11 correlation heatmap."""
+    return FigureSpec(
+        figure_id=f"{name}:heatmap",
+        kind="heatmap",
+        path=str(out_path),
+        title=title or name,
+        data={
+            "values": matrix.to_numpy(dtype="float64"),
+            "labels": [str(c) for c in matrix.columns],
+        },
+        params={"vmin": vmin, "vmax": vmax, "cbar_label": cbar_label, "figsize": tuple(figsize)},
+    )
+
+
+def univariate_specs(
+    df: pd.DataFrame,
+    numeric_cols: Sequence[str],
+    cat_cols: Sequence[str],
+    numeric_dir: Path | str,
+    categorical_dir: Path | str,
+    *,
+    bins: int = 30,
+    top_k: int = 30,
+) -> list[FigureSpec]:
+    """2.10.3 spec list (FIG_ROOTS["FIG_2_10_NUMERIC_DIR"] / ["FIG_2_10_CATEGORICAL_DIR"])."""
+    specs = [hist_spec(c, df[c], numeric_dir, bins=bins) for c in numeric_cols if c in df.columns]
+    specs += [bar_spec(c, df[c], categorical_dir, top_k=top_k) for c in cat_cols if c in df.columns]
+    return specs
+
+
+# ---------------------------------------------------------------------------
+# Renderers (run in workers)
+# ---------------------------------------------------------------------------
+def _draw_hist(fig, ax, spec: FigureSpec) -> None:
+    e, c = np.asarray(spec.data["edges"]), np.asarray(spec.data["counts"])
+    if c.size:
+        ax.bar(e[:-1], c, width=np.diff(e), align="edge", alpha=spec.params.get("alpha", 0.8))
+
+
+def _draw_overlay_hist(fig, ax, spec: FigureSpec) -> None:
+    e = np.asarray(spec.data["edges"])
+    for dens, label in zip(spec.data["series"], spec.data["labels"], strict=True):
+        dens = np.asarray(dens)
+        if dens.size:
+            ax.bar(
+                e[:-1],
+                dens,
+                width=np.diff(e),
+                align="edge",
+                alpha=spec.params.get("alpha", 0.5),
+                label=label,
+            )
+    ax.legend()
+
+
+def _draw_bar(fig, ax, spec: FigureSpec) -> None:
+    labels = list(spec.data["labels"])
+    ax.bar(range(len(labels)), np.asarray(spec.data["counts"]))
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=45, ha="right")
+
+
+def _draw_box(fig, ax, spec: FigureSpec) -> None:
+    stats = [dict(s, fliers=[]) for s in spec.data["stats"]]
+    if stats:
+        ax.bxp(stats, showfliers=False)
+
+
+def _draw_heatmap(fig, ax, spec: FigureSpec) -> None:
+    labels = list(spec.data["labels"])
+    im = ax.imshow(
+        np.asarray(spec.data["values"]), vmin=spec.params.get("vmin"), vmax=spec.params.get("vmax")
+    )
+    ax.set_xticks(range(len(labels)))
+    ax.set_yticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=45, ha="right")
+    ax.set_yticklabels(labels)
+    fig.colorbar(im, ax=ax, label=spec.params.get("cbar_label", ""))
+
+
+_RENDERERS: dict[str, Callable[..., None]] = {
+    "hist": _draw_hist,
+    "overlay_hist": _draw_overlay_hist,
+    "bar": _draw_bar,
+    "box": _draw_box,
+    "heatmap": _draw_heatmap,
+}
+
+
+def _render_batch(specs: Sequence[FigureSpec], dpi: int) -> list[tuple[str, float, str]]:
+    """Worker entry: render each spec headless → [(path, seconds, error)]."""
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+
+    out = []
+    for spec in specs:
+        t0 = time.perf_counter()
+        fig = None
+        try:
+            draw = _RENDERERS.get(spec.kind)
+            if draw is None:
+                raise ValueError(f"Unknown figure kind: {spec.kind}")
+            fig, ax = plt.subplots(figsize=spec.params.get("figsize", (5, 3)))
+            draw(fig, ax, spec)
+            ax.set_title(spec.title)
+            ax.set_xlabel(spec.xlabel)
+            ax.set_ylabel(spec.ylabel)
+            fig.tight_layout()
+            path = Path(spec.path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.stem}.tmp{path.suffix}")
+            fig.savefig(tmp, dpi=dpi)
+            os.replace(tmp, path)
+            out.append((spec.path, time.perf_counter() - t0, ""))
+        except Exception as e:
+            out.append((spec.path, time.perf_counter() - t0, f"{type(e).__name__}: {e}"))
+        finally:
+            if fig is not None:
+                plt.close(fig)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+def _load_manifest(directory: Path) -> dict[str, str]:
+    p = directory / MANIFEST_NAME
+    try:
+        return json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory: Path, manifest: Mapping[str, str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    p = directory / MANIFEST_NAME
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(json.dumps(dict(sorted(manifest.items())), indent=0), encoding="utf-8")
+    os.replace(tmp, p)
+
+
+def _is_fresh(path: Path, digest: str, manifests: dict[Path, dict[str, str]]) -> bool:
+    man = manifests.setdefault(path.parent, _load_manifest(path.parent))
+    return man.get(path.name) == digest and path.exists()
+
+
+# ---------------------------------------------------------------------------
+# Figures
+# ---------------------------------------------------------------------------
+@traced("render.figures")
+def render_figures(specs: Iterable[FigureSpec], cfg: RenderingCfg | None = None) -> pd.DataFrame:
+    """
+    Render the stale subset of `specs` → figure index (FIGURE_INDEX_COLUMNS).
+
+    Specs with identical paths must have identical hashes (ValueError otherwise).
+    """
+    cfg = cfg or RenderingCfg()
+    by_path: dict[str, tuple[FigureSpec, str]] = {}
+    for s in specs:
+        d = s.spec_hash
+        prev = by_path.get(s.path)
+        if prev is not None and prev[1] != d:
+            raise ValueError(f"Two different figure specs write to {s.path}")
+        by_path[s.path] = (s, d)
+
+    manifests: dict[Path, dict[str, str]] = {}
+    rows: dict[str, dict[str, Any]] = {}
+    stale: list[FigureSpec] = []
+    for path, (s, d) in by_path.items():
+        row = {
+            "figure_id": s.figure_id,
+            "kind": s.kind,
+            "path": path,
+            "spec_hash": d,
+            "status": "skipped",
+            "seconds": 0.0,
+            "error": "",
+        }
+        rows[path] = row
+        if cfg.force or not _is_fresh(Path(path), d, manifests):
+            stale.append(s)
+
+    if stale and cfg.enabled:
+        with span("render.figures.batch", n_stale=len(stale), n_total=len(by_path)):
+            results = _run_batches(stale, cfg)
+        for path, secs, err in results:
+            row = rows[path]
+            row.update(status="failed" if err else "rendered", seconds=round(secs, 4), error=err)
+            man = manifests.setdefault(Path(path).parent, _load_manifest(Path(path).parent))
+            if err:
+                man.pop(Path(path).name, None)
+            else:
+                man[Path(path).name] = row["spec_hash"]
+        for directory in {Path(p).parent for p, _, _ in results}:
+            _save_manifest(directory, manifests[directory])
+
+    index = pd.DataFrame(list(rows.values()), columns=FIGURE_INDEX_COLUMNS)
+    n = index["status"].value_counts().to_dict() if not index.empty else {}
+    print(
+        f"🖼️ Figures: {n.get('rendered', 0)} rendered, {n.get('skipped', 0)} unchanged, "
+        f"{n.get('failed', 0)} failed"
+    )
+    return index
+
+
+def _run_batches(stale: Sequence[FigureSpec], cfg: RenderingCfg) -> list[tuple[str, float, str]]:
+    n_jobs = cfg.n_jobs if cfg.n_jobs > 0 else max(1, (os.cpu_count() or 1) + 1 + cfg.n_jobs)
+    if n_jobs == 1 or len(stale) < cfg.min_parallel:
+        return _render_batch(stale, cfg.dpi)
+    from joblib import Parallel, delayed
+
+    # ~4 batches per worker: amortises the per-task pickle / pyplot import without starving the pool
+    size = max(1, math.ceil(len(stale) / (n_jobs * 4)))
+    batches = [list(stale[i : i + size]) for i in range(0, len(stale), size)]
+    parts = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_render_batch)(b, cfg.dpi) for b in batches
+    )
+    return [r for part in parts for r in part]
+
+
+def write_figure_index(index: pd.DataFrame, path: Path | str) -> Path:
+    """Atomic CSV write of the figure index (visual_index.csv style)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.csv")
+    index.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Dashboards
+# ---------------------------------------------------------------------------
+_METRIC_SLOT = re.compile(r'(data-metric-id="([^"]+)">)(.*?)(<)', flags=re.DOTALL)
+_TABLE_SLOT = re.compile(r'(<div[^>]*data-table-id="([^"]+)"[^>]*>)(.*?)(</div>)', flags=re.DOTALL)
+_BADGE_CLASS = {"OK": "badge badge-ok", "WARN": "badge badge-warn", "FAIL": "badge badge-fail"}
+
+
+def inject_metrics(
+    html: str,
+    metrics: Mapping[str, Any],
+    tables: Mapping[str, pd.DataFrame] | None = None,
+    badges: Mapping[str, str] | None = None,
+    *,
+    table_rows: int = 50,
+) -> str:
+    """
+    Fill `data-metric-id="..."` slots (one regex pass for all metrics, like
+    2.5.18 4.1), `data-table-id="..."` divs with small aggregate tables, and
+    badge classes for status metrics (OK / WARN / FAIL). Metric values are
+    HTML-escaped; tables go through `to_html`, which escapes cells.
+    """
+    vals = {str(k): escape(str(v)) for k, v in metrics.items() if v is not None}
+    html = _METRIC_SLOT.sub(
+        lambda m: m.group(1) + vals[m.group(2)] + m.group(4) if m.group(2) in vals else m.group(0),
+        html,
+    )
+    if tables:
+        rendered = {
+            k: df.head(table_rows).to_html(index=False, classes="dq-table", border=0, na_rep="")
+            for k, df in tables.items()
+            if df is not None
+        }
+        html = _TABLE_SLOT.sub(
+            lambda m: (
+                m.group(1) + rendered[m.group(2)] + m.group(4)
+                if m.group(2) in rendered
+                else m.group(0)
+            ),
+            html,
+        )
+    for metric_id, status in (badges or {}).items():
+        cls = _BADGE_CLASS.get(str(status).upper(), "badge badge-neutral")
+        html = re.sub(
+            rf'(<span class=")(?:badge[^"]*)(" data-metric-id="{re.escape(metric_id)}")',
+            rf"\g<1>{cls}\2",
+            html,
+        )
+    return html
+
+
+def _table_digest(df: pd.DataFrame) -> str:
+    h = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+@traced("render.dashboard")
+def write_dashboard(
+    template: Path | str,
+    out_path: Path | str,
+    metrics: Mapping[str, Any],
+    *,
+    tables: Mapping[str, pd.DataFrame] | None = None,
+    badges: Mapping[str, str] | None = None,
+    cfg: RenderingCfg | None = None,
+    table_rows: int = 50,
+) -> dict[str, Any]:
+    """
+    Fill `template` and write `out_path` atomically; skipped when template,
+    metrics and tables hash the same as the last write.
+
+    Returns {"path", "status", "spec_hash", "versioned_path"}; status is
+    written | skipped | missing_template.
+    """
+    cfg = cfg or RenderingCfg()
+    template, out_path = Path(template), Path(out_path)
+    if not template.exists():
+        print(f"   ⚠️ Dashboard template not found at {template}; skipping {out_path.name}")
+        return {
+            "path": str(out_path),
+            "status": "missing_template",
+            "spec_hash": "",
+            "versioned_path": "",
+        }
+    tpl = template.read_text(encoding="utf-8")
+    h = hashlib.sha256()
+    _feed(
+        h,
+        (
+            RENDER_VERSION,
+            tpl,
+            {str(k): str(v) for k, v in metrics.items()},
+            dict(badges or {}),
+            table_rows,
+        ),
+    )
+    _feed(h, {k: _table_digest(df) for k, df in (tables or {}).items() if df is not None})
+    digest = h.hexdigest()[:32]
+
+    manifests: dict[Path, dict[str, str]] = {}
+    if not cfg.force and _is_fresh(out_path, digest, manifests):
+        return {
+            "path": str(out_path),
+            "status": "skipped",
+            "spec_hash": digest,
+            "versioned_path": "",
+        }
+
+    html = inject_metrics(tpl, metrics, tables, badges, table_rows=table_rows)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    targets = [out_path]
+    if cfg.versioned_dashboards:
+        stamp = pd.Timestamp.now(tz="UTC").strftime("%Y%m%d%H%M")
+        targets.append(out_path.with_name(f"{out_path.stem}_{stamp}{out_path.suffix}"))
+    for p in targets:
+        tmp = p.with_suffix(".tmp.html")
+        tmp.write_text(html, encoding="utf-8")
+        os.replace(tmp, p)
+
+    man = manifests.setdefault(out_path.parent, _load_manifest(out_path.parent))
+    man[out_path.name] = digest
+    _save_manifest(out_path.parent, man)
+    return {
+        "path": str(out_path),
+        "status": "written",
+        "spec_hash": digest,
+        "versioned_path": str(targets[1]) if len(targets) > 1 else "",
+    }
+
+
+def _read_small(path: Path, usecols: Sequence[str] | None = None) -> pd.DataFrame | None:
+    if not artifact_exists(path):
+        return None
+    try:
+        return read_artifact(path, usecols or None)
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️ Could not read {path.name}: {e}")
+        return None
+
+
+def master_dashboard_metrics(
+    reports_dir: Path | str, section2_summary: Path | str | None = None
+) -> dict[str, str]:
+    """
+    2.5.18 metric slots from the section aggregates only (integrity index,
+    readiness, drift and rare-category CSVs). Only the columns the slots need
+    are read.
+    """
+    d = Path(reports_dir)
+    m: dict[str, str] = {}
+
+    ii = _read_small(
+        d / "data_integrity_index.csv",
+        [
+            "integrity_index",
+            "numeric_score",
+            "categorical_score",
+            "logic_score",
+            "run_id",
+            "run_timestamp_utc",
+        ],
+    )
+    if ii is not None and not ii.empty:
+        last = ii.iloc[-1]
+        for c in ("integrity_index", "numeric_score", "categorical_score", "logic_score"):
+            if c in last and pd.notna(last[c]):
+                m[c] = f"{float(last[c]):.1f}"
+        for c in ("run_id", "run_timestamp_utc"):
+            if c in last and pd.notna(last[c]):
+                m[c] = str(last[c])
+
+    mr = _read_small(d / "model_readiness_report.csv", ["readiness_label"])
+    if mr is not None and len(mr) and "readiness_label" in mr.columns:
+        pct = 100.0 * (mr["readiness_label"].astype(str).str.lower() == "high").mean()
+        m["pct_features_high_readiness"] = f"{pct:.1f}%"
+
+    if section2_summary is not None:
+        s2 = _read_small(Path(section2_summary))
+        if s2 is not None and "section" in s2.columns:
+            row = s2.loc[s2["section"].astype(str) == "2.5.12"]
+            for cand in ("pct_rows_logic_clean", "pct_rows_logic_ready"):
+                if not row.empty and cand in row.columns and pd.notna(row[cand].iloc[0]):
+                    v = float(row[cand].iloc[0])
+                    v = v * 100.0 if v <= 1.0 else v
+                    m["pct_rows_logic_clean"] = m["logic_clean_pct_sec2_tab"] = f"{v:.1f}%"
+                    break
+
+    nd = _read_small(d / "data_drift_metrics.csv", ["is_drift", "drift_flag", "drifted"])
+    if nd is not None and len(nd.columns):
+        flag = nd[nd.columns[0]].astype(str).str.lower().isin(["1", "true", "yes", "drift"])
+        m["n_drifted_features"] = m["numeric_drifted_cols"] = str(int(flag.sum()))
+
+    rc = _read_small(d / "rare_category_report.csv", ["column"])
+    if rc is not None:
+        m["n_rare_categories"] = str(len(rc))
+        m["n_cols_with_rare"] = str(rc["column"].nunique() if "column" in rc.columns else len(rc))
+    return m
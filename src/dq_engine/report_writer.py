@@ -0,0 +1,670 @@
+# src/dq_engine/report_writer.py
+"""
+Streaming HTML / Markdown report writer for the large 2.5.18 / 2.7.15
+dashboards and the 2.7.16 key-findings report.
+
+- A report is a sequence of `Section`s. Each section renders to one
+  fragment, and fragments are appended to an open tmp file as soon as they
+  (and all sections before them) are ready. The full document never
+  exists as a single string. The file is moved into place with os.replace
+  on close.
+- Sections can render in a joblib process pool (loky). Results stream back
+  in submission order (`return_as="generator"`), so stitching is ordered
+  and at most ~n_jobs fragments are held at once. A lazy section
+  (`Section.lazy`) loads its data inside the worker, so the parent never
+  reads the section CSVs at all.
+- Tables longer than INLINE_ROWS embed only their head. The full table goes
+  to a sidecar Parquet under `<stem>_data/`; for HTML it is also split into
+  PAGE_ROWS-row JSON pages that a small pager loads on demand (script tags,
+  so it works from file:// too).
+- Images, CSS and scripts go to a content-addressed asset store
+  (`<stem>_assets/<sha>.<ext>`). The same figure used in ten sections is
+  stored and referenced once, never base64-inlined.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html as _html
+import json
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+)
+
+import pandas as pd
+
+from dq_engine.artifacts import artifact_exists, read_artifact
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+
+FORMATS = ("html", "markdown")
+
+
+@dataclass(frozen=True)
+class ReportWriterCfg:
+    inline_rows: int = 20  # table rows embedded in the document itself
+    page_rows: int = 500  # rows per lazy-loaded JSON page (HTML)
+    sidecar_formats: tuple[str, ...] = ("parquet", "json")
+    n_jobs: int = -1
+    min_parallel: int = 4  # fewer sections than this render in-process
+    float_format: str = "{:.4g}"
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> ReportWriterCfg:
+        """REPORT_WRITER.*"""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        return cls(
+            inline_rows=max(0, int(get("REPORT_WRITER.INLINE_ROWS", 20))),
+            page_rows=max(1, int(get("REPORT_WRITER.PAGE_ROWS", 500))),
+            sidecar_formats=tuple(
+                str(f).lower()
+                for f in (get("REPORT_WRITER.SIDECAR_FORMATS", ["parquet", "json"]) or [])
+            ),
+            n_jobs=int(get("REPORT_WRITER.N_JOBS", -1)),
+            min_parallel=int(get("REPORT_WRITER.MIN_PARALLEL", 4)),
+            float_format=str(get("REPORT_WRITER.FLOAT_FORMAT", "{:.4g}")),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Sections
+# ---------------------------------------------------------------------------
+Block = tuple[str, dict[str, Any]]
+
+
+@dataclass
+class Section:
+    """
+    Ordered blocks for one report section. Build eagerly with the block
+    methods, or use `Section.lazy` to defer loading to the render worker.
+    """
+
+    section_id: str
+    title: str = ""
+    blocks: list[Block] = field(default_factory=list)
+    builder: Callable[..., Iterable[Block]] | None = None
+    builder_args: tuple[Any, ...] = ()
+
+    @classmethod
+    def lazy(
+        cls, section_id: str, title: str, builder: Callable[..., Iterable[Block]], *args: Any
+    ) -> Section:
+        """`builder(*args)` → blocks, called in the worker (must be a module-level function)."""
+        return cls(section_id, title, builder=builder, builder_args=args)
+
+    def heading(self, text: str, level: int = 3) -> Section:
+        self.blocks.append(("heading", {"text": str(text), "level": int(level)}))
+        return self
+
+    def text(self, text: str) -> Section:
+        """Plain paragraph (escaped in HTML)."""
+        self.blocks.append(("text", {"text": str(text)}))
+        return self
+
+    def raw(self, html: str = "", markdown: str = "") -> Section:
+        """Pre-rendered markup, emitted as-is for the matching format."""
+        self.blocks.append(("raw", {"html": html, "markdown": markdown}))
+        return self
+
+    def metrics(
+        self, values: Mapping[str, Any], badges: Mapping[str, str] | None = None
+    ) -> Section:
+        """Key → value list; `badges` maps a key to OK / WARN / FAIL."""
+        self.blocks.append(("metrics", {"values": dict(values), "badges": dict(badges or {})}))
+        return self
+
+    def table(
+        self, df: pd.DataFrame | None, caption: str = "", table_id: str | None = None
+    ) -> Section:
+        self.blocks.append(("table", {"df": df, "caption": caption, "table_id": table_id}))
+        return self
+
+    def image(self, source: str | Path | bytes, alt: str = "", suffix: str = ".png") -> Section:
+        """Figure from a file path or raw bytes; stored once in the asset store."""
+        self.blocks.append(("image", {"source": source, "alt": alt, "suffix": suffix}))
+        return self
+
+    def resolved_blocks(self) -> list[Block]:
+        if self.builder is None:
+            return list(self.blocks)
+        return list(self.blocks) + list(self.builder(*self.builder_args))
+
+
+def csv_table_blocks(
+    path: str | Path,
+    caption: str = "",
+    intro: str = "",
+    usecols: Sequence[str] | None = None,
+) -> list[Block]:
+    """
+    Lazy builder: one table block from a section artifact / CSV.
+
+    A missing or unreadable file becomes a text note instead.
+    """
+    path = Path(path)
+    blocks: list[Block] = [("text", {"text": intro})] if intro else []
+    if not artifact_exists(path):
+        return blocks + [("text", {"text": f"No data available ({path.name} not found)."})]
+    try:
+        df = read_artifact(path, usecols)
+    except (OSError, ValueError) as e:
+        return blocks + [("text", {"text": f"Could not read {path.name}: {e}"})]
+    # the table id is derived from `source` relative to the report root at render time
+    return blocks + [("table", {"df": df, "caption": caption or path.name, "source": str(path)})]
+
+
+# ---------------------------------------------------------------------------
+# Asset store
+# ---------------------------------------------------------------------------
+class AssetStore:
+    """Content-addressed files under `root`; safe to use from several workers at once."""
+
+    def __init__(self, root: Path, rel_prefix: str):
+        self.root = Path(root)
+        self.rel_prefix = rel_prefix.rstrip("/")
+        self.used: dict[str, int] = {}
+
+    def put(self, data: bytes | str, suffix: str) -> str:
+        """Store `data` once → path relative to the report."""
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        name = hashlib.sha256(payload).hexdigest()[:20] + suffix
+        path = self.root / name
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{name}.{os.getpid()}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        self.used[name] = len(payload)
+        return f"{self.rel_prefix}/{name}"
+
+    def put_file(self, path: str | Path) -> str:
+        path = Path(path)
+        return self.put(path.read_bytes(), path.suffix or ".bin")
+
+
+# ---------------------------------------------------------------------------
+# Rendering (runs in workers)
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Ctx:
+    fmt: str
+    root: str
+    data_dir: str
+    data_rel: str
+    asset_dir: str
+    asset_rel: str
+    inline_rows: int
+    page_rows: int
+    sidecar_formats: tuple[str, ...]
+    float_format: str
+
+
+_SLUG = re.compile(r"[^0-9A-Za-z_.-]+")
+_BADGE_CLASS = {"OK": "badge badge-ok", "WARN": "badge badge-warn", "FAIL": "badge badge-fail"}
+
+
+def _slug(s: str) -> str:
+    return _SLUG.sub("_", str(s)).strip("_") or "table"
+
+
+def _fmt_cell(v: Any, float_format: str) -> str:
+    if v is None or (isinstance(v, float) and v != v) or v is pd.NA or v is pd.NaT:
+        return ""
+    if isinstance(v, float):
+        return float_format.format(v)
+    return str(v)
+
+
+def _md_escape(s: str) -> str:
+    return s.replace("|", "\\|").replace("\n", " ")
+
+
+def _md_table(df: pd.DataFrame, float_format: str) -> str:
+    head = "| " + " | ".join(_md_escape(str(c)) for c in df.columns) + " |"
+    sep = "|" + "|".join("---" for _ in df.columns) + "|"
+    body = [
+        "| " + " | ".join(_md_escape(_fmt_cell(v, float_format)) for v in row) + " |"
+        for row in df.itertuples(index=False, name=None)
+    ]
+    return "\n".join([head, sep, *body])
+
+
+def _html_table(df: pd.DataFrame, float_format: str) -> str:
+    return df.to_html(
+        index=False,
+        classes="dq-table",
+        border=0,
+        na_rep="",
+        float_format=lambda v: float_format.format(v),
+    )
+
+
+def _write_sidecars(df: pd.DataFrame, table_id: str, ctx: _Ctx) -> dict[str, Any]:
+    """
+    Full-table Parquet and (HTML) paged JSON.
+
+    Returns {"parquet": rel path, "pages": n, "page_prefix": rel prefix}.
+    """
+    out: dict[str, Any] = {"parquet": "", "pages": 0, "page_prefix": ""}
+    base = Path(ctx.data_dir)
+    base.mkdir(parents=True, exist_ok=True)
+    if "parquet" in ctx.sidecar_formats:
+        p = base / f"{table_id}.parquet"
+        tmp = p.with_suffix(".tmp.parquet")
+        df.to_parquet(tmp, index=False, compression="zstd", row_group_size=ctx.page_rows)
+        os.replace(tmp, p)
+        out["parquet"] = f"{ctx.data_rel}/{p.name}"
+    if "json" in ctx.sidecar_formats and ctx.fmt == "html":
+        page_dir = base / table_id
+        page_dir.mkdir(parents=True, exist_ok=True)
+        cols = json.dumps([str(c) for c in df.columns], ensure_ascii=False)
+        n_pages = -(-len(df) // ctx.page_rows)
+        for k in range(n_pages):
+            chunk = df.iloc[k * ctx.page_rows : (k + 1) * ctx.page_rows]
+            # orient="values" stays in pandas' C encoder ("split" goes through to_dict)
+            rows = chunk.to_json(
+                orient="values",
+                double_precision=6,
+                date_format="iso",
+                force_ascii=False,
+                default_handler=str,
+            )
+            p = page_dir / f"p{k + 1:05d}.js"
+            tmp = p.with_suffix(".tmp")
+            tmp.write_text(
+                f'dqPage({json.dumps(table_id)},{k + 1},{{"columns":{cols},"data":{rows}}});\n',
+                encoding="utf-8",
+            )
+            os.replace(tmp, p)
+        out.update(pages=n_pages, page_prefix=f"{ctx.data_rel}/{table_id}/p")
+    return out
+
+
+def _source_id(source: str, root: str) -> str:
+    """Sidecar id for a table read from `source`: path relative to the report root, no suffix."""
+    rel = Path(os.path.relpath(Path(source).resolve().with_suffix(""), Path(root).resolve()))
+    return "_".join("up" if part == ".." else part for part in rel.parts)
+
+
+def _render_table(
+    b: dict[str, Any], default_id: str, ctx: _Ctx, assets: AssetStore
+) -> tuple[str, int]:
+    df = b["df"]
+    caption = str(b.get("caption") or "")
+    if df is None or df.empty:
+        msg = "No data available."
+        return (f"<p><em>{msg}</em></p>" if ctx.fmt == "html" else f"_{msg}_"), 0
+    table_id = b.get("table_id") or default_id
+    if not b.get("table_id") and b.get("source"):
+        table_id = _source_id(b["source"], ctx.root)
+    table_id = _slug(table_id)
+    head = df.head(ctx.inline_rows)
+    side = _write_sidecars(df, table_id, ctx) if len(df) > ctx.inline_rows else None
+    if ctx.fmt == "markdown":
+        parts = [f"**{_md_escape(caption)}**"] if caption else []
+        parts.append(_md_table(head, ctx.float_format))
+        if side is not None:
+            link = (
+                f" — full table: [{side['parquet']}]({side['parquet']})" if side["parquet"] else ""
+            )
+            parts.append(f"_Showing {len(head):,} of {len(df):,} rows{link}_")
+        return "\n\n".join(parts), int(side is not None)
+
+    esc = _html.escape
+    parts = [f'<figure class="dq-table-wrap" id="tbl-{esc(table_id)}">']
+    if caption:
+        parts.append(f"<figcaption>{esc(caption)}</figcaption>")
+    body = _html_table(head, ctx.float_format)
+    parts.append(f'<div class="dq-table-body" data-table-id="{esc(table_id)}">{body}</div>')
+    if side is not None:
+        links = [f'<a href="{esc(side["parquet"])}">Parquet</a>'] if side["parquet"] else []
+        pager = ""
+        if side["pages"]:
+            pager = (
+                f' <span class="dq-pager" data-table-id="{esc(table_id)}"'
+                f' data-pages="{side["pages"]}" data-prefix="{esc(side["page_prefix"])}"></span>'
+            )
+        parts.append(
+            f'<p class="dq-table-note">Showing {len(head):,} of {len(df):,} rows. '
+            f'{" ".join(links)}{pager}</p>'
+        )
+    parts.append("</figure>")
+    return "\n".join(parts), 1
+
+
+def render_section(section: Section, ctx: _Ctx) -> tuple[str, dict[str, Any]]:
+    """
+    Section → (fragment, stats).
+
+    stats: {"section_id", "n_tables", "n_sidecars", "assets", "seconds", "error"}.
+    """
+    t0 = time.perf_counter()
+    assets = AssetStore(Path(ctx.asset_dir), ctx.asset_rel)
+    html_fmt = ctx.fmt == "html"
+    esc = _html.escape
+    out: list[str] = []
+    n_tables = n_side = 0
+    err = ""
+    if section.title:
+        out.append(
+            f'<section id="sec-{esc(_slug(section.section_id))}">\n<h2>{esc(section.title)}</h2>'
+            if html_fmt
+            else f"## {section.title}"
+        )
+    elif html_fmt:
+        out.append(f'<section id="sec-{esc(_slug(section.section_id))}">')
+    try:
+        for i, (kind, b) in enumerate(section.resolved_blocks()):
+            if kind == "heading":
+                lvl = min(max(b["level"], 1), 6)
+                out.append(
+                    f"<h{lvl}>{esc(b['text'])}</h{lvl}>" if html_fmt else f"{'#' * lvl} {b['text']}"
+                )
+            elif kind == "text":
+                if b["text"]:
+                    out.append(f"<p>{esc(b['text'])}</p>" if html_fmt else b["text"])
+            elif kind == "raw":
+                out.append(b["html"] if html_fmt else b["markdown"])
+            elif kind == "metrics":
+                items = []
+                for k, v in b["values"].items():
+                    badge = b["badges"].get(k)
+                    if html_fmt:
+                        badge_cls = _BADGE_CLASS.get(str(badge).upper(), "badge badge-neutral")
+                        cls = f' class="{badge_cls}"' if badge else ""
+                        cell = esc(_fmt_cell(v, ctx.float_format))
+                        items.append(
+                            f"<li><strong>{esc(str(k))}</strong>: <span{cls}>{cell}</span></li>"
+                        )
+                    else:
+                        items.append(
+                            f"- **{k}**: {_fmt_cell(v, ctx.float_format)}"
+                            + (f" ({badge})" if badge else "")
+                        )
+                out.append(
+                    '<ul class="dq-metrics">' + "".join(items) + "</ul>"
+                    if html_fmt
+                    else "\n".join(items)
+                )
+            elif kind == "table":
+                frag, s = _render_table(b, f"{section.section_id}_{i}", ctx, assets)
+                out.append(frag)
+                n_tables += 1
+                n_side += s
+            elif kind == "image":
+                src = b["source"]
+                rel = (
+                    assets.put(src, b["suffix"]) if isinstance(src, bytes) else assets.put_file(src)
+                )
+                alt = b.get("alt") or ""
+                out.append(
+                    f'<img class="dq-figure" src="{esc(rel)}" alt="{esc(alt)}" loading="lazy">'
+                    if html_fmt
+                    else f"![{alt}]({rel})"
+                )
+            else:
+                raise ValueError(f"Unknown block kind: {kind}")
+    except Exception as e:  # one broken section never stops the report
+        err = f"{type(e).__name__}: {e}"
+        out.append(
+            f'<p class="dq-error">⚠️ Section failed: {esc(err)}</p>'
+            if html_fmt
+            else f"> ⚠️ Section failed: {err}"
+        )
+    if html_fmt:
+        out.append("</section>")
+    stats = {
+        "section_id": section.section_id,
+        "n_tables": n_tables,
+        "n_sidecars": n_side,
+        "assets": dict(assets.used),
+        "seconds": time.perf_counter() - t0,
+        "error": err,
+    }
+    return "\n\n".join(out) + "\n\n", stats
+
+
+def _render_batch(sections: Sequence[Section], ctx: _Ctx) -> list[tuple[str, dict[str, Any]]]:
+    return [render_section(s, ctx) for s in sections]
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+_CSS = """
+body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+       margin: 0; background: #f7f7fb; color: #222; }
+header { background: linear-gradient(135deg, #297be7, #4f7ad1); color: white; padding: 16px 24px; }
+main { padding: 16px 24px; }
+section { background: white; border-radius: 8px; padding: 12px 16px; margin-bottom: 16px;
+          box-shadow: 0 1px 2px rgba(0,0,0,.08); }
+.dq-table { border-collapse: collapse; font-size: 13px; }
+.dq-table th, .dq-table td { padding: 4px 8px; border-bottom: 1px solid #eee; text-align: left; }
+.dq-table-wrap { margin: 8px 0; overflow-x: auto; }
+.dq-table-note { font-size: 12px; color: #666; }
+.dq-figure { max-width: 100%; }
+.badge-ok { color: #137333; } .badge-warn { color: #b06000; } .badge-fail { color: #c5221f; }
+.dq-error { color: #c5221f; }
+""".strip() + "\n"
+
+_PAGER_JS = """
+(function () {
+  var state = {};
+  function render(id, page) {
+    var body = document.querySelector('.dq-table-body[data-table-id="' + id + '"]');
+    var t = document.createElement('table'); t.className = 'dq-table';
+    var hr = t.createTHead().insertRow();
+    page.columns.forEach(function (c) {
+      var th = document.createElement('th'); th.textContent = c; hr.appendChild(th);
+    });
+    var tb = t.createTBody();
+    page.data.forEach(function (r) {
+      var tr = tb.insertRow();
+      r.forEach(function (v) { tr.insertCell().textContent = v === null ? '' : v; });
+    });
+    body.replaceChildren(t);
+  }
+  window.dqPage = function (id, n, page) {
+    state[id].cache[n] = page; if (state[id].current === n) render(id, page);
+  };
+  function go(id, n) {
+    var s = state[id]; if (n < 1 || n > s.pages) return;
+    s.current = n; s.label.textContent = ' page ' + n + ' / ' + s.pages + ' ';
+    if (s.cache[n]) return render(id, s.cache[n]);
+    var tag = document.createElement('script');
+    tag.src = s.prefix + String(n).padStart(5, '0') + '.js';
+    document.head.appendChild(tag);
+  }
+  document.querySelectorAll('.dq-pager').forEach(function (el) {
+    var id = el.dataset.tableId;
+    state[id] = { pages: +el.dataset.pages, prefix: el.dataset.prefix, cache: {}, current: 0 };
+    var prev = document.createElement('button'), next = document.createElement('button');
+    prev.textContent = '◀'; next.textContent = '▶';
+    state[id].label = document.createElement('span');
+    state[id].label.textContent = ' browse all rows ';
+    prev.onclick = function () { go(id, Math.max(1, state[id].current - 1)); };
+    next.onclick = function () { go(id, state[id].current + 1); };
+    el.append(prev, state[id].label, next);
+  });
+})();
+""".strip() + "\n"
+
+
+class ReportWriter:
+    """
+    Stream sections into an HTML or Markdown report.
+
+    Usage:
+        out = out_dir / "inferential_statistics_dashboard.html"
+        with ReportWriter(out, title="Section 2.7") as w:
+            w.write(Section("kpis", "Overview").metrics({...}))
+            norm = reports / "normality_tests.csv"
+            w.write_all([Section.lazy("norm", "Normality", csv_table_blocks, norm), ...])
+        w.summary  # {"path", "bytes", "n_sections", "n_tables", "n_sidecars", "n_assets", "failed"}
+    """
+
+    def __init__(
+        self,
+        out_path: str | Path,
+        *,
+        title: str = "",
+        subtitle: str = "",
+        fmt: str | None = None,
+        cfg: ReportWriterCfg | None = None,
+    ):
+        self.out_path = Path(out_path)
+        self.fmt = fmt or (
+            "markdown" if self.out_path.suffix.lower() in (".md", ".markdown") else "html"
+        )
+        if self.fmt not in FORMATS:
+            raise ValueError(f"Unknown report format {self.fmt!r}; expected one of {FORMATS}")
+        self.cfg = cfg or ReportWriterCfg()
+        self.title, self.subtitle = title, subtitle
+        stem = self.out_path.stem
+        self.ctx = _Ctx(
+            fmt=self.fmt,
+            root=str(self.out_path.parent),
+            data_dir=str(self.out_path.parent / f"{stem}_data"),
+            data_rel=f"{stem}_data",
+            asset_dir=str(self.out_path.parent / f"{stem}_assets"),
+            asset_rel=f"{stem}_assets",
+            inline_rows=self.cfg.inline_rows,
+            page_rows=self.cfg.page_rows,
+            sidecar_formats=self.cfg.sidecar_formats,
+            float_format=self.cfg.float_format,
+        )
+        self._tmp = self.out_path.with_name(f".{self.out_path.name}.{os.getpid()}.tmp")
+        self._fh = None
+        self._assets: dict[str, int] = {}
+        self._stats: list[dict[str, Any]] = []
+        self._bytes = 0
+        self.summary: dict[str, Any] = {}
+
+    # ------------------------------------------------------------------ io
+    def __enter__(self) -> ReportWriter:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _emit(self, text: str) -> None:
+        self._fh.write(text)
+        self._bytes += len(text.encode("utf-8"))
+
+    def open(self) -> None:
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self._tmp, "w", encoding="utf-8")
+        stamp = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d %H:%M:%S UTC")
+        if self.fmt == "markdown":
+            self._emit(
+                f"# {self.title}\n\n_Generated: {stamp}_\n\n"
+                + (f"{self.subtitle}\n\n" if self.subtitle else "")
+            )
+            return
+        store = AssetStore(Path(self.ctx.asset_dir), self.ctx.asset_rel)
+        css, js = store.put(_CSS, ".css"), store.put(_PAGER_JS, ".js")
+        self._assets.update(store.used)
+        esc = _html.escape
+        self._emit(
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{esc(self.title)}</title>\n<link rel="stylesheet" href="{esc(css)}">\n'
+            f'<script defer src="{esc(js)}"></script>\n</head>\n<body>\n'
+            f"<header><h1>{esc(self.title)}</h1>"
+            f"<p>{esc(self.subtitle)} Generated: {stamp}</p></header>\n<main>\n"
+        )
+
+    def _accept(self, fragment: str, stats: dict[str, Any]) -> None:
+        self._emit(fragment)
+        self._assets.update(stats.pop("assets", {}))
+        self._stats.append(stats)
+
+    def write(self, section: Section) -> None:
+        """Render `section` in-process and append it."""
+        self._accept(*render_section(section, self.ctx))
+
+    @traced("render.report.write_all")
+    def write_all(self, sections: Sequence[Section]) -> None:
+        """Render `sections` (in parallel when worthwhile) and append them in order."""
+        sections = list(sections)
+        n_jobs = (
+            self.cfg.n_jobs
+            if self.cfg.n_jobs > 0
+            else max(1, (os.cpu_count() or 1) + 1 + self.cfg.n_jobs)
+        )
+        with span("render.report.sections", n_sections=len(sections), n_jobs=n_jobs):
+            if n_jobs == 1 or len(sections) < self.cfg.min_parallel:
+                for s in sections:
+                    self.write(s)
+                return
+            for fragment, stats in self._parallel(sections, n_jobs):
+                self._accept(fragment, stats)
+
+    def _parallel(
+        self, sections: Sequence[Section], n_jobs: int
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        from joblib import Parallel, delayed
+
+        # ordered generator: fragment k is yielded only after 0..k-1,
+        # while later ones keep rendering
+        gen = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+            delayed(_render_batch)([s], self.ctx) for s in sections
+        )
+        for part in gen:
+            yield from part
+
+    def close(self) -> dict[str, Any]:
+        if self._fh is None:
+            return self.summary
+        if self.fmt == "html":
+            self._emit("</main>\n</body>\n</html>\n")
+        self._fh.close()
+        self._fh = None
+        os.replace(self._tmp, self.out_path)
+        failed = [s["section_id"] for s in self._stats if s["error"]]
+        self.summary = {
+            "path": str(self.out_path),
+            "bytes": self._bytes,
+            "n_sections": len(self._stats),
+            "n_tables": sum(s["n_tables"] for s in self._stats),
+            "n_sidecars": sum(s["n_sidecars"] for s in self._stats),
+            "n_assets": len(self._assets),
+            "failed": failed,
+        }
+        print(
+            f"📝 Report → {self.out_path.name}: {len(self._stats)} section(s), "
+            f"{self.summary['n_sidecars']} sidecar table(s), {len(self._assets)} asset(s), "
+            f"{self._bytes / 1e6:.2f} MB" + (f" | ⚠️ {len(failed)} failed" if failed else "")
+        )
+        return self.summary
+
+    def abort(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self._tmp.unlink(missing_ok=True)
+
+
+@traced("render.report")
+def write_report(
+    out_path: str | Path,
+    sections: Sequence[Section],
+    *,
+    title: str = "",
+    subtitle: str = "",
+    fmt: str | None = None,
+    cfg: ReportWriterCfg | None = None,
+) -> dict[str, Any]:
+    """One-shot helper: stream `sections` into `out_path` → writer summary."""
+    with ReportWriter(out_path, title=title, subtitle=subtitle, fmt=fmt, cfg=cfg) as w:
+        w.write_all(sections)
+    return w.summary
@@ -0,0 +1,368 @@
+# src/dq_engine/results_store.py
+"""
+DQ_RESULTS as a time series: partitioned history, incremental rollups, trend queries.
+
+- Every row carries `run_ts` (UTC) and `run_date`. In Snowflake the table is
+  clustered on (run_date, dataset_id, check_id), so date predicates prune
+  micro-partitions the way a date partition would. In DuckDB rows are appended
+  in run_ts order, so row-group zone maps on run_date prune in the same way,
+  and an ART index on (dataset_id, check_id) serves per-check lookups.
+- DQ_RESULTS_DAILY / DQ_RESULTS_WEEKLY are materialized rollups keyed by
+  (period_start, dataset_id, check_id). `append` stages the new batch once
+  (in a uniquely named table per call, so concurrent fan-out / watch writers
+  never share a stage), aggregates only that batch and merges it in: INSERT ... ON CONFLICT DO UPDATE in DuckDB, MERGE in
+  Snowflake. History is never rescanned. Counts and sums add, min / max
+  combine, and the last_* columns follow the newest run_ts.
+  `rebuild_rollups` recomputes them from scratch, for backfills and for
+  migrating the old flat table.
+- `history(check_id, since)` reads raw rows for one check from a date
+  onwards. `trend` and `latest_status` read only the rollups, so dashboards
+  never scan the full history.
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from typing import Any, Optional, Sequence, Union
+
+import pandas as pd
+
+from dq_engine.utils.tracing import span, traced
+
+RESULT_COLUMNS = [
+    "run_id",
+    "dataset_id",
+    "check_id",
+    "check_type",
+    "severity",
+    "status",
+    "table_name",
+    "column_name",
+    "metric_name",
+    "metric_value",
+    "threshold",
+    "details_json",
+    "run_ts",
+    "run_date",
+]
+
+ROLLUP_COLUMNS = [
+    "period_start",
+    "dataset_id",
+    "check_id",
+    "check_type",
+    "metric_name",
+    "n_runs",
+    "n_pass",
+    "n_warn",
+    "n_fail",
+    "metric_min",
+    "metric_max",
+    "metric_sum",
+    "metric_count",
+    "first_run_ts",
+    "last_run_ts",
+    "last_run_id",
+    "last_status",
+    "last_metric_value",
+]
+
+ROLLUP_KEY = ("period_start", "dataset_id", "check_id")
+GRAINS = {"daily": "DQ_RESULTS_DAILY", "weekly": "DQ_RESULTS_WEEKLY"}
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _lit(v: Any) -> str:
+    if v is None:
+        return "null"
+    return "'" + str(v).replace("'", "''") + "'"
+
+
+def _date_lit(d: DateLike) -> str:
+    return f"date '{pd.Timestamp(d).date().isoformat()}'"
+
+
+def _period_start(run_date: pd.Series, grain: str) -> pd.Series:
+    d = pd.to_datetime(run_date)
+    if grain == "weekly":                     # ISO week (Monday), same as date_trunc('week', ...) in both warehouses
+        d = d - pd.to_timedelta(d.dt.weekday, unit="D")
+    return d.dt.normalize().dt.date
+
+
+class ResultsStore:
+    """DQ_RESULTS + rollups in `<database>.<dq_schema>` on a DuckDB or Snowflake `Warehouse`."""
+
+    def __init__(self, wh: Any, database: str, dq_schema: str, target: str = "snowflake",
+                 grains: Sequence[str] = ("daily", "weekly")):
+        self.wh = wh
+        self.target = target.lower()
+        self.schema_fqn = f"{database}.{dq_schema}"
+        self.table = f"{self.schema_fqn}.DQ_RESULTS"
+        unknown = set(grains) - set(GRAINS)
+        if unknown:
+            raise ValueError(f"Unknown rollup grain(s): {sorted(unknown)}; expected {sorted(GRAINS)}")
+        self.grains = tuple(grains)
+
+    @property
+    def _sf(self) -> bool:
+        return self.target == "snowflake"
+
+    def rollup_table(self, grain: str) -> str:
+        if grain not in GRAINS:
+            raise ValueError(f"Unknown rollup grain: {grain}; expected {sorted(GRAINS)}")
+        return f"{self.schema_fqn}.{GRAINS[grain]}"
+
+    # -- DDL -------------------------------------------------------------------
+    def ensure(self) -> str:
+        """Create (or migrate) DQ_RESULTS and the rollup tables; returns the DQ_RESULTS fqn."""
+        ts = "timestamp_ntz" if self._sf else "timestamp"
+        js = "variant" if self._sf else "json"
+        self.wh.execute(f"create schema if not exists {self.schema_fqn}")
+        cluster = " cluster by (run_date, dataset_id, check_id)" if self._sf else ""
+        self.wh.execute(f"""
+        create table if not exists {self.table} (
+          run_id string,
+          dataset_id string,
+          check_id string,
+          check_type string,
+          severity string,
+          status string,
+          table_name string,
+          column_name string,
+          metric_name string,
+          metric_value double,
+          threshold double,
+          details_json {js},
+          run_ts {ts},
+          run_date date
+        ){cluster}
+        """)
+        # tables created before run_ts existed (rows keep NULL run_ts and stay out of rollups until backfilled)
+        for col, typ in (("run_ts", ts), ("run_date", "date")):
+            self.wh.execute(f"alter table {self.table} add column if not exists {col} {typ}")
+        if self._sf:
+            self.wh.execute(f"alter table {self.table} cluster by (run_date, dataset_id, check_id)")
+        else:
+            self.wh.execute(f"create index if not exists DQ_RESULTS_CHECK_IDX on {self.table} (dataset_id, check_id)")
+
+        for grain in self.grains:
+            self.wh.execute(f"""
+            create table if not exists {self.rollup_table(grain)} (
+              period_start date not null,
+              dataset_id string not null,
+              check_id string not null,
+              check_type string,
+              metric_name string,
+              n_runs bigint,
+              n_pass bigint,
+              n_warn bigint,
+              n_fail bigint,
+              metric_min double,
+              metric_max double,
+              metric_sum double,
+              metric_count bigint,
+              first_run_ts {ts},
+              last_run_ts {ts},
+              last_run_id string,
+              last_status string,
+              last_metric_value double,
+              primary key (period_start, dataset_id, check_id)
+            )
+            """)
+        return self.table
+
+    # -- writes ----------------------------------------------------------------
+    @traced("results_store.append")
+    def append(self, results: pd.DataFrame, run_ts: Optional[DateLike] = None) -> int:
+        """
+        Insert a batch of CheckResult rows and fold it into every rollup.
+
+        run_ts defaults to now (UTC); rows that already carry run_ts keep it.
+        Returns the number of rows written.
+        """
+        if results.empty:
+            return 0
+        df = results.copy()
+        stamp = pd.Timestamp(run_ts if run_ts is not None else pd.Timestamp.now(tz="UTC"))
+        stamp = stamp.tz_convert("UTC").tz_localize(None) if stamp.tzinfo else stamp
+        if "run_ts" not in df.columns:
+            df["run_ts"] = stamp
+        df["run_ts"] = pd.to_datetime(df["run_ts"]).fillna(stamp)
+        df["run_date"] = df["run_ts"].dt.date
+        for c in RESULT_COLUMNS:
+            if c not in df.columns:
+                df[c] = None
+        df = df[RESULT_COLUMNS].sort_values(["dataset_id", "check_id"], kind="stable")
+
+        stage = f"{self.schema_fqn}.DQ_RESULTS_STAGE_{uuid.uuid4().hex[:16].upper()}"
+        self._begin()
+        try:
+            self.wh.write_df(self._out(df), stage, mode="replace")
+            self.wh.execute(f"insert into {self.table} ({', '.join(RESULT_COLUMNS)}) "
+                            f"select {', '.join(RESULT_COLUMNS)} from {stage}")
+            for grain in self.grains:
+                with span("results_store.rollup", grain=grain, rows_in=len(df)):
+                    self.wh.execute(self._upsert_sql(grain, stage))
+            self.wh.execute(f"drop table if exists {stage}")
+        except Exception:
+            self._rollback()
+            if self._sf:                       # no rollback for Snowflake DDL: drop the stage explicitly
+                try:
+                    self.wh.execute(f"drop table if exists {stage}")
+                except Exception:
+                    pass
+            raise
+        self._commit()
+        return len(df)
+
+    def _rollup_select(self, source: str, grain: str, where: str = "run_ts is not null") -> str:
+        """ROLLUP_COLUMNS aggregated from a DQ_RESULTS-shaped relation (the batch stage or the full table)."""
+        arg_max = "max_by" if self._sf else "arg_max_null"       # keep a NULL last value
+        period = "run_date" if grain == "daily" else "cast(date_trunc('week', run_date) as date)"
+        return f"""
+            select {period} as period_start, dataset_id, check_id,
+              {arg_max}(check_type, run_ts) as check_type, {arg_max}(metric_name, run_ts) as metric_name,
+              count(*) as n_runs,
+              count_if(upper(status) = 'PASS') as n_pass,
+              count_if(upper(status) = 'WARN') as n_warn,
+              count_if(upper(status) = 'FAIL') as n_fail,
+              min(metric_value) as metric_min, max(metric_value) as metric_max,
+              coalesce(sum(metric_value), 0) as metric_sum, count(metric_value) as metric_count,
+              min(run_ts) as first_run_ts, max(run_ts) as last_run_ts,
+              {arg_max}(run_id, run_ts) as last_run_id,
+              {arg_max}(upper(status), run_ts) as last_status,
+              {arg_max}(metric_value, run_ts) as last_metric_value
+            from {source}
+            where {where}
+            group by 1, 2, 3"""
+
+    def _upsert_sql(self, grain: str, stage: str) -> str:
+        tgt = self.rollup_table(grain)
+        t, s = ("t.", "s.") if self._sf else ("", "excluded.")
+        newer = f"{s}last_run_ts >= {t}last_run_ts or {t}last_run_ts is null"
+
+        def pick(a: str, b: str, fn: str) -> str:               # NULL-safe least / greatest in both dialects
+            return f"{fn}(coalesce({a}, {b}), coalesce({b}, {a}))"
+
+        sets = {
+            "check_type": f"coalesce({s}check_type, {t}check_type)",
+            "metric_name": f"coalesce({s}metric_name, {t}metric_name)",
+            "n_runs": f"{t}n_runs + {s}n_runs",
+            "n_pass": f"{t}n_pass + {s}n_pass",
+            "n_warn": f"{t}n_warn + {s}n_warn",
+            "n_fail": f"{t}n_fail + {s}n_fail",
+            "metric_min": pick(f"{t}metric_min", f"{s}metric_min", "least"),
+            "metric_max": pick(f"{t}metric_max", f"{s}metric_max", "greatest"),
+            "metric_sum": f"coalesce({t}metric_sum, 0) + coalesce({s}metric_sum, 0)",
+            "metric_count": f"{t}metric_count + {s}metric_count",
+            "first_run_ts": pick(f"{t}first_run_ts", f"{s}first_run_ts", "least"),
+            "last_run_ts": pick(f"{t}last_run_ts", f"{s}last_run_ts", "greatest"),
+            **{c: f"case when {newer} then {s}{c} else {t}{c} end"
+               for c in ("last_run_id", "last_status", "last_metric_value")},
+        }
+        assignments = ",\n  ".join(f"{k} = {v}" for k, v in sets.items())
+        cols = ", ".join(ROLLUP_COLUMNS)
+        if self._sf:
+            on = " and ".join(f"t.{k} = s.{k}" for k in ROLLUP_KEY)
+            return (f"merge into {tgt} t using ({self._rollup_select(stage, grain)}) s on {on}\n"
+                    f"when matched then update set\n  {assignments}\n"
+                    f"when not matched then insert ({cols}) values ({', '.join('s.' + c for c in ROLLUP_COLUMNS)})")
+        return (f"insert into {tgt} ({cols}) select {cols} from ({self._rollup_select(stage, grain)}) b\n"
+                f"on conflict ({', '.join(ROLLUP_KEY)}) do update set\n  {assignments}")
+
+    @traced("results_store.rebuild_rollups")
+    def rebuild_rollups(self, since: Optional[DateLike] = None) -> None:
+        """Recompute rollups from DQ_RESULTS (all of it, or periods starting at/after `since`)."""
+        for grain in self.grains:
+            tgt = self.rollup_table(grain)
+            where = "run_ts is not null"
+            if since is not None:
+                start = _date_lit(pd.Timestamp(_period_start(pd.Series([pd.Timestamp(since)]), grain).iloc[0]))
+                where += f" and run_date >= {start}"
+                self.wh.execute(f"delete from {tgt} where period_start >= {start}")
+            else:
+                self.wh.execute(f"delete from {tgt}")
+            self.wh.execute(f"insert into {tgt} ({', '.join(ROLLUP_COLUMNS)}) {self._rollup_select(self.table, grain, where)}")
+
+    # -- reads -----------------------------------------------------------------
+    def history(
+        self,
+        check_id: str,
+        since: Optional[DateLike] = None,
+        *,
+        dataset_id: Optional[str] = None,
+        until: Optional[DateLike] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Raw DQ_RESULTS rows for one check, oldest first; `since`/`until` prune on run_date."""
+        cols = ", ".join(columns) if columns else ", ".join(RESULT_COLUMNS)
+        where = [f"check_id = {_lit(check_id)}"]
+        if dataset_id is not None:
+            where.append(f"dataset_id = {_lit(dataset_id)}")
+        if since is not None:
+            where.append(f"run_date >= {_date_lit(since)}")
+        if until is not None:
+            where.append(f"run_date <= {_date_lit(until)}")
+        return self._read(f"select {cols} from {self.table} where {' and '.join(where)} order by run_ts")
+
+    def trend(
+        self,
+        check_id: str,
+        *,
+        grain: str = "daily",
+        since: Optional[DateLike] = None,
+        dataset_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Rollup rows for one check with metric_avg and pass_rate; never touches DQ_RESULTS."""
+        where = [f"check_id = {_lit(check_id)}"]
+        if dataset_id is not None:
+            where.append(f"dataset_id = {_lit(dataset_id)}")
+        if since is not None:
+            where.append(f"period_start >= {_date_lit(since)}")
+        return self._read(f"""
+        select {', '.join(ROLLUP_COLUMNS)},
+          metric_sum / nullif(metric_count, 0) as metric_avg,
+          cast(n_pass as double) / nullif(n_runs, 0) as pass_rate
+        from {self.rollup_table(grain)}
+        where {' and '.join(where)}
+        order by period_start
+        """)
+
+    def latest_status(self, dataset_id: Optional[str] = None) -> pd.DataFrame:
+        """Newest status / metric per (dataset_id, check_id), read from the daily (or first) rollup."""
+        grain = "daily" if "daily" in self.grains else self.grains[0]
+        where = f"where dataset_id = {_lit(dataset_id)}" if dataset_id is not None else ""
+        return self._read(f"""
+        select dataset_id, check_id, check_type, metric_name,
+          last_status as status, last_metric_value as metric_value, last_run_id as run_id, last_run_ts as run_ts
+        from {self.rollup_table(grain)}
+        {where}
+        qualify row_number() over (partition by dataset_id, check_id order by last_run_ts desc) = 1
+        order by dataset_id, check_id
+        """)
+
+    # -- helpers ---------------------------------------------------------------
+    def _read(self, sql: str) -> pd.DataFrame:
+        df = self.wh.read_df(sql)
+        df.columns = [str(c).lower() for c in df.columns]
+        return df
+
+    def _out(self, df: pd.DataFrame) -> pd.DataFrame:
+        # write_pandas quotes identifiers: upper-case names match Snowflake's unquoted DDL
+        return df.rename(columns=str.upper) if self._sf else df
+
+    def _begin(self) -> None:
+        if not self._sf:                       # Snowflake DDL (write_pandas auto-create) commits implicitly
+            self.wh.execute("begin transaction")
+
+    def _commit(self) -> None:
+        if not self._sf:
+            self.wh.execute("commit")
+
+    def _rollback(self) -> None:
+        if not self._sf:
+            try:
+                self.wh.execute("rollback")
+            except Exception:
+                pass
@@ -0,0 +1,724 @@
+# src/dq_engine/sampling.py
+"""
+First-class approximate profiling mode.
+
+- `SamplingCfg` is read once from the `SAMPLING` config block (replaces ad hoc
+  limits like CATEGORICAL.ASSOCIATION_SAMPLE_LIMIT in 2.4.9).
+- Samples are reservoir / Bernoulli / stratified (on TARGET.COLUMN + key
+  categoricals), with seeds derived deterministically per section so re-runs
+  draw the same rows.
+- When the data lives in DuckDB / Snowflake the sample is pushed down as SQL
+  (`TABLESAMPLE ... REPEATABLE` / QUALIFY row_number()).
+- Metric helpers return point estimates with confidence intervals, weighted by
+  the sample's `_sample_weight`: Wilson / normal intervals for the profile
+  (`approx_numeric_profile`), percentile bootstrap intervals for drift
+  (`approx_drift`: PSI / KS against a baseline) and association
+  (`approx_association`: Cramér's V). Any metric whose interval reaches a
+  DATA_CONTRACTS threshold is flagged for a full scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import operator
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import traced
+
+_NORMAL_Z = {0.80: 1.2816, 0.90: 1.6449, 0.95: 1.9600, 0.98: 2.3263, 0.99: 2.5758}
+
+WEIGHT_COL = "_sample_weight"
+
+
+@dataclass(frozen=True)
+class SamplingCfg:
+    enabled: bool = False
+    method: str = "stratified"  # stratified | reservoir | bernoulli
+    max_rows: int = 100_000
+    fraction: float | None = None  # overrides max_rows when set
+    strata: tuple[str, ...] = ()
+    min_per_stratum: int = 50
+    seed: int = 42
+    confidence: float = 0.95
+    n_bootstraps: int = 200
+    escalate_margin: float = 0.10
+    pushdown: bool = True
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None = None) -> SamplingCfg:
+        """Build from SAMPLING.*; TARGET.COLUMN is always the first stratum."""
+        get = lambda k, d=None: C(k, d, config=config)  # noqa: E731
+        strata = [get("TARGET.COLUMN")] + list(get("SAMPLING.STRATA", []) or [])
+        strata = tuple(dict.fromkeys(s for s in strata if s))
+        frac = get("SAMPLING.FRACTION")
+        return cls(
+            enabled=bool(get("SAMPLING.ENABLED", False)),
+            method=str(get("SAMPLING.METHOD", "stratified")).lower(),
+            max_rows=int(get("SAMPLING.MAX_ROWS", 100_000)),
+            fraction=float(frac) if frac is not None else None,
+            strata=strata,
+            min_per_stratum=int(get("SAMPLING.MIN_PER_STRATUM", 50)),
+            seed=int(get("SAMPLING.RANDOM_SEED", 42)),
+            confidence=float(get("SAMPLING.CONFIDENCE", 0.95)),
+            n_bootstraps=int(get("SAMPLING.N_BOOTSTRAPS", 200)),
+            escalate_margin=float(get("SAMPLING.ESCALATE_MARGIN", 0.10)),
+            pushdown=bool(get("SAMPLING.PUSHDOWN", True)),
+        )
+
+    def target_rows(self, population_rows: int) -> int:
+        if self.fraction is not None:
+            return max(1, int(math.ceil(self.fraction * population_rows)))
+        return min(int(self.max_rows), int(population_rows))
+
+
+@dataclass
+class SampleResult:
+    frame: pd.DataFrame
+    population_rows: int
+    method: str
+    seed: int
+    strata: tuple[str, ...] = ()
+    exact: bool = False  # True when the "sample" is the full frame
+
+    @property
+    def sample_rows(self) -> int:
+        return int(self.frame.shape[0])
+
+    @property
+    def weights(self) -> np.ndarray:
+        if WEIGHT_COL in self.frame.columns:
+            return self.frame[WEIGHT_COL].to_numpy(dtype="float64")
+        return np.ones(self.sample_rows)
+
+
+def derive_seed(base_seed: int, *keys: Any) -> int:
+    """Stable 32-bit seed for (base_seed, section, column, ...) — same inputs, same rows."""
+    h = hashlib.sha256(("|".join([str(base_seed)] + [str(k) for k in keys])).encode("utf-8"))
+    return int.from_bytes(h.digest()[:4], "little")
+
+
+# ---------------------------------------------------------------------------
+# In-memory samplers
+# ---------------------------------------------------------------------------
+@traced("engine.sampling.reservoir_sample")
+def reservoir_sample(chunks: Iterable[pd.DataFrame], k: int, *, seed: int = 42) -> SampleResult:
+    """
+    Uniform k-row sample from a stream of chunks (random-priority reservoir).
+
+    Each row gets a seeded U(0,1) priority; the k smallest survive. Works for
+    CSV/Parquet chunk iterators where the population size is unknown upfront.
+    """
+    rng = np.random.default_rng(seed)
+    keep: pd.DataFrame | None = None
+    keep_keys = np.empty(0)
+    total = 0
+    for chunk in chunks:
+        if chunk is None or chunk.empty:
+            continue
+        total += len(chunk)
+        keys = rng.random(len(chunk))
+        if keep is None:
+            keep, keep_keys = chunk, keys
+        else:
+            keep = pd.concat([keep, chunk], ignore_index=True)
+            keep_keys = np.concatenate([keep_keys, keys])
+        if len(keep_keys) > k:
+            idx = np.argpartition(keep_keys, k - 1)[:k]
+            keep, keep_keys = keep.iloc[idx].reset_index(drop=True), keep_keys[idx]
+
+    frame = keep if keep is not None else pd.DataFrame()
+    frame = frame.copy()
+    frame[WEIGHT_COL] = (total / len(frame)) if len(frame) else 1.0
+    return SampleResult(frame, total, "reservoir", seed, exact=len(frame) == total)
+
+
+@traced("engine.sampling.stratified_sample")
+def stratified_sample(
+    df: pd.DataFrame,
+    strata: Sequence[str],
+    n_rows: int,
+    *,
+    seed: int = 42,
+    min_per_stratum: int = 50,
+) -> SampleResult:
+    """
+    Proportional stratified sample with a per-stratum floor.
+
+    Rare strata (e.g. churners in a small segment) keep at least
+    `min_per_stratum` rows; `_sample_weight` = N_h / n_h restores population
+    estimates.
+    """
+    strata = [s for s in strata if s in df.columns]
+    N = len(df)
+    if N == 0 or n_rows >= N:
+        out = df.copy()
+        out[WEIGHT_COL] = 1.0
+        return SampleResult(out, N, "stratified", seed, tuple(strata), exact=True)
+    if not strata:
+        rng = np.random.default_rng(seed)
+        idx = np.sort(rng.choice(N, size=n_rows, replace=False))
+        out = df.iloc[idx].copy()
+        out[WEIGHT_COL] = N / n_rows
+        return SampleResult(out, N, "bernoulli", seed, exact=False)
+
+    codes = df.groupby(list(strata), dropna=False, sort=False).ngroup().to_numpy()
+    sizes = np.bincount(codes)
+    alloc = np.minimum(sizes, np.maximum(np.ceil(sizes * n_rows / N), min_per_stratum)).astype(
+        "int64"
+    )
+
+    rng = np.random.default_rng(seed)
+    prio = rng.random(N)
+    order = np.lexsort((prio, codes))
+    starts = np.cumsum(sizes) - sizes
+    pos_in_stratum = np.arange(N) - starts[codes[order]]
+    picked = order[pos_in_stratum < alloc[codes[order]]]
+    picked.sort()
+
+    out = df.iloc[picked].copy()
+    out[WEIGHT_COL] = (sizes / np.maximum(alloc, 1))[codes[picked]]
+    return SampleResult(out, N, "stratified", seed, tuple(strata), exact=False)
+
+
+def sample_frame(df: pd.DataFrame, cfg: SamplingCfg, *, section: str = "") -> SampleResult:
+    """Section entry point: full frame when disabled / small, else the configured sampler."""
+    seed = derive_seed(cfg.seed, section) if section else cfg.seed
+    n = cfg.target_rows(len(df))
+    if not cfg.enabled or n >= len(df):
+        out = df.copy()
+        out[WEIGHT_COL] = 1.0
+        return SampleResult(out, len(df), "full", seed, exact=True)
+    if cfg.method == "stratified":
+        return stratified_sample(df, cfg.strata, n, seed=seed, min_per_stratum=cfg.min_per_stratum)
+    if cfg.method == "reservoir":
+        return reservoir_sample([df], n, seed=seed)
+    return stratified_sample(df, (), n, seed=seed)
+
+
+# ---------------------------------------------------------------------------
+# Warehouse push-down
+# ---------------------------------------------------------------------------
+def sample_sql(
+    table: str,
+    cfg: SamplingCfg,
+    *,
+    population_rows: int | None = None,
+    dialect: str = "duckdb",
+    order_key: str = "rowid",
+    columns: str = "*",
+    section: str = "",
+) -> str:
+    """
+    SQL that samples `table` inside the warehouse.
+
+    - reservoir / bernoulli → TABLESAMPLE ... REPEATABLE (seed)
+    - stratified (DuckDB)   → QUALIFY row_number() per stratum ordered by a seeded hash,
+      with the same proportional allocation + floor as `stratified_sample`.
+    """
+    seed = derive_seed(cfg.seed, section) if section else cfg.seed
+    dialect = dialect.lower()
+    n = cfg.target_rows(population_rows) if population_rows is not None else int(cfg.max_rows)
+    frac = (
+        cfg.fraction
+        if cfg.fraction is not None
+        else (min(1.0, n / population_rows) if population_rows else None)
+    )
+
+    if cfg.method == "stratified" and cfg.strata and dialect == "duckdb":
+        part = ", ".join(f'"{s}"' for s in cfg.strata)
+        f = frac if frac is not None else 1.0
+        return (
+            f"select {columns}, count(*) over (partition by {part}) "
+            f"/ greatest(1, least(count(*) over (partition by {part}), "
+            f"greatest({cfg.min_per_stratum}, ceil({f} * count(*) over (partition by {part}))))) "
+            f"as {WEIGHT_COL} "
+            f"from {table} "
+            f"qualify row_number() over (partition by {part} order by hash({order_key}, {seed})) "
+            f"<= greatest({cfg.min_per_stratum}, ceil({f} * count(*) over (partition by {part})))"
+        )
+
+    if dialect == "snowflake":
+        pct = 100.0 * (frac if frac is not None else 1.0)
+        return (
+            f"select {columns} from {table} tablesample bernoulli ({pct:.6f}) repeatable ({seed})"
+        )
+
+    if cfg.method == "bernoulli" and frac is not None:
+        pct = 100.0 * frac
+        return (
+            f"select {columns} from {table} tablesample bernoulli({pct:.6f}%) repeatable ({seed})"
+        )
+    return f"select {columns} from {table} using sample reservoir({n} rows) repeatable ({seed})"
+
+
+@traced("engine.sampling.sample_table")
+def sample_table(
+    wh, table: str, cfg: SamplingCfg, *, dialect: str = "duckdb", section: str = ""
+) -> SampleResult:
+    """Pull a sample of a warehouse table via `sample_sql` (one count + one sampled read)."""
+    N = int(wh.read_df(f"select count(*) as n from {table}").iloc[0, 0])
+    if not cfg.enabled or cfg.target_rows(N) >= N:
+        df = wh.read_df(f"select * from {table}")
+        df[WEIGHT_COL] = 1.0
+        return SampleResult(df, N, "full", cfg.seed, exact=True)
+    sql = sample_sql(table, cfg, population_rows=N, dialect=dialect, section=section)
+    df = wh.read_df(sql)
+    if WEIGHT_COL not in df.columns:
+        df[WEIGHT_COL] = N / max(1, len(df))
+    seed = derive_seed(cfg.seed, section) if section else cfg.seed
+    return SampleResult(df, N, cfg.method, seed, cfg.strata, exact=False)
+
+
+# ---------------------------------------------------------------------------
+# Error bounds
+# ---------------------------------------------------------------------------
+def _z(confidence: float) -> float:
+    if confidence in _NORMAL_Z:
+        return _NORMAL_Z[confidence]
+    try:
+        from scipy.stats import norm
+
+        return float(norm.ppf(0.5 + confidence / 2.0))
+    except Exception:
+        return 1.96
+
+
+def _fpc(n: float, N: float | None) -> float:
+    """Finite population correction factor for the standard error."""
+    if not N or N <= 1 or n >= N:
+        return 0.0 if (N and n >= N) else 1.0
+    return math.sqrt((N - n) / (N - 1))
+
+
+def proportion_ci(
+    successes: float, n: float, *, population: float | None = None, confidence: float = 0.95
+) -> tuple[float, float, float]:
+    """Wilson interval (with finite population correction) → (p_hat, low, high)."""
+    if n <= 0:
+        return float("nan"), float("nan"), float("nan")
+    p = successes / n
+    f = _fpc(n, population)
+    if f == 0.0:
+        return p, p, p
+    z = _z(confidence) * f
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return p, max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _weighted_var(v: np.ndarray, w: np.ndarray, m: float) -> float:
+    """Weighted variance with the n / (n - 1) correction (= the ddof=1 variance when w == 1)."""
+    n = v.size
+    return float(np.average((v - m) ** 2, weights=w)) * n / (n - 1)
+
+
+def mean_ci(
+    values: np.ndarray,
+    *,
+    weights: np.ndarray | None = None,
+    population: float | None = None,
+    confidence: float = 0.95,
+) -> tuple[float, float, float]:
+    """(Weighted) mean with a normal CI; weights are stratum expansion weights."""
+    v = np.asarray(values, dtype="float64")
+    w = np.ones_like(v) if weights is None else np.asarray(weights, dtype="float64")
+    ok = ~np.isnan(v)
+    v, w = v[ok], w[ok]
+    n = v.size
+    if n == 0:
+        return float("nan"), float("nan"), float("nan")
+    m = float(np.average(v, weights=w))
+    if n < 2:
+        return m, float("nan"), float("nan")
+    # Kish effective sample size accounts for unequal weights
+    n_eff = w.sum() ** 2 / (w * w).sum()
+    var = _weighted_var(v, w, m)
+    half = _z(confidence) * math.sqrt(var / n_eff) * _fpc(n, population)
+    return m, m - half, m + half
+
+
+def bootstrap_ci(
+    fn: Callable[..., float],
+    *arrays: np.ndarray | tuple[np.ndarray, ...],
+    n_boot: int = 200,
+    seed: int = 42,
+    confidence: float = 0.95,
+) -> tuple[float, float, float]:
+    """
+    Percentile bootstrap for any sample statistic (PSI, KS, Cramér's V, ...).
+
+    Each argument is resampled independently with a seeded generator; a tuple of
+    equal-length arrays is resampled as one (paired columns, values + weights).
+    `fn` gets the arrays flattened in argument order.
+    """
+    groups = [
+        tuple(np.asarray(x) for x in a) if isinstance(a, tuple) else (np.asarray(a),)
+        for a in arrays
+    ]
+    for g in groups:
+        if len({len(x) for x in g}) > 1:
+            raise ValueError(f"bootstrap_ci: paired arrays differ in length {[len(x) for x in g]}")
+    est = float(fn(*(x for g in groups for x in g)))
+    rng = np.random.default_rng(seed)
+    reps = np.empty(n_boot)
+    for b in range(n_boot):
+        draw = []
+        for g in groups:
+            idx = rng.integers(0, len(g[0]), len(g[0]))
+            draw += [x[idx] for x in g]
+        reps[b] = fn(*draw)
+    alpha = (1 - confidence) / 2
+    reps = reps[np.isfinite(reps)]
+    if reps.size == 0:
+        return est, float("nan"), float("nan")
+    return est, float(np.quantile(reps, alpha)), float(np.quantile(reps, 1 - alpha))
+
+
+def approx_numeric_profile(
+    sample: SampleResult, cols: Sequence[str] | None = None, *, confidence: float = 0.95
+) -> pd.DataFrame:
+    """
+    numeric_profile_df-compatible rows (column, null_pct, mean, std, min, max)
+    plus `*_ci_low/_ci_high`, `n_sample`, `n_population`, `exact`.
+
+    null_pct, mean and std are weighted population estimates. min / max are the
+    sample extremes: weights cannot move them, and they bound the population's.
+    """
+    df = sample.frame
+    w = sample.weights
+    if cols is None:
+        cols = [c for c in df.select_dtypes("number").columns if c != WEIGHT_COL]
+    N = sample.population_rows
+    rows = []
+    for c in cols:
+        v = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        isnull = np.isnan(v)
+        share = float((w * isnull).sum() / w.sum()) if v.size else 0.0
+        p, lo, hi = proportion_ci(share * v.size, v.size, population=N, confidence=confidence)
+        null_p, nlo, nhi = p * 100, lo * 100, hi * 100
+        m, mlo, mhi = mean_ci(v, weights=w, population=N, confidence=confidence)
+        ok = ~isnull
+        std = math.sqrt(_weighted_var(v[ok], w[ok], m)) if ok.sum() > 1 else float("nan")
+        rows.append(
+            {
+                "column": c,
+                "null_pct": null_p,
+                "null_pct_ci_low": nlo,
+                "null_pct_ci_high": nhi,
+                "mean": m,
+                "mean_ci_low": mlo,
+                "mean_ci_high": mhi,
+                "std": std,
+                "min": float(np.nanmin(v)) if ok.any() else float("nan"),
+                "max": float(np.nanmax(v)) if ok.any() else float("nan"),
+                "n_sample": int(v.size),
+                "n_population": int(N),
+                "exact": bool(sample.exact),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# ---------------------------------------------------------------------------
+# Drift / association with bootstrap intervals
+# ---------------------------------------------------------------------------
+def _values(s: pd.Series) -> np.ndarray:
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _weights_for(v: np.ndarray, weights: np.ndarray | None) -> np.ndarray:
+    return np.ones(v.size) if weights is None else np.asarray(weights, dtype="float64")
+
+
+def drift_cuts(baseline: np.ndarray, n_bins: int = 10) -> np.ndarray:
+    """Inner bin edges at the baseline's quantiles (open-ended first / last bins)."""
+    b = np.asarray(baseline, dtype="float64")
+    b = b[np.isfinite(b)]
+    if b.size == 0:
+        return np.empty(0)
+    return np.unique(np.quantile(b, np.linspace(0, 1, n_bins + 1)[1:-1]))
+
+
+def _bin_shares(v: np.ndarray, w: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    ok = ~np.isnan(v)
+    counts = np.bincount(
+        np.searchsorted(cuts, v[ok], side="right"), weights=w[ok], minlength=cuts.size + 1
+    )
+    total = counts.sum()
+    return counts / total if total else counts
+
+
+def psi(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    cuts: np.ndarray,
+    weights: np.ndarray | None = None,
+    *,
+    eps: float = 1e-4,
+) -> float:
+    """Population stability index of (weighted) `actual` against `expected` on `cuts`."""
+    expected, actual = np.asarray(expected, dtype="float64"), np.asarray(actual, dtype="float64")
+    e = np.clip(_bin_shares(expected, np.ones(expected.size), cuts), eps, None)
+    a = np.clip(_bin_shares(actual, _weights_for(actual, weights), cuts), eps, None)
+    return float(((a - e) * np.log(a / e)).sum())
+
+
+def ks_stat(expected: np.ndarray, actual: np.ndarray, weights: np.ndarray | None = None) -> float:
+    """Two-sample Kolmogorov–Smirnov distance; `actual` uses its weights in its ECDF."""
+    e = np.sort(np.asarray(expected, dtype="float64"))
+    e = e[~np.isnan(e)]
+    a = np.asarray(actual, dtype="float64")
+    ok = ~np.isnan(a)
+    a, w = a[ok], _weights_for(a, weights)[ok]
+    if e.size == 0 or a.size == 0 or w.sum() <= 0:
+        return float("nan")
+    o = np.argsort(a, kind="stable")
+    a, cw = a[o], np.r_[0.0, np.cumsum(w[o])] / w.sum()
+    grid = np.concatenate([e, a])
+    fe = np.searchsorted(e, grid, side="right") / e.size
+    fa = cw[np.searchsorted(a, grid, side="right")]
+    return float(np.abs(fe - fa).max())
+
+
+def _cramers_v_codes(x: np.ndarray, y: np.ndarray, w: np.ndarray) -> float:
+    ok = (x >= 0) & (y >= 0)
+    x, y, w = x[ok], y[ok], w[ok]
+    if x.size == 0:
+        return float("nan")
+    ky = int(y.max()) + 1
+    obs = np.bincount(x * ky + y, weights=w, minlength=(int(x.max()) + 1) * ky).reshape(-1, ky)
+    obs = obs[obs.sum(axis=1) > 0][:, obs.sum(axis=0) > 0]
+    r, k = obs.shape
+    total = obs.sum()
+    if min(r, k) < 2 or total <= 0:
+        return float("nan")
+    exp = np.outer(obs.sum(axis=1), obs.sum(axis=0)) / total
+    chi2 = float(((obs - exp) ** 2 / exp).sum())
+    return math.sqrt(chi2 / total / (min(r, k) - 1))
+
+
+def cramers_v(x: Sequence[Any], y: Sequence[Any], weights: np.ndarray | None = None) -> float:
+    """(Weighted) Cramér's V of two categorical columns; rows with a null in either are dropped."""
+    xc, yc = pd.factorize(pd.Series(x))[0], pd.factorize(pd.Series(y))[0]
+    return _cramers_v_codes(xc, yc, _weights_for(xc, weights))
+
+
+def _boot_cols(est: float, lo: float, hi: float, name: str, exact: bool) -> dict[str, float]:
+    # a full-frame "sample" has no sampling error: the interval collapses to the point
+    if exact:
+        lo = hi = est
+    return {name: est, f"{name}_ci_low": lo, f"{name}_ci_high": hi}
+
+
+@traced("engine.sampling.approx_drift")
+def approx_drift(
+    baseline: pd.DataFrame,
+    sample: SampleResult,
+    cols: Sequence[str] | None = None,
+    *,
+    n_bins: int = 10,
+    confidence: float = 0.95,
+    n_boot: int = 200,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Per numeric column: weighted PSI (on `n_bins` baseline quantile bins) and KS of
+    the sample against `baseline`, each with a bootstrap CI over the sample's rows
+    (the baseline is the fixed reference), plus `n_sample`, `n_population`, `exact`.
+    """
+    df, w = sample.frame, sample.weights
+    if cols is None:
+        cols = [
+            c
+            for c in df.select_dtypes("number").columns
+            if c != WEIGHT_COL and c in baseline.columns
+        ]
+    rows = []
+    for c in cols:
+        base, v = _values(baseline[c]), _values(df[c])
+        cuts = drift_cuts(base, n_bins)
+        row: dict[str, Any] = {"column": c}
+        for name, fn in (
+            ("psi", lambda a, aw, base=base, cuts=cuts: psi(base, a, cuts, aw)),
+            ("ks", lambda a, aw, base=base: ks_stat(base, a, aw)),
+        ):
+            ci = bootstrap_ci(
+                fn,
+                (v, w),
+                n_boot=n_boot,
+                seed=derive_seed(seed, "drift", name, c),
+                confidence=confidence,
+            )
+            row.update(_boot_cols(*ci, name, sample.exact))
+        row.update(n_sample=int(v.size), n_population=sample.population_rows, exact=sample.exact)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@traced("engine.sampling.approx_association")
+def approx_association(
+    sample: SampleResult,
+    cols: Sequence[str] | None = None,
+    *,
+    confidence: float = 0.95,
+    n_boot: int = 200,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Weighted Cramér's V for every pair of categorical `cols` with a bootstrap CI
+    (rows resampled as pairs, weights included), plus `n_sample`, `n_population`,
+    `exact`.
+    """
+    df, w = sample.frame, sample.weights
+    if cols is None:
+        cols = [
+            c
+            for c in df.select_dtypes(exclude="number").columns
+            if c != WEIGHT_COL and not is_datetime64_any_dtype(df[c])
+        ]
+    codes = {c: pd.factorize(df[c])[0] for c in cols}
+    rows = []
+    for i, a in enumerate(cols):
+        for b in cols[i + 1 :]:
+            ci = bootstrap_ci(
+                _cramers_v_codes,
+                (codes[a], codes[b], w),
+                n_boot=n_boot,
+                seed=derive_seed(seed, "association", a, b),
+                confidence=confidence,
+            )
+            rows.append(
+                {
+                    "column_a": a,
+                    "column_b": b,
+                    **_boot_cols(*ci, "cramers_v", sample.exact),
+                    "n_sample": sample.sample_rows,
+                    "n_population": sample.population_rows,
+                    "exact": sample.exact,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+# ---------------------------------------------------------------------------
+# Escalation against DATA_CONTRACTS
+# ---------------------------------------------------------------------------
+_OPS: dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def _contract_rules(contracts: list[dict[str, Any]] | None, scope: str) -> list[dict[str, Any]]:
+    out = []
+    for c in contracts or []:
+        if not isinstance(c, Mapping) or c.get("scope") != scope:
+            continue
+        if c.get("op") in _OPS and isinstance(c.get("threshold"), (int, float)):
+            out.append(c)
+    return out
+
+
+def flag_escalations(
+    metrics: pd.DataFrame,
+    contracts: list[dict[str, Any]] | None,
+    *,
+    scope: str = "numeric_profile",
+    margin: float = 0.10,
+    key_col: str = "column",
+) -> pd.DataFrame:
+    """
+    Mark rows whose sampled metric could flip a DATA_CONTRACTS verdict.
+
+    A row escalates when its CI straddles a contract threshold, or when the
+    point estimate sits within `margin` (relative) of it. Adds
+    `escalate` (bool) and `escalate_reason`.
+    """
+    out = metrics.copy()
+    out["escalate"] = False
+    out["escalate_reason"] = ""
+    if out.empty:
+        return out
+    exact = (
+        out["exact"].to_numpy(dtype=bool)
+        if "exact" in out.columns
+        else np.zeros(len(out), dtype=bool)
+    )
+
+    for rule in _contract_rules(contracts, scope):
+        target = rule.get("target")
+        if target not in out.columns:
+            continue
+        thr = float(rule["threshold"])
+        where_col = (
+            (rule.get("where") or {}).get("column")
+            if isinstance(rule.get("where"), Mapping)
+            else None
+        )
+        sel = (
+            np.ones(len(out), dtype=bool)
+            if where_col is None
+            else (out[key_col] == where_col).to_numpy()
+        )
+        val = pd.to_numeric(out[target], errors="coerce").to_numpy(dtype="float64")
+        lo = pd.to_numeric(out.get(f"{target}_ci_low", out[target]), errors="coerce").to_numpy(
+            dtype="float64"
+        )
+        hi = pd.to_numeric(out.get(f"{target}_ci_high", out[target]), errors="coerce").to_numpy(
+            dtype="float64"
+        )
+        straddle = (lo <= thr) & (hi >= thr)
+        near = np.abs(val - thr) <= margin * max(abs(thr), 1e-12)
+        hit = sel & ~exact & (straddle | near)
+        out.loc[hit, "escalate"] = True
+        out.loc[hit, "escalate_reason"] = (
+            out.loc[hit, "escalate_reason"].where(
+                out.loc[hit, "escalate_reason"] == "", out.loc[hit, "escalate_reason"] + "; "
+            )
+            + f"{rule.get('name', target)}: {target} {rule['op']} {thr}"
+        )
+    return out
+
+
+@traced("engine.sampling.profile_with_escalation")
+def profile_with_escalation(
+    df: pd.DataFrame,
+    cfg: SamplingCfg,
+    contracts: list[dict[str, Any]] | None = None,
+    *,
+    section: str = "2.3",
+    cols: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Sampled numeric profile; columns flagged by `flag_escalations` are re-profiled
+    on the full frame so contract verdicts never rest on a borderline estimate.
+    """
+    sample = sample_frame(df, cfg, section=section)
+    prof = approx_numeric_profile(sample, cols, confidence=cfg.confidence)
+    prof = flag_escalations(prof, contracts, margin=cfg.escalate_margin)
+    todo = prof.loc[prof["escalate"], "column"].tolist()
+    if todo:
+        full = df[todo].copy()
+        full[WEIGHT_COL] = 1.0
+        exact = approx_numeric_profile(
+            SampleResult(full, len(df), "full", cfg.seed, exact=True), todo
+        )
+        exact["escalate"] = True
+        exact["escalate_reason"] = prof.set_index("column").loc[todo, "escalate_reason"].to_numpy()
+        order = {c: i for i, c in enumerate(prof["column"])}
+        prof = pd.concat([prof[~prof["escalate"]], exact], ignore_index=True)
+        prof = prof.sort_values("column", key=lambda s: s.map(order), ignore_index=True)
+    return prof
@@ -1,14 +1,177 @@
 # /Users/b/DATA/PROJECTS/Telco/_T2/Level_3/src/dq_engine/utils/config.py
 
 from __future__ import annotations
+import copy
+import hashlib
+import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 import yaml
 
 # Bound config lives here (not notebook globals)
 _BOUND_CONFIG: Dict[str, Any] = {}
 _BOUND_CONFIG_PATH: Optional[str] = None
+_BOUND_VIEW: Optional["ConfigView"] = None
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+class ConfigView:
+    """
+    Compiled view of a config dict, built once per bind.
+
+    - `get`: each (key, roots) is parsed once into its candidate paths (the
+      key, then each root prefix), memoized; a lookup is then a few dict hits
+      on the live config with no string work. Values are the config's own
+      dict / list / scalar objects, so in-place edits to CONFIG (the notebook
+      does `CONFIG[key] = {}`) are seen by the next lookup
+    - `index`: every reachable dotted key ("RANGES.tenure.max", "RANGES.tenure",
+      "RANGES", ...) -> frozen value, as of the bind
+    - `aliases`: YAML anchors resolved — each aliased path points at its anchor
+      (e.g. CATEGORICAL.VALID_DOMAINS -> EXPECTED_LEVELS); bind_config gives
+      aliased subtrees their own copy, so editing one no longer edits the other
+    - `hash(key)`: per-subtree content hash (computed bottom-up once), for cache keys
+    - `sections`: typed section objects from config/schema.py, validated at build time
+    - `index`, `hash` and `sections` are snapshots: refresh_config() recompiles
+      them after in-place edits
+    """
+
+    def __init__(self, cfg: Mapping[str, Any], *, source: Optional[str] = None, validate: bool = True):
+        self.source = source
+        self._cfg = cfg
+        index: Dict[str, Any] = {}
+        hashes: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+        seen: Dict[int, str] = {}
+        self._root_hash = self._build(cfg, "", index, hashes, aliases, seen)
+        self.index: Mapping[str, Any] = MappingProxyType(index)
+        self.aliases: Mapping[str, str] = MappingProxyType(aliases)
+        self._hashes: Mapping[str, str] = MappingProxyType(hashes)
+        self._resolved: Dict[Tuple[str, Tuple[str, ...]], Optional[str]] = {}
+        self._paths: dict[tuple[str, tuple[str, ...]], tuple[tuple[str, ...], ...]] = {}
+
+        self.sections: Mapping[str, Any] = MappingProxyType({})
+        if validate:
+            from dq_engine.config.schema import validate_sections
+            self.sections = MappingProxyType(validate_sections(cfg))
+
+    def _build(self, node: Any, path: str, index, hashes, aliases, seen, in_alias: bool = False) -> str:
+        # Walk in document order so the first occurrence of a shared node is its
+        # anchor (&EXPECTED_LEVELS) and later occurrences are the aliases.
+        if isinstance(node, (dict, list)) and path and not in_alias:
+            prior = seen.get(id(node))
+            if prior is not None:
+                aliases[path] = prior
+                in_alias = True
+            else:
+                seen[id(node)] = path
+
+        if isinstance(node, dict):
+            child_hashes = {}
+            for k, v in node.items():
+                # Only str keys without dots are reachable via C("A.B.C") — mirror that.
+                if isinstance(k, str) and "." not in k:
+                    child = f"{path}.{k}" if path else k
+                    child_hashes[k] = self._build(v, child, index, hashes, aliases, seen, in_alias)
+                else:
+                    child_hashes[k] = _leaf_hash(v)
+            h = hashlib.sha256()
+            for k in sorted(child_hashes, key=str):
+                h.update(repr(k).encode("utf-8"))
+                h.update(child_hashes[k].encode("ascii"))
+            digest = h.hexdigest()
+        else:
+            digest = _leaf_hash(node)
+
+        if path:
+            index[path] = _freeze(node)
+            hashes[path] = digest
+        return digest
+
+    def resolve(self, key: str, roots: Optional[Iterable[str]] = None) -> Optional[str]:
+        """Dotted path `key` resolved to at bind time (trying "" then each root prefix), or None."""
+        roots_t = tuple(roots or ())
+        memo = (key, roots_t)
+        if memo in self._resolved:
+            return self._resolved[memo]
+        hit = None
+        for prefix in ("",) + roots_t:
+            full = (prefix + key).strip(".")
+            if full in self.index:
+                hit = full
+                break
+        self._resolved[memo] = hit
+        return hit
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+        *,
+        required: bool = False,
+        roots: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """Same contract as C(): the live value of the first candidate path that exists."""
+        memo = (key, tuple(roots) if roots else ())
+        paths = self._paths.get(memo)
+        if paths is None:
+            paths = ()
+            if isinstance(key, str) and key.strip():
+                prefixes = ("",) + memo[1]
+                paths = tuple(tuple((p + key).strip(".").split(".")) for p in prefixes)
+            self._paths[memo] = paths
+        for parts in paths:
+            cur: Any = self._cfg
+            for part in parts:
+                if isinstance(cur, dict) and part in cur:
+                    cur = cur[part]
+                else:
+                    break
+            else:
+                return cur
+        if required:
+            src = self.source or "(unbound)"
+            raise KeyError(f"Missing CONFIG key: {key} (config source: {src})")
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def hash(self, key: str = "") -> str:
+        """Content hash of the subtree at `key` ("" = whole config)."""
+        if not key:
+            return self._root_hash
+        path = self.resolve(key)
+        if path is None:
+            raise KeyError(f"Missing CONFIG key: {key}")
+        return self._hashes[path]
+
+    def section(self, name: str) -> Any:
+        """Typed section object (see config/schema.py); KeyError if not present/validated."""
+        return self.sections[name]
+
+
+def _unshare_aliases(cfg: dict[str, Any], aliases: Mapping[str, str]) -> None:
+    """Give every aliased path (YAML `*ANCHOR`) its own deep copy of the anchored subtree."""
+    for path in aliases:
+        *parents, leaf = path.split(".")
+        node: Any = cfg
+        for part in parents:
+            node = node[part]
+        node[leaf] = copy.deepcopy(node[leaf])
+
+
+def _leaf_hash(value: Any) -> str:
+    blob = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
 
 def load_config_yaml(path: str | Path) -> Dict[str, Any]:
     """Load YAML into a dict."""
@@ -19,12 +182,36 @@ def load_config_yaml(path: str | Path) -> Dict[str, Any]:
         raise ValueError(f"Config YAML root must be a mapping/dict: {p}")
     return data
 
-def bind_config(cfg: Dict[str, Any], *, path: str | Path | None = None, force: bool = False) -> None:
-    global _BOUND_CONFIG, _BOUND_CONFIG_PATH
+def bind_config(
+    cfg: Dict[str, Any],
+    *,
+    path: str | Path | None = None,
+    force: bool = False,
+    validate: bool = True,
+) -> None:
+    """
+    Bind `cfg` for C() and compile its ConfigView.
+
+    Schema errors (config/schema.py) raise ConfigError here, at load time.
+    C() reads the live dict; after editing it in place, refresh_config()
+    recompiles the snapshot parts (hashes, typed sections).
+    """
+    global _BOUND_CONFIG, _BOUND_CONFIG_PATH, _BOUND_VIEW
     if not force and (not isinstance(cfg, dict) or not cfg):
         raise ValueError("Refusing to bind empty config dict (use force=True if intentional)")
+    src = str(Path(path).expanduser().resolve()) if path else None
+    view = ConfigView(cfg if isinstance(cfg, dict) else {}, source=src, validate=validate)
+    if isinstance(cfg, dict):
+        _unshare_aliases(cfg, view.aliases)
     _BOUND_CONFIG = cfg
-    _BOUND_CONFIG_PATH = str(Path(path).expanduser().resolve()) if path else None
+    _BOUND_CONFIG_PATH = src
+    _BOUND_VIEW = view
+
+def refresh_config() -> None:
+    """Recompile the view (hashes, typed sections) after editing the bound CONFIG dict in place."""
+    if _BOUND_VIEW is None:
+        raise KeyError("CONFIG not bound; call bind_config()/load_and_bind_config() first")
+    bind_config(_BOUND_CONFIG, path=_BOUND_CONFIG_PATH, force=True)
 
 def load_and_bind_config(path: str | Path) -> Dict[str, Any]:
     """Convenience: load YAML and bind it in one step."""
@@ -47,7 +234,15 @@ def C(
       - else bound config (_BOUND_CONFIG)
 
     Optional `roots` lets you try prefixes, e.g. roots=["DATA_QUALITY.", "NUMERIC_CHECKS."].
+
+    Bound-config lookups go through the compiled ConfigView (the dotted key
+    and roots are parsed once) and return the config's own dict / list
+    values, so in-place edits to CONFIG are seen immediately.
+    An explicit `config` dict is walked directly.
     """
+    if config is None and _BOUND_VIEW is not None and _BOUND_CONFIG and isinstance(key, str) and key.strip():
+        return _BOUND_VIEW.get(key, default, required=required, roots=roots)
+
     cfg = config if isinstance(config, dict) else _BOUND_CONFIG
     if not isinstance(cfg, dict) or not cfg:
         if required:
@@ -79,6 +274,13 @@ def C(
     return default
 
 
+def config_view() -> ConfigView:
+    """The compiled view of the bound config (raises if nothing is bound)."""
+    if _BOUND_VIEW is None:
+        raise KeyError("CONFIG not bound; call bind_config()/load_and_bind_config() first")
+    return _BOUND_VIEW
+
+
 def config_source() -> str:
     """Debug helper: where did the bound config come from?"""
     return _BOUND_CONFIG_PATH or "(unbound)"
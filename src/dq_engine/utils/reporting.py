@@ -10,6 +10,8 @@ from collections.abc import Mapping
 from typing import Any
 import json
 
+from dq_engine.utils.tracing import span, traced
+
 # Columns we often want numerically coerced & rounded in the unified Section 2 report
 _NUMERIC_NORMALIZE_COLS = (
     "percent",
@@ -19,6 +21,7 @@ _NUMERIC_NORMALIZE_COLS = (
     "pct_not_allowed",
 )
 
+@traced("reporting.append_sec2")
 def append_sec2(
     chunk: pd.DataFrame,
     report_path: str | Path,
@@ -49,7 +52,9 @@ def append_sec2(
     existing = None
     if path.exists() and path.stat().st_size > 0:
         try:
-            existing = pd.read_csv(path, low_memory=False)
+            with span("reporting.read_csv", path=path.name) as sp:
+                existing = pd.read_csv(path, low_memory=False)
+                sp.set(rows_out=len(existing), bytes_read=path.stat().st_size)
         except Exception:
             existing = None
 
@@ -78,8 +83,10 @@ def append_sec2(
 
     # Atomic write
     try:
-        out.to_csv(tmp_path, index=False)
-        os.replace(tmp_path, path)
+        with span("reporting.write_csv", path=path.name, rows_in=len(out)) as sp:
+            out.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, path)
+            sp.set(bytes_written=path.stat().st_size)
         print(f"🧾 Appended diagnostics → {path}")
     finally:
         if tmp_path.exists():
@@ -558,6 +565,7 @@ def log_section_completion(
 
 
 # V3 log section completion
+@traced("reporting.log_section_completion")
 def log_section_completion(
     section: str,
     status: str,
@@ -0,0 +1,591 @@
+# src/dq_engine/utils/tracing.py
+"""
+Lightweight tracing for runs, sections and hot paths.
+
+- `span(name, section=...)` (context manager) and `@traced(name)` (decorator)
+  record wall time, process CPU time, RSS delta, rows in/out and bytes
+  read/written. The memory peak is the process-wide high-water mark
+  (ru_maxrss) when the span closes, not a per-span figure, so it is exported
+  as `process_peak_memory_mb` / `dq.process_rss_peak_bytes`.
+- Spans nest through a ContextVar, so nesting follows the call stack per
+  thread / task; `section` is inherited from the parent.
+- Disabled by default; `configure_tracing` turns it on from TRACING.ENABLED
+  or DQ_TRACE=1 (pipeline.run calls it). While disabled `span()` hands back a shared no-op
+  object and `@traced` calls straight through, so the instrumented warehouse,
+  reporting and engine calls cost one flag check.
+- Exporters: `write_performance_profile` (2.3.17 performance_profile.csv,
+  same columns as the notebook skeleton), `write_chrome_trace`
+  (chrome://tracing / Perfetto) and `write_otlp_json` (OTLP/JSON lines, the
+  format of the OpenTelemetry collector file exporter; no collector needed).
+
+    enable_tracing(run_id)
+    with span("2.5.1", section="2.5.1", section_name="Row-level logic checks", rows_in=len(df)):
+        ...
+    export_trace(sec23_reports_dir)
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:                     # Windows
+    resource = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PERF_PROFILE_COLUMNS = [
+    "section",
+    "section_name",
+    "stage",
+    "wall_clock_sec",
+    "cpu_time_sec",
+    "peak_memory_mb",
+    "rows_processed",
+    "perf_severity",
+    "notes",
+]
+
+_MB = 1024.0 * 1024.0
+_PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (0 when the platform does not expose it)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def _peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    section: Optional[str] = None
+    section_name: Optional[str] = None
+    stage: Optional[str] = None
+    start_unix_ns: int = 0
+    end_unix_ns: int = 0
+    wall_ns: int = 0
+    cpu_ns: int = 0
+    rss_start: int = 0
+    rss_end: int = 0
+    rss_peak: int = 0                   # process high-water mark at exit (ru_maxrss)
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_read: int = 0
+    bytes_written: int = 0
+    thread_id: int = 0
+    status: str = "OK"
+    error: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    _t0: int = 0
+    _c0: int = 0
+
+    # Instrumentation-side setters (mirrored by _NoopSpan)
+    def set(self, **attrs: Any) -> "Span":
+        for k, v in attrs.items():
+            if k in ("rows_in", "rows_out", "bytes_read", "bytes_written"):
+                setattr(self, k, None if v is None else int(v))
+            else:
+                self.attrs[k] = v
+        return self
+
+    def add_bytes(self, read: int = 0, written: int = 0) -> "Span":
+        self.bytes_read += int(read)
+        self.bytes_written += int(written)
+        return self
+
+    @property
+    def wall_clock_sec(self) -> float:
+        return self.wall_ns / 1e9
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> "_NoopSpan":
+        return self
+
+    def add_bytes(self, read: int = 0, written: int = 0) -> "_NoopSpan":
+        return self
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+_CURRENT: ContextVar[Optional[Span]] = ContextVar("dq_engine_current_span", default=None)
+
+
+class Tracer:
+    """Process-wide span collector for one run (trace)."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.run_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start(self, run_id: Optional[str] = None) -> None:
+        with self._lock:
+            self.run_id = run_id or uuid.uuid4().hex
+            self.spans = []
+            self.enabled = True
+
+    def finished(self) -> List[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    def _record(self, sp: Span) -> None:
+        with self._lock:
+            self.spans.append(sp)
+
+
+_TRACER = Tracer()
+
+
+class _LiveSpan:
+    """Context manager that opens a Span on enter and records it on exit."""
+
+    __slots__ = ("_kw", "_span", "_token")
+
+    def __init__(self, kw: Dict[str, Any]):
+        self._kw = kw
+        self._span: Optional[Span] = None
+        self._token = None
+
+    def __enter__(self) -> Span:
+        kw = self._kw
+        parent = _CURRENT.get()
+        sp = Span(
+            name=kw.pop("name"),
+            trace_id=_TRACER.run_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            section=kw.pop("section", None) or (parent.section if parent is not None else None),
+            section_name=kw.pop("section_name", None),
+            stage=kw.pop("stage", None),
+            thread_id=threading.get_ident(),
+        )
+        if sp.section_name is None and parent is not None and parent.section == sp.section:
+            sp.section_name, sp.stage = parent.section_name, sp.stage or parent.stage
+        sp.set(**kw)
+        sp.rss_start = _rss_bytes()
+        sp.start_unix_ns = time.time_ns()
+        sp._c0 = time.process_time_ns()
+        sp._t0 = time.perf_counter_ns()
+        self._span = sp
+        self._token = _CURRENT.set(sp)
+        return sp
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        sp = self._span
+        sp.wall_ns = time.perf_counter_ns() - sp._t0
+        sp.cpu_ns = time.process_time_ns() - sp._c0
+        sp.end_unix_ns = sp.start_unix_ns + sp.wall_ns
+        sp.rss_end = _rss_bytes()
+        sp.rss_peak = _peak_rss_bytes()
+        if exc_type is not None:
+            sp.status = "ERROR"
+            sp.error = f"{exc_type.__name__}: {exc}"
+        _CURRENT.reset(self._token)
+        _TRACER._record(sp)
+        return False
+
+
+def span(name: str, section: Optional[str] = None, **attrs: Any):
+    """
+    Time a block. Extra keywords: section_name, stage, rows_in, rows_out,
+    bytes_read, bytes_written, or any attribute (exported as span args).
+    """
+    if not _TRACER.enabled:
+        return _NOOP
+    attrs["name"] = name
+    attrs["section"] = section
+    return _LiveSpan(attrs)
+
+
+def _n_rows(obj: Any) -> Optional[int]:
+    shape = getattr(obj, "shape", None)
+    if shape is not None and len(shape) >= 1 and isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(shape[0])
+    return None
+
+
+def traced(name: Optional[str] = None, *, section: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator form of span(). rows_in is taken from the first DataFrame/Series
+    argument (incl. `self.df`), rows_out from a DataFrame/Series result.
+    """
+
+    def deco(fn: F) -> F:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _TRACER.enabled:
+                return fn(*args, **kwargs)
+            rows_in = None
+            for a in args:
+                rows_in = _n_rows(a)
+                if rows_in is None:
+                    rows_in = _n_rows(getattr(a, "df", None))
+                if rows_in is not None:
+                    break
+            with _LiveSpan({"name": label, "section": section, "rows_in": rows_in}) as sp:
+                out = fn(*args, **kwargs)
+                rows_out = _n_rows(out)
+                if rows_out is not None:
+                    sp.rows_out = rows_out
+                return out
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+def frame_nbytes(df: Any) -> int:
+    """Shallow in-memory size of a frame (cheap; used as bytes read/written)."""
+    try:
+        return int(df.memory_usage(index=False, deep=False).sum())
+    except Exception:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Control
+# ---------------------------------------------------------------------------
+def enable_tracing(run_id: Optional[str] = None) -> str:
+    """Start a fresh trace; returns its run id (also the OTel trace id)."""
+    _TRACER.start(run_id.replace("-", "") if run_id else None)
+    return _TRACER.run_id
+
+
+def disable_tracing() -> None:
+    _TRACER.enabled = False
+
+
+def tracing_enabled() -> bool:
+    return _TRACER.enabled
+
+
+_UNSET = object()
+
+
+def _tracing_opt(key: str, default: Any, config: Optional[Dict[str, Any]]) -> Any:
+    """TRACING.<KEY> (notebook config) or tracing.<key> (pipeline project config)."""
+    from dq_engine.utils.config import C
+
+    v = C(f"TRACING.{key.upper()}", _UNSET, config=config)
+    return v if v is not _UNSET else C(f"tracing.{key.lower()}", default, config=config)
+
+
+def configure_tracing(config: Optional[Dict[str, Any]] = None, run_id: Optional[str] = None) -> bool:
+    """
+    Enable from TRACING.ENABLED (or `tracing.enabled` in a pipeline project
+    config, or env DQ_TRACE=1); returns the resulting state.
+    """
+    env = os.environ.get("DQ_TRACE", "").strip().lower()
+    on = env in ("1", "true", "yes") or bool(_tracing_opt("enabled", False, config))
+    if on:
+        enable_tracing(run_id)
+    else:
+        disable_tracing()
+    return on
+
+
+def finished_spans() -> List[Span]:
+    return _TRACER.finished()
+
+
+def current_span() -> Optional[Span]:
+    return _CURRENT.get()
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+def spans_frame(spans: Optional[List[Span]] = None) -> pd.DataFrame:
+    """One row per finished span (start order)."""
+    spans = sorted(spans if spans is not None else finished_spans(), key=lambda s: s.start_unix_ns)
+    return pd.DataFrame([
+        {
+            "run_id": s.trace_id,
+            "span_id": s.span_id,
+            "parent_id": s.parent_id,
+            "name": s.name,
+            "section": s.section,
+            "section_name": s.section_name,
+            "stage": s.stage,
+            "start_utc": pd.Timestamp(s.start_unix_ns, unit="ns", tz="UTC"),
+            "wall_clock_sec": s.wall_ns / 1e9,
+            "cpu_time_sec": s.cpu_ns / 1e9,
+            "rss_delta_mb": (s.rss_end - s.rss_start) / _MB,
+            "process_peak_memory_mb": s.rss_peak / _MB,
+            "rows_in": s.rows_in,
+            "rows_out": s.rows_out,
+            "bytes_read": s.bytes_read,
+            "bytes_written": s.bytes_written,
+            "status": s.status,
+            "error": s.error,
+            "attrs_json": json.dumps(s.attrs, default=str) if s.attrs else None,
+        }
+        for s in spans
+    ])
+
+
+def section_perf_stats(spans: Optional[List[Span]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    SECTION_PERF_STATS-shaped dict for the 2.3.17 overlay.
+
+    Only a section's outermost spans are summed (children of a span in the same
+    section are already inside its wall/CPU time). `peak_memory_mb` keeps the
+    skeleton's column name but is the process high-water mark reached by the
+    end of the section, not memory used by the section alone.
+    """
+    spans = spans if spans is not None else finished_spans()
+    by_id = {s.span_id: s for s in spans}
+    out: Dict[str, Dict[str, Any]] = {}
+    for s in spans:
+        if not s.section:
+            continue
+        parent = by_id.get(s.parent_id) if s.parent_id else None
+        outer = parent is None or parent.section != s.section
+        st = out.setdefault(s.section, {
+            "section_name": s.section_name or "",
+            "stage": s.stage or "",
+            "wall_clock_sec": 0.0,
+            "cpu_time_sec": 0.0,
+            "peak_memory_mb": 0.0,
+            "rows_processed": None,
+            "n_spans": 0,
+            "n_errors": 0,
+        })
+        if s.section_name and not st["section_name"]:
+            st["section_name"] = s.section_name
+        if s.stage and not st["stage"]:
+            st["stage"] = s.stage
+        if outer:
+            st["wall_clock_sec"] += s.wall_ns / 1e9
+            st["cpu_time_sec"] += s.cpu_ns / 1e9
+        st["peak_memory_mb"] = max(st["peak_memory_mb"], s.rss_peak / _MB)
+        rows = max(s.rows_in or 0, s.rows_out or 0)
+        if rows and (st["rows_processed"] is None or rows > st["rows_processed"]):
+            st["rows_processed"] = rows
+        st["n_spans"] += 1
+        st["n_errors"] += int(s.status != "OK")
+    for st in out.values():
+        st["wall_clock_sec"] = round(st["wall_clock_sec"], 6)
+        st["cpu_time_sec"] = round(st["cpu_time_sec"], 6)
+        st["peak_memory_mb"] = round(st["peak_memory_mb"], 1)
+        st["notes"] = f"traced: {st.pop('n_spans')} span(s), {st.pop('n_errors')} error(s)"
+    return out
+
+
+def _perf_severity(wc: Any, warn_sec: float, fail_sec: float) -> Optional[str]:
+    if wc is None or pd.isna(wc):
+        return None
+    wc = float(wc)
+    if wc >= fail_sec:
+        return "critical"
+    if wc >= warn_sec:
+        return "warn"
+    return "ok"
+
+
+def _atomic_write_text(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def write_performance_profile(
+    path: str | Path,
+    spans: Optional[List[Span]] = None,
+    *,
+    warn_sec: float = 30.0,
+    fail_sec: float = 120.0,
+) -> Path:
+    """Overlay traced sections onto performance_profile.csv (skeleton rows are kept)."""
+    path = Path(path)
+    existing = pd.DataFrame(columns=PERF_PROFILE_COLUMNS)
+    if path.exists() and path.stat().st_size > 0:
+        try:
+            existing = pd.read_csv(path)
+        except Exception:
+            pass
+    stats = section_perf_stats(spans)
+    new = pd.DataFrame([{"section": sec, **st} for sec, st in stats.items()], columns=PERF_PROFILE_COLUMNS)
+    new["perf_severity"] = [_perf_severity(w, warn_sec, fail_sec) for w in new["wall_clock_sec"]]
+
+    if existing.empty or "section" not in existing.columns:
+        out = new
+    else:
+        # Update skeleton rows in place (their names/stages win), append the rest
+        out = existing.astype(object).reindex(columns=list(existing.columns) + [
+            c for c in PERF_PROFILE_COLUMNS if c not in existing.columns])
+        pos = {str(sec): i for i, sec in enumerate(out["section"])}
+        extra = []
+        for rec in new.to_dict("records"):
+            i = pos.get(rec["section"])
+            if i is None:
+                extra.append(rec)
+                continue
+            for col in ("wall_clock_sec", "cpu_time_sec", "peak_memory_mb", "rows_processed",
+                        "perf_severity", "notes"):
+                out.iat[i, out.columns.get_loc(col)] = rec[col]
+            for col in ("section_name", "stage"):
+                if pd.isna(out.iat[i, out.columns.get_loc(col)]) or out.iat[i, out.columns.get_loc(col)] == "":
+                    out.iat[i, out.columns.get_loc(col)] = rec[col]
+        if extra:
+            out = pd.concat([out, pd.DataFrame(extra, columns=PERF_PROFILE_COLUMNS)], ignore_index=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp.csv")
+    out.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def write_chrome_trace(path: str | Path, spans: Optional[List[Span]] = None) -> Path:
+    """Chrome trace-event JSON (complete "X" events, µs), loadable in Perfetto."""
+    spans = spans if spans is not None else finished_spans()
+    pid = os.getpid()
+    events = []
+    for s in spans:
+        args = {
+            "section": s.section,
+            "cpu_ms": round(s.cpu_ns / 1e6, 3),
+            "rss_delta_mb": round((s.rss_end - s.rss_start) / _MB, 2),
+            "rows_in": s.rows_in,
+            "rows_out": s.rows_out,
+            "bytes_read": s.bytes_read,
+            "bytes_written": s.bytes_written,
+            **{k: v for k, v in s.attrs.items()},
+        }
+        if s.error:
+            args["error"] = s.error
+        events.append({
+            "name": s.name,
+            "cat": s.section or "dq_engine",
+            "ph": "X",
+            "ts": s.start_unix_ns / 1e3,
+            "dur": s.wall_ns / 1e3,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": {k: v for k, v in args.items() if v is not None},
+        })
+    payload = {"traceEvents": events, "displayTimeUnit": "ms",
+               "otherData": {"run_id": spans[0].trace_id if spans else _TRACER.run_id}}
+    return _atomic_write_text(Path(path), json.dumps(payload, default=str))
+
+
+def _otlp_value(v: Any) -> Dict[str, Any]:
+    if isinstance(v, bool):
+        return {"boolValue": v}
+    if isinstance(v, int):
+        return {"intValue": str(v)}
+    if isinstance(v, float):
+        return {"doubleValue": v}
+    return {"stringValue": str(v)}
+
+
+def write_otlp_json(
+    path: str | Path,
+    spans: Optional[List[Span]] = None,
+    *,
+    service_name: str = "dq-engine",
+    append: bool = True,
+) -> Path:
+    """
+    OTLP/JSON export (one ExportTraceServiceRequest per line), the layout the
+    OpenTelemetry collector's file exporter/receiver use; replay with `otelcol`.
+    """
+    spans = spans if spans is not None else finished_spans()
+    otel_spans = []
+    for s in spans:
+        attrs = {
+            "dq.section": s.section,
+            "dq.section_name": s.section_name,
+            "dq.cpu_time_ns": s.cpu_ns,
+            "dq.rss_delta_bytes": s.rss_end - s.rss_start,
+            "dq.process_rss_peak_bytes": s.rss_peak,
+            "dq.rows_in": s.rows_in,
+            "dq.rows_out": s.rows_out,
+            "dq.bytes_read": s.bytes_read,
+            "dq.bytes_written": s.bytes_written,
+            "thread.id": s.thread_id,
+            **{f"dq.{k}": v for k, v in s.attrs.items()},
+        }
+        rec = {
+            "traceId": s.trace_id[:32].rjust(32, "0"),
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,                                   # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_unix_ns),
+            "endTimeUnixNano": str(s.end_unix_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attrs.items() if v is not None],
+            "status": {"code": 2, "message": s.error} if s.status != "OK" else {"code": 1},
+        }
+        if s.parent_id:
+            rec["parentSpanId"] = s.parent_id
+        otel_spans.append(rec)
+    payload = {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+        "scopeSpans": [{"scope": {"name": "dq_engine.utils.tracing"}, "spans": otel_spans}],
+    }]}
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a" if append else "w", encoding="utf-8") as f:
+        f.write(json.dumps(payload) + "\n")
+    return path
+
+
+def export_trace(out_dir: str | Path, config: Optional[Dict[str, Any]] = None) -> Dict[str, Path]:
+    """Write every configured export (TRACING.* / tracing.* file names) into `out_dir`."""
+    out_dir = Path(out_dir)
+    spans = finished_spans()
+    paths = {
+        "performance_profile": write_performance_profile(
+            out_dir / _tracing_opt("performance_profile", "performance_profile.csv", config),
+            spans,
+            warn_sec=float(_tracing_opt("perf_warn_sec", 30.0, config)),
+            fail_sec=float(_tracing_opt("perf_fail_sec", 120.0, config)),
+        ),
+        "chrome_trace": write_chrome_trace(
+            out_dir / _tracing_opt("chrome_trace", "performance_trace.json", config), spans),
+    }
+    otlp = _tracing_opt("otlp_file", "performance_spans.otlp.jsonl", config)
+    if otlp:
+        paths["otlp"] = write_otlp_json(out_dir / otlp, spans)
+    print(f"⏱️ Trace ({len(spans)} spans) → {', '.join(p.name for p in paths.values())}")
+    return paths
@@ -1,8 +1,20 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+
+import asyncio
+import itertools
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
 import pandas as pd
 
+from dq_engine.utils.tracing import frame_nbytes, span
+
+POLL_INITIAL_S = 0.05  # first status poll; each backend may lower it (`Warehouse.poll_initial_s`)
+POLL_MAX_S = 1.0
+
+
 @dataclass(frozen=True)
 class WarehouseConnCfg:
     target: str
@@ -10,12 +22,111 @@ class WarehouseConnCfg:
     raw_schema: str
     analytics_schema: str
     dq_schema: str
-    duckdb_path: Optional[str] = None
+    duckdb_path: str | None = None
+
+
+@dataclass
+class QueryHandle:
+    """A submitted read query: `done()` polls without blocking; `result()` blocks and re-raises."""
+
+    query_id: str
+    sql: str
+    _poll: Callable[[], bool] = field(repr=False)
+    _fetch: Callable[[], pd.DataFrame] = field(repr=False)
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+    def done(self) -> bool:
+        return self._poll()
+
+    def result(self, timeout: float | None = None) -> pd.DataFrame:
+        wait_for([self], timeout=timeout)
+        return self._fetch()
+
+
+def wait_for(
+    handles: Sequence[QueryHandle], timeout: float | None = None, initial: float = POLL_INITIAL_S
+) -> None:
+    """Poll until every handle is done (capped exponential backoff); TimeoutError past `timeout`."""
+    pending = [h for h in handles if not h.done()]
+    delay, t0 = initial, time.perf_counter()
+    while pending:
+        if timeout is not None and time.perf_counter() - t0 > timeout:
+            raise TimeoutError(
+                f"{len(pending)} quer(ies) still running after {timeout}s: "
+                + ", ".join(h.query_id for h in pending[:5])
+            )
+        time.sleep(delay)
+        delay = min(delay * 1.5, POLL_MAX_S)
+        pending = [h for h in pending if not h.done()]
+
+
+_eager_ids = itertools.count(1)
+
 
 class Warehouse:
+    poll_initial_s: float = POLL_INITIAL_S
+
     def read_df(self, sql: str) -> pd.DataFrame: ...
     def execute(self, sql: str) -> None: ...
     def write_df(self, df: pd.DataFrame, table_fqn: str, mode: str = "append") -> None: ...
+    def close(self) -> None: ...
+
+    def submit(self, sql: str) -> QueryHandle:
+        """Start a read query without waiting; backends without async support run it eagerly."""
+        df = self.read_df(sql)
+        return QueryHandle(f"eager-{next(_eager_ids)}", sql, lambda: True, lambda: df)
+
+    def gather(
+        self,
+        handles: Sequence[QueryHandle],
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Results in handle order. With return_exceptions=True a failed query yields its
+        exception instead of raising.
+        """
+        with span("warehouse.gather", queries=len(handles)) as sp:
+            wait_for(handles, timeout=timeout, initial=self.poll_initial_s)
+            out: list[Any] = []
+            for h in handles:
+                try:
+                    out.append(h._fetch())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    out.append(e)
+            sp.set(rows_out=sum(len(r) for r in out if isinstance(r, pd.DataFrame)))
+            return out
+
+
+class AsyncWarehouse:
+    """asyncio facade over `submit`: awaiting a query yields to the loop between status polls."""
+
+    def __init__(self, wh: Warehouse):
+        self.wh = wh
+
+    async def read_df(self, sql: str, timeout: float | None = None) -> pd.DataFrame:
+        h = self.wh.submit(sql)
+        delay, t0 = self.wh.poll_initial_s, time.perf_counter()
+        while not h.done():
+            if timeout is not None and time.perf_counter() - t0 > timeout:
+                raise TimeoutError(f"query {h.query_id} still running after {timeout}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, POLL_MAX_S)
+        return h._fetch()
+
+    async def gather(
+        self, sqls: Sequence[str], timeout: float | None = None, return_exceptions: bool = False
+    ) -> list[Any]:
+        return await asyncio.gather(
+            *(self.read_df(q, timeout) for q in sqls), return_exceptions=return_exceptions
+        )
+
+
+def _sql_label(sql: str, n: int = 200) -> str:
+    return " ".join(sql.split())[:n]
+
 
 def make_warehouse(cfg: WarehouseConnCfg) -> Warehouse:
     t = cfg.target.lower()
@@ -25,31 +136,80 @@ def make_warehouse(cfg: WarehouseConnCfg) -> Warehouse:
         return SnowflakeWarehouse()
     raise ValueError(f"Unknown warehouse target: {cfg.target}")
 
+
 class DuckDBWarehouse(Warehouse):
-    def __init__(self, path: str):
+    poll_initial_s = 0.001  # in-process: results are usually ready within a millisecond or two
+
+    def __init__(self, path: str, read_only: bool = False):
         import duckdb
+
         self.path = path
-        self.con = duckdb.connect(path)
+        self.read_only = read_only
+        self.con = duckdb.connect(path, read_only=read_only)
 
     def read_df(self, sql: str) -> pd.DataFrame:
-        return self.con.execute(sql).df()
+        with span("warehouse.read_df", target="duckdb", sql=_sql_label(sql)) as sp:
+            df = self.con.execute(sql).df()
+            sp.set(rows_out=len(df), bytes_read=frame_nbytes(df))
+            return df
 
     def execute(self, sql: str) -> None:
-        self.con.execute(sql)
+        with span("warehouse.execute", target="duckdb", sql=_sql_label(sql)):
+            self.con.execute(sql)
 
     def write_df(self, df: pd.DataFrame, table_fqn: str, mode: str = "append") -> None:
-        self.con.register("_dq_tmp", df)
-        if mode == "replace":
-            self.con.execute(f"create or replace table {table_fqn} as select * from _dq_tmp")
-        else:
-            self.con.execute(f"insert into {table_fqn} select * from _dq_tmp")
+        with span(
+            "warehouse.write_df",
+            target="duckdb",
+            table=table_fqn,
+            mode=mode,
+            rows_in=len(df),
+            bytes_written=frame_nbytes(df),
+        ):
+            self.con.register("_dq_tmp", df)
+            if mode == "replace":
+                self.con.execute(f"create or replace table {table_fqn} as select * from _dq_tmp")
+            else:
+                self.con.execute(f"insert into {table_fqn} select * from _dq_tmp")
+
+    def submit(self, sql: str) -> QueryHandle:
+        """Local stand-in for Snowflake async: one cursor per query, run in a thread pool."""
+        import contextvars
+        from concurrent.futures import ThreadPoolExecutor
+
+        if getattr(self, "_async_pool", None) is None:
+            self._async_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="duckdb-async")
+            self._async_ids = itertools.count(1)
+        label = _sql_label(sql)
+
+        def _run() -> pd.DataFrame:
+            cur = self.con.cursor()
+            try:
+                with span("warehouse.read_df", target="duckdb", sql=label, mode="async") as sp:
+                    df = cur.execute(sql).df()
+                    sp.set(rows_out=len(df), bytes_read=frame_nbytes(df))
+                    return df
+            finally:
+                cur.close()
+
+        # copy_context: spans opened in the worker nest under the submitter's span
+        fut = self._async_pool.submit(contextvars.copy_context().run, _run)
+        return QueryHandle(f"duckdb-{next(self._async_ids)}", sql, fut.done, fut.result)
+
+    def close(self) -> None:
+        if getattr(self, "_async_pool", None) is not None:
+            self._async_pool.shutdown(wait=True)
+            self._async_pool = None
+        self.con.close()
+
 
 class SnowflakeWarehouse(Warehouse):
     def __init__(self):
         import os
+
         import snowflake.connector
-        from cryptography.hazmat.primitives import serialization
         from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
 
         key_path = os.environ.get("SNOWFLAKE_PRIVATE_KEY_PATH")
         key_pass = os.environ.get("SNOWFLAKE_PRIVATE_KEY_PASSPHRASE", "")
@@ -82,31 +242,85 @@ class SnowflakeWarehouse(Warehouse):
         )
 
     def read_df(self, sql: str) -> pd.DataFrame:
-        cur = self.ctx.cursor()
-        try:
-            cur.execute(sql)
-            return cur.fetch_pandas_all()
-        finally:
-            cur.close()
+        with span("warehouse.read_df", target="snowflake", sql=_sql_label(sql)) as sp:
+            cur = self.ctx.cursor()
+            try:
+                cur.execute(sql)
+                df = cur.fetch_pandas_all()
+                sp.set(rows_out=len(df), bytes_read=frame_nbytes(df), query_id=cur.sfqid)
+                return df
+            finally:
+                cur.close()
 
     def execute(self, sql: str) -> None:
-        cur = self.ctx.cursor()
-        try:
-            cur.execute(sql)
-        finally:
-            cur.close()
+        with span("warehouse.execute", target="snowflake", sql=_sql_label(sql)) as sp:
+            cur = self.ctx.cursor()
+            try:
+                cur.execute(sql)
+                sp.set(query_id=cur.sfqid)
+            finally:
+                cur.close()
+
+    def submit(self, sql: str) -> QueryHandle:
+        """
+        `execute_async`: the server runs the query while we return; results come via
+        `get_results_from_sfqid`.
+        """
+        with span("warehouse.submit", target="snowflake", sql=_sql_label(sql)) as sp:
+            cur = self.ctx.cursor()
+            try:
+                cur.execute_async(sql)
+                qid = cur.sfqid
+            finally:
+                cur.close()
+            sp.set(query_id=qid)
+
+        def _poll() -> bool:
+            # raises ProgrammingError for failed / aborted queries: errors surface on the first poll
+            return not self.ctx.is_still_running(self.ctx.get_query_status_throw_if_error(qid))
+
+        def _fetch() -> pd.DataFrame:
+            with span(
+                "warehouse.read_df",
+                target="snowflake",
+                sql=_sql_label(sql),
+                mode="async",
+                query_id=qid,
+            ) as sp:
+                cur = self.ctx.cursor()
+                try:
+                    cur.get_results_from_sfqid(qid)
+                    df = cur.fetch_pandas_all()
+                    sp.set(rows_out=len(df), bytes_read=frame_nbytes(df))
+                    return df
+                finally:
+                    cur.close()
+
+        return QueryHandle(qid, sql, _poll, _fetch)
 
     def write_df(self, df: pd.DataFrame, table_fqn: str, mode: str = "append") -> None:
         from snowflake.connector.pandas_tools import write_pandas
 
         db, schema, table = table_fqn.split(".", 2)
-        ok, _, _, _ = write_pandas(
-            conn=self.ctx,
-            df=df,
-            table_name=table,
-            database=db,
-            schema=schema,
-            auto_create_table=True,
-        )
+        with span(
+            "warehouse.write_df",
+            target="snowflake",
+            table=table_fqn,
+            mode=mode,
+            rows_in=len(df),
+            bytes_written=frame_nbytes(df),
+        ):
+            ok, _, _, _ = write_pandas(
+                conn=self.ctx,
+                df=df,
+                table_name=table,
+                database=db,
+                schema=schema,
+                auto_create_table=True,
+                overwrite=(mode == "replace"),
+            )
         if not ok:
             raise RuntimeError(f"write_pandas failed for {table_fqn}")
+
+    def close(self) -> None:
+        self.ctx.close()
@@ -0,0 +1,765 @@
+# src/dq_engine/watch.py
+"""
+Long-running watch / serve mode (`dq watch`, `dq serve`): rerun only the
+checks and sections whose inputs changed.
+
+- Inputs are polled every `interval_s`. Raw files are the files under
+  `raw_dir` (PATHS.RAW_DATA_DIR by default) that match `patterns`. Tables are
+  every table some check reads. Polling is stdlib-only, so it works the same
+  on local disks, bind mounts and network shares where inotify events are
+  not delivered.
+- Each input gets a fingerprint:
+  - Files: (size, mtime_ns), optionally confirmed by a blake2b hash of the
+    content. A file counts as changed only after it has been stable for
+    `settle_s`, so a half-written CSV never triggers a run.
+  - DuckDB tables: `count(*)` plus `sum(hash(row))`. These queries only run
+    when the database file (or its WAL) changed on disk. The file is opened
+    read-only for the poll and closed again, so loaders and dbt can still
+    take the writer lock. A locked file means "busy": it is retried on the
+    next poll. The watcher's own DQ_RESULTS write is re-stat'ed once it
+    closes the file, so it does not cost a fingerprint pass.
+  - Snowflake tables: one information_schema query (last_altered,
+    row_count, bytes) on a connection kept open across polls.
+- Lineage: a check depends on its `table`. `sources:` maps a table to raw
+  file globs; with no mapping, raw files feed each dataset's
+  `source_table`. Sections (`sections:` entries of `{id, files, tables,
+  call: "pkg.module:function"}`) depend on file globs and / or tables, and
+  are called as `fn(files=..., tables=..., config=...)`. With
+  `dbt: true`, a raw file change runs `dbt build` first; the models it
+  rebuilds then show up as table changes on the same cycle.
+- Everything that does not depend on the data stays warm in the process:
+  - the parsed config, expanded into per-dataset checks, with their SQL
+    compiled once;
+  - the imported section callables;
+  - the baselines per (warehouse, dataset_id, check_id)
+    (ResultsStore.latest_status, read once at start and then updated from
+    each cycle's results);
+  - the Snowflake connection.
+  The config file is fingerprinted too; an edit reloads it and reruns
+  everything.
+- Results are appended to the ResultsStore like `pipeline.run`. The cycle's
+  rows go to `run_dir`/dq_results.csv. Regressions (PASS → WARN/FAIL against
+  the warm baseline) are printed.
+- `serve` runs the same loop plus a small HTTP endpoint:
+  - GET /health
+  - GET /status: fingerprints, last cycle, latest status per check
+  - POST /run: force a full rerun on the next poll
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import importlib
+import json
+import os
+import signal
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from dq_engine.config.config import load_config
+from dq_engine.dbt_runner import run_dbt_build
+from dq_engine.fanout import DatasetJob, _conn_cfg, _is_duckdb, discover_jobs, warehouse_key
+from dq_engine.pipeline import _check_sql, run_checks
+from dq_engine.results_store import ResultsStore
+from dq_engine.utils.config import C
+from dq_engine.utils.tracing import span, traced
+from dq_engine.warehouse import DuckDBWarehouse, Warehouse, make_warehouse
+
+WATCH_CYCLE_COLUMNS = [
+    "cycle",
+    "run_id",
+    "changed_files",
+    "changed_tables",
+    "n_checks",  # checks rerun this cycle
+    "n_sections",
+    "n_fail",
+    "n_warn",
+    "n_regressed",
+    "seconds",
+    "error",
+]
+
+_STATUS_RANK = {"PASS": 0, "WARN": 1, "FAIL": 2}
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    id: str
+    files: tuple[str, ...] = ()  # globs relative to raw_dir
+    tables: tuple[str, ...] = ()
+    call: str = ""  # "pkg.module:function"
+
+
+@dataclass(frozen=True)
+class WatchCfg:
+    raw_dir: str = "data/_raw/"
+    patterns: tuple[str, ...] = ("*",)
+    interval_s: float = 2.0
+    settle_s: float = 1.0  # a file must be unchanged this long before it counts
+    content_hash: bool = False  # confirm stat changes with a content hash (ignores `touch`)
+    table_fingerprint: str = "checksum"  # checksum: count + sum(hash(row)) | count: count(*) only
+    initial_run: bool = True  # run everything on the first poll
+    dbt: bool = False  # dbt build when raw files change
+    sources: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    sections: tuple[SectionSpec, ...] = ()
+    run_dir: str | None = None
+    host: str = "127.0.0.1"
+    port: int = 8765
+
+    @classmethod
+    def from_config(cls, cfg: dict[str, Any] | None = None) -> WatchCfg:
+        """`watch:` block of the project config; raw_dir defaults to PATHS.RAW_DATA_DIR."""
+        w = (cfg or {}).get("watch") or {}
+        mode = str(w.get("table_fingerprint", "checksum")).lower()
+        if mode not in ("checksum", "count"):
+            raise ValueError(f"watch.table_fingerprint must be checksum or count, got {mode!r}")
+        as_tuple = lambda v: (v,) if isinstance(v, str) else tuple(v or ())  # noqa: E731
+        return cls(
+            raw_dir=str(w.get("raw_dir") or C("PATHS.RAW_DATA_DIR", "data/_raw/")),
+            patterns=as_tuple(w.get("patterns", ("*",))),
+            interval_s=max(0.05, float(w.get("interval_s", 2.0))),
+            settle_s=max(0.0, float(w.get("settle_s", 1.0))),
+            content_hash=bool(w.get("content_hash", False)),
+            table_fingerprint=mode,
+            initial_run=bool(w.get("initial_run", True)),
+            dbt=bool(w.get("dbt", False)),
+            sources={str(t).upper(): as_tuple(g) for t, g in (w.get("sources") or {}).items()},
+            sections=tuple(
+                SectionSpec(
+                    str(s["id"]),
+                    as_tuple(s.get("files")),
+                    tuple(t.upper() for t in as_tuple(s.get("tables"))),
+                    str(s["call"]),
+                )
+                for s in (w.get("sections") or ())
+            ),
+            run_dir=w.get("run_dir"),
+            host=str(w.get("host", "127.0.0.1")),
+            port=int(w.get("port", 8765)),
+        )
+
+
+# -- fingerprints ---------------------------------------------------------------
+def _digest(*parts: Any) -> str:
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+
+
+def file_digest(path: Path, chunk: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class FileWatcher:
+    """Polls `root` for files matching `patterns`; `poll()` → {relative path: fingerprint}."""
+
+    def __init__(
+        self,
+        root: str,
+        patterns: Sequence[str] = ("*",),
+        settle_s: float = 1.0,
+        content_hash: bool = False,
+    ):
+        self.root = Path(root)
+        self.patterns = tuple(patterns)
+        self.settle_s = settle_s
+        self.content_hash = content_hash
+        self.seen: dict[str, str] = {}  # settled fingerprint per file
+        self._stat: dict[str, tuple[int, int]] = {}  # stat of the settled version
+        self._pending: dict[str, tuple[tuple[int, int], float]] = {}
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        out: dict[str, tuple[int, int]] = {}
+        if not self.root.is_dir():
+            return out
+        stack = [self.root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.name.startswith("."):
+                        continue
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(Path(e.path))
+                        continue
+                    rel = Path(e.path).relative_to(self.root).as_posix()
+                    if any(
+                        fnmatch.fnmatch(rel, p) or fnmatch.fnmatch(e.name, p) for p in self.patterns
+                    ):
+                        st = e.stat()
+                        out[rel] = (st.st_size, st.st_mtime_ns)
+        return out
+
+    def prime(self) -> None:
+        """Accept what is on disk now as the settled state, without reporting it as changed."""
+        current = self._scan()
+        self._stat = dict(current)
+        self.seen = {
+            rel: (file_digest(self.root / rel) if self.content_hash else _digest(*st))
+            for rel, st in current.items()
+        }
+        self._pending.clear()
+
+    def poll(self, now: float | None = None) -> dict[str, str]:
+        now = time.monotonic() if now is None else now
+        current = self._scan()
+        changed: dict[str, str] = {}
+        for rel in set(self.seen) - set(current):  # deleted
+            self.seen.pop(rel)
+            self._stat.pop(rel, None)
+            self._pending.pop(rel, None)
+            changed[rel] = ""
+        for rel, st in current.items():
+            if self._stat.get(rel) == st:
+                self._pending.pop(rel, None)
+                continue
+            first = self._pending.get(rel)
+            if first is None or first[0] != st:  # still being written: restart the settle clock
+                self._pending[rel] = (st, now)
+                if self.settle_s > 0:
+                    continue
+            elif now - first[1] < self.settle_s:
+                continue
+            self._pending.pop(rel, None)
+            self._stat[rel] = st
+            fp = file_digest(self.root / rel) if self.content_hash else _digest(*st)
+            if self.seen.get(rel) != fp:
+                self.seen[rel] = fp
+                changed[rel] = fp
+        return changed
+
+
+def _table_fp_sql(table: str, mode: str) -> str:
+    if mode == "count":
+        return f"select count(*) as n from {table}"
+    return f"select count(*) as n, coalesce(sum(hash(t)), 0)::varchar as h from {table} t"
+
+
+def _is_locked(key: str, e: Exception) -> bool:
+    return _is_duckdb(key) and "lock" in str(e).lower()
+
+
+class TableWatcher:
+    """Per-warehouse table fingerprints; DuckDB is queried only when its file changed on disk."""
+
+    def __init__(self, wcfg: Mapping[str, Any], tables: Sequence[str], mode: str = "checksum"):
+        self.wcfg = dict(wcfg)
+        self.key = warehouse_key(wcfg)
+        self.tables = tuple(dict.fromkeys(t.upper() for t in tables))
+        self.mode = mode
+        self.seen: dict[str, str] = {}
+        self._file_fp: tuple | None = None
+        self._wh: Warehouse | None = None  # warm Snowflake connection
+
+    # DuckDB -----------------------------------------------------------------
+    def _duckdb_file_fp(self) -> tuple:
+        path = str(self.wcfg.get("duckdb_path"))
+        out = []
+        for p in (path, path + ".wal"):
+            try:
+                st = os.stat(p)
+                out.append((st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                out.append(None)
+        return tuple(out)
+
+    def reader(self) -> Warehouse:
+        if _is_duckdb(self.key):
+            return DuckDBWarehouse(str(self.wcfg["duckdb_path"]), read_only=True)
+        if self._wh is None:
+            self._wh = make_warehouse(_conn_cfg(self.wcfg))
+        return self._wh
+
+    def release(self, wh: Warehouse) -> None:
+        if _is_duckdb(self.key):
+            wh.close()
+
+    def reset(self) -> None:
+        if self._wh is not None:
+            try:
+                self._wh.close()
+            except Exception:
+                pass
+            self._wh = None
+
+    def _fingerprints(self, wh: Warehouse) -> dict[str, str]:
+        if _is_duckdb(self.key):
+            frames = wh.gather(
+                [wh.submit(_table_fp_sql(t, self.mode)) for t in self.tables],
+                return_exceptions=True,
+            )
+            return {
+                t: ("" if isinstance(df, Exception) else _digest(*df.iloc[0].tolist()))
+                for t, df in zip(self.tables, frames, strict=True)
+            }
+        by_schema: dict[str, list[str]] = {}
+        for t in self.tables:
+            schema, _, name = t.rpartition(".")
+            by_schema.setdefault(schema or str(self.wcfg["analytics_schema"]).upper(), []).append(
+                name
+            )
+        where = " or ".join(
+            f"(table_schema = '{s}' and table_name in ({', '.join(repr(n) for n in names)}))"
+            for s, names in by_schema.items()
+        )
+        df = wh.read_df(f"""
+        select table_schema || '.' || table_name as fqn, last_altered, row_count, bytes
+        from {self.wcfg['database']}.information_schema.tables
+        where {where}
+        """)
+        df.columns = [str(c).lower() for c in df.columns]
+        got = {
+            str(r.fqn).upper(): _digest(r.last_altered, r.row_count, r.bytes)
+            for r in df.itertuples(index=False)
+        }
+        return {
+            t: got.get(t, got.get(f"{str(self.wcfg['analytics_schema']).upper()}.{t}", ""))
+            for t in self.tables
+        }
+
+    def own_write(self, before: tuple | None) -> None:
+        """
+        Adopt the file stat left by our own DQ_RESULTS write (`before` = stat
+        taken once the writer lock was held), so the next poll does not rescan
+        every table for it. Skipped when the file had already changed since
+        the last poll: that change still needs its fingerprint pass.
+        """
+        if before is not None and before == self._file_fp:
+            self._file_fp = self._duckdb_file_fp()
+
+    def poll(self) -> dict[str, str] | None:
+        """Changed {table: fingerprint}; None when busy (DuckDB writer lock held elsewhere)."""
+        file_fp = self._duckdb_file_fp() if _is_duckdb(self.key) else None
+        if file_fp is not None and file_fp == self._file_fp:
+            return {}
+        try:
+            wh = self.reader()
+        except Exception as e:
+            if _is_locked(self.key, e):
+                return None
+            raise
+        try:
+            with span("watch.fingerprint", warehouse=self.key, tables=len(self.tables)):
+                fps = self._fingerprints(wh)
+        finally:
+            self.release(wh)
+        self._file_fp = file_fp
+        changed = {t: fp for t, fp in fps.items() if self.seen.get(t) != fp}
+        self.seen.update(changed)
+        return changed
+
+
+# -- warm state -----------------------------------------------------------------
+def _load_section(call: str) -> Callable[..., Any]:
+    mod, _, fn = call.partition(":")
+    if not mod or not fn:
+        raise ValueError(f"watch.sections call must be 'module:function', got {call!r}")
+    return getattr(importlib.import_module(mod), fn)
+
+
+@dataclass
+class _Target:
+    """One warehouse: checks grouped by table, table fingerprints, tables waiting for a rerun."""
+
+    wcfg: dict[str, Any]
+    tables: TableWatcher | None
+    by_table: dict[str, list[tuple[DatasetJob, dict[str, Any]]]]
+    dirty: set[str] = field(default_factory=set)  # survives a busy poll
+    full: bool = False
+    _before_write: tuple | None = None
+
+    def writer(self) -> Warehouse:
+        """Snowflake writes on the warm connection; DuckDB on a short-lived read-write one."""
+        assert self.tables is not None
+        if not _is_duckdb(self.tables.key):
+            return self.tables.reader()
+        wh = make_warehouse(_conn_cfg(self.wcfg))
+        self._before_write = self.tables._duckdb_file_fp()  # lock held: nobody else can write now
+        return wh
+
+    def release_writer(self, wh: Warehouse) -> None:
+        assert self.tables is not None
+        if _is_duckdb(self.tables.key):
+            wh.close()
+            self.tables.own_write(self._before_write)  # re-stat: our write is not a table change
+            self._before_write = None
+
+
+class Watcher:
+    """Warm config, checks, sections and baselines; `cycle()` polls once and reruns what changed."""
+
+    def __init__(self, config_path: str, cfg: WatchCfg | None = None):
+        self.config_path = str(Path(config_path).resolve())
+        self._cfg_override = cfg
+        # (warehouse_key, dataset_id, check_id) -> latest status
+        self.baselines: dict[tuple[str, str, str], str] = {}
+        self.latest: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self.cycles: list[dict[str, Any]] = []
+        self.n_polls = 0
+        self.targets: dict[str, _Target] = {}
+        self._force = threading.Event()
+        self._lock = threading.Lock()
+        self.load()
+
+    def _config_stat(self) -> str:
+        st = os.stat(self.config_path)
+        return _digest(st.st_size, st.st_mtime_ns)
+
+    @traced("engine.watch.load")
+    def load(self) -> None:
+        """(Re)parse config, expand datasets, compile check SQL, import sections, read baselines."""
+        self.close()
+        self.config = load_config(self.config_path)
+        self.cfg = self._cfg_override or WatchCfg.from_config(self.config)
+        self.grains = tuple(
+            (self.config.get("results_store") or {}).get("rollups", ("daily", "weekly"))
+        )
+        self.sections = [(s, _load_section(s.call)) for s in self.cfg.sections]
+        self.source_tables = {
+            str(ds["source_table"]).upper()
+            for ds in (self.config.get("datasets") or {}).values()
+            if ds and ds.get("source_table")
+        }
+
+        targets: dict[str, _Target] = {}
+        for job in discover_jobs(self.config_path):
+            t = targets.setdefault(job.warehouse_key, _Target(job.warehouse, None, {}))
+            for chk in job.checks:
+                _check_sql(chk)  # unknown check types fail here, not mid-watch
+                t.by_table.setdefault(str(chk["table"]).upper(), []).append((job, chk))
+        section_tables = [x for s, _ in self.sections for x in s.tables]
+        for key, t in targets.items():
+            t.tables = TableWatcher(
+                t.wcfg, list(t.by_table) + section_tables, self.cfg.table_fingerprint
+            )
+            wh = t.writer()
+            try:
+                store = self._store(t, wh)
+                store.ensure()
+                for r in store.latest_status().itertuples(index=False):
+                    self.baselines[(key, str(r.dataset_id), str(r.check_id))] = str(r.status)
+            finally:
+                t.release_writer(wh)
+        self.targets = targets
+
+        self.files = FileWatcher(
+            self.cfg.raw_dir, self.cfg.patterns, self.cfg.settle_s, self.cfg.content_hash
+        )
+        self.files.prime()
+        self._config_fp = self._config_stat()
+        n_checks = sum(len(ps) for t in targets.values() for ps in t.by_table.values())
+        n_tables = sum(len(t.tables.tables) for t in targets.values() if t.tables)
+        print(
+            f"👀 Watching {self.cfg.raw_dir} ({len(self.files.seen)} file(s)) + "
+            f"{n_tables} table(s) on {len(targets)} warehouse(s): {n_checks} check(s), "
+            f"{len(self.sections)} section(s), {len(self.baselines)} baseline(s)"
+        )
+
+    def close(self) -> None:
+        for t in self.targets.values():
+            if t.tables is not None:
+                t.tables.reset()
+
+    def _store(self, t: _Target, wh: Warehouse) -> ResultsStore:
+        return ResultsStore(
+            wh, t.wcfg["database"], t.wcfg["dq_schema"], t.wcfg["target"], grains=self.grains
+        )
+
+    def request_run(self) -> None:
+        """Rerun every check and section on the next poll."""
+        self._force.set()
+
+    # lineage ------------------------------------------------------------------
+    def tables_for_files(self, files: Sequence[str]) -> set[str]:
+        if not files:
+            return set()
+        if not self.cfg.sources:
+            return set(self.source_tables)
+        return {
+            t
+            for t, globs in self.cfg.sources.items()
+            if any(fnmatch.fnmatch(f, g) for f in files for g in globs)
+        }
+
+    def sections_for(
+        self, files: Sequence[str], tables: set[str]
+    ) -> list[tuple[SectionSpec, Callable[..., Any]]]:
+        return [
+            (spec, fn)
+            for spec, fn in self.sections
+            if tables.intersection(spec.tables)
+            or any(fnmatch.fnmatch(f, g) for f in files for g in spec.files)
+        ]
+
+    # one poll -----------------------------------------------------------------
+    @traced("engine.watch.cycle")
+    def cycle(self) -> dict[str, Any] | None:
+        """
+        Poll every input once and rerun what the changes reach → summary row
+        (WATCH_CYCLE_COLUMNS), or None when idle.
+        """
+        with self._lock:
+            first = self.n_polls == 0
+            self.n_polls += 1
+            full = self._force.is_set() or (first and self.cfg.initial_run)
+            self._force.clear()
+            if self._config_stat() != self._config_fp:
+                print("🔁 Config changed: reloading")
+                self.load()
+                full = True
+
+            t0 = time.perf_counter()
+            files = sorted(self.files.poll())
+            if files and self.cfg.dbt:
+                with span("dbt.build", section="dbt", stage="build"):
+                    run_dbt_build(
+                        self.config["dbt"]["project_dir"], self.config["dbt"]["profiles_dir"]
+                    )
+            from_files = self.tables_for_files(files)
+
+            run_id = uuid.uuid4().hex
+            results: list[dict[str, Any]] = []
+            n_regressed = 0
+            changed: set[str] = set(from_files)
+            errors: list[str] = []
+            for key, t in self.targets.items():
+                assert t.tables is not None
+                t.full = t.full or full
+                t.dirty |= from_files & set(t.by_table)
+                try:
+                    fps = t.tables.poll()
+                    if fps is None:
+                        print(f"⏳ {key} is locked by a writer; retrying next poll")
+                        continue
+                    if first and not full:  # first poll only records fingerprints
+                        continue
+                    changed |= set(fps)
+                    t.dirty |= set(fps) & set(t.by_table)
+                    out = self._run_target(t, run_id)
+                    n_regressed += self._update_baselines(key, out)
+                    results.extend(out)
+                except Exception as e:
+                    if _is_locked(key, e):
+                        print(f"⏳ {key} is locked by a writer; retrying next poll")
+                        continue
+                    t.tables.reset()  # reconnect on the next poll
+                    errors.append(f"{key}: {type(e).__name__}: {e}")
+
+            n_sections = 0
+            if full or not first:
+                for spec, fn in (self.sections if full else self.sections_for(files, changed)):
+                    try:
+                        with span("watch.section", section=spec.id):
+                            fn(files=files, tables=sorted(changed), config=self.config)
+                        n_sections += 1
+                    except Exception as e:
+                        errors.append(f"section {spec.id}: {type(e).__name__}: {e}")
+
+            if not results and not n_sections and not errors:
+                return None
+            row = {
+                "cycle": len(self.cycles) + 1,
+                "run_id": run_id,
+                "changed_files": len(files),
+                "changed_tables": len(changed),
+                "n_checks": len(results),
+                "n_sections": n_sections,
+                "n_fail": sum(r["status"] == "FAIL" for r in results),
+                "n_warn": sum(r["status"] == "WARN" for r in results),
+                "n_regressed": n_regressed,
+                "seconds": round(time.perf_counter() - t0, 3),
+                "error": "; ".join(errors),
+            }
+            self.cycles.append(row)
+            del self.cycles[:-100]
+            self._report(row, results, errors)
+            return row
+
+    def _run_target(self, t: _Target, run_id: str) -> list[dict[str, Any]]:
+        assert t.tables is not None
+        pairs = (
+            [p for ps in t.by_table.values() for p in ps]
+            if t.full
+            else [p for tbl in sorted(t.dirty) for p in t.by_table.get(tbl, [])]
+        )
+        by_job: dict[str, tuple[DatasetJob, list[dict[str, Any]]]] = {}
+        for job, chk in pairs:
+            by_job.setdefault(job.dataset_id, (job, []))[1].append(chk)
+
+        out: list[dict[str, Any]] = []
+        if by_job:
+            wh = t.tables.reader()
+            try:
+                for job, checks in by_job.values():
+                    with span("watch.dataset", dataset_id=job.dataset_id, checks=len(checks)):
+                        out.extend(
+                            asdict(r) for r in run_checks(wh, checks, run_id, job.dataset_id)
+                        )
+            finally:
+                t.tables.release(wh)
+        if out:
+            df = pd.DataFrame(out)
+            df["run_ts"] = pd.Timestamp.now(tz="UTC").tz_localize(None)
+            wh = t.writer()
+            try:
+                self._store(t, wh).append(df)
+            finally:
+                t.release_writer(wh)
+        t.dirty.clear()
+        t.full = False
+        return out
+
+    def _update_baselines(self, key: str, results: Sequence[dict[str, Any]]) -> int:
+        n = 0
+        for r in results:
+            k = (key, str(r["dataset_id"]), str(r["check_id"]))
+            prev = self.baselines.get(k)
+            if prev is not None and _STATUS_RANK.get(r["status"], 0) > _STATUS_RANK.get(prev, 0):
+                n += 1
+                print(f"📉 {k[1]} / {k[2]}: {prev} → {r['status']}")
+            self.baselines[k] = str(r["status"])
+            self.latest[k] = dict(r)
+        return n
+
+    def _report(
+        self, row: dict[str, Any], results: Sequence[dict[str, Any]], errors: Sequence[str]
+    ) -> None:
+        for e in errors:
+            print(f"❌ {e}")
+        ok = not errors and row["n_fail"] == 0 and row["n_regressed"] == 0
+        print(
+            f"{'✅' if ok else '⚠️'} Cycle {row['cycle']}: {row['changed_files']} file(s) / "
+            f"{row['changed_tables']} table(s) changed → {row['n_checks']} check(s) "
+            f"({row['n_fail']} FAIL / {row['n_warn']} WARN, {row['n_regressed']} regressed), "
+            f"{row['n_sections']} section(s) in {row['seconds']:,.2f}s"
+        )
+        if self.cfg.run_dir and results:
+            p = Path(self.cfg.run_dir).resolve()
+            p.mkdir(parents=True, exist_ok=True)
+            df = pd.DataFrame(results)
+            for name, write in (
+                ("dq_results.csv", lambda f: df.to_csv(f, index=False)),
+                (
+                    "dq_results.json",
+                    lambda f: Path(f).write_text(
+                        json.dumps(df.to_dict(orient="records"), indent=2, default=str),
+                        encoding="utf-8",
+                    ),
+                ),
+            ):
+                tmp = p / f".{name}.tmp"
+                write(tmp)
+                os.replace(tmp, p / name)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "config_path": self.config_path,
+            "raw_dir": self.cfg.raw_dir,
+            "polls": self.n_polls,
+            "files": len(self.files.seen),
+            "tables": {
+                k: dict(t.tables.seen)
+                for k, t in list(self.targets.items())
+                if t.tables is not None
+            },
+            "cycles": list(self.cycles[-20:]),
+            "latest": list(self.latest.values()),
+        }
+
+
+# -- loop / server ----------------------------------------------------------------
+def _loop(w: Watcher, stop: threading.Event, once: bool) -> None:
+    installed = {}
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            installed[sig] = signal.signal(sig, lambda *_: stop.set())
+    try:
+        while True:
+            try:
+                w.cycle()
+            except Exception as e:
+                print(f"❌ Watch cycle failed: {type(e).__name__}: {e}")
+            if once or stop.wait(w.cfg.interval_s):
+                break
+    finally:
+        for sig, prev in installed.items():
+            signal.signal(sig, prev)
+        w.close()
+        print("👋 Watch stopped")
+
+
+def watch(
+    config_path: str,
+    *,
+    cfg: WatchCfg | None = None,
+    once: bool = False,
+    stop: threading.Event | None = None,
+) -> Watcher:
+    """Poll and rerun until SIGINT / SIGTERM (or `stop` is set); `once=True` runs a single cycle."""
+    w = Watcher(config_path, cfg)
+    _loop(w, stop or threading.Event(), once)
+    return w
+
+
+def _handler(w: Watcher) -> type:
+    class _Handler(BaseHTTPRequestHandler):
+        def _send(self, code: int, body: Any) -> None:
+            data = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "polls": w.n_polls})
+            elif self.path == "/status":
+                self._send(200, w.status())
+            else:
+                self._send(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self) -> None:  # noqa: N802
+            if self.path == "/run":
+                w.request_run()
+                self._send(202, {"queued": True})
+            else:
+                self._send(404, {"error": f"unknown path {self.path}"})
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return _Handler
+
+
+def serve(
+    config_path: str,
+    *,
+    cfg: WatchCfg | None = None,
+    host: str | None = None,
+    port: int | None = None,
+    stop: threading.Event | None = None,
+) -> Watcher:
+    """`watch` plus the HTTP status endpoint (/health, /status, POST /run)."""
+    w = Watcher(config_path, cfg)
+    server = ThreadingHTTPServer(
+        (host or w.cfg.host, w.cfg.port if port is None else port), _handler(w)
+    )
+    threading.Thread(target=server.serve_forever, name="dq-serve", daemon=True).start()
+    print(f"🌐 Serving status on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        _loop(w, stop or threading.Event(), once=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return w
@@ -0,0 +1,116 @@
+# tests/unit/test_artifacts.py
+import os
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+import pyarrow.parquet as pq  # noqa: E402
+
+from dq_engine.artifacts import (  # noqa: E402
+    ArtifactCfg,
+    artifact_cache_stats,
+    artifact_manifest,
+    clear_artifact_cache,
+    file_sha256,
+    load_manifest,
+    read_artifact,
+    write_artifact,
+)
+
+CFG = ArtifactCfg(compression="none", compression_level=None)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_artifact_cache()
+    yield
+    clear_artifact_cache()
+
+
+def _frame(values):
+    return pd.DataFrame({"rule": ["r_a", "r_b", "r_c"], "n_violations": values})
+
+
+def _rewrite(path, df, *, mtime_ns=None):
+    """Replace the Parquet file behind write_artifact's back (another tool, a hand edit)."""
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression="none")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_write_through_then_unchanged_reads_hit(tmp_path):
+    path = tmp_path / "outlier_report.csv"
+    entry = write_artifact(_frame([1, 2, 3]), path, cfg=CFG)
+    assert entry["sha256"] == file_sha256(tmp_path / "outlier_report.parquet")
+    for _ in range(2):
+        pd.testing.assert_frame_equal(read_artifact(path, cfg=CFG), _frame([1, 2, 3]))
+    assert artifact_cache_stats()["hits"] == 2
+    assert artifact_cache_stats()["misses"] == 0
+
+
+def test_mtime_change_with_same_size_forces_a_miss(tmp_path):
+    path = tmp_path / "outlier_report.csv"
+    entry = write_artifact(_frame([1, 2, 3]), path, cfg=CFG)
+    pq_path = tmp_path / entry["file"]
+    # explicit mtime: two writes inside one filesystem clock tick can share a timestamp
+    _rewrite(pq_path, _frame([7, 8, 9]), mtime_ns=entry["mtime_ns"] + 1_000_000_000)
+    st = pq_path.stat()
+    assert st.st_size == entry["size_bytes"]  # only the mtime tells the files apart
+    assert st.st_mtime_ns != entry["mtime_ns"]
+
+    pd.testing.assert_frame_equal(read_artifact(path, cfg=CFG), _frame([7, 8, 9]))
+    assert artifact_cache_stats()["misses"] == 1
+    recorded = load_manifest(tmp_path)[entry["file"]]
+    assert recorded["sha256"] == file_sha256(pq_path) != entry["sha256"]
+    assert recorded["mtime_ns"] == st.st_mtime_ns
+    assert recorded["csv"] == "outlier_report.csv"  # the mirror link survives the re-hash
+
+
+def test_size_change_with_same_mtime_forces_a_miss(tmp_path):
+    path = tmp_path / "outlier_report.csv"
+    entry = write_artifact(_frame([1, 2, 3]), path, cfg=CFG)
+    pq_path = tmp_path / entry["file"]
+    bigger = pd.concat([_frame([4, 5, 6]), _frame([7, 8, 9])], ignore_index=True)
+    _rewrite(pq_path, bigger, mtime_ns=entry["mtime_ns"])
+    assert pq_path.stat().st_size != entry["size_bytes"]
+    assert pq_path.stat().st_mtime_ns == entry["mtime_ns"]
+
+    pd.testing.assert_frame_equal(read_artifact(path, cfg=CFG), bigger)
+    assert artifact_cache_stats()["misses"] == 1
+    assert load_manifest(tmp_path)[entry["file"]]["n_rows"] == 6
+
+    rows = artifact_manifest([("outliers", path, "2.3", "post")])
+    assert rows.loc[0, "sha256"] == file_sha256(pq_path)
+    assert rows.loc[0, "n_rows"] == 6
+
+
+def test_csv_mirror_is_written_and_reported(tmp_path):
+    df = _frame([1, 2, 3])
+    mirrored, bare = tmp_path / "mirrored.csv", tmp_path / "bare.csv"
+    assert write_artifact(df, mirrored, cfg=CFG)["csv"] == "mirrored.csv"
+    assert write_artifact(df, bare, cfg=CFG, csv_mirror=False)["csv"] is None
+    pd.testing.assert_frame_equal(pd.read_csv(mirrored), df)
+    assert not bare.exists()
+
+    rows = artifact_manifest([("mirrored", mirrored, "2.3", "post"), ("bare", bare, "2.3", "post")])
+    assert rows["format"].tolist() == ["parquet", "parquet"]
+    assert rows["csv_mirror"].tolist() == [str(mirrored), ""]
+    assert rows["path"].tolist() == [
+        str(tmp_path / "mirrored.parquet"),
+        str(tmp_path / "bare.parquet"),
+    ]
+
+    mirrored.write_text("rule,n_violations\nedited,0\n", encoding="utf-8")
+    pd.testing.assert_frame_equal(read_artifact(mirrored, cfg=CFG), df)  # Parquet is the truth
+
+
+def test_csv_format_writes_only_the_csv(tmp_path):
+    cfg = ArtifactCfg(format="csv")
+    path = tmp_path / "report.csv"
+    write_artifact(_frame([1, 2, 3]), path, cfg=CFG)
+    entry = write_artifact(_frame([4, 5, 6]), path, cfg=cfg)
+    assert entry["format"] == "csv" and entry["n_rows"] == 3
+    assert not (tmp_path / "report.parquet").exists()  # a stale Parquet would shadow the CSV
+    pd.testing.assert_frame_equal(read_artifact(path, cfg=cfg), _frame([4, 5, 6]))
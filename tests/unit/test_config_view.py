@@ -0,0 +1,48 @@
+# tests/unit/test_config_view.py
+import pytest
+import yaml
+
+from dq_engine.utils import config as config_mod
+from dq_engine.utils.config import C, bind_config, config_view
+
+
+@pytest.fixture
+def bound(monkeypatch):
+    for name in ("_BOUND_CONFIG", "_BOUND_CONFIG_PATH", "_BOUND_VIEW"):
+        monkeypatch.setattr(config_mod, name, getattr(config_mod, name))
+    cfg = {
+        "RANGES": {"tenure": {"min": 0, "max": 72}},
+        "ID_COLUMNS": ["customerID"],
+        "KEYS": {"PRIMARY_KEYS": ["customerID"]},
+    }
+    bind_config(cfg, validate=False)
+    return cfg
+
+
+def test_containers_are_plain_dicts_and_lists(bound):
+    assert isinstance(C("RANGES.tenure"), dict)
+    assert isinstance(C("ID_COLUMNS"), list)
+    assert C("RANGES") is bound["RANGES"]
+    assert C("RANGES.tenure.max") == 72
+
+
+def test_in_place_edits_are_seen(bound):
+    bound["RANGES"]["tenure"]["max"] = 100
+    bound["KEYS"]["FOREIGN_KEYS"] = {}
+    bound["INTEGRITY_INDEX"] = {"WEIGHTS": {"keys": 1.0}}
+    assert C("RANGES.tenure.max") == 100
+    assert C("KEYS.FOREIGN_KEYS") == {}
+    assert C("WEIGHTS.keys", roots=["INTEGRITY_INDEX."]) == 1.0
+    del bound["RANGES"]
+    assert C("RANGES.tenure", "gone") == "gone"
+
+
+def test_yaml_aliases_are_unshared(monkeypatch):
+    for name in ("_BOUND_CONFIG", "_BOUND_CONFIG_PATH", "_BOUND_VIEW"):
+        monkeypatch.setattr(config_mod, name, getattr(config_mod, name))
+    cfg = yaml.safe_load("LEVELS: &L {plan: [a, b]}\nCATEGORICAL: {VALID_DOMAINS: *L}\n")
+    assert cfg["LEVELS"] is cfg["CATEGORICAL"]["VALID_DOMAINS"]
+    bind_config(cfg, validate=False)
+    assert config_view().aliases == {"CATEGORICAL.VALID_DOMAINS": "LEVELS"}
+    C("CATEGORICAL.VALID_DOMAINS.plan").append("c")
+    assert C("LEVELS.plan") == ["a", "b"]
@@ -0,0 +1,59 @@
+# tests/unit/test_consistency.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.engines.consistency import ConsistencyEngine
+
+
+def _frame(n=3_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "contract": rng.choice(
+                ["Month", "One year", "Two year", None], n, p=[0.5, 0.25, 0.2, 0.05]
+            ),
+            "tenure": rng.integers(0, 72, n).astype(float),  # integer values -> many ties
+            "charges": rng.gamma(2.0, 30.0, n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "charges"] = np.nan
+    df.loc[rng.random(n) < 0.05, "tenure"] = np.nan
+    for i in range(4):
+        df[f"d{i}"] = (rng.random(n) < 0.3).astype(float)
+    df.loc[rng.random(n) < 0.02, "d1"] = np.nan
+    df.loc[:4, "contract"] = "Rare"  # a small group (5 rows)
+    return df
+
+
+def test_group_stats_match_groupby_quantiles():
+    df = _frame()
+    cols = ["tenure", "charges"]
+    eng = ConsistencyEngine(df, quantiles=(0.1, 0.25, 0.5, 0.9))
+    st = eng.group_stats("contract", cols)
+    levels = list(st.index.levels)
+    g = df.groupby("contract")[cols]
+    np.testing.assert_array_equal(st.count, g.count().loc[levels].to_numpy())
+    np.testing.assert_allclose(st.mean, g.mean().loc[levels].to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(st.median, g.median().loc[levels].to_numpy(), rtol=1e-12)
+    for q in (0.1, 0.25, 0.9):
+        expected = g.quantile(q).loc[levels].to_numpy()
+        np.testing.assert_allclose(st.quantiles[q], expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["mutually_exclusive", "at_least_one"])
+def test_onehot_counts_match_row_sums(mode):
+    df = _frame()
+    groups = {
+        "abc": {"mode": mode, "columns": ["d0", "d1", "d2"]},
+        "cd": {"mode": mode, "columns": ["d2", "d3", "missing_col"]},
+    }
+    out = ConsistencyEngine(df).onehot_integrity(groups).set_index("group_id")
+    for gid, g in groups.items():
+        present = [c for c in g["columns"] if c in df.columns]
+        s = df[present].fillna(0).sum(axis=1)
+        row = out.loc[gid]
+        assert row["n_rows"] == len(df)
+        assert row["n_all_zero"] == int((s == 0).sum())
+        assert row["n_single"] == int((s == 1).sum())
+        assert row["n_multi"] == int((s > 1).sum())
@@ -0,0 +1,128 @@
+# tests/unit/test_correlation.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.engines.correlation import (
+    CorrelationEngine,
+    RankIndex,
+    pairwise_pearson,
+    pairwise_spearman,
+    vif_from_corr,
+)
+
+
+def _frame(n=2_000, seed=0, nan_frac=0.1):
+    rng = np.random.default_rng(seed)
+    a, b, c = rng.normal(size=(3, n))
+    df = pd.DataFrame(
+        {
+            "a": a,
+            "b": 0.6 * a + rng.normal(size=n),
+            "c": c,
+            "d": np.exp(c) + rng.normal(scale=0.5, size=n),
+            "t": rng.integers(0, 5, n).astype(float),
+        }
+    )
+    if nan_frac:
+        for col, k in (("a", 1), ("b", 2), ("d", 3)):
+            df.loc[rng.random(n) < nan_frac * k / 2, col] = np.nan
+    return df
+
+
+def _ols_vif(X):
+    out = []
+    for j in range(X.shape[1]):
+        A = np.column_stack([np.ones(len(X)), np.delete(X, j, axis=1)])
+        y = X[:, j]
+        resid = y - A @ np.linalg.lstsq(A, y, rcond=None)[0]
+        r2 = 1.0 - resid @ resid / ((y - y.mean()) @ (y - y.mean()))
+        out.append(np.inf if r2 >= 1 - 1e-12 else 1.0 / (1.0 - r2))
+    return np.asarray(out)
+
+
+@pytest.mark.parametrize("nan_frac", [0.0, 0.1])
+def test_pearson_matches_pandas(nan_frac):
+    df = _frame(nan_frac=nan_frac)
+    corr, n_obs = pairwise_pearson(df.to_numpy())
+    np.testing.assert_allclose(corr, df.corr("pearson").to_numpy(), atol=1e-12)
+    assert n_obs[0, 1] == int((df["a"].notna() & df["b"].notna()).sum())
+
+
+@pytest.mark.parametrize("nan_frac", [0.0, 0.1])
+def test_spearman_matches_pandas(nan_frac):
+    df = _frame(nan_frac=nan_frac)
+    np.testing.assert_allclose(
+        pairwise_spearman(df.to_numpy()), df.corr("spearman").to_numpy(), atol=1e-12
+    )
+    eng = CorrelationEngine(df)
+    np.testing.assert_allclose(
+        eng.matrix("spearman").to_numpy(), df.corr("spearman").to_numpy(), atol=1e-12
+    )
+
+
+def _distinct_missing_frame(n=600, p=12, seed=1):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=n)
+    cols = {}
+    for j in range(p):
+        x = 0.5 * base + rng.normal(size=n)
+        cols[f"x{j}"] = np.round(x, 1) if j % 3 == 0 else x  # rounded columns carry ties
+    df = pd.DataFrame(cols)
+    for j, col in enumerate(df.columns):
+        df.loc[rng.random(n) < 0.02 + 0.03 * j, col] = np.nan
+    df["sparse"] = np.nan
+    df.loc[:2, "sparse"] = [1.0, 2.0, 3.0]  # shares < 2 rows with some columns
+    df["const"] = 1.0
+    df.loc[rng.random(n) < 0.1, "const"] = np.nan
+    return df
+
+
+def test_spearman_matches_pandas_with_distinct_missing_patterns():
+    df = _distinct_missing_frame()
+    expected = df.corr("spearman").to_numpy().copy()
+    np.testing.assert_allclose(pairwise_spearman(df.to_numpy()), expected, atol=1e-12)
+    np.fill_diagonal(expected, 1.0)  # the engine reports a unit diagonal, even for "const"
+    np.testing.assert_allclose(
+        CorrelationEngine(df).matrix("spearman").to_numpy(), expected, atol=1e-12
+    )
+
+
+def test_rank_index_matches_pandas_rank_on_kept_rows():
+    df = _distinct_missing_frame()
+    index = RankIndex(df.to_numpy())
+    np.testing.assert_allclose(index.ranks(), df.rank().to_numpy(), atol=1e-12)
+    keep = df["x1"].notna().to_numpy()
+    np.testing.assert_allclose(
+        index.ranks([0, 3], keep), df.iloc[:, [0, 3]][keep].reindex(df.index).rank().to_numpy()
+    )
+
+
+def test_vif_matches_ols():
+    df = _frame(nan_frac=0.0)
+    vif = CorrelationEngine(df).vif()
+    np.testing.assert_allclose(vif.to_numpy(), _ols_vif(df[list(vif.index)].to_numpy()), rtol=1e-8)
+
+
+def test_vif_singular_reports_only_dependent_columns():
+    df = _frame(nan_frac=0.0)
+    df["e"] = df["a"] + df["c"]
+    vif = CorrelationEngine(df).vif()
+    assert np.isinf(vif[["a", "c", "e"]]).all()
+    free = ["b", "d", "t"]
+    assert np.isfinite(vif[free]).all()
+    expected = pd.Series(_ols_vif(df[list(vif.index)].to_numpy()), index=vif.index)
+    np.testing.assert_allclose(vif[free], expected[free], rtol=1e-6)
+
+    report = CorrelationEngine(df).vif_report()
+    assert set(report["column"]) == set(df.columns)
+    assert report.loc[report["column"] == "e", "vif_category"].item() == "high"
+
+
+def test_vif_from_corr_undefined_column():
+    df = _frame(nan_frac=0.0)[["a", "b", "c"]]
+    R = df.corr().to_numpy()
+    R = np.pad(R, ((0, 1), (0, 1)), constant_values=np.nan)  # a constant column's NaN correlations
+    vif = vif_from_corr(R)
+    assert np.isnan(vif[-1])
+    np.testing.assert_allclose(vif[:3], _ols_vif(df.to_numpy()), rtol=1e-8)
@@ -0,0 +1,148 @@
+# tests/unit/test_dbt_runner.py
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from dq_engine import dbt_runner
+from dq_engine.dbt_runner import STATE_DIRNAME, file_checksum, run_dbt_build
+
+MODELS = {"a": "select 1 as x", "b": "select x from {{ ref('a') }}"}
+
+
+class FakeDbt:
+    """Stands in for subprocess.Popen: records each command and writes dbt's target/ files."""
+
+    def __init__(self):
+        self.calls = []
+        self.returncode = 0
+
+    def __call__(self, cmd, stdout=None, stderr=None, text=None, bufsize=None, cwd=None):
+        self.calls.append(list(cmd))
+        self._cwd = Path(cwd)
+        return self
+
+    def __enter__(self):
+        target = self._cwd / "target"
+        target.mkdir(exist_ok=True)
+        nodes = {
+            f"model.telco.{p.stem}": {
+                "resource_type": "model",
+                "original_file_path": p.relative_to(self._cwd).as_posix(),
+                "patch_path": "telco://models/schema.yml",
+                "checksum": {"name": "sha256", "checksum": file_checksum(p)},
+            }
+            for p in sorted((self._cwd / "models").glob("*.sql"))
+        }
+        (target / "manifest.json").write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+        results = [{"unique_id": uid, "status": "success", "execution_time": 0.5} for uid in nodes]
+        (target / "run_results.json").write_text(
+            json.dumps({"metadata": {"invocation_id": str(len(self.calls))}, "results": results}),
+            encoding="utf-8",
+        )
+        self.stdout = io.StringIO("Running with dbt\nDone.\n")
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def wait(self):
+        return self.returncode
+
+    @property
+    def selected(self):
+        """The last command's --select value (None = full build)."""
+        cmd = self.calls[-1]
+        return cmd[cmd.index("--select") + 1] if "--select" in cmd else None
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    proj, profiles = tmp_path / "dbt", tmp_path / "profiles"
+    (proj / "models").mkdir(parents=True)
+    profiles.mkdir()
+    (proj / "dbt_project.yml").write_text("name: telco\nmodel-paths: [models]\n", encoding="utf-8")
+    (proj / "models" / "schema.yml").write_text("version: 2\n", encoding="utf-8")
+    for name, sql in MODELS.items():
+        (proj / "models" / f"{name}.sql").write_text(sql, encoding="utf-8")
+    (profiles / "profiles.yml").write_text("telco: {target: dev}\n", encoding="utf-8")
+    fake = FakeDbt()
+    monkeypatch.setattr(dbt_runner.subprocess, "Popen", fake)
+    return proj, profiles, fake
+
+
+def _build(project, **kw):
+    proj, profiles, _ = project
+    return run_dbt_build(proj, profiles, log=lambda line: None, **kw)
+
+
+def test_unchanged_project_skips_dbt(project):
+    proj, _, fake = project
+    first = _build(project)
+    assert first.status == "success" and first.selector is None and fake.selected is None
+    assert (proj / "target" / STATE_DIRNAME / "manifest.json").is_file()
+    assert len(first.timings) == 2
+
+    again = _build(project)
+    assert again.status == "skipped"
+    assert len(fake.calls) == 1  # dbt was not started
+    assert _build(project, full=True).status == "success" and fake.selected is None
+    assert len(fake.calls) == 2
+    timings = pd.read_csv(proj / "target" / STATE_DIRNAME / "build_timings.csv")
+    assert timings["invocation_id"].tolist() == [1, 1, 2, 2]
+
+
+def test_changed_model_builds_state_modified_plus(project):
+    proj, _, fake = project
+    _build(project)
+    (proj / "models" / "b.sql").write_text(
+        "select x + 1 as x from {{ ref('a') }}", encoding="utf-8"
+    )
+
+    res = _build(project)
+    state = str(proj.resolve() / "target" / STATE_DIRNAME)
+    assert res.selector == fake.selected == "state:modified+"
+    assert fake.calls[-1][fake.calls[-1].index("--state") + 1] == state
+    assert res.changed_files == ["models/b.sql"]
+    assert res.modified_nodes == ["model.telco.b"]
+    assert _build(project).status == "skipped"  # the state advanced with the build
+
+    (proj / "models" / "schema.yml").write_text("version: 2\nmodels: []\n", encoding="utf-8")
+    assert _build(project).modified_nodes == ["model.telco.a", "model.telco.b"]  # yml patch
+
+
+def test_source_fingerprint_selects_downstream_of_the_source(project):
+    _build(project, source_fingerprints={"source:raw.telco": "v1"})
+    res = _build(project, source_fingerprints={"source:raw.telco": "v2"})
+    assert res.selector == "state:modified+ source:raw.telco+"
+    assert res.changed_files == ["source:raw.telco"]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"vars": {"as_of": "2024-01-01"}},
+        {"target": "prod"},
+    ],
+)
+def test_project_level_change_forces_a_full_build(project, change):
+    _, _, fake = project
+    _build(project)
+    res = _build(project, **change)
+    assert res.status == "success" and res.selector is None and fake.selected is None
+    assert "--target" in fake.calls[-1] or "--vars" in fake.calls[-1]
+
+
+def test_failed_build_keeps_the_previous_state(project):
+    proj, _, fake = project
+    _build(project)
+    (proj / "models" / "a.sql").write_text("select 2 as x", encoding="utf-8")
+    fake.returncode = 1
+    with pytest.raises(RuntimeError, match="returncode=1"):
+        _build(project)
+
+    fake.returncode = 0
+    res = _build(project)  # still sees the change: the fingerprint was not advanced
+    assert res.selector == "state:modified+" and res.changed_files == ["models/a.sql"]
@@ -0,0 +1,74 @@
+# tests/unit/test_fanout.py
+import json
+
+import pytest
+import yaml
+
+duckdb = pytest.importorskip("duckdb")
+
+from dq_engine.fanout import FanoutCfg, run_fanout  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path):
+    db = tmp_path / "DQ_ENGINE.duckdb"
+    con = duckdb.connect(str(db))
+    con.execute("create schema ANALYTICS")
+    con.execute(
+        "create table ANALYTICS.MRT_TELCO_CHURN as select i % 2 as CHURN_FLAG from range(10) t(i)"
+    )
+    con.close()
+    cfg = {
+        "project": {"name": "dq_engine", "dataset_id": "unused"},
+        "warehouse": {
+            "target": "duckdb",
+            "database": "DQ_ENGINE",
+            "raw_schema": "RAW",
+            "analytics_schema": "ANALYTICS",
+            "dq_schema": "DQ",
+            "duckdb_path": str(db),
+        },
+        "datasets": {
+            "broken": {"models": {"mart": "ANALYTICS.NO_SUCH_TABLE"}},
+            "churn": {"models": {"mart": "ANALYTICS.MRT_TELCO_CHURN"}},
+        },
+        "checks": [
+            {
+                "id": "{dataset_id}_churn_flag",
+                "type": "accepted_values",
+                "table": "{mart}",
+                "column": "CHURN_FLAG",
+                "severity": "fail",
+                "params": {"values": [0, 1]},
+            },
+            {"id": "{dataset_id}_row_count", "type": "row_count", "table": "{mart}"},
+        ],
+    }
+    path = tmp_path / "dq_project.yml"
+    path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+    return path, db
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_failing_dataset_does_not_stop_the_others(project, tmp_path, max_workers):
+    path, db = project
+    run_dir = tmp_path / "run"
+    summary = run_fanout(
+        str(path), skip_dbt=True, run_dir=str(run_dir), cfg=FanoutCfg(max_workers=max_workers)
+    )
+
+    assert summary["dataset_id"].tolist() == ["broken", "churn"]
+    assert summary["status"].tolist() == ["failed", "ok"]
+    broken, churn = summary.iloc[0], summary.iloc[1]
+    assert "NO_SUCH_TABLE" in broken["error"]
+    assert broken["n_checks"] == 0
+    assert (churn["n_checks"], churn["n_pass"], churn["error"]) == (2, 2, "")
+
+    saved = json.loads((run_dir / "fanout_summary.json").read_text(encoding="utf-8"))
+    assert saved["n_failed"] == 1
+    con = duckdb.connect(str(db), read_only=True)
+    try:
+        stored = con.execute("select dataset_id, count(*) from DQ.DQ_RESULTS group by 1").fetchall()
+    finally:
+        con.close()
+    assert stored == [("churn", 2)]
@@ -0,0 +1,60 @@
+# tests/unit/test_keys.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.engines.keys import (
+    clear_ref_index_cache,
+    count_duplicate_rows,
+    fk_membership,
+    key_uniqueness,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_ref_index_cache()
+    yield
+    clear_ref_index_cache()
+
+
+@pytest.mark.parametrize("ref_dtype", ["int64", "Int64", "float64", "Int8"])
+def test_nullable_fk_counts_nulls_separately(ref_dtype):
+    fk = pd.Series(pd.array([1, 2, 2, None, 5], dtype="Int64"), name="fk")
+    ref = pd.Series([1, 2, 3], dtype=ref_dtype, name="id")
+    m = fk_membership(fk, ref, "ref", "id")
+    assert m == {"n_rows": 5, "n_null_fk_rows": 1, "n_unmatched_fk": 1, "pct_unmatched_fk": 0.25}
+
+
+def test_sorted_index_matches_brute_force_and_bloom_is_a_lower_bound():
+    rng = np.random.default_rng(7)
+    ref = pd.Series(rng.choice(50_000, 20_000, replace=False), name="id")
+    fk = pd.Series(rng.integers(0, 50_000, 30_000), name="fk").astype("Int64")
+    fk[rng.choice(fk.size, 300, replace=False)] = pd.NA
+    valid = fk.dropna().astype("int64")
+    expected = int((~np.isin(valid, ref)).sum())
+
+    exact = fk_membership(fk, ref, "ref", "id", kind="sorted")
+    bloom = fk_membership(fk, ref, "ref", "id", kind="bloom", fpp=1e-3)
+    assert exact["n_null_fk_rows"] == bloom["n_null_fk_rows"] == 300
+    assert exact["n_unmatched_fk"] == expected
+    assert bloom["n_unmatched_fk"] <= expected
+    assert bloom["n_unmatched_fk"] >= expected * 0.99
+
+
+def test_duplicates_match_pandas():
+    df = pd.DataFrame(
+        {
+            "id": pd.array([1, 1, 2, 3, 3, 3, None, None], dtype="Int64"),
+            "v": ["a", "a", "b", "c", "d", "c", "x", "x"],
+        }
+    )
+    assert count_duplicate_rows(df) == int(df.duplicated().sum())
+    m, detail = key_uniqueness(df, ["id"])
+    assert m == {
+        "n_rows": 8,
+        "n_null_key_rows": 2,
+        "n_duplicate_keys": 2,
+        "n_conflicting_key_groups": 1,
+    }
+    assert sorted(detail["dup_count"].tolist()) == [2, 3]
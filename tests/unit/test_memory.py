@@ -0,0 +1,22 @@
+# tests/unit/test_memory.py
+import numpy as np
+import pandas as pd
+
+from dq_engine.memory import MemoryOptCfg, optimize_frame
+
+
+def _frame():
+    return pd.DataFrame({"charge": [20.05, 1.5, np.nan], "tenure": [1.0, 2.0, np.nan]})
+
+
+def test_floats_stay_float_by_default():
+    out, _ = optimize_frame(_frame())
+    assert out.dtypes.to_dict() == {"charge": np.float64, "tenure": np.float64}
+    assert (out["charge"] == 20.05).sum() == 1
+
+
+def test_float32_only_on_exact_round_trip():
+    out, _ = optimize_frame(_frame(), MemoryOptCfg(downcast_floats=True))
+    assert out["charge"].dtype == np.float64
+    assert out["tenure"].dtype == np.float32
+    assert out["tenure"].isna().sum() == 1
@@ -0,0 +1,61 @@
+# tests/unit/test_model_checks.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.engines.model_checks import (
+    ModelCheckCfg,
+    ModelCheckExecutor,
+    _fit_task,
+    _fold_medians,
+)
+
+pytest.importorskip("sklearn")
+
+
+def _frame(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    a, b = rng.normal(size=n), rng.normal(size=n)
+    df = pd.DataFrame({"a": a, "b": b, "churn": (a + 0.3 * rng.normal(size=n) > 0).astype(int)})
+    df.loc[rng.choice(n, 20, replace=False), "a"] = np.nan
+    df.loc[rng.choice(n, 10, replace=False), "b"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("kind", ["gradient_boosting", "random_forest"])
+def test_fit_folds_with_missing_values(tmp_path, kind):
+    cfg = ModelCheckCfg(
+        target="churn",
+        model_kind=kind,
+        model_params={"n_estimators": 10},
+        n_splits=3,
+        n_jobs=1,
+        cache_dir=str(tmp_path),
+        shap=False,
+    )
+    ex = ModelCheckExecutor.from_frame(_frame(), cfg)
+    folds = ex.fit_folds()
+    assert len(folds) == 3 and folds["score"].notna().all()
+    perm = ex.permutation_importance()
+    assert perm["importance_mean"].notna().all()
+
+
+def test_medians_come_from_training_rows_only(tmp_path):
+    X = np.array([[1.0], [np.nan], [3.0], [100.0]], dtype="float32")
+    y = np.array([0.0, 1.0, 0.0, 1.0])
+    train, test = np.array([0, 1, 2]), np.array([3])
+    assert _fold_medians(X, train).tolist() == [2.0]
+    out = _fit_task(
+        0,
+        "k",
+        str(tmp_path),
+        X,
+        y,
+        train,
+        test,
+        "random_forest",
+        "classification",
+        {"n_estimators": 2},
+        0,
+    )
+    assert out["medians"].tolist() == [2.0]
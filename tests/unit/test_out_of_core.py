@@ -0,0 +1,23 @@
+# tests/unit/test_out_of_core.py
+import numpy as np
+import pandas as pd
+
+from dq_engine.out_of_core import SpillStore
+
+
+def test_spill_promotes_schema_across_chunks(tmp_path):
+    chunks = [
+        pd.DataFrame(
+            {"n": [1, 2], "note": [np.nan, np.nan], "k": pd.array([1, None], dtype="Int64")}
+        ),
+        pd.DataFrame(
+            {"n": [3.5, 4.0], "note": ["late", None], "k": pd.array([2, 3], dtype="Int64")}
+        ),
+    ]
+    with SpillStore(tmp_path) as spill:
+        out = spill.write("clean", chunks).to_pandas()
+        assert [p.name for p in spill.root.iterdir()] == ["clean.arrow"]
+    assert out["n"].tolist() == [1.0, 2.0, 3.5, 4.0]
+    assert out["note"].isna().tolist() == [True, True, False, True]
+    assert out.loc[2, "note"] == "late"
+    assert str(out["k"].dtype) == "Int64"
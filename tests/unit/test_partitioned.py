@@ -0,0 +1,102 @@
+# tests/unit/test_partitioned.py
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from dq_engine.out_of_core import SpillStore  # noqa: E402
+from dq_engine.partitioned import (  # noqa: E402
+    PartitionCfg,
+    _round1,
+    _Spec,
+    merge_states,
+    plan_partitions,
+    run_partitioned,
+)
+
+KEYS = [("pk", ["id"])]
+METRICS = ["n_rows", "n_null_key_rows", "n_duplicate_keys", "n_conflicting_key_groups"]
+
+
+def _frame(seed, n=400):
+    rng = np.random.default_rng(seed)
+    amount = rng.gamma(2.0, 30.0, n).round(2)
+    amount[rng.random(n) < 0.1] = np.nan
+    amount[rng.integers(0, n, 3)] = np.inf
+    df = pd.DataFrame(
+        {
+            "id": pd.array(rng.integers(0, n - n // 5, n), dtype="Int64"),
+            "amount": amount,
+            "tenure": rng.integers(-5, 72, n),
+            "contract": pd.Series(rng.choice(["Month", "One year", "Two year", "Rare"], n)).where(
+                rng.random(n) > 0.05
+            ),
+        }
+    )
+    df.loc[rng.integers(0, n, 6), "id"] = pd.NA
+    dup = df.sample(15, random_state=seed)  # exact copies: duplicate but not conflicting keys
+    return pd.concat([df, dup], ignore_index=True).sample(frac=1.0, random_state=seed)
+
+
+def _run(df, tmp_path, n, by):
+    cfg = PartitionCfg(n_jobs=1, n_partitions=n, by=by, spill_dir=str(tmp_path / "spill"))
+    return run_partitioned(df, cfg=cfg, rules=[], key_defs=KEYS)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("n", [2, 5])
+@pytest.mark.parametrize("by", ["key", "rows"])
+def test_partitions_merge_to_the_single_partition_result(tmp_path, seed, n, by):
+    df = _frame(seed)
+    one, many = _run(df, tmp_path, 1, "key"), _run(df, tmp_path, n, by)
+    assert len(many.partitions) == n
+
+    num_one, num_many = (r.profile.numeric.set_index("column") for r in (one, many))
+    pd.testing.assert_frame_equal(num_many, num_one, check_exact=False, rtol=1e-9)
+    for attr in ("categorical", "top_values", "histograms"):
+        pd.testing.assert_frame_equal(getattr(many.profile, attr), getattr(one.profile, attr))
+    pd.testing.assert_frame_equal(many.null_counts, one.null_counts)
+
+    # row-range partitions count duplicates from key / row hashes; the totals must still agree
+    pd.testing.assert_frame_equal(many.id_integrity[METRICS], one.id_integrity[METRICS])
+    assert one.id_integrity.loc[0, "n_duplicate_keys"] > 0
+    if by == "key":
+        det = [r.id_duplicates.sort_values("id", ignore_index=True) for r in (many, one)]
+        pd.testing.assert_frame_equal(*det)
+
+
+@pytest.mark.parametrize("colocated", [True, False])
+def test_merge_order_does_not_change_the_states(tmp_path, colocated):
+    df = _frame(3)
+    spec = _Spec(
+        ("amount", "tenure"),
+        ("contract",),
+        tuple(df.columns),
+        (),
+        (("pk", ("id",)),),
+        colocated=colocated,
+        precision=14,
+        limit=1_000_000,
+    )
+    cfg = PartitionCfg(n_jobs=1, n_partitions=6, by="key" if colocated else "rows")
+    with SpillStore(tmp_path) as store:
+        parts, _ = plan_partitions(df, store, cfg, ["id"])
+        states = [_round1(p, spec)[0] for p in parts]
+    rng = np.random.default_rng(0)
+    forward = merge_states(states)
+    shuffled = merge_states([states[i] for i in rng.permutation(len(states))])
+    tree = merge_states([merge_states(states[::2]), merge_states(states[1::2])])
+
+    for got in (shuffled, tree):
+        assert got["keys"][0].metrics() == forward["keys"][0].metrics()
+        np.testing.assert_array_equal(got["nulls"], forward["nulls"])
+        np.testing.assert_allclose(got["moments"].mean, forward["moments"].mean, rtol=1e-12)
+        np.testing.assert_allclose(got["moments"].std, forward["moments"].std, rtol=1e-12)
+        np.testing.assert_array_equal(got["moments"].vmin, forward["moments"].vmin)
+        assert [d.estimate() for d in got["distinct"]] == [
+            d.estimate() for d in forward["distinct"]
+        ]
+        for a, b in zip(got["frequencies"].counts, forward["frequencies"].counts, strict=True):
+            pd.testing.assert_series_equal(a.sort_index(), b.sort_index(), check_names=False)
+    assert forward["nulls"].tolist() == df.isna().sum().tolist()
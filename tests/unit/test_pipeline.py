@@ -0,0 +1,81 @@
+# tests/unit/test_pipeline.py
+import json
+
+import pytest
+import yaml
+
+duckdb = pytest.importorskip("duckdb")
+
+from dq_engine import cli  # noqa: E402
+from dq_engine.utils.tracing import disable_tracing  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path):
+    db = tmp_path / "DQ_ENGINE.duckdb"
+    con = duckdb.connect(str(db))
+    con.execute("create schema ANALYTICS")
+    con.execute("create table ANALYTICS.MRT_TELCO_CHURN as select * from range(10) t(CHURN_FLAG)")
+    con.execute("update ANALYTICS.MRT_TELCO_CHURN set CHURN_FLAG = CHURN_FLAG % 2")
+    con.close()
+    cfg = {
+        "project": {"name": "dq_engine", "dataset_id": "telco_churn"},
+        "warehouse": {
+            "target": "duckdb",
+            "database": "DQ_ENGINE",
+            "raw_schema": "RAW",
+            "analytics_schema": "ANALYTICS",
+            "dq_schema": "DQ",
+            "duckdb_path": str(db),
+        },
+        "checks": [
+            {
+                "id": "accepted_values_churn_flag",
+                "type": "accepted_values",
+                "table": "ANALYTICS.MRT_TELCO_CHURN",
+                "column": "CHURN_FLAG",
+                "severity": "fail",
+                "params": {"values": [0, 1]},
+            },
+            {"id": "row_count", "type": "row_count", "table": "ANALYTICS.MRT_TELCO_CHURN"},
+        ],
+    }
+    path = tmp_path / "dq_project.yml"
+    path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+    return path, db
+
+
+def test_run_writes_results_to_run_dir(project, tmp_path):
+    path, db = project
+    run_dir = tmp_path / "run"
+    assert cli.main(["run", str(path), "--skip-dbt", "--run-dir", str(run_dir)]) == 0
+    rows = json.loads((run_dir / "dq_results.json").read_text(encoding="utf-8"))
+    assert {r["check_id"]: r["status"] for r in rows} == {
+        "accepted_values_churn_flag": "PASS",
+        "row_count": "PASS",
+    }
+    assert (run_dir / "dq_results.csv").exists()
+    con = duckdb.connect(str(db), read_only=True)
+    try:
+        n, n_ts = con.execute("select count(*), count(run_ts) from DQ.DQ_RESULTS").fetchone()
+    finally:
+        con.close()
+    assert n == n_ts == 2
+
+
+def test_run_exports_trace_from_project_config(project, tmp_path, monkeypatch):
+    monkeypatch.delenv("DQ_TRACE", raising=False)
+    path, _ = project
+    cfg = yaml.safe_load(path.read_text(encoding="utf-8"))
+    cfg["tracing"] = {"enabled": True, "chrome_trace": "trace.json", "otlp_file": None}
+    path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+    run_dir = tmp_path / "run"
+    try:
+        cli.main(["run", str(path), "--skip-dbt", "--run-dir", str(run_dir)])
+    finally:
+        disable_tracing()
+    trace = json.loads((run_dir / "trace.json").read_text(encoding="utf-8"))
+    names = {e["name"] for e in trace["traceEvents"]}
+    assert {"pipeline.run", "check.accepted_values", "check.row_count"} <= names
+    assert (run_dir / "performance_profile.csv").exists()
+    assert not list(run_dir.glob("*.otlp.jsonl"))
@@ -0,0 +1,38 @@
+# tests/unit/test_profiling.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.engines.profiling import ProfilingCfg, profile
+
+
+@pytest.mark.parametrize("backend", ["pandas", "duckdb"])
+def test_categorical_shares_ignore_nulls(backend):
+    if backend == "duckdb":
+        pytest.importorskip("duckdb")
+    s = pd.Series(["a", "a", "b", None, None, None], dtype="object")
+    res = profile(pd.DataFrame({"plan": s}), cfg=ProfilingCfg(backend=backend), cat_cols=["plan"])
+    row = res.categorical.iloc[0]
+    p = s.value_counts(normalize=True)
+    assert row["pct_top_category"] == pytest.approx(100.0 * p.iloc[0])
+    assert row["entropy"] == pytest.approx(float(-(p * np.log2(p)).sum()), abs=1e-5)
+    assert row["pct_blank"] == pytest.approx(50.0)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "duckdb"])
+def test_sign_shares_are_per_column(backend):
+    if backend == "duckdb":
+        pytest.importorskip("duckdb")
+    df = pd.DataFrame(
+        {
+            "pos": [1.0, 2.0, 0.0, np.nan],
+            "neg": [-1.0, -2.0, -3.0, 4.0],
+        }
+    )
+    res = profile(df, cfg=ProfilingCfg(backend=backend), numeric_cols=["pos", "neg"])
+    got = res.numeric.set_index("column")
+    expected = {"pos": (100 / 3, 0.0, 200 / 3), "neg": (0.0, 75.0, 25.0)}
+    for col, (zero, negative, positive) in expected.items():
+        assert got.loc[col, "pct_zero"] == pytest.approx(zero)
+        assert got.loc[col, "pct_negative"] == pytest.approx(negative)
+        assert got.loc[col, "pct_positive"] == pytest.approx(positive)
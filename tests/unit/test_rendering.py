@@ -0,0 +1,62 @@
+# tests/unit/test_rendering.py
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from dq_engine.rendering import (  # noqa: E402
+    RenderingCfg,
+    box_spec,
+    heatmap_spec,
+    overlay_hist_spec,
+    render_figures,
+    univariate_specs,
+)
+
+CFG = RenderingCfg(n_jobs=1)
+
+
+def _specs(df, root):
+    num, cat = root / "numeric", root / "categorical"
+    specs = univariate_specs(df, ["tenure", "charges"], ["contract"], num, cat)
+    specs.append(overlay_hist_spec("charges", df["charges"], df["charges"] * 1.1, num))
+    specs.append(box_spec("tenure", dict(tuple(df.groupby("contract")["tenure"])), num))
+    specs.append(heatmap_spec("corr", df[["tenure", "charges"]].corr(), root / "corr.png"))
+    return specs
+
+
+def _frame(seed=0, n=300):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "tenure": rng.integers(0, 72, n).astype(float),
+            "charges": rng.gamma(2.0, 30.0, n),
+            "contract": rng.choice(["Month", "One year", "Two year"], n),
+        }
+    )
+
+
+def test_second_render_on_unchanged_specs_skips_every_figure(tmp_path):
+    df = _frame()
+    first = render_figures(_specs(df, tmp_path), CFG)
+    assert len(first) == 6
+    assert (first["status"] == "rendered").all(), first[["figure_id", "error"]]
+    mtimes = {p: (tmp_path / p).stat().st_mtime_ns for p in first["path"]}
+
+    second = render_figures(_specs(df, tmp_path), CFG)  # specs rebuilt from the same data
+    assert (second["status"] == "skipped").all()
+    assert second["spec_hash"].tolist() == first["spec_hash"].tolist()
+    assert {p: (tmp_path / p).stat().st_mtime_ns for p in second["path"]} == mtimes
+
+
+def test_changed_or_deleted_figures_rerender(tmp_path):
+    df = _frame()
+    first = render_figures(_specs(df, tmp_path), CFG).set_index("figure_id")
+    (tmp_path / first.loc["contract:bar", "path"]).unlink()
+    df.loc[0, "charges"] = 10_000.0  # moves the charges histogram, overlay and heatmap
+
+    again = render_figures(_specs(df, tmp_path), CFG).set_index("figure_id")
+    rendered = set(again.index[again["status"] == "rendered"])
+    assert rendered == {"contract:bar", "charges:hist", "charges:pre_post_hist", "corr:heatmap"}
+    assert set(again.index[again["status"] == "skipped"]) == set(again.index) - rendered
@@ -0,0 +1,110 @@
+# tests/unit/test_sampling.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dq_engine.sampling import (
+    WEIGHT_COL,
+    SampleResult,
+    approx_association,
+    approx_drift,
+    approx_numeric_profile,
+    bootstrap_ci,
+    cramers_v,
+    flag_escalations,
+    psi,
+    stratified_sample,
+)
+
+
+def _population(n=20_000, seed=0):
+    """A rare, shifted, high-variance segment that a per-stratum floor oversamples."""
+    rng = np.random.default_rng(seed)
+    rare = rng.random(n) < 0.05
+    contract = np.where(rare, "Two year", rng.choice(["Month", "One year"], n))
+    charges = np.where(rare, rng.normal(300.0, 80.0, n), rng.normal(60.0, 10.0, n))
+    churn = np.where(rng.random(n) < np.where(contract == "Month", 0.4, 0.1), "Yes", "No")
+    return pd.DataFrame({"Contract": contract, "charges": charges, "Churn": churn})
+
+
+def _sample(df, n_rows=600, min_per_stratum=250):
+    return stratified_sample(df, ["Contract"], n_rows, seed=1, min_per_stratum=min_per_stratum)
+
+
+def _full(df):
+    return SampleResult(df.assign(**{WEIGHT_COL: 1.0}), len(df), "full", 0, exact=True)
+
+
+def test_profile_std_uses_the_sampling_weights():
+    df = _population()
+    sample = _sample(df)
+    assert sample.weights.min() < sample.weights.max()  # the rare stratum is oversampled
+    prof = approx_numeric_profile(sample, ["charges"]).iloc[0]
+    truth = df["charges"].std()
+    unweighted = sample.frame["charges"].std()
+    assert abs(prof["std"] - truth) < 0.1 * truth < abs(unweighted - truth)
+    assert prof["mean_ci_low"] <= df["charges"].mean() <= prof["mean_ci_high"]
+    assert (prof["min"], prof["max"]) == (
+        sample.frame["charges"].min(),
+        sample.frame["charges"].max(),
+    )
+
+    exact = approx_numeric_profile(_full(df), ["charges"]).iloc[0]
+    assert exact["std"] == pytest.approx(truth)
+
+
+def test_bootstrap_resamples_tuples_as_pairs():
+    x = np.arange(200) % 4
+    pairs = bootstrap_ci(lambda a, b: float(np.mean(a == b)), (x, x), n_boot=50)
+    independent = bootstrap_ci(lambda a, b: float(np.mean(a == b)), x, x, n_boot=50)
+    assert pairs == (1.0, 1.0, 1.0)
+    assert independent[0] == 1.0 and independent[2] < 0.5
+    with pytest.raises(ValueError, match="paired"):
+        bootstrap_ci(np.mean, (x, x[:-1]))
+
+
+def test_drift_is_weighted_and_has_bootstrap_intervals():
+    df = _population()
+    sample = _sample(df)
+    drift = approx_drift(df, sample, ["charges"], n_boot=100).iloc[0]
+    assert drift["psi_ci_low"] <= drift["psi"] <= drift["psi_ci_high"] < 0.1
+    assert drift["ks"] < 0.1 and drift["ks_ci_high"] > drift["ks_ci_low"]
+
+    # without the weights the oversampled segment looks like drift
+    cuts = np.quantile(df["charges"], np.linspace(0, 1, 11)[1:-1])
+    assert psi(df["charges"], sample.frame["charges"], cuts) > 3 * drift["psi"]
+
+    shifted = sample.frame.assign(charges=sample.frame["charges"] + 40.0)
+    moved = approx_drift(df, SampleResult(shifted, len(df), "stratified", 1), ["charges"])
+    assert moved.loc[0, "psi_ci_low"] > 0.25 and moved.loc[0, "ks_ci_low"] > 0.3
+
+    flagged = flag_escalations(
+        pd.concat([drift.to_frame().T, moved], ignore_index=True),
+        [{"scope": "drift", "target": "psi", "op": "<", "threshold": 0.25}],
+        scope="drift",
+    )
+    assert flagged["escalate"].tolist() == [False, False]  # both intervals clear the threshold
+
+    exact = approx_drift(df, _full(df), ["charges"]).iloc[0]
+    assert exact["psi"] == exact["psi_ci_low"] == exact["psi_ci_high"]
+    assert exact["ks"] == pytest.approx(0.0)
+
+
+def test_association_is_weighted_and_resampled_in_pairs():
+    df = _population()
+    df["Contract_copy"] = df["Contract"]
+    sample = _sample(df)
+    assoc = approx_association(sample, ["Contract", "Contract_copy", "Churn"], n_boot=100)
+    assoc = assoc.set_index(["column_a", "column_b"])
+    copy = assoc.loc[("Contract", "Contract_copy")]
+    assert copy["cramers_v"] == pytest.approx(1.0) and copy["cramers_v_ci_low"] > 0.99
+
+    truth = cramers_v(df["Contract"], df["Churn"])
+    churn = assoc.loc[("Contract", "Churn")]
+    assert churn["cramers_v_ci_low"] <= truth <= churn["cramers_v_ci_high"]
+    assert abs(churn["cramers_v"] - truth) < 0.05
+    weighted = cramers_v(sample.frame["Contract"], sample.frame["Churn"], sample.weights)
+    assert churn["cramers_v"] == pytest.approx(weighted)
+
+    again = approx_association(sample, ["Contract", "Contract_copy", "Churn"], n_boot=100)
+    pd.testing.assert_frame_equal(again.set_index(["column_a", "column_b"]), assoc)
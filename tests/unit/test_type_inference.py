@@ -0,0 +1,74 @@
+# tests/unit/test_type_inference.py
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from dq_engine.engines.type_inference import detect_and_coerce  # noqa: E402
+
+BLANKS = [" ", "", "  "]
+
+
+def _telco(n=200):
+    rng = np.random.default_rng(0)
+    charges = (rng.gamma(2.0, 800.0, n)).round(2).astype(str).astype(object)
+    charges[[3, 50, 120]] = BLANKS  # new customers: TotalCharges is blank, not a bad number
+    return pd.DataFrame(
+        {
+            "customerID": [f"{i:04d}-ABCDE" for i in range(n)],
+            "tenure": rng.integers(0, 72, n),
+            "TotalCharges": charges,
+            "Churn": rng.choice(["Yes", "No"], n),
+        }
+    )
+
+
+def _config(apply):
+    return {
+        "TYPE_DETECTION": {"APPLY_COERCION": apply},
+        "ID_COLUMNS": ["customerID"],
+        "TARGET": {"COLUMN": "Churn"},
+    }
+
+
+@pytest.mark.parametrize("apply", [False, True])
+def test_blank_total_charges_are_missing_not_invalid(tmp_path, apply):
+    df = _telco()
+    res = detect_and_coerce(df, tmp_path, _config(apply))
+
+    summary = res.summary.set_index("column")
+    assert summary.loc["TotalCharges", "n_blank"] == len(BLANKS)
+    assert summary.loc["TotalCharges", "semantic_type"] == "numeric_like_string"
+
+    log = pd.read_csv(tmp_path / "coercion_log.csv").set_index("column")
+    row = log.loc["TotalCharges"]
+    assert (row["target_kind"], row["attempted"], row["ok"]) == ("numeric", True, True)
+    assert (row["n_blank"], row["new_nulls"], row["n_invalid"]) == (3, 3, 0)
+    assert row["success_ratio"] == 1.0
+    assert json.loads(row["sample_fail_values"]) == []
+    assert row["applied"] == apply
+    assert log.loc["customerID", "reason"] == log.loc["Churn", "reason"] == "id_or_target"
+
+    out = res.frame["TotalCharges"]
+    if apply:
+        assert row["post_dtype"] == "float64" and out.dtype == np.float64
+        assert row["post_non_null"] == len(df) - 3
+        assert out.isna().sum() == 3 and out.iloc[3:4].isna().all()
+        np.testing.assert_allclose(out.iloc[:3], df["TotalCharges"].iloc[:3].astype(float))
+    else:
+        assert row["post_dtype"] == str(df["TotalCharges"].dtype) == str(out.dtype)
+        assert out.equals(df["TotalCharges"])
+    assert res.column_type_map["TotalCharges"]["hints"]["n_blank"] == 3
+
+
+def test_bad_numbers_are_invalid_and_sampled(tmp_path):
+    df = _telco()
+    df.loc[[7, 8], "TotalCharges"] = ["n/a", "1,234.5"]
+    res = detect_and_coerce(df, tmp_path, _config(True))
+    row = res.coercion_log.set_index("column").loc["TotalCharges"]
+    assert (row["n_blank"], row["n_invalid"], row["new_nulls"]) == (3, 2, 5)
+    assert sorted(json.loads(row["sample_fail_values"])) == ["1,234.5", "n/a"]
+    assert res.frame["TotalCharges"].isna().sum() == 5
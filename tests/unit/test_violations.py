@@ -0,0 +1,75 @@
+# tests/unit/test_violations.py
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from dq_engine.engines.violations import ViolationMatrix  # noqa: E402
+
+N_ROWS = 40
+FLAGS = {
+    "r_a": (np.array([0, 1, 2, 3, 5, 8, 13]), ["tenure", "contract"], "warn"),
+    "r_b": (np.array([1, 2, 3, 4, 5]), ["tenure", "charges"], "fail"),
+    "r_c": (np.arange(N_ROWS) % 3 == 0, ["charges"], "warn"),  # bool mask
+    "r_d": (np.array([30, 31]), ["total", "contract"], "info"),
+    "r_e": (np.array([2, 3, 3]), ["tenure"], "warn"),  # duplicate row counted once
+}
+
+
+def _rows(rule):
+    r = np.asarray(FLAGS[rule][0])
+    return set(np.flatnonzero(r).tolist() if r.dtype == bool else r.tolist())
+
+
+def _expected(sets, n_total, min_count=1):
+    out = {}
+    for a, b in combinations(sorted(sets), 2):
+        n_co = len(sets[a] & sets[b])
+        if n_co >= min_count:
+            na, nb = len(sets[a]), len(sets[b])
+            out[frozenset((a, b))] = (n_co, n_co / (na + nb - n_co), n_co * n_total / (na * nb))
+    return out
+
+
+def _check(edges, src, tgt, expected):
+    got = {
+        frozenset((r[src], r[tgt])): (r["n_co"], r["jaccard"], r["lift"])
+        for r in edges.to_dict("records")
+    }
+    assert got.keys() == expected.keys()
+    for key, (n_co, jaccard, lift) in expected.items():
+        assert got[key][0] == n_co
+        assert got[key][1] == pytest.approx(jaccard)
+        assert got[key][2] == pytest.approx(lift)
+
+
+@pytest.mark.parametrize("min_count", [1, 2])
+def test_rule_edges_match_pairwise_counts(min_count):
+    vm = ViolationMatrix.from_flags(FLAGS, N_ROWS)
+    sets = {rule: _rows(rule) for rule in FLAGS}
+    edges = vm.rule_edges(min_count=min_count)
+    _check(edges, "source_rule", "target_rule", _expected(sets, N_ROWS, min_count))
+    np.testing.assert_array_equal(vm.rule_counts(), [len(sets[r]) for r in vm.rule_ids])
+    sev = {"info": 0, "warn": 1, "fail": 2}
+    for r in edges.to_dict("records"):
+        a, b = FLAGS[r["source_rule"]][2], FLAGS[r["target_rule"]][2]
+        assert r["max_severity"] == max(a, b, key=sev.get)
+
+
+def test_column_edges_match_rows_touching_each_column():
+    vm = ViolationMatrix.from_flags(FLAGS, N_ROWS)
+    touched = {}
+    for rule, (_, cols, _) in FLAGS.items():
+        for c in cols:
+            touched.setdefault(c, set()).update(_rows(rule))
+    edges = vm.column_edges()
+    _check(edges, "source_column", "target_column", _expected(touched, N_ROWS))
+    for r in edges.to_dict("records"):
+        shared = [
+            rule
+            for rule, (_, cols, _) in FLAGS.items()
+            if {r["source_column"], r["target_column"]} <= set(cols)
+        ]
+        assert r["n_rules"] == len(shared)
@@ -0,0 +1,95 @@
+# tests/unit/test_warehouse.py
+import asyncio
+import threading
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from dq_engine.warehouse import AsyncWarehouse, DuckDBWarehouse, wait_for  # noqa: E402
+
+
+@pytest.fixture
+def wh(tmp_path):
+    """DuckDB warehouse with `gate(x)`, a UDF that blocks until the test opens the gate."""
+    w = DuckDBWarehouse(str(tmp_path / "wh.duckdb"))
+    w.execute("create table T as select i, i % 3 as g from range(30) t(i)")
+    gate = threading.Event()
+
+    def _gate(x: int) -> int:
+        gate.wait(10)
+        return x
+
+    w.con.create_function("gate", _gate)
+    yield w, gate
+    gate.set()
+    w.close()
+
+
+def test_submit_returns_before_the_query_finishes(wh):
+    w, gate = wh
+    h = w.submit("select gate(42) as x")
+    assert h.query_id.startswith("duckdb-") and not h.done()
+    with pytest.raises(TimeoutError, match=h.query_id):
+        wait_for([h], timeout=0.05, initial=0.01)
+
+    gate.set()
+    assert h.result(timeout=5)["x"].tolist() == [42]
+    assert h.done()
+
+
+def test_submitted_queries_run_concurrently(wh):
+    w, _ = wh
+    barrier = threading.Barrier(3)
+
+    def _meet(x: int) -> int:
+        barrier.wait(5)  # BrokenBarrierError unless all three queries are running at once
+        return x
+
+    w.con.create_function("meet", _meet)
+    handles = [w.submit(f"select meet({k}) as k") for k in range(3)]
+    assert [df["k"].item() for df in w.gather(handles, timeout=10)] == [0, 1, 2]
+
+
+def test_gather_keeps_handle_order_and_surfaces_errors(wh):
+    w, gate = wh
+    gate.set()
+    sqls = [f"select i from T where g = {g} order by i" for g in (2, 0, 1)]
+    handles = [w.submit(q) for q in sqls]
+    assert len({h.query_id for h in handles}) == 3
+    for got, q in zip(w.gather(handles, timeout=10), sqls, strict=True):
+        assert got.equals(w.read_df(q))
+
+    bad = [w.submit("select count(*) as n from T"), w.submit("select * from NO_SUCH_TABLE")]
+    n, err = w.gather(bad, timeout=10, return_exceptions=True)
+    assert n["n"].item() == 30
+    assert isinstance(err, duckdb.CatalogException)
+    with pytest.raises(duckdb.CatalogException):
+        w.gather(bad, timeout=10)
+
+
+def test_async_facade_awaits_without_blocking_the_loop(wh):
+    w, gate = wh
+    aw = AsyncWarehouse(w)
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await aw.read_df("select gate(1) as x", timeout=0.05)
+        ticks = 0
+
+        async def open_gate():
+            nonlocal ticks
+            while ticks < 3:  # the loop keeps running while the gated query is pending
+                ticks += 1
+                await asyncio.sleep(0.01)
+            gate.set()
+
+        out, _ = await asyncio.gather(
+            aw.gather(["select gate(7) as x", "select count(*) as n from T"], timeout=10),
+            open_gate(),
+        )
+        return out
+
+    gated, counted = asyncio.run(main())
+    assert gated["x"].tolist() == [7]
+    assert counted["n"].item() == 30
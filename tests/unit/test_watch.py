@@ -0,0 +1,103 @@
+# tests/unit/test_watch.py
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+import yaml
+
+duckdb = pytest.importorskip("duckdb")
+
+from dq_engine import cli  # noqa: E402
+from dq_engine.watch import WatchCfg, Watcher  # noqa: E402
+
+TABLES = {"telco": "ANALYTICS.MRT_TELCO", "billing": "ANALYTICS.MRT_BILLING"}
+
+
+def _checks(dataset_id, table):
+    return [
+        {
+            "id": f"{dataset_id}_flag",
+            "type": "accepted_values",
+            "table": table,
+            "column": "FLAG",
+            "params": {"values": [0, 1]},
+        },
+        {"id": f"{dataset_id}_rows", "type": "row_count", "table": table},
+    ]
+
+
+@pytest.fixture
+def project(tmp_path):
+    db = tmp_path / "DQ_ENGINE.duckdb"
+    con = duckdb.connect(str(db))
+    con.execute("create schema ANALYTICS")
+    for table in TABLES.values():
+        con.execute(f"create table {table} as select i % 2 as FLAG from range(10) t(i)")
+    con.close()
+    raw = tmp_path / "raw"
+    for name in TABLES:
+        (raw / name).mkdir(parents=True)
+        (raw / name / "part-0.csv").write_text("FLAG\n0\n1\n", encoding="utf-8")
+    cfg = {
+        "project": {"name": "dq_engine", "dataset_id": "unused"},
+        "warehouse": {
+            "target": "duckdb",
+            "database": "DQ_ENGINE",
+            "raw_schema": "RAW",
+            "analytics_schema": "ANALYTICS",
+            "dq_schema": "DQ",
+            "duckdb_path": str(db),
+        },
+        "datasets": {name: {"checks": _checks(name, t)} for name, t in TABLES.items()},
+        "watch": {
+            "raw_dir": str(raw),
+            "patterns": ["*.csv"],
+            "settle_s": 0,
+            "sources": {t: [f"{name}/*.csv"] for name, t in TABLES.items()},
+        },
+    }
+    path = tmp_path / "dq_project.yml"
+    path.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+    return path, db, raw
+
+
+def _results(run_dir):
+    return sorted(pd.read_csv(run_dir / "dq_results.csv")["check_id"])
+
+
+def test_watch_once_runs_every_check(project, tmp_path):
+    path, _, _ = project
+    run_dir = tmp_path / "run"
+    assert cli.main(["watch", str(path), "--once", "--run-dir", str(run_dir)]) == 0
+    assert _results(run_dir) == ["billing_flag", "billing_rows", "telco_flag", "telco_rows"]
+
+    quiet = tmp_path / "quiet"  # first poll only records fingerprints
+    assert (
+        cli.main(["watch", str(path), "--once", "--no-initial-run", "--run-dir", str(quiet)]) == 0
+    )
+    assert not quiet.exists()
+
+
+def test_changed_raw_file_reruns_only_its_checks(project, tmp_path):
+    path, db, raw = project
+    run_dir = tmp_path / "run"
+    cfg = replace(WatchCfg.from_config(yaml.safe_load(path.read_text())), run_dir=str(run_dir))
+    w = Watcher(str(path), cfg)
+    try:
+        assert w.cycle()["n_checks"] == 4  # initial full run
+        assert w.cycle() is None  # nothing changed, and our own results write is not a change
+
+        (raw / "telco" / "part-0.csv").write_text("FLAG\n0\n1\n1\n", encoding="utf-8")
+        row = w.cycle()
+        assert (row["changed_files"], row["n_checks"]) == (1, 2)
+        assert _results(run_dir) == ["telco_flag", "telco_rows"]
+
+        con = duckdb.connect(str(db))
+        con.execute(f"insert into {TABLES['billing']} values (2)")
+        con.close()
+        row = w.cycle()
+        assert (row["changed_files"], row["changed_tables"], row["n_fail"]) == (0, 1, 0)
+        assert _results(run_dir) == ["billing_flag", "billing_rows"]
+        assert row["n_warn"] == 1  # accepted_values defaults to warn severity
+    finally:
+        w.close()